@@ -22,7 +22,9 @@ Usage:
 
 from contextcore_rabbit.action import Action, ActionResult, action_registry
 from contextcore_rabbit.alert import Alert, AlertSeverity
+from contextcore_rabbit.jobs import Job, JobQueue, JobStatus
 from contextcore_rabbit.server import WebhookServer
+from contextcore_rabbit.store import InMemoryRunStore, RunStore, SQLiteRunStore
 
 __version__ = "0.1.0"
 __all__ = [
@@ -31,5 +33,11 @@ __all__ = [
     "action_registry",
     "Alert",
     "AlertSeverity",
+    "Job",
+    "JobQueue",
+    "JobStatus",
     "WebhookServer",
+    "RunStore",
+    "InMemoryRunStore",
+    "SQLiteRunStore",
 ]
@@ -3,23 +3,35 @@ Beaver Workflow Action - Triggers Lead Contractor workflows.
 
 This action "wakes up" Beaver to run Lead Contractor workflows.
 It's fire-and-forget: starts the workflow and returns immediately.
-Status is tracked via spans in Tempo, not through Rabbit.
+Run records are persisted in the Rabbit run store (see store.py) so status
+and history queries survive restarts; detailed progress lives in Tempo spans.
 """
 
 import logging
+import os
 import sys
-import threading
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from contextcore_rabbit.action import Action, ActionResult, ActionStatus, action_registry
+from contextcore_rabbit.store import get_run_store
 
 logger = logging.getLogger(__name__)
 
-# Track running workflows for status queries
-_workflow_runs: Dict[str, Dict[str, Any]] = {}
+# Retention applied to finished runs after each workflow completes
+_RUN_RETENTION_DAYS = float(os.environ.get("RABBIT_RUN_RETENTION_DAYS", "30"))
+_RUN_MAX_RUNS = int(os.environ.get("RABBIT_RUN_MAX_RUNS", "1000"))
+
+# Workflow runs are long-lived; cap how many execute at once. Excess runs wait
+# in the executor queue with status "starting".
+_MAX_CONCURRENT_WORKFLOWS = int(os.environ.get("RABBIT_MAX_CONCURRENT_WORKFLOWS", "2"))
+_workflow_executor = ThreadPoolExecutor(
+    max_workers=max(1, _MAX_CONCURRENT_WORKFLOWS),
+    thread_name_prefix="beaver-workflow",
+)
 
 
 def _get_project_root() -> Path:
@@ -33,11 +45,24 @@ def _get_project_root() -> Path:
     return Path.cwd()
 
 
+def _apply_retention() -> None:
+    """Compact finished runs per RABBIT_RUN_RETENTION_DAYS / RABBIT_RUN_MAX_RUNS."""
+    try:
+        deleted = get_run_store().compact(
+            max_age=timedelta(days=_RUN_RETENTION_DAYS),
+            max_runs=_RUN_MAX_RUNS,
+        )
+        if deleted:
+            logger.info(f"Compacted {deleted} old workflow run(s)")
+    except Exception:
+        logger.exception("Workflow run retention failed")
+
+
 def _run_workflow_background(run_id: str, project_id: str, dry_run: bool):
-    """Run the workflow in a background thread."""
+    """Run the workflow on the background executor."""
+    store = get_run_store()
     try:
-        _workflow_runs[run_id]["status"] = "running"
-        _workflow_runs[run_id]["started_at"] = datetime.now().isoformat()
+        store.update(run_id, status="running", started_at=datetime.now().isoformat())
 
         project_root = _get_project_root()
         sys.path.insert(0, str(project_root))
@@ -48,8 +73,12 @@ def _run_workflow_background(run_id: str, project_id: str, dry_run: bool):
             from scripts.prime_contractor.feature_queue import FeatureStatus
         except ImportError as e:
             logger.error(f"Failed to import Prime Contractor: {e}")
-            _workflow_runs[run_id]["status"] = "failed"
-            _workflow_runs[run_id]["error"] = f"Prime Contractor not available: {e}"
+            store.update(
+                run_id,
+                status="failed",
+                error=f"Prime Contractor not available: {e}",
+                completed_at=datetime.now().isoformat(),
+            )
             return
 
         # Create and run workflow
@@ -60,12 +89,14 @@ def _run_workflow_background(run_id: str, project_id: str, dry_run: bool):
 
         # Import features from backlog
         imported = workflow.import_from_backlog()
-        _workflow_runs[run_id]["steps_total"] = len(workflow.queue.features)
-        _workflow_runs[run_id]["steps_completed"] = 0
+        store.update(run_id, steps_total=len(workflow.queue.features), steps_completed=0)
 
         # Track progress
+        progress = {"completed": 0}
+
         def on_complete(feature):
-            _workflow_runs[run_id]["steps_completed"] += 1
+            progress["completed"] += 1
+            store.update(run_id, steps_completed=progress["completed"])
 
         workflow.on_feature_complete = on_complete
 
@@ -73,23 +104,29 @@ def _run_workflow_background(run_id: str, project_id: str, dry_run: bool):
         result = workflow.run(stop_on_failure=True)
 
         # Update status
-        _workflow_runs[run_id]["status"] = "completed" if result["failed"] == 0 else "failed"
-        _workflow_runs[run_id]["completed_at"] = datetime.now().isoformat()
-        _workflow_runs[run_id]["steps_completed"] = result["succeeded"]
-        _workflow_runs[run_id]["result"] = {
-            "processed": result["processed"],
-            "succeeded": result["succeeded"],
-            "failed": result["failed"],
-        }
-
-        if result["failed"] > 0:
-            _workflow_runs[run_id]["error"] = f"{result['failed']} feature(s) failed"
+        store.update(
+            run_id,
+            status="completed" if result["failed"] == 0 else "failed",
+            completed_at=datetime.now().isoformat(),
+            steps_completed=result["succeeded"],
+            result={
+                "processed": result["processed"],
+                "succeeded": result["succeeded"],
+                "failed": result["failed"],
+            },
+            error=f"{result['failed']} feature(s) failed" if result["failed"] > 0 else None,
+        )
 
     except Exception as e:
         logger.exception(f"Workflow {run_id} failed")
-        _workflow_runs[run_id]["status"] = "failed"
-        _workflow_runs[run_id]["error"] = str(e)
-        _workflow_runs[run_id]["completed_at"] = datetime.now().isoformat()
+        store.update(
+            run_id,
+            status="failed",
+            error=str(e),
+            completed_at=datetime.now().isoformat(),
+        )
+    finally:
+        _apply_retention()
 
 
 @action_registry.register("beaver_workflow")
@@ -98,7 +135,7 @@ class BeaverWorkflowAction(Action):
     Trigger a Beaver Lead Contractor workflow.
 
     This action starts the workflow and returns immediately (fire-and-forget).
-    The workflow runs in a background thread. Status can be queried via
+    The workflow runs on a bounded background executor. Status can be queried via
     the workflow status endpoint or by querying Tempo for spans.
 
     Payload:
@@ -119,25 +156,22 @@ class BeaverWorkflowAction(Action):
         run_id = str(uuid.uuid4())[:8]
 
         # Initialize tracking
-        _workflow_runs[run_id] = {
+        get_run_store().create({
             "run_id": run_id,
             "project_id": project_id,
             "dry_run": dry_run,
             "status": "starting",
-            "started_at": None,
+            # Submit time, so queued runs sort with recent history; replaced
+            # by the actual start time once the executor picks the run up
+            "started_at": datetime.now().isoformat(),
             "completed_at": None,
             "steps_total": 0,
             "steps_completed": 0,
             "error": None,
-        }
+        })
 
-        # Start workflow in background thread
-        thread = threading.Thread(
-            target=_run_workflow_background,
-            args=(run_id, project_id, dry_run),
-            daemon=True,
-        )
-        thread.start()
+        # Hand off to the bounded workflow executor
+        _workflow_executor.submit(_run_workflow_background, run_id, project_id, dry_run)
 
         mode = "dry_run" if dry_run else "execute"
         return ActionResult(
@@ -183,15 +217,14 @@ class BeaverWorkflowStatusAction(Action):
                 message="Missing run_id",
             )
 
-        if run_id not in _workflow_runs:
+        run_data = get_run_store().get(run_id)
+        if run_data is None:
             return ActionResult(
                 status=ActionStatus.FAILED,
                 action_name=self.name,
                 message=f"Run not found: {run_id}",
             )
 
-        run_data = _workflow_runs[run_id]
-
         return ActionResult(
             status=ActionStatus.SUCCESS,
             action_name=self.name,
@@ -208,7 +241,8 @@ class BeaverWorkflowHistoryAction(Action):
     Payload:
         {
             "project_id": "optional-filter",
-            "limit": 20
+            "limit": 20,
+            "offset": 0
         }
     """
 
@@ -219,18 +253,12 @@ class BeaverWorkflowHistoryAction(Action):
         """Get workflow history."""
         project_filter = payload.get("project_id")
         limit = payload.get("limit", 20)
+        offset = payload.get("offset", 0)
 
-        # Get all runs, optionally filtered by project
-        runs = list(_workflow_runs.values())
-
-        if project_filter:
-            runs = [r for r in runs if r.get("project_id") == project_filter]
-
-        # Sort by started_at (most recent first)
-        runs.sort(key=lambda r: r.get("started_at") or "", reverse=True)
-
-        # Apply limit
-        runs = runs[:limit]
+        # Most recent first; paging is done by the store's index scan
+        runs, total = get_run_store().history(
+            project_id=project_filter, limit=limit, offset=offset
+        )
 
         return ActionResult(
             status=ActionStatus.SUCCESS,
@@ -238,7 +266,8 @@ class BeaverWorkflowHistoryAction(Action):
             message=f"Found {len(runs)} workflow runs",
             data={
                 "runs": runs,
-                "total": len(_workflow_runs),
+                "total": total,
+                "offset": offset,
             },
         )
 
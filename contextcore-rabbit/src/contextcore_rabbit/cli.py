@@ -32,14 +32,54 @@ def main():
         "--debug", action="store_true",
         help="Enable debug mode"
     )
+    parser.add_argument(
+        "--workers", type=int, default=4,
+        help="Worker threads executing queued actions (default: 4)"
+    )
+    parser.add_argument(
+        "--max-queue-size", type=int, default=1000,
+        help="Maximum pending jobs before webhooks get 503 (default: 1000)"
+    )
+    parser.add_argument(
+        "--action-limit", action="append", default=[], metavar="ACTION=N",
+        help="Per-action concurrency limit, repeatable (e.g. beaver_workflow=1)"
+    )
+    parser.add_argument(
+        "--coalesce-window", type=float, default=300.0,
+        help="Seconds during which duplicate alerts are grouped (default: 300)"
+    )
+
+    parser.add_argument(
+        "--run-store", default=None,
+        help="Workflow run store: SQLite path or ':memory:' "
+             "(default: $RABBIT_RUN_STORE or ~/.contextcore/rabbit/runs.db)"
+    )
 
     args = parser.parse_args()
 
+    action_limits = {}
+    for spec in args.action_limit:
+        name, sep, limit = spec.partition("=")
+        if not sep or not limit.isdigit():
+            parser.error(f"--action-limit expects ACTION=N, got: {spec}")
+        action_limits[name] = int(limit)
+
     # Import here to ensure actions are registered
     from contextcore_rabbit import WebhookServer
     from contextcore_rabbit import actions  # noqa: F401 - registers actions
+    from contextcore_rabbit.store import create_run_store, set_run_store
+
+    if args.run_store:
+        set_run_store(create_run_store(args.run_store))
 
-    server = WebhookServer(port=args.port, host=args.host)
+    server = WebhookServer(
+        port=args.port,
+        host=args.host,
+        workers=args.workers,
+        max_queue_size=args.max_queue_size,
+        action_limits=action_limits,
+        coalesce_window_seconds=args.coalesce_window,
+    )
     server.run(debug=args.debug)
 
 
@@ -0,0 +1,383 @@
+"""
+In-process job queue for Rabbit.
+
+Webhook handlers submit actions here instead of executing them inline, so
+senders get an immediate 202 with a job id while a bounded pool of worker
+threads drains the queue. During an alert storm:
+
+- The pool size caps total concurrent action executions.
+- Per-action limits stop one noisy action from starving the others. They
+  are checked at submission, under the queue lock: a job whose action is
+  saturated is parked in a per-action FIFO rather than blocking a worker,
+  and the worker holding that action's slot runs parked jobs in submission
+  order (so a "resolved" notification never overtakes its "firing" one).
+- Alerts sharing a group key (action, status and fingerprint) within the
+  coalescing window are folded into a single job while it is still queued;
+  once that job starts, the next alert gets a run of its own.
+"""
+
+import hashlib
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from contextcore_rabbit.action import ActionRegistry, ActionResult, ActionStatus, action_registry
+
+logger = logging.getLogger(__name__)
+
+# Labels ignored when deriving a group key for alerts without a fingerprint.
+# They vary between notifications for the same underlying alert.
+_VOLATILE_LABELS = frozenset({"rabbit_action"})
+
+
+class JobStatus(Enum):
+    """Lifecycle state of a queued job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue has no capacity for a new job."""
+    pass
+
+
+@dataclass
+class Job:
+    """A unit of work: one action execution, possibly covering several alerts."""
+    id: str
+    action_name: str
+    payload: Dict[str, Any]
+    context: Dict[str, Any] = field(default_factory=dict)
+    group_key: Optional[str] = None
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    coalesced: int = 0
+    result: Optional[ActionResult] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        def _iso(ts: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(ts).isoformat() if ts is not None else None
+
+        return {
+            "job_id": self.id,
+            "action_name": self.action_name,
+            "status": self.status.value,
+            "group_key": self.group_key,
+            "coalesced": self.coalesced,
+            "submitted_at": _iso(self.submitted_at),
+            "started_at": _iso(self.started_at),
+            "completed_at": _iso(self.completed_at),
+            "result": self.result.to_dict() if self.result else None,
+        }
+
+
+@dataclass
+class SubmitResult:
+    """Outcome of submitting work to the queue."""
+    job: Job
+    deduplicated: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": "accepted",
+            "job_id": self.job.id,
+            "action_name": self.job.action_name,
+            "deduplicated": self.deduplicated,
+            "status_endpoint": f"/jobs/{self.job.id}",
+        }
+
+
+def alert_group_key(action_name: str, alert: Dict[str, Any]) -> str:
+    """
+    Derive the coalescing key for an alert.
+
+    Uses the source fingerprint when present; otherwise hashes the alert
+    name, status and stable labels so repeated notifications collapse. The
+    status is always part of the key, so a "resolved" notification never
+    folds into the "firing" job for the same alert.
+    """
+    fingerprint = alert.get("fingerprint")
+    if fingerprint:
+        return f"{action_name}:{alert.get('status')}:{fingerprint}"
+
+    labels = {
+        k: v for k, v in (alert.get("labels") or {}).items()
+        if k not in _VOLATILE_LABELS
+    }
+    material = json.dumps(
+        [alert.get("name"), alert.get("status"), sorted(labels.items())],
+        default=str,
+    )
+    digest = hashlib.sha256(material.encode()).hexdigest()[:16]
+    return f"{action_name}:{digest}"
+
+
+class JobQueue:
+    """
+    Bounded worker pool with per-action concurrency limits and alert coalescing.
+
+    Usage:
+        jobs = JobQueue(workers=4, action_limits={"beaver_workflow": 1})
+        jobs.start()
+        submitted = jobs.submit("log", payload, context, group_key="log:abc")
+        jobs.get(submitted.job.id)
+    """
+
+    def __init__(
+        self,
+        registry: Optional[ActionRegistry] = None,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        action_limits: Optional[Dict[str, int]] = None,
+        default_action_limit: Optional[int] = None,
+        coalesce_window_seconds: float = 300.0,
+        max_retained_jobs: int = 1000,
+    ):
+        """
+        Args:
+            registry: Action registry to dispatch to (defaults to the global one)
+            workers: Number of worker threads draining the queue
+            max_queue_size: Maximum queued (not yet running) jobs
+            action_limits: Per-action concurrent execution caps
+            default_action_limit: Cap for actions not listed in action_limits
+                (None means bounded only by the pool size)
+            coalesce_window_seconds: How long a group key keeps absorbing
+                duplicate alerts after its job was submitted
+            max_retained_jobs: Finished jobs kept for status queries
+        """
+        self.registry = registry or action_registry
+        self.workers = max(1, workers)
+        self.action_limits = dict(action_limits or {})
+        self.default_action_limit = default_action_limit
+        self.coalesce_window_seconds = coalesce_window_seconds
+        self.max_retained_jobs = max_retained_jobs
+
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._groups: Dict[str, Job] = {}
+        # Per-action running counts and jobs parked while the action is saturated
+        self._active: Dict[str, int] = {}
+        self._deferred: Dict[str, "deque[Job]"] = {}
+        self._deferred_count = 0
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        """Start worker threads (idempotent)."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"rabbit-worker-{i}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"Started Rabbit job queue with {self.workers} workers")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop worker threads after the queued jobs have drained."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            threads = list(self._threads)
+            self._threads.clear()
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    # -- submission --------------------------------------------------------
+
+    def submit(
+        self,
+        action_name: str,
+        payload: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        group_key: Optional[str] = None,
+    ) -> SubmitResult:
+        """
+        Enqueue an action execution.
+
+        If group_key matches a still-queued job submitted within the
+        coalescing window, no new job is created: that job absorbs the payload
+        into its ``grouped_alerts`` list. Once a job has started, a matching
+        alert gets a new job.
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        self.start()
+        now = time.time()
+
+        with self._lock:
+            if group_key:
+                existing = self._groups.get(group_key)
+                if (
+                    existing is not None
+                    and existing.status == JobStatus.QUEUED
+                    and now - existing.submitted_at <= self.coalesce_window_seconds
+                ):
+                    existing.coalesced += 1
+                    existing.payload.setdefault("grouped_alerts", []).append(payload)
+                    return SubmitResult(job=existing, deduplicated=True)
+
+            job = Job(
+                id=uuid.uuid4().hex[:12],
+                action_name=action_name,
+                payload=payload,
+                context=context or {},
+                group_key=group_key,
+                submitted_at=now,
+            )
+            # Parked jobs are still pending and count against the limit
+            pending = self._queue.qsize() + self._deferred_count
+            if self._queue.maxsize > 0 and pending >= self._queue.maxsize:
+                raise QueueFullError(f"Job queue full ({self._queue.maxsize} pending jobs)")
+
+            limit = self._limit_for(action_name)
+            if limit is not None and self._active.get(action_name, 0) >= limit:
+                # Decided here, in submission order; the slot holder runs it
+                self._deferred.setdefault(action_name, deque()).append(job)
+                self._deferred_count += 1
+            else:
+                try:
+                    self._queue.put_nowait(job)
+                except queue.Full:
+                    raise QueueFullError(
+                        f"Job queue full ({self._queue.maxsize} pending jobs)"
+                    ) from None
+                if limit is not None:
+                    self._active[action_name] = self._active.get(action_name, 0) + 1
+
+            self._jobs[job.id] = job
+            if group_key:
+                self._groups[group_key] = job
+            self._prune(now)
+
+        return SubmitResult(job=job)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and job counts by status."""
+        with self._lock:
+            by_status: Dict[str, int] = {s.value: 0 for s in JobStatus}
+            for job in self._jobs.values():
+                by_status[job.status.value] += 1
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queue.qsize(),
+                "deferred": self._deferred_count,
+                "jobs": by_status,
+                "groups": len(self._groups),
+            }
+
+    def join(self) -> None:
+        """Block until every queued job has been processed."""
+        self._queue.join()
+
+    # -- internals ---------------------------------------------------------
+
+    def _limit_for(self, action_name: str) -> Optional[int]:
+        return self.action_limits.get(action_name, self.default_action_limit) or None
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._dispatch(job)
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, job: Job) -> None:
+        """
+        Run a dequeued job, then any jobs parked behind it.
+
+        A limited action's job only reaches the queue once it holds one of
+        the action's slots (see submit()). The worker keeps that slot and
+        runs the action's parked jobs itself, oldest first, so parked work
+        never waits on a worker blocked elsewhere and no worker ever blocks
+        on a saturated action.
+        """
+        action_name = job.action_name
+        limited = self._limit_for(action_name) is not None
+
+        next_job: Optional[Job] = job
+        while next_job is not None:
+            self._run(next_job)
+            if not limited:
+                return
+            with self._lock:
+                parked = self._deferred.get(action_name)
+                if parked:
+                    next_job = parked.popleft()
+                    self._deferred_count -= 1
+                else:
+                    next_job = None
+                    self._active[action_name] -= 1
+
+    def _run(self, job: Job) -> None:
+        try:
+            with self._lock:
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+            result = self.registry.execute(job.action_name, job.payload, job.context)
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.action_name}) failed")
+            result = ActionResult(
+                status=ActionStatus.FAILED,
+                action_name=job.action_name,
+                message=str(e),
+            )
+
+        with self._lock:
+            job.result = result
+            job.completed_at = time.time()
+            job.status = (
+                JobStatus.COMPLETED if result.status != ActionStatus.FAILED
+                else JobStatus.FAILED
+            )
+
+    def _prune(self, now: float) -> None:
+        """Expire coalescing groups and cap retained finished jobs. Caller holds the lock."""
+        expired = [
+            key for key, job in self._groups.items()
+            if now - job.submitted_at > self.coalesce_window_seconds
+        ]
+        for key in expired:
+            del self._groups[key]
+
+        excess = len(self._jobs) - self.max_retained_jobs
+        if excess <= 0:
+            return
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                del self._jobs[job_id]
+                excess -= 1
@@ -4,9 +4,7 @@ Webhook server for Rabbit.
 Receives webhooks from various sources and dispatches to registered actions.
 """
 
-import json
 import logging
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -15,6 +13,8 @@ from flask_cors import CORS
 
 from contextcore_rabbit.action import action_registry, ActionResult, ActionStatus
 from contextcore_rabbit.alert import Alert
+from contextcore_rabbit.jobs import JobQueue, QueueFullError, alert_group_key
+from contextcore_rabbit.store import recover_interrupted_runs
 
 try:
     from contextcore.compat.otel_messaging import build_messaging_attributes
@@ -72,7 +72,8 @@ class WebhookServer:
     Flask-based webhook server for Rabbit.
 
     Receives webhooks and dispatches to registered actions.
-    Fire-and-forget design - actions are triggered and control returns immediately.
+    Fire-and-forget design - alert and trigger endpoints enqueue the action on
+    a bounded worker pool and return 202 with a job id immediately.
     """
 
     def __init__(
@@ -80,16 +81,43 @@ class WebhookServer:
         port: int = 8080,
         host: str = "0.0.0.0",
         otel_endpoint: Optional[str] = None,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        action_limits: Optional[Dict[str, int]] = None,
+        coalesce_window_seconds: float = 300.0,
+        job_queue: Optional[JobQueue] = None,
     ):
         self.port = port
         self.host = host
         self.otel_endpoint = otel_endpoint
 
+        self.jobs = job_queue or JobQueue(
+            workers=workers,
+            max_queue_size=max_queue_size,
+            action_limits=action_limits,
+            coalesce_window_seconds=coalesce_window_seconds,
+        )
+
         self.app = Flask(__name__)
         CORS(self.app)
 
         self._setup_routes()
 
+    def _enqueue(
+        self,
+        action_name: str,
+        payload: Dict[str, Any],
+        context: Dict[str, Any],
+        group_key: Optional[str] = None,
+    ):
+        """Submit an action to the job queue and build the 202 response."""
+        try:
+            submitted = self.jobs.submit(action_name, payload, context, group_key=group_key)
+        except QueueFullError as e:
+            logger.warning(f"Rejecting {action_name}: {e}")
+            return jsonify({"status": "error", "error": str(e)}), 503
+        return jsonify(submitted.to_dict()), 202
+
     def _setup_routes(self):
         """Set up Flask routes."""
 
@@ -99,8 +127,20 @@ class WebhookServer:
                 "status": "healthy",
                 "service": "contextcore-rabbit",
                 "timestamp": datetime.now().isoformat(),
+                "jobs": self.jobs.stats(),
             })
 
+        @self.app.route("/jobs/<job_id>", methods=["GET"])
+        def job_status(job_id: str):
+            """Get the status and result of a queued job."""
+            job = self.jobs.get(job_id)
+            if job is None:
+                return jsonify({
+                    "status": "error",
+                    "error": "Job not found"
+                }), 404
+            return jsonify(job.to_dict())
+
         @self.app.route("/actions", methods=["GET"])
         def list_actions():
             """List all registered actions."""
@@ -131,14 +171,17 @@ class WebhookServer:
                     "error": "Missing 'action' field"
                 }), 400
 
+            if action_registry.get(action_name) is None:
+                return jsonify({
+                    "status": "error",
+                    "error": f"Action not found: {action_name}"
+                }), 404
+
             payload = data.get("payload", {})
             context = data.get("context", {})
 
-            # Execute action (fire-and-forget)
-            result = action_registry.execute(action_name, payload, context)
-
-            status_code = 200 if result.status == ActionStatus.SUCCESS else 500
-            return jsonify(result.to_dict()), status_code
+            # Enqueue action (fire-and-forget); poll /jobs/<job_id> for the result
+            return self._enqueue(action_name, payload, context)
 
         @self.app.route("/workflow/run", methods=["POST"])
         def workflow_run():
@@ -267,6 +310,7 @@ class WebhookServer:
             Query params:
                 - project_id: Optional filter by project
                 - limit: Max number of results (default 20)
+                - offset: Number of runs to skip for paging (default 0)
 
             Response (200):
                 {
@@ -283,15 +327,17 @@ class WebhookServer:
                             "result": { ... }
                         }
                     ],
-                    "total": int
+                    "total": int,
+                    "offset": int
                 }
             """
             project_id = request.args.get("project_id")
             limit = request.args.get("limit", 20, type=int)
+            offset = request.args.get("offset", 0, type=int)
 
             result = action_registry.execute(
                 "beaver_workflow_history",
-                {"project_id": project_id, "limit": limit},
+                {"project_id": project_id, "limit": limit, "offset": offset},
                 {"api_endpoint": "/workflow/history"}
             )
 
@@ -315,20 +361,20 @@ class WebhookServer:
             # Determine action based on alert labels or default
             action_name = alert.labels.get("rabbit_action", "log")
 
+            alert_dict = alert.to_dict()
             span_attrs = _messaging_attrs(
                 "grafana", alert.name, "receive",
                 message_id=alert.id,
-                body_size=len(json.dumps(payload)),
+                body_size=request.content_length,
             )
             with _span("webhook.grafana receive", span_attrs):
-                result = action_registry.execute(
+                return self._enqueue(
                     action_name,
-                    alert.to_dict(),
-                    {"source": "grafana", "raw_payload": payload}
+                    alert_dict,
+                    {"source": "grafana", "raw_payload": payload},
+                    group_key=alert_group_key(action_name, alert_dict),
                 )
 
-            return jsonify(result.to_dict())
-
         @self.app.route("/webhook/alertmanager", methods=["POST"])
         def alertmanager_webhook():
             """Handle Alertmanager webhooks."""
@@ -342,20 +388,20 @@ class WebhookServer:
 
             action_name = alert.labels.get("rabbit_action", "log")
 
+            alert_dict = alert.to_dict()
             span_attrs = _messaging_attrs(
                 "alertmanager", alert.name, "receive",
                 message_id=alert.id,
-                body_size=len(json.dumps(payload)),
+                body_size=request.content_length,
             )
             with _span("webhook.alertmanager receive", span_attrs):
-                result = action_registry.execute(
+                return self._enqueue(
                     action_name,
-                    alert.to_dict(),
-                    {"source": "alertmanager", "raw_payload": payload}
+                    alert_dict,
+                    {"source": "alertmanager", "raw_payload": payload},
+                    group_key=alert_group_key(action_name, alert_dict),
                 )
 
-            return jsonify(result.to_dict())
-
         @self.app.route("/webhook/manual", methods=["POST"])
         def manual_trigger():
             """
@@ -390,7 +436,7 @@ class WebhookServer:
 
             span_attrs = _messaging_attrs(
                 "manual", action_name, "receive",
-                body_size=len(json.dumps(data)),
+                body_size=request.content_length,
             )
             with _span("webhook.manual receive", span_attrs):
                 result = action_registry.execute(action_name, payload, context)
@@ -402,4 +448,10 @@ class WebhookServer:
         logger.info(f"Starting Rabbit webhook server on {self.host}:{self.port}")
         logger.info(f"Registered actions: {[a['name'] for a in action_registry.list_actions()]}")
 
-        self.app.run(host=self.host, port=self.port, debug=debug)
+        # Runs left unfinished by a previous server can never complete now
+        recover_interrupted_runs()
+        self.jobs.start()
+        try:
+            self.app.run(host=self.host, port=self.port, debug=debug, threaded=True)
+        finally:
+            self.jobs.stop(timeout=5.0)
@@ -0,0 +1,367 @@
+"""
+Workflow run store for Rabbit.
+
+Persists Beaver workflow run records so status polling and history survive
+server restarts. Two backends:
+
+- InMemoryRunStore: process-local dict (tests, ephemeral deployments)
+- SQLiteRunStore: embedded SQLite file with indexes on project_id and
+  started_at, so status reads are primary-key lookups and history queries
+  are index range scans with LIMIT/OFFSET paging.
+
+The active store is chosen by RABBIT_RUN_STORE:
+    unset        -> ~/.contextcore/rabbit/runs.db
+    ":memory:"   -> InMemoryRunStore
+    <path>       -> SQLiteRunStore at <path>
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = "~/.contextcore/rabbit/runs.db"
+
+# Statuses that mean the run is no longer executing and may be compacted.
+TERMINAL_STATUSES = ("completed", "failed")
+
+# Run fields stored as columns; anything else in a run record is rejected.
+_COLUMNS = (
+    "run_id",
+    "project_id",
+    "dry_run",
+    "status",
+    "started_at",
+    "completed_at",
+    "steps_total",
+    "steps_completed",
+    "error",
+    "result",
+)
+
+
+class RunStore(ABC):
+    """Storage interface for workflow run records (plain dicts keyed by run_id)."""
+
+    @abstractmethod
+    def create(self, run: Dict[str, Any]) -> None:
+        """Insert a new run record."""
+
+    @abstractmethod
+    def update(self, run_id: str, **fields: Any) -> None:
+        """Update fields on an existing run."""
+
+    @abstractmethod
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a run by id, or None."""
+
+    @abstractmethod
+    def history(
+        self,
+        project_id: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Most recent runs first, optionally filtered by project.
+
+        Returns:
+            (page of runs, total runs matching the filter)
+        """
+
+    @abstractmethod
+    def compact(
+        self,
+        max_age: Optional[timedelta] = None,
+        max_runs: Optional[int] = None,
+    ) -> int:
+        """
+        Apply retention to finished runs.
+
+        Args:
+            max_age: Delete finished runs that completed longer ago than this
+            max_runs: Keep at most this many finished runs (newest first)
+
+        Returns:
+            Number of runs deleted
+        """
+
+    @abstractmethod
+    def mark_interrupted(self) -> int:
+        """Fail runs left non-terminal by a previous process. Returns the count."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemoryRunStore(RunStore):
+    """Process-local run store. State is lost on restart."""
+
+    def __init__(self):
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, run: Dict[str, Any]) -> None:
+        with self._lock:
+            self._runs[run["run_id"]] = dict(run)
+
+    def update(self, run_id: str, **fields: Any) -> None:
+        with self._lock:
+            if run_id in self._runs:
+                self._runs[run_id].update(fields)
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            run = self._runs.get(run_id)
+            return dict(run) if run else None
+
+    def history(
+        self,
+        project_id: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        with self._lock:
+            runs = [
+                dict(r) for r in self._runs.values()
+                if not project_id or r.get("project_id") == project_id
+            ]
+        runs.sort(key=lambda r: r.get("started_at") or "", reverse=True)
+        return runs[offset:offset + limit], len(runs)
+
+    def compact(
+        self,
+        max_age: Optional[timedelta] = None,
+        max_runs: Optional[int] = None,
+    ) -> int:
+        with self._lock:
+            finished = sorted(
+                (r for r in self._runs.values() if r.get("status") in TERMINAL_STATUSES),
+                key=lambda r: r.get("completed_at") or "",
+                reverse=True,
+            )
+            doomed = set()
+            if max_age is not None:
+                cutoff = (datetime.now() - max_age).isoformat()
+                doomed.update(
+                    r["run_id"] for r in finished if (r.get("completed_at") or "") < cutoff
+                )
+            if max_runs is not None:
+                doomed.update(r["run_id"] for r in finished[max_runs:])
+            for run_id in doomed:
+                del self._runs[run_id]
+            return len(doomed)
+
+    def mark_interrupted(self) -> int:
+        # Nothing survives a restart, so nothing can be left interrupted.
+        return 0
+
+    def close(self) -> None:
+        # Nothing to release.
+        return None
+
+
+class SQLiteRunStore(RunStore):
+    """
+    Embedded SQLite run store.
+
+    A single connection is shared across threads behind a lock; WAL mode lets
+    other processes (e.g. a CLI reading history) read while the server writes.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS workflow_runs (
+            run_id          TEXT PRIMARY KEY,
+            project_id      TEXT NOT NULL,
+            dry_run         INTEGER NOT NULL DEFAULT 0,
+            status          TEXT NOT NULL,
+            started_at      TEXT,
+            completed_at    TEXT,
+            steps_total     INTEGER NOT NULL DEFAULT 0,
+            steps_completed INTEGER NOT NULL DEFAULT 0,
+            error           TEXT,
+            result          TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_started_at
+            ON workflow_runs (started_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_runs_project_started
+            ON workflow_runs (project_id, started_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_runs_completed_at
+            ON workflow_runs (completed_at);
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            resolved = Path(os.path.expanduser(path))
+            resolved.parent.mkdir(parents=True, exist_ok=True)
+            path = str(resolved)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self._SCHEMA)
+
+    @staticmethod
+    def _to_row(fields: Dict[str, Any]) -> Dict[str, Any]:
+        unknown = set(fields) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown run fields: {sorted(unknown)}")
+        row = dict(fields)
+        if "dry_run" in row:
+            row["dry_run"] = int(bool(row["dry_run"]))
+        if "result" in row and row["result"] is not None:
+            row["result"] = json.dumps(row["result"])
+        return row
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        run = dict(row)
+        run["dry_run"] = bool(run["dry_run"])
+        if run.get("result") is not None:
+            run["result"] = json.loads(run["result"])
+        else:
+            run.pop("result", None)
+        return run
+
+    def create(self, run: Dict[str, Any]) -> None:
+        row = self._to_row(run)
+        cols = ", ".join(row)
+        params = ", ".join(f":{c}" for c in row)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO workflow_runs ({cols}) VALUES ({params})", row
+            )
+
+    def update(self, run_id: str, **fields: Any) -> None:
+        if not fields:
+            return
+        row = self._to_row(fields)
+        assignments = ", ".join(f"{c} = :{c}" for c in row)
+        row["_run_id"] = run_id
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE workflow_runs SET {assignments} WHERE run_id = :_run_id", row
+            )
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM workflow_runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def history(
+        self,
+        project_id: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        where, params = "", []
+        if project_id:
+            where, params = "WHERE project_id = ?", [project_id]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM workflow_runs {where} "
+                "ORDER BY started_at DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM workflow_runs {where}", params
+            ).fetchone()[0]
+        return [self._from_row(r) for r in rows], total
+
+    def compact(
+        self,
+        max_age: Optional[timedelta] = None,
+        max_runs: Optional[int] = None,
+    ) -> int:
+        terminal = ", ".join("?" for _ in TERMINAL_STATUSES)
+        deleted = 0
+        with self._lock:
+            if max_age is not None:
+                cutoff = (datetime.now() - max_age).isoformat()
+                deleted += self._conn.execute(
+                    f"DELETE FROM workflow_runs WHERE status IN ({terminal}) "
+                    "AND completed_at < ?",
+                    (*TERMINAL_STATUSES, cutoff),
+                ).rowcount
+            if max_runs is not None:
+                deleted += self._conn.execute(
+                    f"DELETE FROM workflow_runs WHERE run_id IN ("
+                    f"  SELECT run_id FROM workflow_runs WHERE status IN ({terminal}) "
+                    "   ORDER BY completed_at DESC LIMIT -1 OFFSET ?)",
+                    (*TERMINAL_STATUSES, max_runs),
+                ).rowcount
+            if deleted:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
+
+    def mark_interrupted(self) -> int:
+        terminal = ", ".join("?" for _ in TERMINAL_STATUSES)
+        with self._lock:
+            return self._conn.execute(
+                f"UPDATE workflow_runs SET status = 'failed', "
+                "error = 'Interrupted by Rabbit restart', completed_at = ? "
+                f"WHERE status NOT IN ({terminal})",
+                (datetime.now().isoformat(), *TERMINAL_STATUSES),
+            ).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[RunStore] = None
+_store_lock = threading.Lock()
+
+
+def create_run_store(location: Optional[str] = None) -> RunStore:
+    """Build a run store from a location string (see module docstring)."""
+    location = location or os.environ.get("RABBIT_RUN_STORE") or DEFAULT_STORE_PATH
+    if location == ":memory:":
+        return InMemoryRunStore()
+    return SQLiteRunStore(location)
+
+
+def get_run_store() -> RunStore:
+    """Get the process-wide run store, creating it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = create_run_store()
+        return _store
+
+
+def set_run_store(store: Optional[RunStore]) -> None:
+    """Replace the process-wide run store (None resets to lazy default)."""
+    global _store
+    with _store_lock:
+        _store = store
+
+
+def recover_interrupted_runs() -> int:
+    """
+    Mark runs a previous server left "starting"/"running" as failed.
+
+    Only the server calls this, at startup: no thread will ever finish those
+    runs. Other processes sharing the SQLite file (e.g. a CLI reading
+    history) must not, since the runs may belong to a live server.
+
+    Returns:
+        Number of runs marked failed
+    """
+    interrupted = get_run_store().mark_interrupted()
+    if interrupted:
+        logger.warning(f"Marked {interrupted} interrupted workflow run(s) as failed")
+    return interrupted
@@ -0,0 +1,225 @@
+"""Tests for the Rabbit job queue."""
+
+import threading
+import time
+
+import pytest
+from contextcore_rabbit.action import Action, ActionRegistry, ActionResult, ActionStatus
+from contextcore_rabbit.jobs import JobQueue, JobStatus, QueueFullError, alert_group_key
+
+
+class Gate:
+    """Actions that block until released and record what ran."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.ran = []
+        self.started = threading.Semaphore(0)
+        self._lock = threading.Lock()
+
+    def action(self, name, blocking=True):
+        gate = self
+
+        class GatedAction(Action):
+            def execute(self, payload, context):
+                gate.started.release()
+                if blocking:
+                    gate.release.wait(5)
+                with gate._lock:
+                    gate.ran.append((name, payload.get("n")))
+                return ActionResult(status=ActionStatus.SUCCESS, action_name=name)
+
+        return GatedAction
+
+
+@pytest.fixture
+def gate():
+    gate = Gate()
+    yield gate
+    gate.release.set()
+
+
+def _registry(gate, **blocking):
+    registry = ActionRegistry()
+    for name, blocks in blocking.items():
+        registry.register_class(name, gate.action(name, blocks))
+    return registry
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _alert(status="firing", fingerprint="abc", **labels):
+    return {"name": "HighLatency", "status": status, "fingerprint": fingerprint, "labels": labels}
+
+
+class TestGroupKey:
+    def test_status_is_part_of_the_key(self):
+        assert alert_group_key("log", _alert("firing")) != alert_group_key("log", _alert("resolved"))
+
+    def test_without_fingerprint_volatile_labels_are_ignored(self):
+        a = _alert(fingerprint=None, service="api")
+        b = _alert(fingerprint=None, service="api", rabbit_action="log")
+        assert alert_group_key("log", a) == alert_group_key("log", b)
+
+
+class TestCoalescing:
+    def test_queued_job_absorbs_duplicates(self, gate):
+        jobs = JobQueue(_registry(gate, slow=True), workers=1)
+        blocker = jobs.submit("slow", {"n": 0})
+        gate.started.acquire(timeout=5)  # the only worker is busy
+
+        first = jobs.submit("slow", {"n": 1}, group_key="slow:firing:abc")
+        second = jobs.submit("slow", {"n": 2}, group_key="slow:firing:abc")
+
+        assert second.deduplicated
+        assert second.job is first.job
+        assert first.job.coalesced == 1
+        assert first.job.payload["grouped_alerts"] == [{"n": 2}]
+        gate.release.set()
+        jobs.join()
+        assert gate.ran == [("slow", 0), ("slow", 1)]
+        assert blocker.job.status == JobStatus.COMPLETED
+        jobs.stop()
+
+    def test_resolved_does_not_join_firing_job(self, gate):
+        jobs = JobQueue(_registry(gate, slow=True), workers=1)
+        jobs.submit("slow", {"n": 0})
+        gate.started.acquire(timeout=5)
+
+        firing = jobs.submit("slow", {"n": 1}, group_key=alert_group_key("slow", _alert("firing")))
+        resolved = jobs.submit("slow", {"n": 2}, group_key=alert_group_key("slow", _alert("resolved")))
+
+        assert not resolved.deduplicated
+        assert resolved.job is not firing.job
+        gate.release.set()
+        jobs.join()
+        assert [n for _, n in gate.ran] == [0, 1, 2]
+        jobs.stop()
+
+    def test_running_job_does_not_absorb_new_alerts(self, gate):
+        jobs = JobQueue(_registry(gate, slow=True), workers=1)
+        first = jobs.submit("slow", {"n": 1}, group_key="slow:firing:abc")
+        gate.started.acquire(timeout=5)  # first is running
+
+        second = jobs.submit("slow", {"n": 2}, group_key="slow:firing:abc")
+
+        assert not second.deduplicated
+        assert second.job is not first.job
+        gate.release.set()
+        jobs.join()
+        assert [n for _, n in gate.ran] == [1, 2]
+        jobs.stop()
+
+    def test_finished_job_does_not_absorb_new_alerts(self, gate):
+        jobs = JobQueue(_registry(gate, fast=False), workers=1)
+        first = jobs.submit("fast", {"n": 1}, group_key="fast:firing:abc")
+        jobs.join()
+
+        second = jobs.submit("fast", {"n": 2}, group_key="fast:firing:abc")
+        jobs.join()
+
+        assert second.job is not first.job
+        assert gate.ran == [("fast", 1), ("fast", 2)]
+        jobs.stop()
+
+
+class TestActionLimits:
+    def test_saturated_action_does_not_block_other_actions(self, gate):
+        jobs = JobQueue(_registry(gate, slow=True, fast=False), workers=2,
+                        action_limits={"slow": 1})
+        for n in range(5):
+            jobs.submit("slow", {"n": n})
+        # Admission is decided at submit time, so the order is already fixed
+        assert jobs.stats()["deferred"] == 4
+        gate.started.acquire(timeout=5)
+
+        fast = jobs.submit("fast", {"n": 99})
+
+        _wait_for(lambda: fast.job.status == JobStatus.COMPLETED)
+        assert jobs.stats()["deferred"] == 4
+        gate.release.set()
+        jobs.join()
+        assert [n for name, n in gate.ran if name == "slow"] == [0, 1, 2, 3, 4]
+        assert jobs.stats()["deferred"] == 0
+        jobs.stop()
+
+    def test_limited_action_runs_in_submission_order(self, gate):
+        # Several idle workers used to race for the single slot
+        jobs = JobQueue(_registry(gate, notify=False), workers=4, action_limits={"notify": 1})
+        for n in range(20):
+            jobs.submit("notify", {"n": n})
+        jobs.join()
+        jobs.stop()
+        assert [n for _, n in gate.ran] == list(range(20))
+
+    def test_limit_caps_concurrency(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        class Counting(Action):
+            def execute(self, payload, context):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+                return ActionResult(status=ActionStatus.SUCCESS, action_name="count")
+
+        registry = ActionRegistry()
+        registry.register_class("count", Counting)
+        jobs = JobQueue(registry, workers=6, action_limits={"count": 2})
+        for n in range(10):
+            jobs.submit("count", {"n": n})
+        jobs.join()
+        jobs.stop()
+
+        assert peak[0] == 2
+        assert jobs.stats()["jobs"]["completed"] == 10
+
+
+class TestQueueFull:
+    def test_submit_raises_when_full(self, gate):
+        jobs = JobQueue(_registry(gate, slow=True), workers=1, max_queue_size=2)
+        jobs.submit("slow", {"n": 0})
+        gate.started.acquire(timeout=5)
+        jobs.submit("slow", {"n": 1})
+        jobs.submit("slow", {"n": 2})
+
+        with pytest.raises(QueueFullError):
+            jobs.submit("slow", {"n": 3})
+
+    def test_parked_jobs_count_as_pending(self, gate):
+        jobs = JobQueue(_registry(gate, slow=True), workers=2, max_queue_size=2,
+                        action_limits={"slow": 1})
+        jobs.submit("slow", {"n": 0})
+        gate.started.acquire(timeout=5)
+        jobs.submit("slow", {"n": 1})
+        jobs.submit("slow", {"n": 2})
+        assert jobs.stats()["deferred"] == 2
+
+        with pytest.raises(QueueFullError):
+            jobs.submit("slow", {"n": 3})
+
+    def test_webhook_returns_503_when_full(self, gate, monkeypatch):
+        pytest.importorskip("flask")
+        from contextcore_rabbit import server as server_module
+
+        registry = _registry(gate, slow=True)
+        monkeypatch.setattr(server_module, "action_registry", registry)
+        jobs = JobQueue(registry, workers=1, max_queue_size=1)
+        server = server_module.WebhookServer(job_queue=jobs)
+        client = server.app.test_client()
+
+        assert client.post("/trigger", json={"action": "slow", "payload": {"n": 0}}).status_code == 202
+        gate.started.acquire(timeout=5)
+        assert client.post("/trigger", json={"action": "slow", "payload": {"n": 1}}).status_code == 202
+        response = client.post("/trigger", json={"action": "slow", "payload": {"n": 2}})
+
+        assert response.status_code == 503
+        assert "full" in response.get_json()["error"]
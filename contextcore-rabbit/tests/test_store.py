@@ -0,0 +1,186 @@
+"""Tests for the workflow run stores and their retention."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from contextcore_rabbit import store as store_module
+from contextcore_rabbit.store import (
+    InMemoryRunStore,
+    SQLiteRunStore,
+    create_run_store,
+    get_run_store,
+    recover_interrupted_runs,
+    set_run_store,
+)
+
+
+def _run(run_id, project="p1", status="completed", started=0, completed=None, **extra):
+    base = datetime(2026, 1, 1)
+    run = {
+        "run_id": run_id,
+        "project_id": project,
+        "dry_run": False,
+        "status": status,
+        "started_at": (base + timedelta(minutes=started)).isoformat(),
+        "completed_at": completed,
+        "steps_total": 0,
+        "steps_completed": 0,
+        "error": None,
+    }
+    run.update(extra)
+    return run
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        s = InMemoryRunStore()
+    else:
+        s = SQLiteRunStore(str(tmp_path / "runs.db"))
+    yield s
+    s.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_default_store():
+    yield
+    set_run_store(None)
+
+
+class TestRunStore:
+    def test_create_get_update(self, store):
+        store.create(_run("a", status="starting"))
+        store.update("a", status="completed", steps_completed=3, result={"ok": True})
+
+        run = store.get("a")
+        assert run["status"] == "completed"
+        assert run["steps_completed"] == 3
+        assert run["result"] == {"ok": True}
+        assert run["dry_run"] is False
+        assert store.get("missing") is None
+
+    def test_history_newest_first_with_paging(self, store):
+        for i in range(5):
+            store.create(_run(f"r{i}", project="p1" if i % 2 else "p2", started=i))
+
+        page, total = store.history(limit=2)
+        assert [r["run_id"] for r in page] == ["r4", "r3"]
+        assert total == 5
+
+        page, total = store.history(limit=2, offset=2)
+        assert [r["run_id"] for r in page] == ["r2", "r1"]
+
+        page, total = store.history(project_id="p1")
+        assert [r["run_id"] for r in page] == ["r3", "r1"]
+        assert total == 2
+
+    def test_compact_by_age_keeps_active_runs(self, store):
+        old = (datetime.now() - timedelta(days=40)).isoformat()
+        recent = datetime.now().isoformat()
+        store.create(_run("old", completed=old))
+        store.create(_run("recent", completed=recent))
+        store.create(_run("running", status="running"))
+
+        assert store.compact(max_age=timedelta(days=30)) == 1
+        assert store.get("old") is None
+        assert store.get("recent") is not None
+        assert store.get("running") is not None
+
+    def test_compact_by_count_keeps_newest_finished(self, store):
+        for i in range(4):
+            store.create(_run(f"r{i}", completed=f"2026-01-0{i + 1}T00:00:00"))
+        store.create(_run("running", status="running"))
+
+        assert store.compact(max_runs=2) == 2
+        page, total = store.history()
+        assert {r["run_id"] for r in page} == {"r2", "r3", "running"}
+        assert total == 3
+
+
+class TestSQLiteRunStore:
+    def test_runs_survive_reopen(self, tmp_path):
+        path = str(tmp_path / "runs.db")
+        first = SQLiteRunStore(path)
+        first.create(_run("a"))
+        first.close()
+
+        second = SQLiteRunStore(path)
+        assert second.get("a")["project_id"] == "p1"
+        second.close()
+
+    def test_unknown_fields_rejected(self, tmp_path):
+        store = SQLiteRunStore(str(tmp_path / "runs.db"))
+        with pytest.raises(ValueError):
+            store.create(_run("a", bogus=1))
+        store.close()
+
+
+class TestInterruptedRuns:
+    def _orphan(self, path):
+        crashed = SQLiteRunStore(path)
+        crashed.create(_run("orphan", status="running"))
+        crashed.create(_run("queued", status="starting"))
+        crashed.create(_run("done", completed="2026-01-01T00:00:00"))
+        crashed.close()
+
+    def _check(self, store):
+        assert store.get("orphan")["status"] == "failed"
+        assert store.get("orphan")["error"] == "Interrupted by Rabbit restart"
+        assert store.get("queued")["status"] == "failed"
+        assert store.get("done")["status"] == "completed"
+
+    def test_opening_the_store_leaves_runs_alone(self, tmp_path, monkeypatch):
+        # e.g. a CLI reading history while a server is running
+        path = str(tmp_path / "runs.db")
+        self._orphan(path)
+        monkeypatch.setenv("RABBIT_RUN_STORE", path)
+
+        assert get_run_store().get("orphan")["status"] == "running"
+        set_run_store(create_run_store(path))
+        assert get_run_store().get("queued")["status"] == "starting"
+
+    def test_recover_marks_interrupted(self, tmp_path):
+        path = str(tmp_path / "runs.db")
+        self._orphan(path)
+        set_run_store(create_run_store(path))
+
+        assert recover_interrupted_runs() == 2
+        self._check(get_run_store())
+
+    def test_server_startup_recovers(self, tmp_path, monkeypatch):
+        pytest.importorskip("flask")
+        from contextcore_rabbit.server import WebhookServer
+
+        path = str(tmp_path / "runs.db")
+        self._orphan(path)
+        set_run_store(create_run_store(path))
+        server = WebhookServer()
+        monkeypatch.setattr(server.app, "run", lambda **kwargs: None)
+
+        server.run()
+
+        self._check(get_run_store())
+
+
+class TestQueuedRuns:
+    def test_queued_run_sorts_with_recent_history(self, monkeypatch):
+        from contextcore_rabbit.actions import beaver_workflow
+
+        store = InMemoryRunStore()
+        store.create(_run("earlier", started=0))
+        set_run_store(store)
+        monkeypatch.setattr(beaver_workflow._workflow_executor, "submit", lambda *a: None)
+
+        result = beaver_workflow.BeaverWorkflowAction().execute({"project_id": "p1"}, {})
+
+        page, _ = store.history()
+        assert page[0]["run_id"] == result.data["run_id"]
+        assert page[0]["status"] == "starting"
+        assert page[0]["started_at"] is not None
+
+
+def test_default_location_is_sqlite(monkeypatch, tmp_path):
+    monkeypatch.setattr(store_module, "DEFAULT_STORE_PATH", str(tmp_path / "runs.db"))
+    monkeypatch.delenv("RABBIT_RUN_STORE", raising=False)
+    assert isinstance(create_run_store(), SQLiteRunStore)
+    assert isinstance(create_run_store(":memory:"), InMemoryRunStore)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Per-check cost of BudgetTracker as consumption records accumulate.
+
+Records N consumption entries across a few budgets and phases, then times
+get_remaining() + get_phase_consumed() calls against the running-total
+ledger and against a full scan of the record list (the previous
+implementation). Ledger cost should stay flat as N grows; the scan grows
+linearly.
+
+Usage:
+    python3 scripts/benchmarks/bench_budget_ledger.py
+    python3 scripts/benchmarks/bench_budget_ledger.py --sizes 100 10000 100000 --checks 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+from contextcore.contracts.budget.schema import BudgetPropagationSpec
+from contextcore.contracts.budget.tracker import BUDGET_KEY, BudgetTracker
+
+BUDGETS = ["latency", "tokens", "cost"]
+PHASES = ["plan", "design", "implement", "test", "review"]
+
+
+def _contract() -> BudgetPropagationSpec:
+    return BudgetPropagationSpec.model_validate({
+        "schema_version": "0.1.0",
+        "contract_type": "budget_propagation",
+        "pipeline_id": "bench",
+        "budgets": [
+            {
+                "budget_id": b,
+                "budget_type": "latency_ms",
+                "total": 1e12,
+                "allocations": [{"phase": p, "amount": 1e11} for p in PHASES],
+            }
+            for b in BUDGETS
+        ],
+    })
+
+
+def _scan_check(context, budget_id, phase) -> float:
+    records = context.get(BUDGET_KEY, [])
+    total = sum(r["consumed"] for r in records if r["budget_id"] == budget_id)
+    in_phase = sum(
+        r["consumed"] for r in records
+        if r["budget_id"] == budget_id and r["phase"] == phase
+    )
+    return total + in_phase
+
+
+def _time_per_check(fn, checks: int) -> float:
+    start = time.perf_counter()
+    for i in range(checks):
+        fn(BUDGETS[i % len(BUDGETS)], PHASES[i % len(PHASES)])
+    return (time.perf_counter() - start) / checks * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BudgetTracker check cost")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--checks", type=int, default=1000)
+    args = parser.parse_args()
+
+    contract = _contract()
+    tracker = BudgetTracker()
+
+    print(f"{'records':>10} {'ledger us/check':>16} {'scan us/check':>14}")
+    for size in args.sizes:
+        context: dict = {}
+        for i in range(size):
+            tracker.record(context, BUDGETS[i % len(BUDGETS)], PHASES[i % len(PHASES)], 1.5)
+
+        ledger_us = _time_per_check(
+            lambda b, p, context=context: tracker.get_remaining(contract, context, b)
+            + tracker.get_phase_consumed(context, b, p),
+            args.checks,
+        )
+        scan_checks = max(1, min(args.checks, 2_000_000 // max(size, 1)))
+        scan_us = _time_per_check(
+            lambda b, p, context=context: _scan_check(context, b, p), scan_checks
+        )
+        print(f"{size:>10} {ledger_us:>16.2f} {scan_us:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for demo telemetry replay.
+
+Starts a local OTLP/gRPC trace receiver and a local Loki-compatible push
+endpoint in-process, writes a synthetic spans/logs file in the format
+produced by ``contextcore demo generate``, then replays both through
+``contextcore.demo.replay`` and reports items/second.
+
+Usage:
+    python3 scripts/benchmarks/bench_demo_replay.py
+    python3 scripts/benchmarks/bench_demo_replay.py --spans 200000 --workers 8 --chunk-size 2000
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+import threading
+import time
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+import grpc
+from opentelemetry.proto.collector.trace.v1 import trace_service_pb2, trace_service_pb2_grpc
+
+from contextcore.demo.replay import LokiPusher, SpanReplayer
+
+
+class _CountingTraceService(trace_service_pb2_grpc.TraceServiceServicer):
+    def __init__(self):
+        self.spans = 0
+        self._lock = threading.Lock()
+
+    def Export(self, request, context):
+        n = sum(len(ss.spans) for rs in request.resource_spans for ss in rs.scope_spans)
+        with self._lock:
+            self.spans += n
+        return trace_service_pb2.ExportTraceServiceResponse()
+
+
+class _LokiHandler(BaseHTTPRequestHandler):
+    received = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        payload = json.loads(body)
+        n = sum(len(s["values"]) for s in payload["streams"])
+        with _LokiHandler.lock:
+            _LokiHandler.received += n
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _write_fixtures(directory: Path, span_count: int, spans_per_trace: int):
+    base_ns = time.time_ns() - 90 * 24 * 3600 * 10**9
+    spans = []
+    for i in range(span_count):
+        trace = i // spans_per_trace
+        root = i % spans_per_trace == 0
+        span = {
+            "name": f"task:T-{i}",
+            "trace_id": f"{trace + 1:032x}",
+            "span_id": f"{i + 1:016x}",
+            "start_time_ns": base_ns + i * 10**9,
+            "end_time_ns": base_ns + i * 10**9 + 3600 * 10**9,
+            "status": {"status_code": "OK", "description": None},
+            "kind": "INTERNAL",
+            "attributes": {
+                "task.id": f"T-{i}",
+                "task.type": "task",
+                "task.status": "done",
+                "task.story_points": 3,
+                "project.id": "bench",
+            },
+            "events": [{"name": "task.status_changed", "timestamp_ns": base_ns + i * 10**9, "attributes": {"to": "done"}}],
+            "resource": {"service.name": f"svc-{trace % 11}", "project.id": "bench"},
+        }
+        if not root:
+            span["parent_span_id"] = f"{trace * spans_per_trace + 1:016x}"
+        spans.append(span)
+
+    logs = [
+        {
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "service": f"svc-{i % 11}",
+            "project_id": "bench",
+            "event": "task.status_changed",
+            "task_id": f"T-{i}",
+            "message": "status changed to done " + "x" * 80,
+        }
+        for i in range(span_count)
+    ]
+
+    spans_file = directory / "spans.json"
+    logs_file = directory / "logs.json"
+    spans_file.write_text(json.dumps({"span_count": len(spans), "spans": spans}, indent=2))
+    logs_file.write_text(json.dumps({"log_count": len(logs), "logs": logs}, indent=2))
+    return spans_file, logs_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark demo telemetry replay")
+    parser.add_argument("--spans", type=int, default=50000, help="Synthetic spans (and logs) to replay")
+    parser.add_argument("--spans-per-trace", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-bytes", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    service = _CountingTraceService()
+    grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=args.workers * 2))
+    trace_service_pb2_grpc.add_TraceServiceServicer_to_server(service, grpc_server)
+    grpc_port = grpc_server.add_insecure_port("127.0.0.1:0")
+    grpc_server.start()
+
+    http_server = ThreadingHTTPServer(("127.0.0.1", 0), _LokiHandler)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    loki_url = f"http://127.0.0.1:{http_server.server_address[1]}/loki/api/v1/push"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spans_file, logs_file = _write_fixtures(Path(tmp), args.spans, args.spans_per_trace)
+
+        replayer = SpanReplayer(f"127.0.0.1:{grpc_port}", chunk_size=args.chunk_size, workers=args.workers)
+        span_stats = replayer.replay_file(str(spans_file), shift_to_now=True)
+        replayer.shutdown()
+
+        pusher = LokiPusher(loki_url, max_batch_bytes=args.batch_bytes, workers=args.workers)
+        log_stats = pusher.push_file(str(logs_file))
+        pusher.close()
+
+    grpc_server.stop(0)
+    http_server.shutdown()
+
+    print(f"spans: {span_stats.items_sent} sent / {service.spans} received, "
+          f"{span_stats.requests} requests, {span_stats.items_per_second:,.0f} spans/s")
+    print(f"logs:  {log_stats.items_sent} sent / {_LokiHandler.received} received, "
+          f"{log_stats.requests} requests, {log_stats.items_per_second:,.0f} logs/s, "
+          f"{log_stats.bytes_sent / 1e6:.1f} MB on the wire")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Reconcile storm benchmark for the ContextCore operator.
+
+Fires a burst of create/update events for many ProjectContexts across a few
+namespaces at the async kopf handlers, against an in-memory Kubernetes API
+stub that sleeps for a fixed latency per call. Reports wall time, API calls
+made, coalesced reconciles and p50/p99 handler latency, compared with
+running the same events through reconcile_artifacts() one at a time.
+
+Usage:
+    python3 scripts/benchmarks/bench_operator_storm.py
+    python3 scripts/benchmarks/bench_operator_storm.py --objects 200 --updates 5 --api-latency-ms 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+from contextcore import operator
+
+
+class _StubKubeApi:
+    """CoreV1Api/CustomObjectsApi stand-in with fixed per-call latency."""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self, body):
+        time.sleep(self.latency_s)
+        with self._lock:
+            self.calls += 1
+        return body
+
+    def patch_namespaced_config_map(self, name, namespace, body, **kwargs):
+        return self._call(body)
+
+    def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):
+        return self._call(body)
+
+
+class _NoopTracer:
+    @contextmanager
+    def trace_action(self, **_):
+        yield None
+
+
+def _body(namespace: str, name: str, revision: int) -> dict:
+    return {
+        "apiVersion": "contextcore.io/v1",
+        "kind": "ProjectContext",
+        "metadata": {"name": name, "namespace": namespace, "uid": f"uid-{namespace}-{name}"},
+        "spec": {
+            "project": {"id": name},
+            "business": {"criticality": "high", "owner": "bench"},
+            "targets": [{"kind": "Deployment", "name": name}],
+            "observability": {"alertChannels": [f"rev-{revision}"]},
+        },
+    }
+
+
+def _events(objects: int, updates: int, namespaces: int):
+    for revision in range(updates + 1):
+        for i in range(objects):
+            yield f"ns{i % namespaces}", f"cr{i}", revision
+
+
+def _sequential(events) -> float:
+    start = time.perf_counter()
+    for namespace, name, revision in events:
+        operator.reconcile_artifacts(
+            _body(namespace, name, revision), namespace, name, {}, force=revision == 0
+        )
+    return time.perf_counter() - start
+
+
+async def _storm(events) -> tuple:
+    latencies = []
+
+    async def handle(namespace, name, revision):
+        handler = operator.on_create if revision == 0 else operator.on_update
+        start = time.perf_counter()
+        await handler(body=_body(namespace, name, revision), namespace=namespace, name=name, patch={})
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handle(*event) for event in events))
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark operator reconcile under a CR storm")
+    parser.add_argument("--objects", type=int, default=100, help="ProjectContexts in the storm")
+    parser.add_argument("--updates", type=int, default=4, help="Updates per object after create")
+    parser.add_argument("--namespaces", type=int, default=10)
+    parser.add_argument("--api-latency-ms", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--namespace-concurrency", type=int, default=4)
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    os.environ["CONTEXTCORE_OPERATOR_MAX_CONCURRENCY"] = str(args.concurrency)
+    os.environ["CONTEXTCORE_OPERATOR_NAMESPACE_CONCURRENCY"] = str(args.namespace_concurrency)
+    operator.get_tracer = lambda: _NoopTracer()
+    events = list(_events(args.objects, args.updates, args.namespaces))
+
+    print(f"{len(events)} events, {args.objects} objects, {args.namespaces} namespaces, "
+          f"{args.api_latency_ms:.1f} ms per API call")
+
+    if not args.skip_sequential:
+        api = _StubKubeApi(args.api_latency_ms / 1000)
+        operator._core_api = operator._custom_api = api
+        elapsed = _sequential(events)
+        print(f"sequential: {elapsed:.2f}s, {api.calls} API calls")
+
+    api = _StubKubeApi(args.api_latency_ms / 1000)
+    operator._core_api = operator._custom_api = api
+    elapsed, latencies = asyncio.run(_storm(events))
+    stats = operator.get_reconcile_queue().stats()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"queued:     {elapsed:.2f}s, {api.calls} API calls, "
+          f"{stats['completed']} reconciles, {stats['coalesced']} coalesced, "
+          f"p50 {p50:.0f} ms, p99 {p99:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
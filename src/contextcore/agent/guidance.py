@@ -3,18 +3,36 @@ Human-to-Agent Guidance
 
 Read human direction from ProjectContext CRD and respond to questions.
 Guidance persists across agent sessions.
+
+GuidanceReader caches parsed guidance and keeps it fresh without re-reading
+the CRD on every call:
+
+- Kubernetes source with ``watch=True``: a background watch on the
+  ProjectContext delivers each new resourceVersion; reads stay in memory.
+- File source (``context_path``): the ProjectContext manifest is re-parsed
+  only when its mtime or size changes.
+
+Constraint scopes are compiled into a ScopeMatcher when guidance is loaded,
+so checking a batch of paths is a single regex pass per path.
 """
 
 from __future__ import annotations
 
+import logging
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
 
 from kubernetes import client, config
+from kubernetes import watch as k8s_watch
 
 from contextcore.agent.insights import Evidence, InsightEmitter, InsightType, InsightAudience
+from contextcore.utils.scope_matcher import ScopeMatcher
+
+logger = logging.getLogger(__name__)
 
 
 class ConstraintSeverity(str, Enum):
@@ -119,6 +137,16 @@ class GuidanceReader:
         for q in questions:
             if q.priority == QuestionPriority.CRITICAL:
                 print(f"CRITICAL: {q.question}")
+
+        # Keep guidance fresh via a resourceVersion watch
+        reader = GuidanceReader(project_id="checkout-service", watch=True)
+        blocked = reader.get_constraints_for_paths(changed_files)
+
+        # Read from an exported ProjectContext manifest (mtime-invalidated)
+        reader = GuidanceReader(
+            project_id="checkout-service",
+            context_path="k8s/projectcontext.yaml",
+        )
     """
 
     def __init__(
@@ -126,9 +154,38 @@ class GuidanceReader:
         project_id: str,
         namespace: str = "default",
         kubeconfig: str | None = None,
+        watch: bool = False,
+        context_path: str | None = None,
     ):
+        """
+        Args:
+            project_id: ProjectContext name
+            namespace: ProjectContext namespace
+            kubeconfig: Path to kubeconfig (defaults to in-cluster, then local)
+            watch: Start a background watch that refreshes the cache whenever
+                the ProjectContext resourceVersion changes
+            context_path: Read the ProjectContext from this YAML file instead of
+                Kubernetes; the cache is refreshed when the file changes
+        """
         self.project_id = project_id
         self.namespace = namespace
+        self.context_path = context_path
+
+        self._lock = threading.Lock()
+        self._cache: AgentGuidance | None = None
+        self._cache_time: datetime | None = None
+        self._scope_matcher: ScopeMatcher | None = None
+        self._resource_version: str | None = None
+        self._file_signature: tuple[int, int] | None = None
+        # Latest object delivered by the watch, parsed on next read
+        self._pending_context: dict[str, Any] | None = None
+        self._watch: k8s_watch.Watch | None = None
+        self._watch_thread: threading.Thread | None = None
+        self._watch_stop = threading.Event()
+
+        if context_path:
+            self.custom_api = None
+            return
 
         # Initialize K8s client
         if kubeconfig:
@@ -140,11 +197,17 @@ class GuidanceReader:
                 config.load_kube_config()
 
         self.custom_api = client.CustomObjectsApi()
-        self._cache: AgentGuidance | None = None
-        self._cache_time: datetime | None = None
+
+        if watch:
+            self.start_watch()
 
     def _get_context(self) -> dict[str, Any]:
-        """Get ProjectContext from K8s."""
+        """Get ProjectContext from K8s (or the local manifest file)."""
+        if self.context_path:
+            import yaml
+
+            with open(self.context_path, encoding="utf-8") as f:
+                return yaml.safe_load(f) or {}
         return self.custom_api.get_namespaced_custom_object(
             group="contextcore.io",
             version="v2",
@@ -153,20 +216,64 @@ class GuidanceReader:
             name=self.project_id,
         )
 
+    def _stat_context_file(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.context_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def get_guidance(self, refresh: bool = False) -> AgentGuidance:
         """
         Get complete guidance (with caching).
 
+        Cached guidance is reused until the source changes: a new
+        resourceVersion from the watch, or a new mtime/size of the
+        context file. Without a watch, the Kubernetes source is only
+        re-read on ``refresh=True``, and re-parsed only if its
+        resourceVersion changed.
+
         Args:
             refresh: Force refresh from K8s
 
         Returns:
             AgentGuidance with all sections
         """
-        if self._cache is not None and not refresh:
+        with self._lock:
+            pending, self._pending_context = self._pending_context, None
+            if pending is not None:
+                self._load(pending)
+                return self._cache
+
+            if self.context_path:
+                signature = self._stat_context_file()
+                if self._cache is not None and not refresh and signature == self._file_signature:
+                    return self._cache
+                self._load(self._get_context())
+                self._file_signature = signature
+                return self._cache
+
+            if self._cache is not None and not refresh:
+                return self._cache
+
+            context = self._get_context()
+            version = context.get("metadata", {}).get("resourceVersion")
+            if self._cache is None or version is None or version != self._resource_version:
+                self._load(context)
             return self._cache
 
-        context = self._get_context()
+    def _load(self, context: dict[str, Any]) -> None:
+        """Parse a ProjectContext into the cache and rebuild the scope matcher. Caller holds the lock."""
+        self._cache = self._parse_guidance(context)
+        self._cache_time = datetime.now()
+        self._resource_version = context.get("metadata", {}).get("resourceVersion")
+        self._scope_matcher = ScopeMatcher(
+            c.scope for c in self._cache.constraints if c.scope is not None
+        )
+
+    @staticmethod
+    def _parse_guidance(context: dict[str, Any]) -> AgentGuidance:
+        """Build AgentGuidance from a ProjectContext object."""
         guidance_data = context.get("spec", {}).get("agentGuidance", {})
 
         # Parse focus
@@ -222,16 +329,80 @@ class GuidanceReader:
             for c in guidance_data.get("context", [])
         ]
 
-        self._cache = AgentGuidance(
+        return AgentGuidance(
             focus=focus,
             constraints=constraints,
             preferences=preferences,
             questions=questions,
             context=context_items,
         )
-        self._cache_time = datetime.now()
 
-        return self._cache
+    # -------------------------------------------------------------------------
+    # resourceVersion watch
+    # -------------------------------------------------------------------------
+
+    def start_watch(self) -> None:
+        """Start the background ProjectContext watch (idempotent)."""
+        if self.custom_api is None or self._watch_thread is not None:
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            name=f"guidance-watch-{self.project_id}",
+            daemon=True,
+        )
+        self._watch_thread.start()
+
+    def stop_watch(self, timeout: float | None = 5.0) -> None:
+        """Stop the background watch."""
+        self._watch_stop.set()
+        if self._watch is not None:
+            self._watch.stop()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout)
+            self._watch_thread = None
+
+    def _watch_loop(self) -> None:
+        backoff = 1.0
+        while not self._watch_stop.is_set():
+            self._watch = k8s_watch.Watch()
+            try:
+                for event in self._watch.stream(
+                    self.custom_api.list_namespaced_custom_object,
+                    group="contextcore.io",
+                    version="v2",
+                    namespace=self.namespace,
+                    plural="projectcontexts",
+                    field_selector=f"metadata.name={self.project_id}",
+                    resource_version=self._resource_version,
+                    timeout_seconds=300,
+                ):
+                    self._handle_watch_event(event)
+                    backoff = 1.0
+            except client.ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old: resume from a fresh list
+                    self._resource_version = None
+                    continue
+                logger.warning(f"Guidance watch for {self.project_id} failed: {e}")
+            except Exception as e:
+                logger.warning(f"Guidance watch for {self.project_id} failed: {e}")
+            if self._watch_stop.wait(backoff):
+                break
+            backoff = min(backoff * 2, 60.0)
+
+    def _handle_watch_event(self, event: dict[str, Any]) -> None:
+        obj = event.get("object") or {}
+        version = obj.get("metadata", {}).get("resourceVersion")
+        with self._lock:
+            if event.get("type") == "DELETED":
+                self._cache = None
+                self._scope_matcher = None
+                self._pending_context = None
+            elif version != self._resource_version:
+                self._pending_context = obj
+            if version:
+                self._resource_version = version
 
     def get_focus(self) -> Focus | None:
         """Get current focus areas."""
@@ -251,17 +422,37 @@ class GuidanceReader:
         Returns:
             Constraints with matching scope patterns
         """
-        import fnmatch
+        return self.get_constraints_for_paths([path])[path]
+
+    def get_constraints_for_paths(
+        self, paths: Iterable[str]
+    ) -> dict[str, list[Constraint]]:
+        """
+        Resolve a batch of paths against all constraint scopes.
 
-        constraints = []
-        for c in self.get_constraints():
-            if c.scope is None:
-                # No scope means applies everywhere
-                constraints.append(c)
-            elif fnmatch.fnmatch(path, c.scope):
-                constraints.append(c)
+        Args:
+            paths: File or directory paths
 
-        return constraints
+        Returns:
+            Mapping of each path to its constraints, in constraint order
+        """
+        guidance = self.get_guidance()
+        with self._lock:
+            matcher = self._scope_matcher or ScopeMatcher(
+                c.scope for c in guidance.constraints if c.scope is not None
+            )
+        unscoped = [c for c in guidance.constraints if c.scope is None]
+        scoped = [c for c in guidance.constraints if c.scope is not None]
+        order = {id(c): i for i, c in enumerate(guidance.constraints)}
+
+        results: dict[str, list[Constraint]] = {}
+        for path, indices in matcher.match_many(paths).items():
+            # No scope means applies everywhere
+            matched = unscoped + [scoped[i] for i in indices]
+            if unscoped and indices:
+                matched.sort(key=lambda c: order[id(c)])
+            results[path] = matched
+        return results
 
     def check_blocking_constraints(self, path: str) -> list[Constraint]:
         """Get blocking constraints for a path."""
@@ -0,0 +1,197 @@
+"""
+Local index from insight ID to the trace that carries it.
+
+Looking up a single insight in Tempo by searching recent insights and
+scanning the results costs a heavy search per lookup and misses anything
+outside the search limit. InsightEmitter records every emitted insight's
+trace ID here, so InsightQuerier.get() can fetch exactly one trace by ID.
+
+The index is an append-only JSON Lines file shared by every process on the
+host. Each process loads it once and afterwards only reads lines appended
+since its last read, so lookups stay constant-time as the index grows. The
+file is compacted to the newest ``max_entries`` entries once it holds twice
+that many lines.
+
+Usage:
+    from contextcore.agent.insight_index import get_insight_index
+
+    index = get_insight_index()
+    index.record("insight-abc123", "4bf92f3577b34da6a3ce929d0e0e4736", "checkout")
+    entry = index.lookup("insight-abc123")
+    if entry:
+        print(entry.trace_id)
+
+Configuration:
+    CONTEXTCORE_INSIGHT_INDEX: "0" keeps the index in memory only
+    CONTEXTCORE_INSIGHT_INDEX_PATH: index file location
+        (default ~/.contextcore/cache/insight-index.jsonl)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from contextcore.utils.persisted_cache import cache_path, write_atomic
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["InsightIndex", "InsightIndexEntry", "get_insight_index"]
+
+
+
+@dataclass(frozen=True)
+class InsightIndexEntry:
+    """Where an insight was emitted."""
+
+    trace_id: str
+    project_id: str = ""
+
+
+class InsightIndex:
+    """Thread-safe insight ID -> trace ID index backed by a JSON Lines file."""
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 100_000):
+        """
+        Args:
+            path: JSON Lines file to persist entries to (None keeps them in memory)
+            max_entries: Entries kept when the file is compacted
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, InsightIndexEntry] = OrderedDict()
+        self._offset = 0
+        self._lines = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._entries)
+
+    def record(self, insight_id: str, trace_id: str, project_id: str = "") -> None:
+        """Remember which trace carries ``insight_id``."""
+        if not insight_id or not trace_id:
+            return
+        entry = InsightIndexEntry(trace_id=trace_id, project_id=project_id or "")
+        with self._lock:
+            self._refresh()
+            self._remember(insight_id, entry)
+            path = self.path
+            if path is None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                return
+            line = json.dumps(
+                {"id": insight_id, "trace_id": entry.trace_id, "project_id": entry.project_id}
+            ) + "\n"
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "a", encoding="utf-8") as fh:
+                    fh.write(line)
+                # Our own line is already in memory; skip it on the next refresh
+                # unless another process appended in between.
+                if path.stat().st_size == self._offset + len(line.encode("utf-8")):
+                    self._offset += len(line.encode("utf-8"))
+                self._lines += 1
+                if self._lines > 2 * self.max_entries:
+                    self._compact(path)
+            except OSError as e:
+                logger.debug(f"Could not write insight index {path}: {e}")
+
+    def lookup(self, insight_id: str) -> Optional[InsightIndexEntry]:
+        """Trace holding ``insight_id``, or None if it was never recorded here."""
+        with self._lock:
+            entry = self._entries.get(insight_id)
+            if entry is None and self._refresh():
+                entry = self._entries.get(insight_id)
+            return entry
+
+    def clear(self) -> None:
+        """Drop all entries, including the backing file."""
+        with self._lock:
+            self._entries.clear()
+            self._offset = self._lines = 0
+            if self.path is not None:
+                try:
+                    self.path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.debug(f"Could not remove insight index {self.path}: {e}")
+
+    # -- internals ---------------------------------------------------------
+
+    def _remember(self, insight_id: str, entry: InsightIndexEntry) -> None:
+        self._entries.pop(insight_id, None)
+        self._entries[insight_id] = entry
+
+    def _refresh(self) -> bool:
+        """Read lines appended since the last read. Returns True if any were."""
+        if self.path is None:
+            return False
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return False
+        if size < self._offset:
+            # Compacted or replaced by another process: start over.
+            self._entries.clear()
+            self._offset = self._lines = 0
+        if size == self._offset:
+            return False
+        try:
+            with open(self.path, "rb") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read(size - self._offset)
+        except OSError as e:
+            logger.debug(f"Could not read insight index {self.path}: {e}")
+            return False
+        # Leave a partially written trailing line for the next refresh.
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return False
+        for raw in chunk[:end].splitlines():
+            self._lines += 1
+            try:
+                item = json.loads(raw)
+                self._remember(
+                    item["id"],
+                    InsightIndexEntry(item["trace_id"], item.get("project_id", "")),
+                )
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._offset += end
+        return True
+
+    def _compact(self, path: Path) -> None:
+        """Rewrite ``path`` with only the retained entries."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        payload = "".join(
+            json.dumps({"id": k, "trace_id": v.trace_id, "project_id": v.project_id}) + "\n"
+            for k, v in self._entries.items()
+        )
+        write_atomic(path, payload)
+        self._offset = len(payload.encode("utf-8"))
+        self._lines = len(self._entries)
+
+
+_default_index: Optional[InsightIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_insight_index() -> InsightIndex:
+    """Process-wide index, persisted unless CONTEXTCORE_INSIGHT_INDEX=0."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = InsightIndex(
+                cache_path("CONTEXTCORE_INSIGHT_INDEX", "insight-index.jsonl")
+            )
+        return _default_index
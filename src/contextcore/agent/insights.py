@@ -23,12 +23,11 @@ from opentelemetry.trace import SpanKind, Status, StatusCode
 from contextcore.contracts.timeouts import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY_S,
-    DEFAULT_RETRY_BACKOFF,
-    RETRYABLE_HTTP_STATUS_CODES,
-    HTTP_CLIENT_TIMEOUT_S,
     INSIGHT_CACHE_TTL_S,
 )
+from contextcore.agent.insight_index import InsightIndex, get_insight_index
 from contextcore.compat.otel_genai import mapper
+from contextcore.tracing.traceql import get_traceql_client, quote_traceql
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +105,8 @@ class InsightEmitter:
 
     Insights are persisted in Tempo and queryable by other agents and humans.
     Optionally also saves to local JSON files for development without OTel.
+    Every emitted insight's trace ID is recorded in the local insight index
+    so InsightQuerier.get() can fetch it directly.
 
     Example:
         # Production: emit to OTel only
@@ -142,6 +143,7 @@ class InsightEmitter:
         local_storage_path: str | None = None,
         agent_name: str | None = None,
         agent_description: str | None = None,
+        insight_index: InsightIndex | None = None,
     ):
         self.project_id = project_id
         self.agent_id = agent_id
@@ -150,6 +152,7 @@ class InsightEmitter:
         self.local_storage_path = local_storage_path
         self.agent_name = agent_name
         self.agent_description = agent_description
+        self._index = insight_index if insight_index is not None else get_insight_index()
 
     def emit(
         self,
@@ -339,6 +342,9 @@ class InsightEmitter:
             span_context = span.get_span_context()
             trace_id = format(span_context.trace_id, "032x")
 
+        if span_context.is_valid:
+            self._index.record(insight_id, trace_id, self.project_id)
+
         insight = Insight(
             id=insight_id,
             type=insight_type,
@@ -529,6 +535,7 @@ class InsightQuerier:
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY_S,
         cache_ttl_s: float = INSIGHT_CACHE_TTL_S,
+        insight_index: InsightIndex | None = None,
     ):
         """
         Initialize the querier.
@@ -539,12 +546,13 @@ class InsightQuerier:
             max_retries: Maximum number of retry attempts for transient failures
             retry_delay: Initial delay between retries (uses exponential backoff)
             cache_ttl_s: Time-to-live for cached query results in seconds
+            insight_index: ID -> trace index used by get() (default: process-wide index)
         """
         self.tempo_url = tempo_url
         self.local_storage_path = local_storage_path
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._http_client = None
+        self._index = insight_index if insight_index is not None else get_insight_index()
         self._cache: dict[str, tuple[list[Insight], float]] = {}
         self._cache_ttl_s = cache_ttl_s
 
@@ -553,26 +561,16 @@ class InsightQuerier:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close HTTP client."""
+        """Context manager exit - release resources."""
         self.close()
         return False
 
     def close(self) -> None:
-        """Close HTTP client and release resources."""
-        if self._http_client is not None:
-            try:
-                self._http_client.close()
-            except Exception as e:
-                logger.debug(f"Error closing HTTP client: {e}")
-            finally:
-                self._http_client = None
+        """Release resources.
 
-    def _get_http_client(self):
-        """Lazy-load httpx client."""
-        if self._http_client is None:
-            import httpx
-            self._http_client = httpx.Client(timeout=HTTP_CLIENT_TIMEOUT_S)
-        return self._http_client
+        Tempo access goes through the process-wide TraceQL client
+        (contextcore.tracing.traceql), which stays open for other consumers.
+        """
 
     def _build_cache_key(self, **kwargs) -> str:
         """Build a deterministic cache key from query parameters."""
@@ -587,81 +585,12 @@ class InsightQuerier:
         return hashlib.md5(raw.encode()).hexdigest()
 
     def invalidate_cache(self) -> None:
-        """Clear all cached query results."""
+        """Clear all cached query results, including the shared TraceQL responses."""
         self._cache.clear()
+        if self.tempo_url:
+            get_traceql_client(self.tempo_url).clear_cache()
         logger.debug("Insight query cache invalidated")
 
-    def _request_with_retry(
-        self,
-        method: str,
-        url: str,
-        max_retries: int | None = None,
-        **kwargs,
-    ) -> "httpx.Response":
-        """
-        Execute HTTP request with retry logic for transient failures.
-
-        Args:
-            method: HTTP method (get, post, etc.)
-            url: Request URL
-            max_retries: Override default max retries
-            **kwargs: Additional arguments for httpx request
-
-        Returns:
-            httpx.Response object
-
-        Raises:
-            httpx.HTTPStatusError: For non-retryable errors after all retries exhausted
-        """
-        import httpx
-
-        client = self._get_http_client()
-        retries = max_retries if max_retries is not None else self.max_retries
-        delay = self.retry_delay
-        last_error = None
-
-        for attempt in range(retries + 1):
-            try:
-                response = getattr(client, method)(url, **kwargs)
-
-                # Check for retryable status codes
-                if response.status_code in RETRYABLE_HTTP_STATUS_CODES:
-                    if attempt < retries:
-                        logger.warning(
-                            f"Tempo returned {response.status_code} for {url}, "
-                            f"retrying in {delay:.1f}s (attempt {attempt + 1}/{retries + 1})"
-                        )
-                        time_module.sleep(delay)
-                        delay *= DEFAULT_RETRY_BACKOFF
-                        continue
-                    else:
-                        logger.error(
-                            f"Tempo returned {response.status_code} for {url} "
-                            f"after {retries + 1} attempts"
-                        )
-
-                return response
-
-            except (httpx.TimeoutException, httpx.ConnectError) as e:
-                last_error = e
-                if attempt < retries:
-                    logger.warning(
-                        f"Tempo request to {url} failed: {e}, "
-                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{retries + 1})"
-                    )
-                    time_module.sleep(delay)
-                    delay *= DEFAULT_RETRY_BACKOFF
-                else:
-                    logger.error(
-                        f"Tempo request to {url} failed after {retries + 1} attempts: {e}"
-                    )
-                    raise
-
-        # Should not reach here, but handle edge case
-        if last_error:
-            raise last_error
-        raise RuntimeError("Unexpected retry loop exit")
-
     def _parse_time_range(self, time_range: str) -> int:
         """Parse time range string to seconds."""
         import re
@@ -763,6 +692,108 @@ class InsightQuerier:
         self._cache[cache_key] = (results, time_module.time())
         return results
 
+    def get(
+        self,
+        insight_id: str,
+        project_id: str | None = None,
+        time_range: str = "30d",
+    ) -> Insight | None:
+        """
+        Fetch a single insight by ID.
+
+        The trace carrying the insight is taken from the local insight index
+        (maintained by InsightEmitter) and fetched by ID. IDs not in the
+        index are resolved with a TraceQL search on ``insight.id`` limited
+        to one trace, then indexed. Local storage is the fallback when Tempo
+        is disabled, unreachable or does not have the insight.
+
+        Args:
+            insight_id: Insight ID (e.g. "insight-1a2b3c4d5e6f")
+            project_id: Only return the insight if it belongs to this project
+            time_range: Search window for IDs missing from the index
+
+        Returns:
+            The Insight, or None if not found
+        """
+        insight: Insight | None = None
+
+        if self.tempo_url:
+            try:
+                insight = self._get_tempo(insight_id, time_range)
+            except Exception as e:
+                import warnings
+                warnings.warn(f"Tempo lookup failed: {e}. Falling back to local storage.")
+
+        if insight is None and self.local_storage_path:
+            insight = self._get_local(insight_id, project_id)
+
+        if insight is not None and project_id and insight.project_id != project_id:
+            return None
+        return insight
+
+    def _get_tempo(self, insight_id: str, time_range: str) -> Insight | None:
+        """Resolve an insight via the index, then a one-trace TraceQL search."""
+        tempo = get_traceql_client(self.tempo_url)
+
+        entry = self._index.lookup(insight_id)
+        if entry is not None:
+            insight = self._insight_from_trace(tempo, entry.trace_id, insight_id)
+            if insight is not None:
+                return insight
+
+        data = tempo.search(
+            f"{{ span.insight.id = {quote_traceql(insight_id)} }}",
+            since_seconds=self._parse_time_range(time_range),
+            limit=1,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+        traces = data.get("traces", []) if isinstance(data, dict) else []
+        for trace_data in traces[:1] if isinstance(traces, list) else []:
+            trace_id = trace_data.get("traceID", "")
+            insight = self._insight_from_trace(tempo, trace_id, insight_id)
+            if insight is not None:
+                self._index.record(insight_id, trace_id, insight.project_id)
+                return insight
+        return None
+
+    def _insight_from_trace(self, tempo, trace_id: str, insight_id: str) -> Insight | None:
+        """Fetch one trace by ID and return the span carrying ``insight_id``."""
+        if not trace_id:
+            return None
+        trace_detail = tempo.get_trace(
+            trace_id,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+        )
+        for batch in trace_detail.get("batches", []):
+            for scope in batch.get("scopeSpans", []):
+                for span in scope.get("spans", []):
+                    insight = self._span_to_insight(span, trace_id)
+                    if insight is not None and insight.id == insight_id:
+                        return insight
+        return None
+
+    def _get_local(self, insight_id: str, project_id: str | None) -> Insight | None:
+        """Find an insight by ID in local JSON storage."""
+        import os
+        from pathlib import Path
+
+        storage_path = Path(os.path.expanduser(self.local_storage_path))
+        for file_path in storage_path.glob(f"{project_id or '*'}_insights.json"):
+            try:
+                with open(file_path) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            for item in data:
+                if item.get("id") == insight_id:
+                    try:
+                        return self._local_item_to_insight(item)
+                    except (ValueError, KeyError):
+                        return None
+        return None
+
     def _query_tempo(
         self,
         project_id: str | None,
@@ -801,26 +832,16 @@ class InsightQuerier:
 
         query = "{ " + " && ".join(conditions) + " }"
 
-        # Calculate time range
-        end_ns = int(time_module.time() * 1_000_000_000)
-        start_ns = end_ns - (self._parse_time_range(time_range) * 1_000_000_000)
-
-        # Execute query via Tempo HTTP API with retry
-        response = self._request_with_retry(
-            "get",
-            f"{self.tempo_url}/api/search",
-            params={
-                "q": query,
-                "start": start_ns,
-                "end": end_ns,
-                "limit": limit,
-            },
-        )
-        response.raise_for_status()
-
-        # Validate response format
+        # Execute query via the shared TraceQL client (pooled, cached, retried)
+        tempo = get_traceql_client(self.tempo_url)
         try:
-            data = response.json()
+            data = tempo.search(
+                query,
+                since_seconds=self._parse_time_range(time_range),
+                limit=limit,
+                max_retries=self.max_retries,
+                retry_delay=self.retry_delay,
+            )
         except ValueError as e:
             logger.error(f"Tempo returned invalid JSON: {e}")
             return []
@@ -845,16 +866,11 @@ class InsightQuerier:
 
             # Fetch full trace to get span details with shorter timeout for individual traces
             try:
-                trace_response = self._request_with_retry(
-                    "get",
-                    f"{self.tempo_url}/api/traces/{trace_id}",
+                trace_detail = tempo.get_trace(
+                    trace_id,
                     max_retries=1,  # Fewer retries for individual trace fetches
+                    retry_delay=self.retry_delay,
                 )
-                if trace_response.status_code != 200:
-                    logger.debug(f"Failed to fetch trace {trace_id}: {trace_response.status_code}")
-                    continue
-
-                trace_detail = trace_response.json()
                 for batch in trace_detail.get("batches", []):
                     for span in batch.get("scopeSpans", [{}])[0].get("spans", []):
                         insight = self._span_to_insight(span, trace_id)
@@ -996,21 +1012,7 @@ class InsightQuerier:
                             continue
 
                     # Create Insight object
-                    insights.append(Insight(
-                        id=item.get("id", ""),
-                        type=InsightType(item.get("type", "analysis")),
-                        summary=item.get("summary", ""),
-                        confidence=float(item.get("confidence", 0.0)),
-                        audience=InsightAudience(item.get("audience", "both")),
-                        project_id=item.get("project_id", ""),
-                        agent_id=item.get("agent_id", ""),
-                        session_id=item.get("session_id", ""),
-                        rationale=item.get("rationale"),
-                        trace_id=item.get("trace_id"),
-                        timestamp=ts,
-                        applies_to=item.get("applies_to", []),
-                        category=item.get("category"),
-                    ))
+                    insights.append(self._local_item_to_insight(item, ts))
             except (json.JSONDecodeError, KeyError):
                 continue
 
@@ -1018,6 +1020,27 @@ class InsightQuerier:
         insights.sort(key=lambda x: x.timestamp, reverse=True)
         return insights[:limit]
 
+    @staticmethod
+    def _local_item_to_insight(item: dict, ts: datetime | None = None) -> Insight:
+        """Build an Insight from a local storage record."""
+        if ts is None:
+            ts = datetime.fromisoformat(item.get("timestamp", "2000-01-01"))
+        return Insight(
+            id=item.get("id", ""),
+            type=InsightType(item.get("type", "analysis")),
+            summary=item.get("summary", ""),
+            confidence=float(item.get("confidence", 0.0)),
+            audience=InsightAudience(item.get("audience", "both")),
+            project_id=item.get("project_id", ""),
+            agent_id=item.get("agent_id", ""),
+            session_id=item.get("session_id", ""),
+            rationale=item.get("rationale"),
+            trace_id=item.get("trace_id"),
+            timestamp=ts,
+            applies_to=item.get("applies_to", []),
+            category=item.get("category"),
+        )
+
     def get_blockers(
         self,
         project_id: str,
@@ -160,13 +160,10 @@ class InsightsAPI:
     def get(self, insight_id: str) -> Insight | None:
         """Retrieve a specific insight by ID.
 
-        Queries recent insights and filters by ID.
+        Point lookup via the local insight index and a trace-by-ID fetch;
+        see InsightQuerier.get().
         """
-        results = self._querier.query(project_id=self._project_id, time_range="30d", limit=500)
-        for insight in results:
-            if insight.id == insight_id:
-                return insight
-        return None
+        return self._querier.get(insight_id, project_id=self._project_id)
 
     def list(self, project_id: str | None = None, limit: int = 100) -> list[Insight]:
         """List insights for a project (alias for query with minimal filters)."""
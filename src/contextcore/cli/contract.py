@@ -74,6 +74,12 @@ def contract():
               help="Output format")
 @click.option("--fail-on-drift", is_flag=True, help="Exit with error if critical drift detected")
 @click.option("--namespace", "-n", default="default", help="Kubernetes namespace")
+@click.option("--probe-concurrency", type=int, default=8, show_default=True,
+              help="Endpoints probed in parallel (openapi scope)")
+@click.option("--probe-rate", type=float, default=20.0, show_default=True,
+              help="Max requests per second per host, 0 for no limit (openapi scope)")
+@click.option("--probe-deadline", type=float, default=None,
+              help="Overall probing deadline in seconds (openapi scope)")
 def contract_check_cmd(
     project: str,
     scope: str,
@@ -85,6 +91,9 @@ def contract_check_cmd(
     output_format: str,
     fail_on_drift: bool,
     namespace: str,
+    probe_concurrency: int,
+    probe_rate: float,
+    probe_deadline: Optional[float],
 ):
     """Check for contract drift (A2A schema drift or OpenAPI drift).
 
@@ -142,7 +151,11 @@ def contract_check_cmd(
         click.echo(f"  Contract: {contract_url}")
         click.echo(f"  Service:  {service_url}")
 
-    detector = ContractDriftDetector()
+    detector = ContractDriftDetector(
+        max_concurrency=probe_concurrency,
+        per_host_rps=probe_rate or None,
+        deadline_s=probe_deadline,
+    )
     report = detector.detect(
         project_id=project,
         contract_url=contract_url,
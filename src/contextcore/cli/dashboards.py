@@ -68,6 +68,14 @@ def dashboards():
     help="Filter by extension (core, squirrel, rabbit, beaver, fox, coyote, owl, external)",
 )
 @click.option("--dry-run", is_flag=True, help="Preview without applying")
+@click.option("--force", is_flag=True, help="Re-post dashboards even if unchanged in Grafana")
+@click.option(
+    "--workers",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Dashboards provisioned in parallel",
+)
 def dashboards_provision(
     grafana_url: str,
     api_key: Optional[str],
@@ -75,11 +83,14 @@ def dashboards_provision(
     password: str,
     extension: Optional[str],
     dry_run: bool,
+    force: bool,
+    workers: int,
 ):
     """Provision ContextCore dashboards to Grafana.
 
     Discovers dashboards from extension folders and provisions them
-    to the appropriate Grafana folders.
+    to the appropriate Grafana folders. Dashboards whose content already
+    matches Grafana are skipped unless --force is given.
 
     \b
     Examples:
@@ -87,6 +98,7 @@ def dashboards_provision(
       contextcore dashboards provision -e core      # Provision 5 core dashboards
       contextcore dashboards provision -e squirrel  # Provision 2 squirrel dashboards
       contextcore dashboards provision --dry-run    # Preview what would be provisioned
+      contextcore dashboards provision --force      # Re-post unchanged dashboards too
     """
     from contextcore.dashboards import DashboardProvisioner
     from contextcore.dashboards.discovery import EXTENSION_REGISTRY
@@ -117,7 +129,12 @@ def dashboards_provision(
         password=password,
     )
 
-    results = provisioner.provision_all(dry_run=dry_run, extension=extension)
+    results = provisioner.provision_all(
+        dry_run=dry_run,
+        extension=extension,
+        force=force,
+        max_workers=workers,
+    )
 
     if not results:
         click.echo(click.style("No dashboards found to provision", fg="yellow"))
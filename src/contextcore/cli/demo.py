@@ -57,40 +57,179 @@ def demo_generate(project: str, output: str, months: int, seed: Optional[int], o
         click.echo("(Direct OTLP export not yet implemented)")
 
 
+@demo.command("workload")
+@click.option("--tasks", "-n", type=int, default=100_000, help="Approximate number of work items to generate")
+@click.option("--projects", type=int, default=10, help="Number of synthetic projects")
+@click.option("--days", type=int, default=90, help="Duration of the generated history (days)")
+@click.option("--depth", type=click.IntRange(1, 4), default=3, help="Hierarchy depth (epic>story>task>subtask)")
+@click.option("--cycle-time-hours", type=float, default=16.0, help="Median leaf cycle time (lognormal)")
+@click.option("--blocker-rate", type=float, default=0.15, help="Probability a leaf task gets blocked")
+@click.option("--insights-per-task", type=float, default=0.2, help="Mean agent insights per leaf task")
+@click.option("--handoffs-per-task", type=float, default=0.05, help="Mean agent handoffs per leaf task")
+@click.option("--no-logs", is_flag=True, help="Generate spans only")
+@click.option("--seed", type=int, default=0, help="Random seed (same seed = identical output)")
+@click.option(
+    "--end-time",
+    default=None,
+    help="ISO-8601 end of the generated history, or 'now' "
+    "(default: a fixed date for json so output is reproducible, now for otlp)",
+)
+@click.option("--output", "-o", default="./load_output", help="Output directory (json format)")
+@click.option("--format", "output_format", type=click.Choice(["json", "otlp"]), default="json", help="Write files or stream to endpoints")
+@click.option("--endpoint", envvar="OTEL_EXPORTER_OTLP_ENDPOINT", default="localhost:4317", help="OTLP gRPC endpoint (otlp format)")
+@click.option("--loki-endpoint", envvar="LOKI_URL", default=None, help="Loki push endpoint for logs (otlp format)")
+@click.option("--workers", type=int, default=4, help="Concurrent export requests (otlp format)")
+def demo_workload(
+    tasks: int,
+    projects: int,
+    days: int,
+    depth: int,
+    cycle_time_hours: float,
+    blocker_rate: float,
+    insights_per_task: float,
+    handoffs_per_task: float,
+    no_logs: bool,
+    seed: int,
+    end_time: Optional[str],
+    output: str,
+    output_format: str,
+    endpoint: str,
+    loki_endpoint: Optional[str],
+    workers: int,
+):
+    """Generate a large synthetic workload for capacity-testing the stack.
+
+    Bypasses TaskTracker state entirely and streams spans/logs straight to
+    files or OTLP/Loki, so memory stays flat at millions of tasks.
+
+    JSON output is reproducible: the same seed and options always write
+    identical files. Use `contextcore demo load --shift-to-now` to move the
+    history to the present when loading it.
+    """
+    import time
+    from datetime import datetime, timezone
+
+    from contextcore.demo.workload import (
+        Distribution,
+        JsonFileSink,
+        OTLPSink,
+        SyntheticWorkloadGenerator,
+        WorkloadProfile,
+    )
+
+    if end_time is None:
+        end_time = "now" if output_format == "otlp" else None
+    if end_time == "now":
+        end = datetime.now(timezone.utc)
+    elif end_time:
+        try:
+            end = datetime.fromisoformat(end_time)
+        except ValueError as e:
+            raise click.BadParameter(f"not an ISO-8601 datetime: {end_time}", param_hint="--end-time") from e
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+    else:
+        end = None
+
+    profile = WorkloadProfile.for_task_count(
+        tasks,
+        projects=projects,
+        duration_days=days,
+        hierarchy_depth=depth,
+        cycle_time_hours=Distribution("lognormal", cycle_time_hours, 0.9),
+        blocker_probability=blocker_rate,
+        insights_per_task=Distribution("poisson", insights_per_task),
+        handoffs_per_task=Distribution("poisson", handoffs_per_task),
+        emit_logs=not no_logs,
+        seed=seed,
+        end_time=end,
+    )
+
+    if output_format == "json":
+        sink = JsonFileSink(output)
+    else:
+        sink = OTLPSink(endpoint, loki_endpoint=loki_endpoint, workers=workers)
+
+    click.echo(f"Generating ~{tasks:,} work items across {projects} projects ({profile.epics_per_project} epics each)")
+    started = time.perf_counter()
+    stats = SyntheticWorkloadGenerator(profile).generate(sink)
+    elapsed = time.perf_counter() - started
+
+    click.echo()
+    click.echo(f"Generation complete in {elapsed:.1f}s")
+    for key in ("epics", "stories", "tasks", "subtasks", "sprints", "blockers", "insights", "handoffs", "spans", "logs"):
+        if isinstance(stats.get(key), int):
+            click.echo(f"  {key.capitalize()}: {stats[key]:,}")
+    if "spans_file" in stats:
+        click.echo()
+        click.echo(f"Spans saved to: {stats['spans_file']}")
+        click.echo(f"Logs saved to: {stats['logs_file']}")
+    for key, label in (("otlp_export", "Spans"), ("loki_push", "Logs")):
+        if key in stats:
+            result = stats[key]
+            click.echo(
+                f"  {label} exported: {result['items_sent']:,} "
+                f"({result['items_per_second']:,.0f}/s, {result['items_failed']:,} failed)"
+            )
+
+
 @demo.command("load")
 @click.option("--file", "-f", "spans_file", required=True, type=click.Path(exists=True), help="JSON spans file")
 @click.option("--endpoint", "-e", envvar="OTEL_EXPORTER_OTLP_ENDPOINT", default="localhost:4317", help="OTLP endpoint")
 @click.option("--insecure/--secure", default=True, help="Use insecure connection")
-def demo_load(spans_file: str, endpoint: str, insecure: bool):
-    """Load generated spans to Tempo via OTLP."""
+@click.option("--chunk-size", type=int, default=1000, help="Spans per OTLP export request")
+@click.option("--workers", type=int, default=4, help="Concurrent export requests")
+@click.option("--shift-to-now", is_flag=True, help="Shift timestamps so the latest span ends now")
+def demo_load(spans_file: str, endpoint: str, insecure: bool, chunk_size: int, workers: int, shift_to_now: bool):
+    """Load generated spans to Tempo via OTLP (original trace/span IDs preserved)."""
     from contextcore.demo import load_to_tempo
 
     click.echo(f"Loading spans from {spans_file}")
     click.echo(f"  Endpoint: {endpoint}")
 
-    result = load_to_tempo(endpoint=endpoint, spans_file=spans_file, insecure=insecure)
+    result = load_to_tempo(
+        endpoint=endpoint,
+        spans_file=spans_file,
+        insecure=insecure,
+        chunk_size=chunk_size,
+        workers=workers,
+        shift_to_now=shift_to_now,
+    )
 
     if result["success"]:
-        click.echo(f"Successfully loaded {result['spans_exported']} spans to {endpoint}")
+        click.echo(
+            f"Successfully loaded {result['spans_exported']} spans to {endpoint} "
+            f"({result['spans_per_second']:.0f} spans/s)"
+        )
     else:
-        click.echo("Failed to load spans", err=True)
+        click.echo(f"Failed to load {result['spans_failed']} spans", err=True)
         sys.exit(1)
 
 
 @demo.command("load-logs")
 @click.option("--file", "-f", "logs_file", required=True, type=click.Path(exists=True), help="JSON logs file")
 @click.option("--endpoint", "-e", envvar="LOKI_URL", default="http://localhost:3100/loki/api/v1/push", help="Loki push endpoint")
-def demo_load_logs(logs_file: str, endpoint: str):
+@click.option("--batch-bytes", type=int, default=1_000_000, help="Uncompressed bytes per push request")
+@click.option("--workers", type=int, default=4, help="Concurrent push requests")
+def demo_load_logs(logs_file: str, endpoint: str, batch_bytes: int, workers: int):
     """Load generated logs to Loki via push API."""
     from contextcore.demo import load_to_loki
 
     click.echo(f"Loading logs from {logs_file}")
     click.echo(f"  Endpoint: {endpoint}")
 
-    result = load_to_loki(endpoint=endpoint, logs_file=logs_file)
+    result = load_to_loki(
+        endpoint=endpoint,
+        logs_file=logs_file,
+        max_batch_bytes=batch_bytes,
+        workers=workers,
+    )
 
     if result["success"]:
-        click.echo(f"Successfully loaded {result['logs_pushed']} logs ({result['streams']} streams) to {endpoint}")
+        click.echo(
+            f"Successfully loaded {result['logs_pushed']} logs ({result['streams']} streams, "
+            f"{result['requests']} requests) to {endpoint}"
+        )
     else:
         click.echo(f"Failed to load logs: {result.get('error', 'unknown error')}", err=True)
         sys.exit(1)
@@ -68,7 +68,11 @@ def _validate_manifest(path: str, strict: bool = False) -> tuple[list[str], list
     """
     Validate a context manifest. Returns (errors, warnings, manifest_version).
     """
-    from contextcore.models.manifest_loader import load_manifest, detect_manifest_version
+    from contextcore.models.manifest_loader import (
+        detect_manifest_version,
+        load_manifest,
+        load_manifest_raw,
+    )
 
     path_obj = Path(path)
     errors: list[str] = []
@@ -76,7 +80,7 @@ def _validate_manifest(path: str, strict: bool = False) -> tuple[list[str], list
     manifest_version = "unknown"
 
     try:
-        raw_data = yaml.safe_load(path_obj.read_text(encoding="utf-8"))
+        raw_data = load_manifest_raw(path_obj)
         manifest_version = detect_manifest_version(raw_data)
 
         manifest = load_manifest(path)
@@ -469,10 +473,14 @@ def show(path: str, output_format: str):
     """
     Display manifest contents in various formats.
     """
-    from contextcore.models.manifest_loader import load_manifest, detect_manifest_version
+    from contextcore.models.manifest_loader import (
+        detect_manifest_version,
+        load_manifest,
+        load_manifest_raw,
+    )
 
     try:
-        raw_data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+        raw_data = load_manifest_raw(path)
         version = detect_manifest_version(raw_data)
         manifest = load_manifest(path)
 
@@ -1925,7 +1933,11 @@ def export(
     """
     from datetime import datetime as dt
 
-    from contextcore.models.manifest_loader import load_manifest, detect_manifest_version
+    from contextcore.models.manifest_loader import (
+        detect_manifest_version,
+        load_manifest,
+        load_manifest_raw,
+    )
     from contextcore.models.manifest_v2 import ContextManifestV2
 
     # Capture start time for duration tracking
@@ -1984,7 +1996,7 @@ def export(
         emit_run_provenance = profile["emit_run_provenance"]
 
         # Load manifest
-        raw_data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+        raw_data = load_manifest_raw(path)
         version = detect_manifest_version(raw_data)
         manifest = load_manifest(path)
 
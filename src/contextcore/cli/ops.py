@@ -15,6 +15,7 @@ def ops():
         doctor      Preflight system checks
         health      Component health status
         smoke-test  Full stack validation
+        refresh     Keep the shared probe snapshot warm
         backup      Export state to backup
         restore     Restore from backup
         backups     List available backups
@@ -25,7 +26,8 @@ def ops():
 @ops.command("doctor")
 @click.option("--no-ports", is_flag=True, help="Skip port availability checks")
 @click.option("--no-docker", is_flag=True, help="Skip Docker daemon check")
-def ops_doctor(no_ports: bool, no_docker: bool):
+@click.option("--fresh", is_flag=True, help="Re-probe instead of reading the probe snapshot")
+def ops_doctor(no_ports: bool, no_docker: bool, fresh: bool):
     """Run preflight system checks.
 
     Validates system readiness before deployment:
@@ -49,6 +51,7 @@ def ops_doctor(no_ports: bool, no_docker: bool):
     result = doctor(
         check_ports=not no_ports,
         check_docker=not no_docker,
+        max_age_s=0 if fresh else None,
     )
 
     for check in result.checks:
@@ -72,7 +75,8 @@ def ops_doctor(no_ports: bool, no_docker: bool):
 
 
 @ops.command("health")
-def ops_health():
+@click.option("--fresh", is_flag=True, help="Re-probe instead of reading the probe snapshot")
+def ops_health(fresh: bool):
     """Show one-line health status per component.
 
     Checks health of:
@@ -82,15 +86,19 @@ def ops_health():
     - Loki
     - OTLP endpoints
 
+    Components are probed concurrently; results from the last few seconds
+    are read from the shared probe snapshot unless --fresh is given.
+
     \b
     Examples:
         contextcore ops health
+        contextcore ops health --fresh
     """
     from contextcore.ops import health_check, HealthStatus
 
     click.echo(click.style("=== Component Health ===", fg="cyan", bold=True))
 
-    result = health_check()
+    result = health_check(max_age_s=0 if fresh else None)
 
     for component in result.components:
         if component.status == HealthStatus.HEALTHY:
@@ -114,7 +122,8 @@ def ops_health():
 
 
 @ops.command("smoke-test")
-def ops_smoke_test():
+@click.option("--fresh", is_flag=True, help="Re-probe instead of reading the probe snapshot")
+def ops_smoke_test(fresh: bool):
     """Validate entire stack is working after deployment.
 
     Runs comprehensive tests:
@@ -127,6 +136,7 @@ def ops_smoke_test():
     \b
     Examples:
         contextcore ops smoke-test
+        contextcore ops smoke-test --fresh
     """
     from contextcore.ops import smoke_test
     from contextcore.ops.smoke_test import TestStatus
@@ -134,7 +144,7 @@ def ops_smoke_test():
     click.echo(click.style("=== Smoke Test ===", fg="cyan", bold=True))
     click.echo()
 
-    suite = smoke_test()
+    suite = smoke_test(max_age_s=0 if fresh else None)
 
     for result in suite.results:
         if result.status == TestStatus.PASS:
@@ -159,16 +169,65 @@ def ops_smoke_test():
         sys.exit(1)
 
 
+@ops.command("refresh")
+@click.option("--interval", default=10.0, show_default=True, help="Seconds between refreshes")
+@click.option("--once", is_flag=True, help="Refresh a single time and exit")
+def ops_refresh(interval: float, once: bool):
+    """Keep the shared probe snapshot warm.
+
+    Re-probes everything doctor, health and smoke-test check, and publishes
+    the results to the probe snapshot that those commands and the TUI status
+    screen read. Runs until interrupted unless --once is given.
+
+    \b
+    Examples:
+        contextcore ops refresh
+        contextcore ops refresh --interval 5
+        contextcore ops refresh --once
+    """
+    import time
+
+    from contextcore.ops.doctor import doctor_probes
+    from contextcore.ops.health import health_probes
+    from contextcore.ops.probes import ProbeRefresher
+    from contextcore.ops.smoke_test import SMOKE_PROBES
+
+    def report(outcomes):
+        ok = sum(1 for o in outcomes.values() if o.ok)
+        stamp = time.strftime("%H:%M:%S")
+        click.echo(f"[{stamp}] refreshed {len(outcomes)} probes ({ok} ok)")
+
+    refresher = ProbeRefresher(
+        health_probes() + SMOKE_PROBES + doctor_probes(),
+        interval_s=interval,
+        on_refresh=report,
+    )
+    if once:
+        refresher.refresh_once()
+        return
+
+    refresher.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        refresher.stop(timeout=interval)
+
+
 @ops.command("backup")
 @click.option("--output-dir", "-o", type=click.Path(), help="Output directory for backup")
 @click.option("--grafana-url", default="http://localhost:3000", help="Grafana URL")
 @click.option("--grafana-user", default="admin", help="Grafana username")
 @click.option("--grafana-password", default="admin", help="Grafana password")
+@click.option("--full", is_flag=True, help="Fetch every dashboard, even if unchanged since the last backup")
+@click.option("--workers", default=8, show_default=True, type=click.IntRange(min=1), help="Dashboards fetched in parallel")
 def ops_backup(
     output_dir: Optional[str],
     grafana_url: str,
     grafana_user: str,
     grafana_password: str,
+    full: bool,
+    workers: int,
 ):
     """Export state to timestamped backup directory.
 
@@ -177,10 +236,15 @@ def ops_backup(
     - Grafana datasources
     - Backup manifest
 
+    Backups are incremental: dashboards unchanged since the previous backup
+    in the same directory are not fetched again, and identical content is
+    stored once in a shared blob store.
+
     \b
     Examples:
         contextcore ops backup
         contextcore ops backup --output-dir ./my-backups
+        contextcore ops backup --full
     """
     from contextcore.ops import backup
     from pathlib import Path
@@ -192,10 +256,15 @@ def ops_backup(
         output_dir=Path(output_dir) if output_dir else None,
         grafana_url=grafana_url,
         grafana_auth=(grafana_user, grafana_password),
+        incremental=not full,
+        max_workers=workers,
     )
 
     click.echo(f"Backup directory: {result.path}")
-    click.echo(f"Dashboards: {result.manifest.dashboards_count}")
+    click.echo(
+        f"Dashboards: {result.manifest.dashboards_count}"
+        f" ({result.manifest.dashboards_reused} unchanged)"
+    )
     click.echo(f"Datasources: {result.manifest.datasources_count}")
 
     if result.errors:
@@ -216,21 +285,41 @@ def ops_backup(
 @click.option("--grafana-url", default="http://localhost:3000", help="Grafana URL")
 @click.option("--grafana-user", default="admin", help="Grafana username")
 @click.option("--grafana-password", default="admin", help="Grafana password")
+@click.option(
+    "--at",
+    "at",
+    help="Restore the latest backup at or before this ISO time; BACKUP_PATH is then the backups directory",
+)
 def ops_restore(
     backup_path: str,
     grafana_url: str,
     grafana_user: str,
     grafana_password: str,
+    at: Optional[str],
 ):
     """Restore from a backup directory.
 
     \b
     Examples:
         contextcore ops restore ./backups/20260117-143000
+        contextcore ops restore ./backups --at 2026-01-17T14:30
     """
     from contextcore.ops import restore
+    from contextcore.ops.backup import find_backup
+    from datetime import datetime
     from pathlib import Path
 
+    if at:
+        try:
+            point_in_time = datetime.fromisoformat(at)
+        except ValueError as e:
+            raise click.BadParameter(f"Not an ISO date/time: {at}", param_hint="--at") from e
+        found = find_backup(point_in_time, Path(backup_path))
+        if found is None:
+            click.echo(click.style(f"No backup in {backup_path} at or before {at}", fg="red"))
+            sys.exit(1)
+        backup_path = str(found)
+
     click.echo(click.style("=== Restoring from Backup ===", fg="cyan", bold=True))
     click.echo()
     click.echo(f"Backup path: {backup_path}")
@@ -285,4 +374,6 @@ def ops_list_backups(base_dir: Optional[str]):
         click.echo(f"    Created: {manifest.created_at}")
         click.echo(f"    Dashboards: {manifest.dashboards_count}")
         click.echo(f"    Datasources: {manifest.datasources_count}")
+        if manifest.parent:
+            click.echo(f"    Incremental from: {manifest.parent}")
         click.echo()
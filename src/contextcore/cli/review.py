@@ -11,7 +11,7 @@ import yaml
 
 def _get_project_context_spec(project: str, namespace: str = "default") -> Optional[dict]:
     """Fetch ProjectContext spec from Kubernetes cluster or local file."""
-    import subprocess
+    from contextcore.utils.project_context_client import get_project_context_client
 
     # Check if it's a file path
     if Path(project).exists():
@@ -25,12 +25,9 @@ def _get_project_context_spec(project: str, namespace: str = "default") -> Optio
     else:
         name = project
 
-    cmd = ["kubectl", "get", "projectcontext", name, "-n", namespace, "-o", "json"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
+    pc = get_project_context_client().get(name, namespace)
+    if pc is None:
         return None
-
-    pc = json.loads(result.stdout)
     return pc.get("spec", {})
 
 
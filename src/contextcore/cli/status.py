@@ -12,6 +12,11 @@ Usage::
     contextcore status report -p my-project
     contextcore status report -p my-project --format markdown --output status.md
     contextcore status summary -p my-project
+    contextcore status summary -p my-project --export-dir ./out/export --watch
+
+Each section (coverage, pipeline health, agent insights) is cached in a
+snapshot store with its own invalidation key and only recomputed when its
+inputs change; see ``contextcore.cli.status_ops``.
 
 See ``docs/design/STATUS_REPORT_REQUIREMENTS.md`` for full requirements.
 """
@@ -20,13 +25,22 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import click
 
+from contextcore.cli.status_ops import (
+    StatusSnapshotStore,
+    coverage_key,
+    get_status_store,
+    insights_key,
+    pipeline_key,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -287,18 +301,47 @@ def _generate_highlights(summary: StatusSummary) -> List[str]:
     return highlights
 
 
+def _coverage_from_dict(data: Dict[str, Any]) -> CoverageStatus:
+    return CoverageStatus(**data)
+
+
+def _health_from_dict(data: Dict[str, Any]) -> PipelineHealth:
+    failures = [GateFailure(**f) for f in data.get("failures", [])]
+    return PipelineHealth(**{**data, "failures": failures})
+
+
 def build_status_summary(
     project_id: str,
     period: str = "7d",
     export_dir: Optional[str] = None,
     tempo_url: Optional[str] = None,
     local_storage: Optional[str] = None,
+    store: Optional[StatusSnapshotStore] = None,
+    use_cache: bool = True,
+    force: bool = False,
 ) -> StatusSummary:
-    """Build a complete status summary from all available data sources."""
+    """
+    Build a complete status summary from all available data sources.
+
+    Sections whose invalidation key is unchanged are taken from the snapshot
+    store (the shared one unless ``store`` is given); ``use_cache=False``
+    bypasses it and ``force`` recomputes every section but stores the result.
+    """
+    if use_cache:
+        store = store or get_status_store()
+    else:
+        store = StatusSnapshotStore()
+        force = True
+    export_scope = str(Path(export_dir).resolve()) if export_dir else "-"
+
     summary = StatusSummary(project_id=project_id, report_period=period)
 
     # Coverage (from export files — offline)
-    coverage = _aggregate_coverage(export_dir)
+    data, _ = store.fetch(
+        "coverage", export_scope, coverage_key(export_dir),
+        lambda: asdict(_aggregate_coverage(export_dir)), force=force,
+    )
+    coverage = _coverage_from_dict(data)
     summary.coverage_status = coverage
     if export_dir and Path(export_dir).exists():
         summary.data_sources_available.append("export_output")
@@ -306,7 +349,11 @@ def build_status_summary(
         summary.data_sources_unavailable.append("export_output")
 
     # Pipeline health (from pipeline checker — offline)
-    health = _aggregate_pipeline_health(export_dir)
+    data, _ = store.fetch(
+        "pipeline", export_scope, pipeline_key(export_dir),
+        lambda: asdict(_aggregate_pipeline_health(export_dir)), force=force,
+    )
+    health = _health_from_dict(data)
     summary.pipeline_health = health
     if health.gates_run > 0:
         summary.data_sources_available.append("pipeline_checker")
@@ -314,7 +361,10 @@ def build_status_summary(
         summary.data_sources_unavailable.append("pipeline_checker")
 
     # Agent insights
-    decisions = _aggregate_insights(project_id, period, tempo_url, local_storage)
+    decisions, _ = store.fetch(
+        "insights", json.dumps([project_id, tempo_url, local_storage]), insights_key(period),
+        lambda: _aggregate_insights(project_id, period, tempo_url, local_storage), force=force,
+    )
     summary.agent_decisions = decisions
     if decisions:
         summary.data_sources_available.append("agent_insights")
@@ -325,9 +375,57 @@ def build_status_summary(
     # Highlights
     summary.highlights = _generate_highlights(summary)
 
+    store.save()
     return summary
 
 
+def _changed_sections(previous: Optional[StatusSummary], current: StatusSummary) -> List[str]:
+    """Names of the sections that differ between two summaries."""
+    sections = [
+        ("coverage", lambda s: s.coverage_status),
+        ("pipeline", lambda s: s.pipeline_health),
+        ("insights", lambda s: s.agent_decisions),
+    ]
+    if previous is None:
+        return [name for name, _ in sections]
+    return [name for name, get in sections if get(previous) != get(current)]
+
+
+def watch_status_summary(
+    project_id: str,
+    period: str = "7d",
+    export_dir: Optional[str] = None,
+    tempo_url: Optional[str] = None,
+    local_storage: Optional[str] = None,
+    interval_s: float = 5.0,
+    store: Optional[StatusSnapshotStore] = None,
+    force: bool = False,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[Tuple[StatusSummary, List[str]]]:
+    """
+    Yield ``(summary, changed_sections)`` whenever a section changes.
+
+    The first summary is always yielded with every section listed. Between
+    polls only stale sections are recomputed, so an idle watch is cheap.
+    """
+    previous: Optional[StatusSummary] = None
+    while True:
+        summary = build_status_summary(
+            project_id=project_id,
+            period=period,
+            export_dir=export_dir,
+            tempo_url=tempo_url,
+            local_storage=local_storage,
+            store=store,
+            force=force and previous is None,
+        )
+        changed = _changed_sections(previous, summary)
+        if changed:
+            yield summary, changed
+        previous = summary
+        sleep(interval_s)
+
+
 # ---------------------------------------------------------------------------
 # Phase (b): Report generation
 # ---------------------------------------------------------------------------
@@ -543,6 +641,39 @@ def status():
     pass
 
 
+def _render(summary: StatusSummary, output_format: str) -> str:
+    if output_format == "markdown":
+        return render_markdown_report(summary)
+    if output_format == "json":
+        return render_json_report(summary)
+    return render_text_report(summary)
+
+
+def _summary_line(project: str, summary: StatusSummary) -> str:
+    """One-paragraph summary (<500 chars)."""
+    parts: List[str] = [f"{project}:"]
+
+    h = summary.pipeline_health
+    if h.gates_run > 0:
+        parts.append(f"pipeline {h.overall_status} ({h.gates_passed}/{h.gates_run} gates)")
+
+    c = summary.coverage_status
+    if c.total_required > 0:
+        parts.append(f"coverage {c.overall_percent:.0f}% ({c.total_gaps} gaps)")
+
+    if summary.blockers:
+        crit = sum(1 for b in summary.blockers if b.severity == "critical")
+        if crit:
+            parts.append(f"{crit} critical blockers")
+        else:
+            parts.append(f"{len(summary.blockers)} blockers (none critical)")
+
+    if summary.agent_decisions:
+        parts.append(f"{len(summary.agent_decisions)} recent decisions")
+
+    return " | ".join(parts)
+
+
 @status.command("report")
 @click.option("--project", "-p", envvar="CONTEXTCORE_PROJECT", required=True, help="Project ID")
 @click.option("--period", default="7d", help="Report period: 24h, 7d, 14d")
@@ -552,6 +683,9 @@ def status():
 @click.option("--tempo-url", envvar="TEMPO_URL", default=None, help="Tempo URL")
 @click.option("--local-storage", envvar="CONTEXTCORE_LOCAL_STORAGE", help="Local insight storage path")
 @click.option("--verbose", "-v", is_flag=True, help="Include detailed breakdowns")
+@click.option("--fresh", is_flag=True, help="Recompute every section instead of using snapshots")
+@click.option("--watch", is_flag=True, help="Keep running and re-emit the report when a section changes")
+@click.option("--interval", default=5.0, type=float, show_default=True, help="Seconds between polls with --watch")
 def status_report(
     project: str,
     period: str,
@@ -561,6 +695,9 @@ def status_report(
     tempo_url: Optional[str],
     local_storage: Optional[str],
     verbose: bool,
+    fresh: bool,
+    watch: bool,
+    interval: float,
 ):
     """Generate a full status report from pipeline telemetry.
 
@@ -571,21 +708,39 @@ def status_report(
         contextcore status report -p my-project
         contextcore status report -p my-project --format markdown -o status.md
         contextcore status report -p my-project --export-dir ./out/export --format json
+        contextcore status report -p my-project --export-dir ./out/export --watch -o status.md
     """
+    if watch:
+        updates = watch_status_summary(
+            project_id=project,
+            period=period,
+            export_dir=export_dir,
+            tempo_url=tempo_url,
+            local_storage=local_storage,
+            interval_s=interval,
+            force=fresh,
+        )
+        try:
+            for summary, changed in updates:
+                report_text = _render(summary, output_format)
+                if output:
+                    Path(output).write_text(report_text, encoding="utf-8")
+                    click.echo(f"✓ Status report written to {output} (changed: {', '.join(changed)})")
+                else:
+                    click.echo(report_text)
+        except KeyboardInterrupt:
+            pass
+        return
+
     summary = build_status_summary(
         project_id=project,
         period=period,
         export_dir=export_dir,
         tempo_url=tempo_url,
         local_storage=local_storage,
+        force=fresh,
     )
-
-    if output_format == "markdown":
-        report_text = render_markdown_report(summary)
-    elif output_format == "json":
-        report_text = render_json_report(summary)
-    else:
-        report_text = render_text_report(summary)
+    report_text = _render(summary, output_format)
 
     if output:
         Path(output).write_text(report_text, encoding="utf-8")
@@ -598,10 +753,16 @@ def status_report(
 @click.option("--project", "-p", envvar="CONTEXTCORE_PROJECT", required=True, help="Project ID")
 @click.option("--period", default="24h", help="Report period")
 @click.option("--export-dir", type=click.Path(exists=True), help="Export output dir")
+@click.option("--fresh", is_flag=True, help="Recompute every section instead of using snapshots")
+@click.option("--watch", is_flag=True, help="Keep running and print a line when a section changes")
+@click.option("--interval", default=5.0, type=float, show_default=True, help="Seconds between polls with --watch")
 def status_summary_cmd(
     project: str,
     period: str,
     export_dir: Optional[str],
+    fresh: bool,
+    watch: bool,
+    interval: float,
 ):
     """Quick one-paragraph executive summary.
 
@@ -609,32 +770,27 @@ def status_summary_cmd(
 
     Example:
         contextcore status summary -p my-project
+        contextcore status summary -p my-project --export-dir ./out/export --watch
     """
+    if watch:
+        updates = watch_status_summary(
+            project_id=project,
+            period=period,
+            export_dir=export_dir,
+            interval_s=interval,
+            force=fresh,
+        )
+        try:
+            for summary, _ in updates:
+                click.echo(_summary_line(project, summary))
+        except KeyboardInterrupt:
+            pass
+        return
+
     summary = build_status_summary(
         project_id=project,
         period=period,
         export_dir=export_dir,
+        force=fresh,
     )
-
-    # Build one-paragraph summary (<500 chars)
-    parts: List[str] = [f"{project}:"]
-
-    h = summary.pipeline_health
-    if h.gates_run > 0:
-        parts.append(f"pipeline {h.overall_status} ({h.gates_passed}/{h.gates_run} gates)")
-
-    c = summary.coverage_status
-    if c.total_required > 0:
-        parts.append(f"coverage {c.overall_percent:.0f}% ({c.total_gaps} gaps)")
-
-    if summary.blockers:
-        crit = sum(1 for b in summary.blockers if b.severity == "critical")
-        if crit:
-            parts.append(f"{crit} critical blockers")
-        else:
-            parts.append(f"{len(summary.blockers)} blockers (none critical)")
-
-    if summary.agent_decisions:
-        parts.append(f"{len(summary.agent_decisions)} recent decisions")
-
-    click.echo(" | ".join(parts))
+    click.echo(_summary_line(project, summary))
@@ -0,0 +1,240 @@
+"""
+Section snapshot store for `contextcore status`.
+
+A status summary is assembled from three independently expensive sections:
+artifact coverage (reads the export output), pipeline health (runs the full
+``PipelineChecker`` gate suite) and agent insights (queries Tempo or local
+insight storage). StatusSnapshotStore keeps the last computed value of each
+section together with the invalidation key it was computed under, so
+``contextcore status`` only recomputes the sections whose inputs changed:
+
+- ``coverage``: size and mtime of the export directory and of
+  ``onboarding-metadata.json``
+- ``pipeline``: SHA-256 of the pipeline metadata files
+  (``onboarding-metadata.json``, ``provenance.json``, ``run-provenance.json``)
+  and of the files they reference that the gates read (source manifest,
+  artifact manifest, project context, provenance outputs), so a touched but
+  unchanged export does not re-run the gates while an edited artifact does
+- ``insights``: the query parameters plus the current insight time window;
+  windows are ``CONTEXTCORE_STATUS_INSIGHT_TTL`` seconds wide, so insights
+  are re-queried at most once per window
+
+Exports modified within ``RACY_WINDOW_S`` seconds get no coverage key and
+are always re-read: a second write within the same mtime tick and with the
+same size would otherwise go unnoticed. Snapshots are persisted as JSON so
+separate CLI invocations (and watch loops) share them.
+
+Usage:
+    from contextcore.cli.status_ops import coverage_key, get_status_store
+
+    store = get_status_store()
+    value, recomputed = store.fetch(
+        "coverage", export_dir, coverage_key(export_dir), compute_coverage
+    )
+    store.save()
+
+Configuration:
+    CONTEXTCORE_STATUS_CACHE: "0" disables persistence (in-memory only)
+    CONTEXTCORE_STATUS_CACHE_PATH: snapshot file location
+        (default ~/.contextcore/cache/status-snapshot.json)
+    CONTEXTCORE_STATUS_INSIGHT_TTL: insight window in seconds (default 60)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from contextcore.utils.file_checksums import FileChecksumCache, get_checksum_cache
+from contextcore.utils.persisted_cache import (
+    PersistedJSONCache,
+    cache_path,
+    env_float,
+    is_racy,
+    read_json,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "StatusSnapshotStore",
+    "coverage_key",
+    "get_status_store",
+    "insights_key",
+    "pipeline_key",
+]
+
+DEFAULT_INSIGHT_TTL_S = 60.0
+COVERAGE_FILE = "onboarding-metadata.json"
+PIPELINE_FILES = ("onboarding-metadata.json", "provenance.json", "run-provenance.json")
+
+# Bump when the shape of a section value changes
+_SNAPSHOT_FORMAT = 1
+
+
+def _stat_signature(path: Path) -> list:
+    try:
+        st = path.stat()
+    except OSError:
+        return [None, None]
+    return [st.st_size, st.st_mtime_ns]
+
+
+def coverage_key(export_dir: Optional[str]) -> Optional[str]:
+    """
+    Invalidation key for the coverage section, or None if it must be recomputed.
+
+    Built from the export directory's and the onboarding metadata's stat
+    signatures; None while the metadata is younger than ``RACY_WINDOW_S``.
+    """
+    if not export_dir:
+        return "none"
+    root = Path(export_dir)
+    meta = _stat_signature(root / COVERAGE_FILE)
+    if meta[1] is not None and is_racy(meta[1]):
+        return None
+    return json.dumps([_stat_signature(root), meta])
+
+
+def _pipeline_inputs(root: Path) -> List[Path]:
+    """
+    Files the pipeline gates read besides the metadata files themselves.
+
+    Mirrors ``PipelineChecker``: the checksum chain re-hashes the source
+    manifest (relative to the export's parent, then the working directory),
+    the artifact manifest and the project context file; other gates read
+    provenance output files, owned files and the source files listed in the
+    run provenance ``artifact_inventory``.
+    """
+    metadata = read_json(root / COVERAGE_FILE)
+    if not isinstance(metadata, dict):
+        return []
+    provenance = read_json(root / "provenance.json")
+    provenance = provenance if isinstance(provenance, dict) else {}
+    run_provenance = read_json(root / "run-provenance.json")
+    inventory = run_provenance.get("artifact_inventory") if isinstance(run_provenance, dict) else None
+    inventory_sources = [
+        entry.get("source_file") for entry in inventory if isinstance(entry, dict)
+    ] if isinstance(inventory, list) else []
+
+    paths: List[Path] = []
+    source_rel = metadata.get("source_path_relative")
+    if isinstance(source_rel, str) and source_rel:
+        candidates = [root.parent / source_rel, Path.cwd() / source_rel]
+        paths.append(next((p for p in candidates if p.exists()), candidates[0]))
+    for name in ("artifact_manifest_path", "project_context_path"):
+        rel = metadata.get(name)
+        if isinstance(rel, str) and rel:
+            paths.append(root / rel)
+    for rel in [
+        *(provenance.get("outputFiles") or []),
+        *(metadata.get("file_ownership") or {}),
+        *inventory_sources,
+    ]:
+        if isinstance(rel, str) and rel:
+            paths.append(root / rel)
+    return paths
+
+
+def pipeline_key(
+    export_dir: Optional[str],
+    checksums: Optional[FileChecksumCache] = None,
+) -> Optional[str]:
+    """
+    Invalidation key for the pipeline section.
+
+    Checksums of the metadata files and of every file they reference that
+    the gates read (see ``_pipeline_inputs``); a missing file hashes to None.
+    """
+    if not export_dir:
+        return "none"
+    checksums = checksums or get_checksum_cache()
+    root = Path(export_dir)
+    own = [checksums.sha256(root / name) for name in PIPELINE_FILES]
+    referenced = [[str(p), checksums.sha256(p)] for p in _pipeline_inputs(root)]
+    return json.dumps([own, referenced])
+
+
+def insight_ttl() -> float:
+    return env_float("CONTEXTCORE_STATUS_INSIGHT_TTL", DEFAULT_INSIGHT_TTL_S)
+
+
+def insights_key(period: str, ttl_s: Optional[float] = None, now: Optional[float] = None) -> str:
+    """Invalidation key for the insights section: the period and current window."""
+    ttl_s = insight_ttl() if ttl_s is None else ttl_s
+    now = time.time() if now is None else now
+    window = int(now // ttl_s) if ttl_s > 0 else now
+    return json.dumps([period, window])
+
+
+class StatusSnapshotStore(PersistedJSONCache):
+    """Thread-safe store of status section values keyed by invalidation key."""
+
+    FORMAT = _SNAPSHOT_FORMAT
+    DESCRIPTION = "status snapshot"
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 256):
+        """
+        Args:
+            path: JSON file to persist snapshots to (None keeps them in memory)
+            max_entries: Oldest snapshots are dropped beyond this many
+        """
+        super().__init__(path, max_entries)
+
+    def fetch(
+        self,
+        section: str,
+        scope: str,
+        key: Optional[str],
+        compute: Callable[[], Any],
+        force: bool = False,
+    ) -> Tuple[Any, bool]:
+        """
+        Cached value of a section, computing it if its key changed.
+
+        Args:
+            section: Section name (coverage, pipeline, insights)
+            scope: What the section was computed for (export dir, project)
+            key: Invalidation key; None always recomputes and stores nothing
+            compute: Returns the section value as JSON-serializable data
+            force: Recompute even if the key is unchanged
+
+        Returns:
+            (value, recomputed)
+        """
+        # "section|scope" -> [key, computed_at, value]
+        entry_key = f"{section}|{scope}"
+        if key is not None and not force:
+            entry = self._get(entry_key)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[2], False
+
+        self.misses += 1
+        # Round-trip so cached and fresh values are identical
+        value = json.loads(json.dumps(compute(), default=str))
+        if key is not None:
+            self._put(entry_key, [key, time.time(), value])
+        return value, True
+
+    def _valid_entry(self, entry: Any) -> bool:
+        return isinstance(entry, list) and len(entry) == 3 and isinstance(entry[0], str)
+
+
+_default_store: Optional[StatusSnapshotStore] = None
+_default_lock = threading.Lock()
+
+
+def get_status_store() -> StatusSnapshotStore:
+    """Process-wide store, persisted unless CONTEXTCORE_STATUS_CACHE=0."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = StatusSnapshotStore(
+                cache_path("CONTEXTCORE_STATUS_CACHE", "status-snapshot.json")
+            )
+        return _default_store
@@ -16,16 +16,19 @@ See ``docs/plans/WEAVER_REGISTRY_REQUIREMENTS.md`` for full requirements.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
 import click
 import yaml
 
+from contextcore.cli.weaver_ops import get_registry_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,9 +78,10 @@ class RegistryValidationReport:
         )
 
 
-def _load_python_enums() -> Dict[str, Set[str]]:
+@functools.lru_cache(maxsize=1)
+def _load_python_enums() -> Dict[str, FrozenSet[str]]:
     """Load canonical enum values from contracts/types.py."""
-    enums: Dict[str, Set[str]] = {}
+    enums: Dict[str, FrozenSet[str]] = {}
     try:
         from contextcore.contracts.types import (
             TaskStatus,
@@ -92,23 +96,24 @@ def _load_python_enums() -> Dict[str, Set[str]]:
             Criticality,
         )
 
-        enums["TaskStatus"] = {e.value for e in TaskStatus}
-        enums["TaskType"] = {e.value for e in TaskType}
-        enums["Priority"] = {e.value for e in Priority}
-        enums["HandoffStatus"] = {e.value for e in HandoffStatus}
-        enums["SessionStatus"] = {e.value for e in SessionStatus}
-        enums["InsightType"] = {e.value for e in InsightType}
-        enums["AgentType"] = {e.value for e in AgentType}
-        enums["BusinessValue"] = {e.value for e in BusinessValue}
-        enums["RiskType"] = {e.value for e in RiskType}
-        enums["Criticality"] = {e.value for e in Criticality}
+        enums["TaskStatus"] = frozenset(e.value for e in TaskStatus)
+        enums["TaskType"] = frozenset(e.value for e in TaskType)
+        enums["Priority"] = frozenset(e.value for e in Priority)
+        enums["HandoffStatus"] = frozenset(e.value for e in HandoffStatus)
+        enums["SessionStatus"] = frozenset(e.value for e in SessionStatus)
+        enums["InsightType"] = frozenset(e.value for e in InsightType)
+        enums["AgentType"] = frozenset(e.value for e in AgentType)
+        enums["BusinessValue"] = frozenset(e.value for e in BusinessValue)
+        enums["RiskType"] = frozenset(e.value for e in RiskType)
+        enums["Criticality"] = frozenset(e.value for e in Criticality)
     except ImportError as e:
         logger.warning(f"Could not import enums: {e}")
 
     return enums
 
 
-def _load_python_attributes() -> Set[str]:
+@functools.lru_cache(maxsize=1)
+def _load_python_attributes() -> FrozenSet[str]:
     """Load attribute constants from tracker.py."""
     attrs: Set[str] = set()
     try:
@@ -121,8 +126,11 @@ def _load_python_attributes() -> Set[str]:
     except ImportError:
         pass
 
-    return attrs
+    return frozenset(attrs)
+
 
+# Namespaces whose Python attributes must be registered (Phase 1)
+_PHASE1_NAMESPACES = frozenset({"task", "project", "sprint", "agent"})
 
 # Map registry attribute IDs to the Python enum they should match
 _ATTRIBUTE_ENUM_MAP = {
@@ -205,34 +213,30 @@ def validate_registry(registry_path: str = "semconv/") -> RegistryValidationRepo
                 )
             )
 
-    # Validate all registry YAML files
+    # Validate all registry YAML files (parsed summaries come from the index;
+    # only files changed since the last run are parsed again)
+    index = get_registry_index()
     registry_attrs: Set[str] = set()
-    for yaml_file in sorted(reg_path.rglob("*.yaml")):
-        if yaml_file.name == "registry_manifest.yaml":
-            continue
-
+    for registry_file in index.scan(reg_path):
         report.files_checked += 1
-        relative = yaml_file.relative_to(reg_path)
+        relative = registry_file.relative
 
-        try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except (yaml.YAMLError, OSError) as e:
+        if registry_file.error is not None:
             report.issues.append(
                 RegistryIssue(
-                    file=str(relative),
+                    file=relative,
                     location="/",
                     issue_type="parse_error",
                     severity="error",
-                    message=f"Failed to parse: {e}",
+                    message=f"Failed to parse: {registry_file.error}",
                 )
             )
             continue
 
-        if not data or not isinstance(data, dict):
+        if registry_file.empty:
             report.issues.append(
                 RegistryIssue(
-                    file=str(relative),
+                    file=relative,
                     location="/",
                     issue_type="format_error",
                     severity="warning",
@@ -241,94 +245,71 @@ def validate_registry(registry_path: str = "semconv/") -> RegistryValidationRepo
             )
             continue
 
-        # Extract and validate groups
-        groups = data.get("groups", [])
-        if not isinstance(groups, list):
-            continue
+        for attr in registry_file.attributes:
+            attr_id = attr["id"]
+            if attr_id:
+                registry_attrs.add(attr_id)
+                report.attributes_found += 1
 
-        for group in groups:
-            if not isinstance(group, dict):
+            # Validate enum members against Python enums
+            if attr["members"] is None:
                 continue
-
-            group_id = group.get("id", "unknown")
-            attributes = group.get("attributes", [])
-            if not isinstance(attributes, list):
+            enum_name = _ATTRIBUTE_ENUM_MAP.get(attr_id)
+            if not enum_name or enum_name not in python_enums:
                 continue
 
-            for attr in attributes:
-                if not isinstance(attr, dict):
-                    continue
-
-                attr_id = attr.get("id") or attr.get("ref")
-                if attr_id:
-                    registry_attrs.add(attr_id)
-                    report.attributes_found += 1
-
-                # Validate enum members against Python enums
-                attr_type = attr.get("type")
-                if isinstance(attr_type, dict) and "members" in attr_type:
-                    members = attr_type["members"]
-                    yaml_values = set()
-                    for member in members:
-                        if isinstance(member, dict) and "value" in member:
-                            yaml_values.add(member["value"])
-
-                    # Find the matching Python enum
-                    enum_name = _ATTRIBUTE_ENUM_MAP.get(attr_id)
-                    if enum_name and enum_name in python_enums:
-                        report.enums_checked += 1
-                        python_values = python_enums[enum_name]
-
-                        in_yaml_not_python = yaml_values - python_values
-                        in_python_not_yaml = python_values - yaml_values
-
-                        for val in sorted(in_yaml_not_python):
-                            report.issues.append(
-                                RegistryIssue(
-                                    file=str(relative),
-                                    location=f"/{group_id}/{attr_id}/members",
-                                    issue_type="enum_mismatch",
-                                    severity="error",
-                                    message=(
-                                        f"Value '{val}' in registry but not in Python "
-                                        f"{enum_name}. Remove from YAML or add to "
-                                        f"contracts/types.py."
-                                    ),
-                                )
-                            )
+            report.enums_checked += 1
+            group_id = attr["group"] or "unknown"
+            yaml_values = set(attr["members"])
+            python_values = python_enums[enum_name]
 
-                        for val in sorted(in_python_not_yaml):
-                            report.issues.append(
-                                RegistryIssue(
-                                    file=str(relative),
-                                    location=f"/{group_id}/{attr_id}/members",
-                                    issue_type="enum_mismatch",
-                                    severity="error",
-                                    message=(
-                                        f"Value '{val}' in Python {enum_name} but not "
-                                        f"in registry. Add to {relative}."
-                                    ),
-                                )
-                            )
+            for val in sorted(yaml_values - python_values):
+                report.issues.append(
+                    RegistryIssue(
+                        file=relative,
+                        location=f"/{group_id}/{attr_id}/members",
+                        issue_type="enum_mismatch",
+                        severity="error",
+                        message=(
+                            f"Value '{val}' in registry but not in Python "
+                            f"{enum_name}. Remove from YAML or add to "
+                            f"contracts/types.py."
+                        ),
+                    )
+                )
 
-    # Cross-check: Python attributes not in registry (warnings only)
-    for py_attr in sorted(python_attrs):
-        if py_attr not in registry_attrs:
-            # Only warn for Phase 1 namespaces
-            ns = py_attr.split(".")[0]
-            if ns in ("task", "project", "sprint", "agent"):
+            for val in sorted(python_values - yaml_values):
                 report.issues.append(
                     RegistryIssue(
-                        file="(python source)",
-                        location=py_attr,
-                        issue_type="missing_in_registry",
-                        severity="warning",
+                        file=relative,
+                        location=f"/{group_id}/{attr_id}/members",
+                        issue_type="enum_mismatch",
+                        severity="error",
                         message=(
-                            f"Attribute '{py_attr}' defined in Python but not in "
-                            f"registry. Add to semconv/registry/{ns}.yaml."
+                            f"Value '{val}' in Python {enum_name} but not "
+                            f"in registry. Add to {relative}."
                         ),
                     )
                 )
+    index.save()
+
+    # Cross-check: Python attributes not in registry (warnings only)
+    for py_attr in sorted(python_attrs - registry_attrs):
+        # Only warn for Phase 1 namespaces
+        ns = py_attr.split(".")[0]
+        if ns in _PHASE1_NAMESPACES:
+            report.issues.append(
+                RegistryIssue(
+                    file="(python source)",
+                    location=py_attr,
+                    issue_type="missing_in_registry",
+                    severity="warning",
+                    message=(
+                        f"Attribute '{py_attr}' defined in Python but not in "
+                        f"registry. Add to semconv/registry/{ns}.yaml."
+                    ),
+                )
+            )
 
     return report
 
@@ -457,64 +438,31 @@ def weaver_list(registry: str, namespace: Optional[str], output_format: str):
 
     all_attrs: List[Dict[str, Any]] = []
 
-    for yaml_file in sorted(reg_path.rglob("*.yaml")):
-        if yaml_file.name == "registry_manifest.yaml":
-            continue
-
-        try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except (yaml.YAMLError, OSError):
-            continue
-
-        if not data or not isinstance(data, dict):
-            continue
-
-        groups = data.get("groups", [])
-        if not isinstance(groups, list):
+    index = get_registry_index()
+    for registry_file in index.scan(reg_path):
+        if registry_file.error is not None or registry_file.empty:
             continue
 
-        source_file = str(yaml_file.relative_to(reg_path))
-        for group in groups:
-            if not isinstance(group, dict):
+        for attr in registry_file.attributes:
+            attr_id = attr["id"]
+            if not attr_id:
                 continue
 
-            group_id = group.get("id", "")
-            group_type = group.get("type", "attribute_group")
-            attributes = group.get("attributes", [])
-            if not isinstance(attributes, list):
+            # Filter by namespace
+            if namespace and not attr_id.startswith(f"{namespace}."):
                 continue
 
-            for attr in attributes:
-                if not isinstance(attr, dict):
-                    continue
-
-                attr_id = attr.get("id") or attr.get("ref", "")
-                if not attr_id:
-                    continue
-
-                # Filter by namespace
-                if namespace and not attr_id.startswith(f"{namespace}."):
-                    continue
-
-                attr_type = attr.get("type", "string")
-                if isinstance(attr_type, dict):
-                    attr_type = "enum"
-
-                req_level = attr.get("requirement_level", "opt_in")
-                deprecated = attr.get("deprecated")
-                brief = attr.get("brief", "")
-
-                all_attrs.append({
-                    "id": attr_id,
-                    "type": attr_type if isinstance(attr_type, str) else "enum",
-                    "requirement_level": req_level,
-                    "deprecated": deprecated,
-                    "brief": brief[:60] if isinstance(brief, str) else "",
-                    "source": source_file,
-                    "group": group_id,
-                    "group_type": group_type,
-                })
+            all_attrs.append({
+                "id": attr_id,
+                "type": attr["type"],
+                "requirement_level": attr["requirement_level"],
+                "deprecated": attr["deprecated"],
+                "brief": attr["brief"][:60],
+                "source": registry_file.relative,
+                "group": attr["group"] or "",
+                "group_type": attr["group_type"],
+            })
+    index.save()
 
     if output_format == "json":
         click.echo(json.dumps(all_attrs, indent=2))
@@ -0,0 +1,186 @@
+"""
+Parsed-YAML index for `contextcore weaver` registry commands.
+
+``weaver check`` runs from pre-commit on every commit, and it and
+``weaver list`` used to YAML-parse every registry file each time. RegistryIndex
+keeps a compact summary of each file (its attributes, enum members and
+parse status) keyed by the SHA-256 of its contents, which comes from the
+shared ``FileChecksumCache`` and so is only recomputed when a file's size,
+mtime or inode changes. Only files whose contents actually changed are
+parsed again. Summaries are persisted as JSON so separate CLI invocations
+share them.
+
+Usage:
+    from contextcore.cli.weaver_ops import get_registry_index
+
+    index = get_registry_index()
+    for registry_file in index.scan(Path("semconv")):
+        for attr in registry_file.attributes:
+            print(registry_file.relative, attr["id"])
+    index.save()
+
+Configuration:
+    CONTEXTCORE_WEAVER_CACHE: "0" disables persistence (in-memory only)
+    CONTEXTCORE_WEAVER_CACHE_PATH: cache file location
+        (default ~/.contextcore/cache/weaver-registry.json)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from contextcore.utils.file_checksums import FileChecksumCache, get_checksum_cache
+from contextcore.utils.persisted_cache import PersistedJSONCache, cache_path
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["RegistryFile", "RegistryIndex", "get_registry_index"]
+
+MANIFEST_NAME = "registry_manifest.yaml"
+
+# Bump when the shape of a file summary changes
+_SUMMARY_FORMAT = 2
+
+
+@dataclass
+class RegistryFile:
+    """Summary of one registry YAML file."""
+
+    relative: str
+    error: Optional[str] = None  # YAML parse/read error
+    empty: bool = False  # Empty or not a mapping
+    # One dict per attribute: id, group, group_type, type, members,
+    # requirement_level, deprecated, brief
+    attributes: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def summarize_registry_file(data: Any) -> Dict[str, Any]:
+    """Reduce parsed registry YAML to what the weaver commands use."""
+    if not data or not isinstance(data, dict):
+        return {"error": None, "empty": True, "attributes": []}
+
+    attributes: List[Dict[str, Any]] = []
+    groups = data.get("groups", [])
+    if isinstance(groups, list):
+        for group in groups:
+            if not isinstance(group, dict):
+                continue
+            group_attrs = group.get("attributes", [])
+            if not isinstance(group_attrs, list):
+                continue
+            for attr in group_attrs:
+                if not isinstance(attr, dict):
+                    continue
+                attr_type = attr.get("type", "string")
+                members = None
+                if isinstance(attr_type, dict) and "members" in attr_type:
+                    members = [
+                        m["value"]
+                        for m in attr_type["members"] or []
+                        if isinstance(m, dict) and "value" in m
+                    ]
+                brief = attr.get("brief", "")
+                attributes.append({
+                    "id": attr.get("id") or attr.get("ref") or None,
+                    "group": group.get("id"),
+                    "group_type": group.get("type", "attribute_group"),
+                    "type": attr_type if isinstance(attr_type, str) else "enum",
+                    "members": members,
+                    "requirement_level": attr.get("requirement_level", "opt_in"),
+                    "deprecated": attr.get("deprecated"),
+                    "brief": brief if isinstance(brief, str) else "",
+                })
+    return {"error": None, "empty": False, "attributes": attributes}
+
+
+class RegistryIndex(PersistedJSONCache):
+    """Thread-safe cache of registry file summaries keyed by content checksum."""
+
+    FORMAT = _SUMMARY_FORMAT
+    DESCRIPTION = "weaver registry cache"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = 5_000,
+        checksums: Optional[FileChecksumCache] = None,
+    ):
+        """
+        Args:
+            path: JSON file to persist summaries to (None keeps them in memory)
+            max_entries: Oldest summaries are dropped beyond this many
+            checksums: File checksum cache (default: the process-wide one)
+        """
+        super().__init__(path, max_entries)
+        self.checksums = checksums or get_checksum_cache()
+
+    def scan(self, registry: Path) -> List[RegistryFile]:
+        """Summaries of every registry YAML file except the manifest, sorted by path."""
+        files = []
+        for yaml_file in sorted(Path(registry).rglob("*.yaml")):
+            if yaml_file.name == MANIFEST_NAME:
+                continue
+            summary = self.summary(yaml_file)
+            files.append(
+                RegistryFile(
+                    relative=str(yaml_file.relative_to(registry)),
+                    error=summary["error"],
+                    empty=summary["empty"],
+                    attributes=summary["attributes"],
+                )
+            )
+        return files
+
+    def summary(self, yaml_file: Path) -> Dict[str, Any]:
+        """Summary of one file, parsing it only if its contents changed."""
+        digest = self.checksums.sha256(yaml_file)
+        cached = self._get(digest) if digest is not None else None
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        try:
+            raw = yaml_file.read_bytes()
+        except OSError as e:
+            return {"error": str(e), "empty": False, "attributes": []}
+        self.misses += 1
+        try:
+            summary = summarize_registry_file(yaml.safe_load(raw.decode("utf-8")))
+        except (yaml.YAMLError, UnicodeDecodeError) as e:
+            summary = {"error": str(e), "empty": False, "attributes": []}
+        # Round-trip so cached and fresh summaries are identical
+        summary = json.loads(json.dumps(summary, default=str))
+        # Key by what was parsed, in case the file changed after it was hashed
+        self._put(hashlib.sha256(raw).hexdigest(), summary)
+        return summary
+
+    def save(self) -> None:
+        """Persist summaries and the file checksums they are keyed by."""
+        super().save()
+        self.checksums.save()
+
+    def _valid_entry(self, entry: Any) -> bool:
+        return isinstance(entry, dict) and "attributes" in entry
+
+
+_default_index: Optional[RegistryIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_registry_index() -> RegistryIndex:
+    """Process-wide index, persisted unless CONTEXTCORE_WEAVER_CACHE=0."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = RegistryIndex(
+                cache_path("CONTEXTCORE_WEAVER_CACHE", "weaver-registry.json")
+            )
+        return _default_index
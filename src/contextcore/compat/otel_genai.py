@@ -1,5 +1,7 @@
 """OpenTelemetry GenAI semantic conventions compatibility layer."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
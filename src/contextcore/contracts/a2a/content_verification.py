@@ -30,7 +30,10 @@ Usage::
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -60,18 +63,127 @@ _PLACEHOLDER_PATTERNS: list[re.Pattern[str]] = [
 
 _SOURCE_EXTENSIONS = {".py", ".go", ".js", ".ts", ".java", ".cs", ".proto"}
 
+# Files are scanned across a process pool once there are at least this many.
+_PARALLEL_MIN_FILES = 64
 
-def _iter_source_files(source_dir: Path) -> list[Path]:
-    """Collect source files from a directory tree."""
+
+def _combine_patterns(patterns: list[re.Pattern[str]], flags: int = 0) -> re.Pattern[str]:
+    """Fold patterns into one alternation, keeping each pattern's case flag."""
+    parts = [
+        f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        for p in patterns
+    ]
+    return re.compile("|".join(parts), flags)
+
+
+# The built-in patterns never match across a line break and only use \b at
+# their edges, so one pass over the joined file buffer finds exactly the
+# lines on which at least one of them matches.
+_BUILTIN_COMBINED = _combine_patterns(_PLACEHOLDER_PATTERNS)
+
+
+def _iter_source_files(
+    source_dir: Path,
+    exclude_dirs: Optional[set[str]] = None,
+) -> list[Path]:
+    """
+    Collect source files from a directory tree.
+
+    Walks with ``os.scandir``; directories named in ``exclude_dirs`` are
+    pruned before they are entered. Symlinked directories are not followed
+    (as with ``Path.rglob``), symlinked files are included.
+    """
     files: list[Path] = []
     if not source_dir.is_dir():
         return files
-    for p in source_dir.rglob("*"):
-        if p.is_file() and p.suffix in _SOURCE_EXTENSIONS:
-            files.append(p)
+    excluded = exclude_dirs or set()
+    stack = [str(source_dir)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded:
+                            stack.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1] in _SOURCE_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        files.append(Path(entry.path))
+                except OSError:
+                    continue
     return sorted(files)
 
 
+def _scan_file_for_placeholders(
+    fpath: Path,
+    extra_patterns: list[re.Pattern[str]],
+) -> Optional[list[tuple[int, str]]]:
+    """
+    Return ``(lineno, matched text)`` for every (line, pattern) hit in order,
+    or ``None`` if the file cannot be read.
+
+    Candidate lines are found with combined regexes; each candidate line is
+    then checked pattern by pattern, exactly as a line-by-line scan would.
+    """
+    try:
+        lines = fpath.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError as exc:
+        logger.debug("Skipping unreadable file %s: %s", fpath, exc)
+        return None
+
+    buffer = "\n".join(lines)
+    candidates: set[int] = set()
+    pos = 0
+    lineno = 0
+    for match in _BUILTIN_COMBINED.finditer(buffer):
+        lineno += buffer.count("\n", pos, match.start())
+        pos = match.start()
+        candidates.add(lineno)
+
+    patterns = _PLACEHOLDER_PATTERNS
+    if extra_patterns:
+        # User patterns may anchor or look around line edges; prefilter per line.
+        patterns = _PLACEHOLDER_PATTERNS + extra_patterns
+        extra_search = _combine_patterns(extra_patterns).search
+        candidates.update(i for i, line in enumerate(lines) if extra_search(line))
+
+    hits: list[tuple[int, str]] = []
+    for i in sorted(candidates):
+        line = lines[i]
+        for pat in patterns:
+            match = pat.search(line)
+            if match:
+                hits.append((i + 1, match.group()))
+    return hits
+
+
+def _scan_files_for_placeholders(
+    files: list[Path],
+    extra_patterns: list[re.Pattern[str]],
+    workers: Optional[int],
+) -> list[Optional[list[tuple[int, str]]]]:
+    """Scan files in input order, across a process pool for large trees."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(
+                    _scan_file_for_placeholders,
+                    files,
+                    [extra_patterns] * len(files),
+                    chunksize=max(1, len(files) // (workers * 4)),
+                ))
+        except (OSError, BrokenProcessPool) as exc:
+            logger.debug("Process pool unavailable, scanning serially: %s", exc)
+    return [_scan_file_for_placeholders(f, extra_patterns) for f in files]
+
+
 # ---------------------------------------------------------------------------
 # Gate 1: Placeholder scan
 # ---------------------------------------------------------------------------
@@ -86,10 +198,16 @@ def scan_placeholders(
     trace_id: str | None = None,
     blocking: bool = True,
     extra_patterns: list[str] | None = None,
+    exclude_dirs: list[str] | None = None,
+    workers: int | None = None,
 ) -> GateResult:
     """
     Scan source files for leftover placeholder tokens.
 
+    Each file buffer is prefiltered with a single combined regex, and large
+    trees are scanned across a process pool; findings are reported per
+    file, line and pattern in the same order as a line-by-line scan.
+
     Args:
         gate_id: Unique gate identifier.
         task_id: Parent task span ID.
@@ -98,6 +216,9 @@ def scan_placeholders(
         trace_id: Optional trace ID.
         blocking: Whether failures block downstream.
         extra_patterns: Additional regex patterns to scan for.
+        exclude_dirs: Directory names to skip while walking (e.g. ``.git``).
+        workers: Process pool size for large trees (default: CPU count;
+            1 scans in-process).
 
     Returns:
         A :class:`GateResult` with per-match evidence.
@@ -105,32 +226,28 @@ def scan_placeholders(
     if isinstance(phase, str):
         phase = Phase(phase)
 
-    patterns = list(_PLACEHOLDER_PATTERNS)
+    extra: list[re.Pattern[str]] = []
     for p in (extra_patterns or []):
         try:
-            patterns.append(re.compile(p, re.IGNORECASE))
+            extra.append(re.compile(p, re.IGNORECASE))
         except re.error as exc:
             logger.warning("Skipping invalid extra pattern %r: %s", p, exc)
 
     evidence: list[EvidenceItem] = []
     source_path = Path(source_dir)
 
-    for fpath in _iter_source_files(source_path):
-        try:
-            lines = fpath.read_text(encoding="utf-8", errors="replace").splitlines()
-        except OSError as exc:
-            logger.debug("Skipping unreadable file %s: %s", fpath, exc)
+    files = _iter_source_files(source_path, set(exclude_dirs or ()))
+    scanned = _scan_files_for_placeholders(files, extra, workers)
+    for fpath, hits in zip(files, scanned, strict=True):
+        if not hits:
             continue
         rel = str(fpath.relative_to(source_path))
-        for lineno, line in enumerate(lines, start=1):
-            for pat in patterns:
-                match = pat.search(line)
-                if match:
-                    evidence.append(EvidenceItem(
-                        type="placeholder_found",
-                        ref=f"{rel}:{lineno}",
-                        description=f"Pattern '{match.group()}' in {rel} line {lineno}.",
-                    ))
+        for lineno, text in hits:
+            evidence.append(EvidenceItem(
+                type="placeholder_found",
+                ref=f"{rel}:{lineno}",
+                description=f"Pattern '{text}' in {rel} line {lineno}.",
+            ))
 
     if evidence:
         result = GateResult(
@@ -754,6 +871,8 @@ class ContentVerifier:
         phase: Phase | str = Phase.FINALIZE_VERIFY,
         blocking: bool = True,
         extra_patterns: list[str] | None = None,
+        exclude_dirs: list[str] | None = None,
+        workers: int | None = None,
     ) -> GateResult:
         """Run :func:`scan_placeholders` and record the result."""
         result = scan_placeholders(
@@ -764,6 +883,8 @@ class ContentVerifier:
             trace_id=self.trace_id,
             blocking=blocking,
             extra_patterns=extra_patterns,
+            exclude_dirs=exclude_dirs,
+            workers=workers,
         )
         self.results.append(result)
         return result
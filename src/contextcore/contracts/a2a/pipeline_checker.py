@@ -14,6 +14,11 @@ export output directory and applies the full gate suite:
 8. **Artifact inventory** — validates v2 provenance artifact_inventory roles
 9. **Service metadata** — validates transport_protocol and schema_contract declarations
 
+Gates only read the loaded metadata, so they run concurrently on a thread
+pool (``max_workers``); the report lists them in the order above regardless.
+Checksums come from the persistent ``utils.file_checksums`` cache, so
+unchanged files are not re-hashed on repeated runs.
+
 Usage::
 
     from contextcore.contracts.a2a.pipeline_checker import PipelineChecker
@@ -29,10 +34,10 @@ CLI::
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -51,32 +56,11 @@ from contextcore.contracts.a2a.models import (
     GateSeverity,
     Phase,
 )
+from contextcore.utils.file_checksums import FileChecksumCache, get_checksum_cache
 
 logger = logging.getLogger(__name__)
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _sha256_file(path: Path) -> Optional[str]:
-    """Compute SHA-256 hex digest of a file, or ``None`` if it doesn't exist."""
-    if not path.exists():
-        return None
-    hasher = hashlib.sha256()
-    with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
-
-
-def _sha256_content(content: str | bytes) -> str:
-    """Compute SHA-256 hex digest of string/bytes content."""
-    if isinstance(content, str):
-        content = content.encode("utf-8")
-    return hashlib.sha256(content).hexdigest()
-
-
 # ---------------------------------------------------------------------------
 # Report data structures
 # ---------------------------------------------------------------------------
@@ -201,6 +185,10 @@ class PipelineChecker:
             ``onboarding-metadata.json`` and optionally ``provenance.json``.
         task_id: Optional task span ID for gate context (defaults to project ID).
         trace_id: Optional trace ID for gate context.
+        max_workers: Gates run concurrently on this many threads (1 runs
+            them sequentially in the calling thread).
+        checksum_cache: File checksum cache (defaults to the shared,
+            persistent cache).
     """
 
     def __init__(
@@ -210,11 +198,15 @@ class PipelineChecker:
         task_id: str | None = None,
         trace_id: str | None = None,
         min_coverage: float | None = None,
+        max_workers: int = 4,
+        checksum_cache: FileChecksumCache | None = None,
     ) -> None:
         self.output_dir = Path(output_dir)
         self.task_id = task_id
         self.trace_id = trace_id
         self.min_coverage = min_coverage
+        self.max_workers = max(1, max_workers)
+        self._checksums = checksum_cache or get_checksum_cache()
 
         # Loaded lazily by _load()
         self._metadata: dict[str, Any] = {}
@@ -334,7 +326,7 @@ class PipelineChecker:
             for base in [self.output_dir.parent, Path.cwd()]:
                 source_path = base / source_rel
                 if source_path.exists():
-                    recomputed["source_checksum"] = _sha256_file(source_path) or ""
+                    recomputed["source_checksum"] = self._checksums.sha256(source_path) or ""
                     break
 
         # Recompute artifact manifest checksum
@@ -342,16 +334,18 @@ class PipelineChecker:
         if manifest_rel:
             manifest_path = self.output_dir / manifest_rel
             if manifest_path.exists():
-                content = manifest_path.read_text(encoding="utf-8")
-                recomputed["artifact_manifest_checksum"] = _sha256_content(content)
+                checksum = self._checksums.sha256(manifest_path, text=True)
+                if checksum:
+                    recomputed["artifact_manifest_checksum"] = checksum
 
         # Recompute project context checksum
         ctx_rel = self._metadata.get("project_context_path")
         if ctx_rel:
             ctx_path = self.output_dir / ctx_rel
             if ctx_path.exists():
-                content = ctx_path.read_text(encoding="utf-8")
-                recomputed["project_context_checksum"] = _sha256_content(content)
+                checksum = self._checksums.sha256(ctx_path, text=True)
+                if checksum:
+                    recomputed["project_context_checksum"] = checksum
 
         # Build expected/actual maps for the gate — only include keys we can verify
         expected: dict[str, str] = {}
@@ -1181,6 +1175,17 @@ class PipelineChecker:
 
     # ---- Main runner --------------------------------------------------------
 
+    def _run_gates(self, gates: list) -> list[Optional[GateResult]]:
+        """Run gate methods concurrently; results are in input order."""
+        if self.max_workers == 1:
+            return [gate() for gate in gates]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(gates)),
+            thread_name_prefix="pipeline-gate",
+        ) as pool:
+            futures = [pool.submit(gate) for gate in gates]
+            return [f.result() for f in futures]
+
     @property
     def _effective_task_id(self) -> str:
         return self.task_id or self._metadata.get("project_id", "pipeline-check")
@@ -1200,6 +1205,9 @@ class PipelineChecker:
         8. Artifact inventory (provenance v2 role registration)
         9. Service metadata (transport protocol, schema contract)
         10. Edit-first coverage (edit_min_pct thresholds in output contracts)
+
+        The gates are independent of each other and run concurrently; the
+        report lists them in the order above.
         """
         self._load()
 
@@ -1209,18 +1217,40 @@ class PipelineChecker:
             project_id=project_id,
         )
 
+        (
+            structural,
+            checksum,
+            provenance,
+            mapping,
+            gap_parity,
+            calibration,
+            param_check,
+            inv_check,
+            svc_check,
+            efe_check,
+        ) = self._run_gates([
+            self._check_structural_integrity,
+            self._check_checksum_chain,
+            self._check_provenance_consistency,
+            self._check_mapping_completeness,
+            self._check_gap_parity,
+            self._check_design_calibration,
+            self._check_parameter_resolvability,
+            self._check_artifact_inventory,
+            self._check_service_metadata,
+            self._check_edit_first_coverage,
+        ])
+        self._checksums.save()
+
         # 1. Structural integrity
-        structural = self._check_structural_integrity()
         report.gates.append(structural)
         if structural.result == GateOutcome.FAIL:
             logger.warning("Structural integrity failed — remaining checks may be unreliable.")
 
         # 2. Checksum chain
-        checksum = self._check_checksum_chain()
         report.gates.append(checksum)
 
         # 3. Provenance cross-check
-        provenance = self._check_provenance_consistency()
         if provenance:
             report.gates.append(provenance)
         else:
@@ -1229,7 +1259,6 @@ class PipelineChecker:
             )
 
         # 4. Mapping completeness
-        mapping = self._check_mapping_completeness()
         if mapping:
             report.gates.append(mapping)
         else:
@@ -1243,7 +1272,6 @@ class PipelineChecker:
                 )
 
         # 5. Gap parity
-        gap_parity = self._check_gap_parity()
         if gap_parity:
             report.gates.append(gap_parity)
         else:
@@ -1252,7 +1280,6 @@ class PipelineChecker:
             )
 
         # 6. Design calibration
-        calibration = self._check_design_calibration()
         if calibration:
             report.gates.append(calibration)
         else:
@@ -1261,7 +1288,6 @@ class PipelineChecker:
             )
 
         # 7. Parameter resolvability
-        param_check = self._check_parameter_resolvability()
         if param_check:
             report.gates.append(param_check)
         else:
@@ -1270,7 +1296,6 @@ class PipelineChecker:
             )
 
         # 8. Artifact inventory (Mottainai)
-        inv_check = self._check_artifact_inventory()
         if inv_check:
             report.gates.append(inv_check)
         else:
@@ -1279,7 +1304,6 @@ class PipelineChecker:
             )
 
         # 9. Service metadata
-        svc_check = self._check_service_metadata()
         if svc_check:
             report.gates.append(svc_check)
         else:
@@ -1290,7 +1314,6 @@ class PipelineChecker:
                 )
 
         # 10. Edit-first coverage
-        efe_check = self._check_edit_first_coverage()
         if efe_check:
             report.gates.append(efe_check)
         else:
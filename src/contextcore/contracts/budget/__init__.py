@@ -18,6 +18,7 @@ Public API::
         BudgetTracker,
         BudgetConsumption,
         BUDGET_KEY,
+        BUDGET_LEDGER_KEY,
         # Validator
         BudgetValidator,
         BudgetCheckResult,
@@ -40,6 +41,7 @@ from contextcore.contracts.budget.schema import (
 )
 from contextcore.contracts.budget.tracker import (
     BUDGET_KEY,
+    BUDGET_LEDGER_KEY,
     BudgetConsumption,
     BudgetTracker,
 )
@@ -60,6 +62,7 @@ __all__ = [
     "BudgetTracker",
     "BudgetConsumption",
     "BUDGET_KEY",
+    "BUDGET_LEDGER_KEY",
     # Validator
     "BudgetValidator",
     "BudgetCheckResult",
@@ -8,6 +8,13 @@ Consumption records are stored inside the context dict itself (under
 Follows the provenance-in-context pattern from
 ``contracts/propagation/tracker.py``.
 
+Alongside the audit list, a ledger of running totals per budget and per
+(budget, phase) is kept under ``_cc_budget_ledger``, so consumption checks
+cost O(1) regardless of how many records have accumulated. The ledger is
+rebuilt from the records whenever its record count no longer matches
+(e.g. a context assembled by hand); records should be added via
+``BudgetTracker.record``.
+
 Usage::
 
     from contextcore.contracts.budget.tracker import BudgetTracker
@@ -33,6 +40,9 @@ logger = logging.getLogger(__name__)
 # Key under which budget consumption metadata is stored in the context dict.
 BUDGET_KEY = "_cc_budgets"
 
+# Key under which running consumption totals are stored in the context dict.
+BUDGET_LEDGER_KEY = "_cc_budget_ledger"
+
 
 @dataclass
 class BudgetConsumption:
@@ -57,6 +67,49 @@ def _get_records(context: dict[str, Any]) -> list[dict[str, Any]]:
     return context.setdefault(BUDGET_KEY, [])
 
 
+def _build_ledger(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Compute running totals from scratch."""
+    ledger: dict[str, Any] = {"count": 0, "budgets": {}}
+    for r in records:
+        _apply_to_ledger(ledger, r["budget_id"], r["phase"], r["consumed"])
+    return ledger
+
+
+def _add(acc: list[float], value: float) -> None:
+    """Neumaier-compensated add into ``[total, compensation]`` (as builtin sum())."""
+    total = acc[0]
+    t = total + value
+    if abs(total) >= abs(value):
+        acc[1] += (total - t) + value
+    else:
+        acc[1] += (value - t) + total
+    acc[0] = t
+
+
+def _value(acc: list[float]) -> float:
+    return acc[0] + acc[1] if acc[1] else acc[0]
+
+
+def _apply_to_ledger(
+    ledger: dict[str, Any], budget_id: str, phase: str, consumed: float
+) -> None:
+    entry = ledger["budgets"].setdefault(budget_id, {"total": [0.0, 0.0], "phases": {}})
+    _add(entry["total"], consumed)
+    _add(entry["phases"].setdefault(phase, [0.0, 0.0]), consumed)
+    ledger["count"] += 1
+
+
+def _get_ledger(context: dict[str, Any]) -> dict[str, Any]:
+    """Return the running-totals ledger, rebuilding it if out of step with the records."""
+    records = context.get(BUDGET_KEY, [])
+    ledger = context.get(BUDGET_LEDGER_KEY)
+    if not isinstance(ledger, dict) or ledger.get("count") != len(records):
+        ledger = _build_ledger(records)
+        if records:
+            context[BUDGET_LEDGER_KEY] = ledger
+    return ledger
+
+
 def _find_budget(contract: BudgetPropagationSpec, budget_id: str) -> Optional[BudgetSpec]:
     """Find a BudgetSpec by id, or None."""
     for b in contract.budgets:
@@ -86,6 +139,7 @@ class BudgetTracker:
         Returns:
             The ``BudgetConsumption`` record that was stored.
         """
+        ledger = _get_ledger(context)
         records = _get_records(context)
         entry = BudgetConsumption(
             budget_id=budget_id,
@@ -94,6 +148,8 @@ class BudgetTracker:
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
         records.append(entry.to_dict())
+        _apply_to_ledger(ledger, budget_id, phase, consumed)
+        context[BUDGET_LEDGER_KEY] = ledger
         logger.debug(
             "Recorded consumption: budget=%s phase=%s consumed=%.2f",
             budget_id,
@@ -116,10 +172,8 @@ class BudgetTracker:
         Returns:
             Total consumed amount.
         """
-        records = context.get(BUDGET_KEY, [])
-        return sum(
-            r["consumed"] for r in records if r["budget_id"] == budget_id
-        )
+        entry = _get_ledger(context)["budgets"].get(budget_id)
+        return _value(entry["total"]) if entry else 0.0
 
     def get_remaining(
         self,
@@ -160,12 +214,9 @@ class BudgetTracker:
         Returns:
             Amount consumed by this phase for this budget.
         """
-        records = context.get(BUDGET_KEY, [])
-        return sum(
-            r["consumed"]
-            for r in records
-            if r["budget_id"] == budget_id and r["phase"] == phase
-        )
+        entry = _get_ledger(context)["budgets"].get(budget_id)
+        acc = entry["phases"].get(phase) if entry else None
+        return _value(acc) if acc else 0.0
 
     def query_budget(
         self,
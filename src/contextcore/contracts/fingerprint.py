@@ -0,0 +1,162 @@
+"""
+Structural value fingerprints for lineage and propagation tracking.
+
+Trackers record a short fingerprint of every value they see so later checks
+can tell whether a value changed between phases. The original scheme,
+``sha256(repr(value))[:8]``, builds the full repr of large documents and
+nested dicts on every record. This module instead serializes values with
+``marshal`` (format version 2, which is deterministic across processes and
+has no reference sharing) and hashes the bytes with BLAKE2b:
+
+- Plain data (str, bytes, int, float, bool, None, and lists, tuples and
+  dicts of them) is serialized entirely in C.
+- Anything else (enums, models, custom objects) takes a canonical walk in
+  which unknown objects contribute their type and repr and sets are
+  ordered by element. Sets nested inside otherwise plain data keep their
+  iteration order, as they did under repr.
+- Large immutable strings and bytes are memoized by identity, so a
+  document carried unchanged through many phases is hashed once.
+
+Fingerprints are 16 hex characters; legacy fingerprints are 8. During the
+migration window, ``fingerprint_matches()`` compares a stored fingerprint of
+either kind against a value, and setting ``CONTEXTCORE_FINGERPRINT_SCHEME=legacy``
+makes trackers keep emitting 8-character legacy fingerprints.
+
+Usage::
+
+    from contextcore.contracts.fingerprint import fingerprint, fingerprint_matches
+
+    fp = fingerprint({"domain": "web_application"})
+    assert fingerprint_matches(fp, {"domain": "web_application"})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+__all__ = [
+    "LEGACY_FINGERPRINT_LENGTH",
+    "fingerprint",
+    "fingerprint_matches",
+    "legacy_fingerprint",
+    "value_fingerprint",
+]
+
+LEGACY_FINGERPRINT_LENGTH = 8
+
+# marshal format 2 predates reference sharing and interned-string flags,
+# so equal values always serialize to identical bytes.
+_MARSHAL_VERSION = 2
+
+_PLAIN_SCALARS = (str, bytes, int, float, bool, type(None))
+
+# Identity memo for large immutable values: id -> (value, fingerprint).
+# Holding the value keeps its id from being reused while memoized.
+_MEMO_MIN_SIZE = 4096
+_MEMO_MAX_ENTRIES = 256
+_memo: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def legacy_fingerprint(value: Any) -> str:
+    """The original ``sha256(repr(value))[:8]`` fingerprint."""
+    return hashlib.sha256(repr(value).encode()).hexdigest()[:LEGACY_FINGERPRINT_LENGTH]
+
+
+def fingerprint(value: Any) -> str:
+    """Return the 16-character structural fingerprint of ``value``."""
+    cls = type(value)
+    if (cls is str or cls is bytes) and len(value) >= _MEMO_MIN_SIZE:
+        return _memoized(value)
+    return _digest(_serialize(value))
+
+
+def value_fingerprint(value: Any) -> str:
+    """
+    Fingerprint used by the trackers.
+
+    Structural by default; legacy when CONTEXTCORE_FINGERPRINT_SCHEME=legacy.
+    """
+    if os.environ.get("CONTEXTCORE_FINGERPRINT_SCHEME", "").lower() == "legacy":
+        return legacy_fingerprint(value)
+    return fingerprint(value)
+
+
+def fingerprint_matches(stored: str, value: Any) -> bool:
+    """Whether a stored fingerprint (legacy or structural) was taken of ``value``."""
+    if len(stored) == LEGACY_FINGERPRINT_LENGTH:
+        return stored == legacy_fingerprint(value)
+    return stored == fingerprint(value)
+
+
+def clear_fingerprint_memo() -> None:
+    """Drop identity-memoized fingerprints."""
+    with _memo_lock:
+        _memo.clear()
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _memoized(value: Any) -> str:
+    key = id(value)
+    with _memo_lock:
+        entry = _memo.get(key)
+        if entry is not None and entry[0] is value:
+            _memo.move_to_end(key)
+            return entry[1]
+    fp = _digest(_serialize(value))
+    with _memo_lock:
+        _memo[key] = (value, fp)
+        _memo.move_to_end(key)
+        while len(_memo) > _MEMO_MAX_ENTRIES:
+            _memo.popitem(last=False)
+    return fp
+
+
+def _serialize(value: Any) -> bytes:
+    if not isinstance(value, (set, frozenset)):
+        try:
+            return marshal.dumps(value, _MARSHAL_VERSION)
+        except ValueError:
+            # Contains something marshal cannot represent (or a str/int
+            # subclass such as an Enum); fall back to the canonical walk.
+            pass
+    return marshal.dumps(_canonical(value), _MARSHAL_VERSION)
+
+
+def _canonical(value: Any) -> Any:
+    """Rebuild ``value`` from plain data only, deterministically."""
+    cls = type(value)
+    if cls in _PLAIN_SCALARS:
+        return value
+    if cls is list:
+        return [_canonical(v) for v in value]
+    if cls is tuple:
+        return tuple(_canonical(v) for v in value)
+    if cls is dict:
+        return {_canonical_key(k): _canonical(v) for k, v in value.items()}
+    if cls is set or cls is frozenset:
+        members = sorted(marshal.dumps(_canonical(v), _MARSHAL_VERSION) for v in value)
+        return ("__set__", tuple(members))
+    return ("__obj__", f"{cls.__module__}.{cls.__qualname__}", repr(value))
+
+
+def _canonical_key(key: Any) -> Any:
+    canonical = _canonical(key)
+    try:
+        hash(canonical)
+    except TypeError:
+        return ("__key__", marshal.dumps(canonical, _MARSHAL_VERSION))
+    return canonical
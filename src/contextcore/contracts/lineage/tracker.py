@@ -5,8 +5,8 @@ Records individual field transformations as context flows through pipeline
 phases.  Transformation metadata is stored inside the context dict itself
 (under ``_cc_lineage``) so it travels with the context through the pipeline.
 
-Hash computation uses ``sha256[:8]`` of ``repr(value)`` — the same scheme
-used by ``propagation/tracker.py``.
+Hashes are structural fingerprints from ``contracts/fingerprint.py`` — the
+same scheme used by ``propagation/tracker.py``.
 
 Usage::
 
@@ -23,12 +23,12 @@ Usage::
 
 from __future__ import annotations
 
-import hashlib
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from contextcore.contracts.fingerprint import value_fingerprint
 from contextcore.contracts.types import TransformOp
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,7 @@ logger = logging.getLogger(__name__)
 
 def _value_hash(value: Any) -> str:
     """Compute a short hash of a value for lineage tracking."""
-    return hashlib.sha256(repr(value).encode()).hexdigest()[:8]
+    return value_fingerprint(value)
 
 
 # ---------------------------------------------------------------------------
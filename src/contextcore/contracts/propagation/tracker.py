@@ -19,7 +19,6 @@ Usage::
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import platform
 import signal
@@ -27,6 +26,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from contextcore.contracts.fingerprint import value_fingerprint
 from contextcore.contracts.propagation.schema import ContextContract, PropagationChainSpec
 from contextcore.contracts.types import ChainStatus
 
@@ -42,7 +42,7 @@ class FieldProvenance:
 
     origin_phase: str
     set_at: str  # ISO 8601 timestamp
-    value_hash: str  # sha256[:8] of repr(value)
+    value_hash: str  # contracts.fingerprint of the value
     evaluated_by: Optional[str] = None  # evaluator ID
     evaluation_score: Optional[float] = None  # numeric score
     evaluation_timestamp: Optional[str] = None  # ISO 8601
@@ -96,7 +96,7 @@ class PropagationChainResult:
 
 def _value_hash(value: Any) -> str:
     """Compute a short hash of a value for provenance tracking."""
-    return hashlib.sha256(repr(value).encode()).hexdigest()[:8]
+    return value_fingerprint(value)
 
 
 def _timeout_handler(signum: int, frame: Any) -> None:
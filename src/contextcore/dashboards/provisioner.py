@@ -4,14 +4,22 @@ Dashboard provisioner for Grafana.
 Handles provisioning ContextCore dashboards to Grafana via API.
 Supports auto-detection of Grafana URL, idempotent provisioning,
 and auto-discovery of dashboards from extension folders.
+
+provision_all() works over one pooled HTTP client: folders are resolved
+once per run, dashboards are provisioned concurrently, and a dashboard whose
+content hash matches the version already deployed in Grafana is skipped
+instead of being re-posted.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import threading
 import time as time_module
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -34,6 +42,27 @@ from contextcore.dashboards.discovery import (
 
 logger = logging.getLogger(__name__)
 
+# Dashboards provisioned in parallel by provision_all()
+DEFAULT_PROVISION_WORKERS = 8
+
+# Fields Grafana rewrites on every save; ignored when comparing content
+_VOLATILE_DASHBOARD_KEYS = ("id", "version")
+
+
+def dashboard_content_hash(dashboard: dict) -> str:
+    """
+    SHA-256 of a dashboard's content, ignoring fields Grafana assigns on save.
+
+    Args:
+        dashboard: Dashboard JSON (as posted, or as returned by Grafana)
+
+    Returns:
+        Hex digest that is equal for local and deployed copies of the same content
+    """
+    content = {k: v for k, v in dashboard.items() if k not in _VOLATILE_DASHBOARD_KEYS}
+    payload = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 @dataclass
 class DashboardConfig:
@@ -55,7 +84,9 @@ class DashboardProvisioner:
     - Auto-discovery of dashboards from extension folders
     - Auto-detection of Grafana URL from environment
     - API key or basic auth authentication
-    - Idempotent provisioning (safe to run multiple times)
+    - Idempotent provisioning (safe to run multiple times; unchanged
+      dashboards are skipped)
+    - Concurrent provisioning over a pooled HTTP client
     - Per-extension folder organization
     - Extension filtering (provision only specific extensions)
     - Dry-run mode for preview
@@ -99,6 +130,7 @@ class DashboardProvisioner:
         self.username = username or os.environ.get("GRAFANA_USERNAME", "admin")
         self.password = password or os.environ.get("GRAFANA_PASSWORD", "admin")
         self._folder_cache: dict[str, int] = {}  # folder_uid -> folder_id
+        self._folder_lock = threading.Lock()
         self._dashboard_root = get_dashboard_root()
 
     def _get_headers(self) -> dict[str, str]:
@@ -114,6 +146,17 @@ class DashboardProvisioner:
             return None
         return (self.username, self.password)
 
+    @staticmethod
+    def _new_client(max_connections: int = 1) -> httpx.Client:
+        """HTTP client whose connections are reused across requests of a run."""
+        return httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
     def _request_with_retry(
         self,
         client: httpx.Client,
@@ -214,6 +257,16 @@ class DashboardProvisioner:
         if folder_uid in self._folder_cache:
             return self._folder_cache[folder_uid]
 
+        # Serialize misses so concurrent provisioning creates a folder only once
+        with self._folder_lock:
+            if folder_uid in self._folder_cache:
+                return self._folder_cache[folder_uid]
+            return self._lookup_or_create_folder(client, folder_name, folder_uid)
+
+    def _lookup_or_create_folder(
+        self, client: httpx.Client, folder_name: str, folder_uid: str
+    ) -> int:
+        """Find a folder by UID or name, creating it if missing."""
         # Check if folder exists by UID
         try:
             response = self._request_with_retry(
@@ -261,6 +314,73 @@ class DashboardProvisioner:
         logger.info(f"Created folder '{folder_name}' (uid: {folder_uid})")
         return folder_id
 
+    def _resolve_folders(
+        self, client: httpx.Client, dashboards: List[DiscoveryConfig]
+    ) -> None:
+        """
+        Fill the folder cache for a provisioning run.
+
+        Lists existing folders once, then looks up or creates only the folders
+        that listing did not contain.
+
+        Raises:
+            httpx.ConnectError: If Grafana cannot be reached
+        """
+        try:
+            response = self._request_with_retry(
+                client,
+                "get",
+                f"{self.grafana_url}/api/folders",
+                headers=self._get_headers(),
+                auth=self._get_auth(),
+            )
+            existing = (
+                {f.get("uid"): f["id"] for f in response.json()}
+                if response.status_code == 200
+                else {}
+            )
+        except httpx.ConnectError:
+            raise
+        except Exception as e:
+            logger.debug(f"Could not list Grafana folders: {e}")
+            existing = {}
+
+        folders = {config.folder_uid: config.folder for config in dashboards}
+        for folder_uid, folder_name in folders.items():
+            if folder_uid in existing:
+                self._folder_cache[folder_uid] = existing[folder_uid]
+                continue
+            try:
+                self._ensure_folder(client, folder_name, folder_uid)
+            except httpx.ConnectError:
+                raise
+            except Exception as e:
+                # Reported per dashboard when provisioning retries the folder
+                logger.debug(f"Could not resolve folder '{folder_name}': {e}")
+
+    def _is_deployed(
+        self, client: httpx.Client, uid: str, dashboard_json: dict, folder_id: int
+    ) -> bool:
+        """True if Grafana already holds this exact dashboard content in this folder."""
+        response = self._request_with_retry(
+            client,
+            "get",
+            f"{self.grafana_url}/api/dashboards/uid/{uid}",
+            headers=self._get_headers(),
+            auth=self._get_auth(),
+        )
+        if response.status_code != 200:
+            return False
+        try:
+            data = response.json()
+            deployed = data["dashboard"]
+            meta = data.get("meta", {})
+        except (ValueError, KeyError, TypeError):
+            return False
+        if meta.get("folderId", folder_id) != folder_id:
+            return False
+        return dashboard_content_hash(deployed) == dashboard_content_hash(dashboard_json)
+
     def _load_dashboard_json(self, config: DiscoveryConfig) -> dict:
         """
         Load dashboard JSON from file.
@@ -296,6 +416,8 @@ class DashboardProvisioner:
         self,
         config: DiscoveryConfig,
         dry_run: bool = False,
+        client: Optional[httpx.Client] = None,
+        force: bool = False,
     ) -> Tuple[str, bool, str]:
         """
         Provision a single dashboard to Grafana.
@@ -303,6 +425,8 @@ class DashboardProvisioner:
         Args:
             config: Dashboard configuration from discovery
             dry_run: If True, only validate without applying
+            client: HTTP client to reuse (a new one is opened if None)
+            force: Post the dashboard even if Grafana already has identical content
 
         Returns:
             Tuple of (dashboard_title, success, message)
@@ -316,43 +440,10 @@ class DashboardProvisioner:
             return (config.title or config.uid, True, f"Dry run - would provision to {config.folder}")
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                # Get folder for this extension
-                folder_id = self._ensure_folder(
-                    client, config.folder, config.folder_uid
-                )
-
-                # Prepare dashboard payload
-                payload = {
-                    "dashboard": dashboard_json,
-                    "folderId": folder_id,
-                    "overwrite": True,
-                    "message": f"Provisioned by ContextCore ({config.extension})",
-                }
-
-                # Create/update dashboard
-                response = self._request_with_retry(
-                    client,
-                    "post",
-                    f"{self.grafana_url}/api/dashboards/db",
-                    headers=self._get_headers(),
-                    auth=self._get_auth(),
-                    json=payload,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return (
-                        config.title or config.uid,
-                        True,
-                        f"Provisioned to {config.folder}: {data.get('url', config.uid)}",
-                    )
-                else:
-                    return (
-                        config.title or config.uid,
-                        False,
-                        self._format_grafana_error(response),
-                    )
+            if client is None:
+                with self._new_client() as own_client:
+                    return self._post_dashboard(own_client, config, dashboard_json, force)
+            return self._post_dashboard(client, config, dashboard_json, force)
 
         except httpx.ConnectError:
             return (
@@ -363,20 +454,72 @@ class DashboardProvisioner:
         except Exception as e:
             return (config.title or config.uid, False, str(e))
 
+    def _post_dashboard(
+        self,
+        client: httpx.Client,
+        config: DiscoveryConfig,
+        dashboard_json: dict,
+        force: bool,
+    ) -> Tuple[str, bool, str]:
+        # Get folder for this extension
+        folder_id = self._ensure_folder(client, config.folder, config.folder_uid)
+
+        uid = dashboard_json.get("uid") or config.uid
+        if not force and self._is_deployed(client, uid, dashboard_json, folder_id):
+            return (config.title or config.uid, True, f"Unchanged in {config.folder}")
+
+        # Prepare dashboard payload
+        payload = {
+            "dashboard": dashboard_json,
+            "folderId": folder_id,
+            "overwrite": True,
+            "message": f"Provisioned by ContextCore ({config.extension})",
+        }
+
+        # Create/update dashboard
+        response = self._request_with_retry(
+            client,
+            "post",
+            f"{self.grafana_url}/api/dashboards/db",
+            headers=self._get_headers(),
+            auth=self._get_auth(),
+            json=payload,
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            return (
+                config.title or config.uid,
+                True,
+                f"Provisioned to {config.folder}: {data.get('url', config.uid)}",
+            )
+        return (
+            config.title or config.uid,
+            False,
+            self._format_grafana_error(response),
+        )
+
     def provision_all(
         self,
         dry_run: bool = False,
         extension: Optional[str] = None,
+        force: bool = False,
+        max_workers: int = DEFAULT_PROVISION_WORKERS,
     ) -> List[Tuple[str, bool, str]]:
         """
         Provision all discovered dashboards to Grafana.
 
         Uses auto-discovery to find all dashboards in extension folders
-        and provisions them to the appropriate Grafana folders.
+        and provisions them to the appropriate Grafana folders. Folders are
+        resolved once, dashboards are provisioned concurrently over one pooled
+        client, and dashboards already deployed with identical content are
+        skipped.
 
         Args:
             dry_run: If True, only validate without applying
             extension: Optional extension to filter by (e.g., "core", "squirrel")
+            force: Re-post every dashboard, even unchanged ones
+            max_workers: Dashboards provisioned in parallel
 
         Returns:
             List of (dashboard_title, success, message) tuples
@@ -402,12 +545,12 @@ class DashboardProvisioner:
             f"{f' for extension {extension}' if extension else ''}"
         )
 
-        results = []
-        for config in dashboards:
-            result = self.provision_dashboard(config, dry_run=dry_run)
-            results.append(result)
-            status = "OK" if result[1] else "FAILED"
-            logger.debug(f"  {result[0]}: {status}")
+        if dry_run:
+            results = [self.provision_dashboard(config, dry_run=True) for config in dashboards]
+        else:
+            results = self._provision_concurrently(dashboards, force, max_workers)
+        for name, ok, _ in results:
+            logger.debug(f"  {name}: {'OK' if ok else 'FAILED'}")
 
         # Summary logging
         success_count = sum(1 for _, ok, _ in results if ok)
@@ -421,6 +564,32 @@ class DashboardProvisioner:
 
         return results
 
+    def _provision_concurrently(
+        self,
+        dashboards: List[DiscoveryConfig],
+        force: bool,
+        max_workers: int,
+    ) -> List[Tuple[str, bool, str]]:
+        workers = max(1, min(max_workers, len(dashboards)))
+        with self._new_client(max_connections=workers) as client:
+            # Resolve folders afresh each run; they may have changed in Grafana
+            self._folder_cache.clear()
+            try:
+                self._resolve_folders(client, dashboards)
+            except httpx.ConnectError:
+                message = f"Cannot connect to Grafana at {self.grafana_url}"
+                return [(config.title or config.uid, False, message) for config in dashboards]
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(
+                    pool.map(
+                        lambda config: self.provision_dashboard(
+                            config, client=client, force=force
+                        ),
+                        dashboards,
+                    )
+                )
+
     def list_provisioned(self, extension: Optional[str] = None) -> List[dict]:
         """
         List ContextCore dashboards currently in Grafana.
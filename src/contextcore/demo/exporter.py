@@ -15,8 +15,7 @@ from __future__ import annotations
 
 import json
 import logging
-import requests
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from opentelemetry.sdk.trace import ReadableSpan
@@ -167,107 +166,51 @@ def load_to_loki(
     endpoint: str,
     logs_file: Optional[str] = None,
     logs: Optional[List[Dict[str, Any]]] = None,
+    max_batch_bytes: int = 1_000_000,
+    workers: int = 4,
 ) -> Dict[str, Any]:
     """
     Load logs to Loki via push API.
 
+    Logs are streamed from the file and pushed in gzip-compressed batches of
+    at most ``max_batch_bytes`` (see ``contextcore.demo.replay.LokiPusher``).
+
     Args:
         endpoint: Loki push endpoint (e.g., http://localhost:3100/loki/api/v1/push)
         logs_file: Path to JSON file with logs (alternative to logs param)
         logs: List of log dictionaries (alternative to logs_file param)
+        max_batch_bytes: Uncompressed payload budget per push request
+        workers: Concurrent push requests
 
     Returns:
         Statistics about the export
     """
+    from contextcore.demo.replay import LokiPusher, iter_json_array
+
     if logs_file:
-        log_entries = load_logs_from_file(logs_file)
+        log_entries = iter_json_array(logs_file, "logs")
     elif logs:
         log_entries = logs
     else:
         raise ValueError("Either logs_file or logs must be provided")
 
-    # Group logs by service label for efficient Loki push
-    streams: Dict[str, List[List]] = {}
-    now_ns = int(datetime.now(timezone.utc).timestamp() * 1e9)
-    future_clamped = 0
-
-    for log_entry in log_entries:
-        # Build label set
-        service = log_entry.get("service", "contextcore")
-        project_id = log_entry.get("project_id", "unknown")
-
-        label_key = f'{{service="{service}", project_id="{project_id}"}}'
-
-        if label_key not in streams:
-            streams[label_key] = []
-
-        # Convert timestamp to nanoseconds
-        ts = log_entry.get("timestamp", datetime.now(timezone.utc).isoformat())
-        if isinstance(ts, str):
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            ts_ns_int = int(dt.timestamp() * 1e9)
-        else:
-            ts_ns_int = int(ts * 1e9)
-
-        # Safety net: clamp to never exceed now (Loki rejects future timestamps)
-        if ts_ns_int > now_ns:
-            ts_ns_int = now_ns
-            future_clamped += 1
-
-        ts_ns = str(ts_ns_int)
-
-        # Log line is the full JSON entry
-        log_line = json.dumps(log_entry, default=str)
-
-        streams[label_key].append([ts_ns, log_line])
-
-    if future_clamped > 0:
-        logger.warning(
-            f"Clamped {future_clamped} future timestamp(s) to now in Loki push"
-        )
-
-    # Build Loki push payload
-    loki_streams = []
-    for label_key, values in streams.items():
-        # Parse labels from the key
-        labels = {}
-        label_key_clean = label_key.strip("{}")
-        for part in label_key_clean.split(", "):
-            k, v = part.split("=")
-            labels[k] = v.strip('"')
-
-        loki_streams.append({
-            "stream": labels,
-            "values": values
-        })
-
-    payload = {"streams": loki_streams}
-
-    # Push to Loki
+    pusher = LokiPusher(endpoint, max_batch_bytes=max_batch_bytes, workers=workers)
+    counters: Dict[str, int] = {}
     try:
-        response = requests.post(
-            endpoint,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
-        response.raise_for_status()
+        stats = pusher.push(log_entries, counters=counters)
+    finally:
+        pusher.close()
 
-        logger.info(f"Pushed {len(log_entries)} logs to Loki at {endpoint}")
-        return {
-            "endpoint": endpoint,
-            "logs_pushed": len(log_entries),
-            "streams": len(loki_streams),
-            "success": True,
-        }
-
-    except requests.RequestException as e:
-        logger.error(f"Failed to push logs to Loki: {e}")
-        return {
-            "endpoint": endpoint,
-            "logs_pushed": 0,
-            "success": False,
-            "error": str(e),
-        }
+    result: Dict[str, Any] = {
+        "endpoint": endpoint,
+        "logs_pushed": stats.items_sent,
+        "streams": counters.get("streams", 0),
+        "requests": stats.requests,
+        "success": stats.success,
+    }
+    if not stats.success:
+        result["error"] = stats.errors[0] if stats.errors else "unknown error"
+    return result
 
 
 def load_to_tempo(
@@ -275,6 +218,9 @@ def load_to_tempo(
     spans_file: Optional[str] = None,
     spans: Optional[List[ReadableSpan]] = None,
     insecure: bool = True,
+    chunk_size: int = 1000,
+    workers: int = 4,
+    shift_to_now: bool = False,
 ) -> Dict[str, Any]:
     """
     Load spans to Tempo via OTLP.
@@ -284,32 +230,35 @@ def load_to_tempo(
         spans_file: Path to JSON file with spans (alternative to spans param)
         spans: List of ReadableSpan objects (alternative to spans_file param)
         insecure: Use insecure connection (no TLS)
+        chunk_size: Spans per export request (file replay only)
+        workers: Concurrent export requests (file replay only)
+        shift_to_now: Shift file timestamps so the latest span ends now
 
     Returns:
         Statistics about the export
     """
     if spans_file:
-        span_dicts = load_spans_from_file(spans_file)
-        # For file-based loading, we need to reconstruct and export
-        # This requires using the OTLP exporter with reconstructed span data
-        logger.info(f"Loaded {len(span_dicts)} span definitions from {spans_file}")
+        # Saved spans are encoded directly to OTLP protobuf, preserving
+        # trace/span IDs and parent links (see contextcore.demo.replay)
+        from contextcore.demo.replay import SpanReplayer
 
-        # Create exporter
-        exporter = OTLPSpanExporter(
-            endpoint=endpoint,
+        replayer = SpanReplayer(
+            endpoint,
             insecure=insecure,
+            chunk_size=chunk_size,
+            workers=workers,
         )
-
-        # Export spans in batches
-        # Note: For JSON-loaded spans, we need to reconstruct them
-        # This is handled by the BatchOTLPExporter below
-        batch_exporter = BatchOTLPExporter(endpoint, insecure=insecure)
-        result = batch_exporter.export_span_dicts(span_dicts)
+        try:
+            stats = replayer.replay_file(spans_file, shift_to_now=shift_to_now)
+        finally:
+            replayer.shutdown()
 
         return {
             "endpoint": endpoint,
-            "spans_exported": len(span_dicts),
-            "success": result == SpanExportResult.SUCCESS,
+            "spans_exported": stats.items_sent,
+            "spans_failed": stats.items_failed,
+            "spans_per_second": round(stats.items_per_second, 1),
+            "success": stats.success,
         }
 
     elif spans:
@@ -336,10 +285,17 @@ class BatchOTLPExporter:
     """
     Batch exporter for sending span dictionaries to OTLP endpoint.
 
-    Reconstructs span data from JSON format and exports via OTLP.
+    Encodes span dictionaries directly to OTLP protobuf and exports them in
+    concurrent chunks via ``contextcore.demo.replay.SpanReplayer``.
     """
 
-    def __init__(self, endpoint: str, insecure: bool = True, batch_size: int = 100):
+    def __init__(
+        self,
+        endpoint: str,
+        insecure: bool = True,
+        batch_size: int = 100,
+        workers: int = 4,
+    ):
         """
         Initialize batch exporter.
 
@@ -347,87 +303,44 @@ class BatchOTLPExporter:
             endpoint: OTLP gRPC endpoint
             insecure: Use insecure connection
             batch_size: Number of spans per batch
+            workers: Concurrent export requests
         """
+        from contextcore.demo.replay import SpanReplayer
+
         self.endpoint = endpoint
         self.insecure = insecure
         self.batch_size = batch_size
-        self._exporter = OTLPSpanExporter(
-            endpoint=endpoint,
+        self._replayer = SpanReplayer(
+            endpoint,
             insecure=insecure,
+            chunk_size=batch_size,
+            workers=workers,
         )
 
-    def export_span_dicts(self, span_dicts: List[Dict[str, Any]]) -> SpanExportResult:
+    def export_span_dicts(
+        self,
+        span_dicts: List[Dict[str, Any]],
+        time_shift_ns: int = 0,
+    ) -> SpanExportResult:
         """
         Export span dictionaries to OTLP endpoint.
 
-        Note: This creates new spans with the same attributes but new trace/span IDs.
-        For historical data demonstration, this maintains the timing relationships.
+        Original trace IDs, span IDs, parent links and span links are kept;
+        only timestamps are offset by ``time_shift_ns``.
 
         Args:
             span_dicts: List of span dictionaries from JSON
+            time_shift_ns: Offset added to every timestamp
 
         Returns:
             SpanExportResult indicating success/failure
         """
-        from opentelemetry import trace
-        from opentelemetry.sdk.trace import TracerProvider
-        from opentelemetry.sdk.resources import Resource
-        from opentelemetry.sdk.trace.export import BatchSpanProcessor
-
-        # Group spans by resource
-        resource_spans: Dict[str, List[Dict]] = {}
-        for span_dict in span_dicts:
-            resource_key = json.dumps(span_dict.get("resource", {}), sort_keys=True)
-            if resource_key not in resource_spans:
-                resource_spans[resource_key] = []
-            resource_spans[resource_key].append(span_dict)
-
-        total_exported = 0
-        last_result = SpanExportResult.SUCCESS
-
-        for resource_json, spans in resource_spans.items():
-            resource_attrs = json.loads(resource_json)
-            resource = Resource.create(resource_attrs)
-
-            # Create provider for this resource
-            provider = TracerProvider(resource=resource)
-            provider.add_span_processor(BatchSpanProcessor(self._exporter))
-            tracer = provider.get_tracer("contextcore.demo.reload")
-
-            # Recreate spans
-            for span_dict in spans:
-                span = tracer.start_span(
-                    name=span_dict["name"],
-                    start_time=span_dict["start_time_ns"],
-                    attributes=span_dict.get("attributes", {}),
-                )
-
-                # Add events
-                for event in span_dict.get("events", []):
-                    span.add_event(
-                        event["name"],
-                        attributes=event.get("attributes", {}),
-                        timestamp=event["timestamp_ns"],
-                    )
-
-                # End span at original time
-                if span_dict.get("end_time_ns"):
-                    span.end(end_time=span_dict["end_time_ns"])
-                else:
-                    span.end()
-
-                total_exported += 1
-
-            # Flush this batch
-            provider.force_flush()
-            provider.shutdown()
-
-        logger.info(f"Exported {total_exported} spans to {self.endpoint}")
-        return last_result
+        stats = self._replayer.replay(span_dicts, time_shift_ns)
+        return SpanExportResult.SUCCESS if stats.success else SpanExportResult.FAILURE
 
     def shutdown(self) -> None:
         """Shutdown the exporter."""
-        self._exporter.shutdown()
+        self._replayer.shutdown()
 
 
 class FileSpanExporter(SpanExporter):
@@ -0,0 +1,721 @@
+"""
+High-throughput replay of saved demo telemetry.
+
+Spans are encoded straight from the saved JSON dictionaries into OTLP
+protobuf ``ResourceSpans``, so trace IDs, span IDs, parent/child structure,
+links and events survive the round trip exactly. Only timestamps may be
+shifted (e.g. to make a months-old demo history end "now").
+
+Replay is streaming end to end:
+- span/log files are decoded incrementally, one array element at a time
+- spans are sent in fixed-size chunks over a single gRPC channel by a small
+  worker pool, with a bounded number of requests in flight
+- Loki pushes are split by a byte budget, gzip-compressed and sent
+  concurrently over a pooled HTTP session, retrying 429/5xx responses
+
+Usage:
+    from contextcore.demo.replay import LokiPusher, SpanReplayer
+
+    replayer = SpanReplayer("localhost:4317", workers=4, chunk_size=1000)
+    stats = replayer.replay_file("demo_output/demo_spans.json", shift_to_now=True)
+    replayer.shutdown()
+
+    pusher = LokiPusher("http://localhost:3100/loki/api/v1/push")
+    stats = pusher.push_file("demo_output/demo_logs.json")
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from opentelemetry.proto.collector.trace.v1 import trace_service_pb2
+from opentelemetry.proto.common.v1 import common_pb2
+from opentelemetry.proto.resource.v1 import resource_pb2
+from opentelemetry.proto.trace.v1 import trace_pb2
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+REPLAY_SCOPE_NAME = "contextcore.demo.replay"
+
+_SPAN_KINDS = {
+    "INTERNAL": trace_pb2.Span.SPAN_KIND_INTERNAL,
+    "SERVER": trace_pb2.Span.SPAN_KIND_SERVER,
+    "CLIENT": trace_pb2.Span.SPAN_KIND_CLIENT,
+    "PRODUCER": trace_pb2.Span.SPAN_KIND_PRODUCER,
+    "CONSUMER": trace_pb2.Span.SPAN_KIND_CONSUMER,
+}
+
+_STATUS_CODES = {
+    "UNSET": trace_pb2.Status.STATUS_CODE_UNSET,
+    "OK": trace_pb2.Status.STATUS_CODE_OK,
+    "ERROR": trace_pb2.Status.STATUS_CODE_ERROR,
+}
+
+_RETRYABLE_HTTP_STATUS = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class ReplayStats:
+    """Throughput and outcome counters for a replay run."""
+    items_sent: int = 0
+    items_failed: int = 0
+    requests: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items_sent / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.items_failed == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "items_sent": self.items_sent,
+            "items_failed": self.items_failed,
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "items_per_second": round(self.items_per_second, 1),
+            "errors": self.errors[:10],
+        }
+
+
+# =============================================================================
+# Streaming JSON
+# =============================================================================
+
+
+def iter_json_array(filepath: str, key: str, read_size: int = 1 << 20) -> Iterator[Any]:
+    """
+    Yield elements of a top-level JSON array without loading the whole file.
+
+    Works on the files written by ``save_spans_to_file`` / ``save_logs_to_file``
+    (``{"...": ..., "<key>": [ {...}, {...} ]}``). Only one read buffer plus
+    the element being decoded is held in memory.
+
+    Args:
+        filepath: JSON file path
+        key: Name of the top-level array field (e.g. "spans" or "logs")
+        read_size: Bytes read from disk per refill
+    """
+    decoder = json.JSONDecoder()
+    marker = f'"{key}"'
+
+    with open(filepath, encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+
+        def refill() -> bool:
+            nonlocal buf, pos
+            chunk = f.read(read_size)
+            if not chunk:
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        # Locate `"<key>"` `:` `[`
+        while True:
+            idx = buf.find(marker, pos)
+            if idx != -1:
+                colon = buf.find(":", idx + len(marker))
+                bracket = buf.find("[", colon + 1) if colon != -1 else -1
+                if bracket != -1:
+                    pos = bracket + 1
+                    break
+                pos = idx
+            else:
+                pos = max(pos, len(buf) - len(marker))
+            if not refill():
+                return
+
+        while True:
+            # Skip separators
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buf):
+                    break
+                if not refill():
+                    return
+            if buf[pos] == "]":
+                return
+
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not refill():
+                    raise
+                continue
+            # A number at the buffer edge may be truncated; make sure the
+            # element is followed by a delimiter we have actually read.
+            if end >= len(buf) and refill():
+                continue
+            pos = end
+            yield value
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most ``size`` items."""
+    chunk: List[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# =============================================================================
+# OTLP encoding
+# =============================================================================
+
+
+def _any_value(value: Any) -> common_pb2.AnyValue:
+    """Convert a JSON attribute value to an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return common_pb2.AnyValue(bool_value=value)
+    if isinstance(value, int):
+        return common_pb2.AnyValue(int_value=value)
+    if isinstance(value, float):
+        return common_pb2.AnyValue(double_value=value)
+    if isinstance(value, str):
+        return common_pb2.AnyValue(string_value=value)
+    if isinstance(value, (list, tuple)):
+        return common_pb2.AnyValue(
+            array_value=common_pb2.ArrayValue(values=[_any_value(v) for v in value])
+        )
+    if isinstance(value, dict):
+        return common_pb2.AnyValue(
+            kvlist_value=common_pb2.KeyValueList(values=_key_values(value))
+        )
+    return common_pb2.AnyValue(string_value=str(value))
+
+
+def _key_values(attributes: Optional[Dict[str, Any]]) -> List[common_pb2.KeyValue]:
+    if not attributes:
+        return []
+    return [
+        common_pb2.KeyValue(key=k, value=_any_value(v))
+        for k, v in attributes.items()
+        if v is not None
+    ]
+
+
+def span_dict_to_proto(span_dict: Dict[str, Any], time_shift_ns: int = 0) -> trace_pb2.Span:
+    """
+    Encode a saved span dictionary (see ``span_to_dict``) as an OTLP Span.
+
+    Trace, span and parent IDs are copied verbatim; only timestamps are
+    shifted by ``time_shift_ns``.
+    """
+    start_ns = span_dict["start_time_ns"]
+    end_ns = span_dict.get("end_time_ns") or start_ns
+    status = span_dict.get("status") or {}
+
+    span = trace_pb2.Span(
+        trace_id=bytes.fromhex(span_dict["trace_id"]),
+        span_id=bytes.fromhex(span_dict["span_id"]),
+        name=span_dict["name"],
+        kind=_SPAN_KINDS.get(span_dict.get("kind", "INTERNAL"), trace_pb2.Span.SPAN_KIND_INTERNAL),
+        start_time_unix_nano=start_ns + time_shift_ns,
+        end_time_unix_nano=end_ns + time_shift_ns,
+        attributes=_key_values(span_dict.get("attributes")),
+        status=trace_pb2.Status(
+            code=_STATUS_CODES.get(status.get("status_code", "UNSET"), trace_pb2.Status.STATUS_CODE_UNSET),
+            message=status.get("description") or "",
+        ),
+    )
+    if span_dict.get("parent_span_id"):
+        span.parent_span_id = bytes.fromhex(span_dict["parent_span_id"])
+
+    for event in span_dict.get("events", ()):
+        span.events.append(trace_pb2.Span.Event(
+            name=event["name"],
+            time_unix_nano=event["timestamp_ns"] + time_shift_ns,
+            attributes=_key_values(event.get("attributes")),
+        ))
+    for link in span_dict.get("links", ()):
+        span.links.append(trace_pb2.Span.Link(
+            trace_id=bytes.fromhex(link["trace_id"]),
+            span_id=bytes.fromhex(link["span_id"]),
+            attributes=_key_values(link.get("attributes")),
+        ))
+    return span
+
+
+def encode_resource_spans(
+    span_dicts: Iterable[Dict[str, Any]],
+    time_shift_ns: int = 0,
+) -> trace_service_pb2.ExportTraceServiceRequest:
+    """
+    Build one OTLP export request, grouping spans by their saved resource.
+
+    Args:
+        span_dicts: Saved span dictionaries
+        time_shift_ns: Offset added to every timestamp
+
+    Returns:
+        ExportTraceServiceRequest with one ResourceSpans per distinct resource
+    """
+    by_resource: Dict[str, Tuple[Dict[str, Any], List[trace_pb2.Span]]] = {}
+    for span_dict in span_dicts:
+        resource = span_dict.get("resource") or {}
+        key = json.dumps(resource, sort_keys=True, default=str)
+        if key not in by_resource:
+            by_resource[key] = (resource, [])
+        by_resource[key][1].append(span_dict_to_proto(span_dict, time_shift_ns))
+
+    request = trace_service_pb2.ExportTraceServiceRequest()
+    for resource, spans in by_resource.values():
+        request.resource_spans.append(trace_pb2.ResourceSpans(
+            resource=resource_pb2.Resource(attributes=_key_values(resource)),
+            scope_spans=[trace_pb2.ScopeSpans(
+                scope=common_pb2.InstrumentationScope(name=REPLAY_SCOPE_NAME),
+                spans=spans,
+            )],
+        ))
+    return request
+
+
+def compute_time_shift(span_dicts: Iterable[Dict[str, Any]], anchor_ns: Optional[int] = None) -> int:
+    """
+    Offset that moves the latest span end onto ``anchor_ns`` (default: now).
+
+    Takes an iterable so a file can be pre-scanned with ``iter_json_array``
+    without holding it in memory.
+    """
+    latest = 0
+    for span_dict in span_dicts:
+        latest = max(latest, span_dict.get("end_time_ns") or span_dict.get("start_time_ns") or 0)
+    if not latest:
+        return 0
+    if anchor_ns is None:
+        anchor_ns = time.time_ns()
+    return anchor_ns - latest
+
+
+# =============================================================================
+# Retry helper
+# =============================================================================
+
+
+def _with_retries(
+    send: Callable[[], None],
+    is_retryable: Callable[[Exception], bool],
+    max_retries: int,
+    backoff_seconds: float,
+    on_retry: Callable[[], None],
+) -> None:
+    """Call ``send`` with exponential backoff on retryable failures."""
+    attempt = 0
+    while True:
+        try:
+            send()
+            return
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+            on_retry()
+            time.sleep(min(backoff_seconds * (2 ** attempt), 30.0))
+            attempt += 1
+
+
+class _InFlight:
+    """Executor wrapper that caps queued+running submissions for streaming input."""
+
+    def __init__(self, workers: int, thread_name_prefix: str):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(workers * 2)
+        self._futures: List[Future] = []
+
+    def submit(self, fn: Callable[..., None], *args: Any) -> None:
+        self._slots.acquire()
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def wait(self) -> None:
+        for future in self._futures:
+            future.result()
+        self._futures.clear()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+# =============================================================================
+# Span replay (OTLP/gRPC)
+# =============================================================================
+
+
+class SpanReplayer:
+    """
+    Replays saved span dictionaries to an OTLP/gRPC endpoint.
+
+    One gRPC channel is shared by all workers (channels multiplex concurrent
+    RPCs over a single HTTP/2 connection).
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        insecure: bool = True,
+        chunk_size: int = 1000,
+        workers: int = 4,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.5,
+        timeout_seconds: float = 30.0,
+        compression: bool = True,
+    ):
+        """
+        Args:
+            endpoint: OTLP gRPC endpoint (host:port, scheme optional)
+            insecure: Use a plaintext channel
+            chunk_size: Spans per export request
+            workers: Concurrent export requests
+            max_retries: Retries per request on transient gRPC errors
+            backoff_seconds: Initial retry backoff (doubles per attempt)
+            timeout_seconds: Per-request deadline
+            compression: gzip-compress export requests
+        """
+        import grpc
+        from opentelemetry.proto.collector.trace.v1 import trace_service_pb2_grpc
+
+        self._grpc = grpc
+        self.endpoint = endpoint.split("://", 1)[-1]
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self._channel = (
+            grpc.insecure_channel(self.endpoint) if insecure
+            else grpc.secure_channel(self.endpoint, grpc.ssl_channel_credentials())
+        )
+        self._stub = trace_service_pb2_grpc.TraceServiceStub(self._channel)
+        self._compression = grpc.Compression.Gzip if compression else grpc.Compression.NoCompression
+        self._retryable_codes = {
+            grpc.StatusCode.UNAVAILABLE,
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            grpc.StatusCode.ABORTED,
+        }
+
+    def _is_retryable(self, error: Exception) -> bool:
+        return isinstance(error, self._grpc.RpcError) and error.code() in self._retryable_codes
+
+    def _send_chunk(self, chunk: List[Dict[str, Any]], time_shift_ns: int, stats: ReplayStats, lock: threading.Lock) -> None:
+        request = encode_resource_spans(chunk, time_shift_ns)
+        size = request.ByteSize()
+
+        def on_retry() -> None:
+            with lock:
+                stats.retries += 1
+
+        try:
+            _with_retries(
+                lambda: self._stub.Export(
+                    request, timeout=self.timeout_seconds, compression=self._compression
+                ),
+                self._is_retryable,
+                self.max_retries,
+                self.backoff_seconds,
+                on_retry,
+            )
+        except Exception as e:
+            logger.error(f"Span export of {len(chunk)} spans failed: {e}")
+            with lock:
+                stats.items_failed += len(chunk)
+                stats.requests += 1
+                stats.errors.append(str(e))
+            return
+
+        with lock:
+            stats.items_sent += len(chunk)
+            stats.requests += 1
+            stats.bytes_sent += size
+
+    def replay(self, span_dicts: Iterable[Dict[str, Any]], time_shift_ns: int = 0) -> ReplayStats:
+        """Export span dictionaries in concurrent chunks."""
+        stats = ReplayStats()
+        lock = threading.Lock()
+        started = time.perf_counter()
+
+        pool = _InFlight(self.workers, "otlp-replay")
+        try:
+            for chunk in iter_chunks(span_dicts, self.chunk_size):
+                pool.submit(self._send_chunk, chunk, time_shift_ns, stats, lock)
+            pool.wait()
+        finally:
+            pool.shutdown()
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Replayed {stats.items_sent} spans to {self.endpoint} in "
+            f"{stats.elapsed_seconds:.2f}s ({stats.items_per_second:.0f} spans/s)"
+        )
+        return stats
+
+    def replay_file(
+        self,
+        filepath: str,
+        shift_to_now: bool = False,
+        time_shift_ns: int = 0,
+    ) -> ReplayStats:
+        """
+        Stream a saved spans file to the endpoint.
+
+        Args:
+            filepath: File written by ``save_spans_to_file``
+            shift_to_now: Pre-scan the file and shift timestamps so the
+                latest span ends now (overrides time_shift_ns)
+            time_shift_ns: Explicit timestamp offset
+        """
+        if shift_to_now:
+            time_shift_ns = compute_time_shift(iter_json_array(filepath, "spans"))
+        return self.replay(iter_json_array(filepath, "spans"), time_shift_ns)
+
+    def shutdown(self) -> None:
+        """Close the gRPC channel."""
+        self._channel.close()
+
+
+# =============================================================================
+# Log replay (Loki push API)
+# =============================================================================
+
+
+def loki_labels(log_entry: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """Stream label set for a demo log entry."""
+    return (
+        ("service", str(log_entry.get("service", "contextcore"))),
+        ("project_id", str(log_entry.get("project_id", "unknown"))),
+    )
+
+
+def loki_timestamp_ns(log_entry: Dict[str, Any], now_ns: int) -> Tuple[int, bool]:
+    """
+    Entry timestamp in nanoseconds, clamped to ``now_ns``.
+
+    Returns:
+        (timestamp_ns, was_clamped) - Loki rejects future timestamps
+    """
+    ts = log_entry.get("timestamp", datetime.now(timezone.utc).isoformat())
+    if isinstance(ts, str):
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        ts_ns = int(dt.timestamp() * 1e9)
+    else:
+        ts_ns = int(ts * 1e9)
+    if ts_ns > now_ns:
+        return now_ns, True
+    return ts_ns, False
+
+
+# Approximate per-entry JSON framing overhead: ["<19-digit ts>", "<line>"],
+_LOKI_ENTRY_OVERHEAD = 30
+
+
+def iter_loki_batches(
+    log_entries: Iterable[Dict[str, Any]],
+    max_batch_bytes: int = 1_000_000,
+    now_ns: Optional[int] = None,
+    counters: Optional[Dict[str, int]] = None,
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Group log entries into Loki push payloads of at most ``max_batch_bytes``.
+
+    An entry larger than the budget is sent on its own.
+
+    Args:
+        log_entries: Demo log dictionaries
+        max_batch_bytes: Uncompressed payload budget per push
+        now_ns: Clamp ceiling for timestamps (default: now)
+        counters: Optional dict updated with "clamped" and "streams" counts
+
+    Yields:
+        (payload, entry_count)
+    """
+    if now_ns is None:
+        now_ns = int(datetime.now(timezone.utc).timestamp() * 1e9)
+    if counters is None:
+        counters = {}
+    counters.setdefault("clamped", 0)
+    seen_streams: set = set()
+
+    streams: Dict[Tuple[Tuple[str, str], ...], List[List[str]]] = {}
+    batch_bytes = 0
+    batch_count = 0
+
+    def flush() -> Tuple[Dict[str, Any], int]:
+        payload = {
+            "streams": [
+                {"stream": dict(labels), "values": values}
+                for labels, values in streams.items()
+            ]
+        }
+        return payload, batch_count
+
+    for log_entry in log_entries:
+        labels = loki_labels(log_entry)
+        ts_ns, clamped = loki_timestamp_ns(log_entry, now_ns)
+        if clamped:
+            counters["clamped"] += 1
+        line = json.dumps(log_entry, default=str)
+        entry_bytes = len(line) + _LOKI_ENTRY_OVERHEAD
+
+        if batch_count and batch_bytes + entry_bytes > max_batch_bytes:
+            yield flush()
+            streams, batch_bytes, batch_count = {}, 0, 0
+
+        streams.setdefault(labels, []).append([str(ts_ns), line])
+        seen_streams.add(labels)
+        batch_bytes += entry_bytes
+        batch_count += 1
+
+    if batch_count:
+        yield flush()
+    counters["streams"] = len(seen_streams)
+
+
+class LokiPusher:
+    """
+    Pushes demo logs to Loki in byte-budgeted, gzip-compressed batches.
+
+    Batches are posted concurrently over one pooled ``requests.Session``.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        max_batch_bytes: int = 1_000_000,
+        workers: int = 4,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.5,
+        timeout_seconds: float = 30.0,
+        compress_level: int = 6,
+    ):
+        """
+        Args:
+            endpoint: Loki push endpoint (e.g. http://localhost:3100/loki/api/v1/push)
+            max_batch_bytes: Uncompressed payload budget per push
+            workers: Concurrent push requests
+            max_retries: Retries per batch on connection errors, 429 and 5xx
+            backoff_seconds: Initial retry backoff (doubles per attempt)
+            timeout_seconds: Per-request timeout
+            compress_level: gzip level (0 disables compression)
+        """
+        self.endpoint = endpoint
+        self.max_batch_bytes = max_batch_bytes
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout_seconds = timeout_seconds
+        self.compress_level = compress_level
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in _RETRYABLE_HTTP_STATUS
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def _post(self, payload: Dict[str, Any], count: int, stats: ReplayStats, lock: threading.Lock) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        headers = {"Content-Type": "application/json"}
+        if self.compress_level:
+            body = gzip.compress(body, compresslevel=self.compress_level)
+            headers["Content-Encoding"] = "gzip"
+
+        def send() -> None:
+            response = self._session.post(
+                self.endpoint, data=body, headers=headers, timeout=self.timeout_seconds
+            )
+            response.raise_for_status()
+
+        def on_retry() -> None:
+            with lock:
+                stats.retries += 1
+
+        try:
+            _with_retries(send, self._is_retryable, self.max_retries, self.backoff_seconds, on_retry)
+        except Exception as e:
+            logger.error(f"Loki push of {count} logs failed: {e}")
+            with lock:
+                stats.items_failed += count
+                stats.requests += 1
+                stats.errors.append(str(e))
+            return
+
+        with lock:
+            stats.items_sent += count
+            stats.requests += 1
+            stats.bytes_sent += len(body)
+
+    def push(
+        self,
+        log_entries: Iterable[Dict[str, Any]],
+        counters: Optional[Dict[str, int]] = None,
+    ) -> ReplayStats:
+        """
+        Push log entries to Loki.
+
+        Args:
+            log_entries: Demo log dictionaries (may be a streaming iterator)
+            counters: Optional dict receiving "clamped" and "streams" counts
+        """
+        stats = ReplayStats()
+        lock = threading.Lock()
+        counters = counters if counters is not None else {}
+        started = time.perf_counter()
+
+        pool = _InFlight(self.workers, "loki-replay")
+        try:
+            for payload, count in iter_loki_batches(
+                log_entries, self.max_batch_bytes, counters=counters
+            ):
+                pool.submit(self._post, payload, count, stats, lock)
+            pool.wait()
+        finally:
+            pool.shutdown()
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        if counters.get("clamped"):
+            logger.warning(
+                f"Clamped {counters['clamped']} future timestamp(s) to now in Loki push"
+            )
+        logger.info(
+            f"Pushed {stats.items_sent} logs to Loki at {self.endpoint} in "
+            f"{stats.elapsed_seconds:.2f}s ({stats.items_per_second:.0f} logs/s)"
+        )
+        return stats
+
+    def push_file(self, filepath: str, counters: Optional[Dict[str, int]] = None) -> ReplayStats:
+        """Stream a saved logs file (see ``save_logs_to_file``) to Loki."""
+        return self.push(iter_json_array(filepath, "logs"), counters=counters)
+
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
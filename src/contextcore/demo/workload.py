@@ -0,0 +1,666 @@
+"""
+Large-scale synthetic workload generator.
+
+Produces project telemetry at capacity-testing volume (millions of tasks)
+for exercising Tempo/Loki/Mimir dashboards and TraceQL queries. Unlike
+``generate_demo_data`` it never touches TaskTracker, state files or the OTel
+SDK: span and log dictionaries are built directly in the same shape as
+``span_to_dict`` / ``HistoricalTaskLogger`` and streamed to a sink, so memory
+stays flat regardless of volume. Span names and attributes follow
+TaskTracker (``contextcore.task.<type>``, ``contextcore.sprint``), so the
+same TraceQL queries work against synthetic and real data.
+
+Everything is driven by a seeded ``random.Random``: the same profile and
+seed always produce byte-identical output, including trace and span IDs.
+Timestamps are anchored to ``profile.end_time``, which defaults to the fixed
+``DEFAULT_END_TIME`` rather than the wall clock; ``contextcore demo load
+--shift-to-now`` moves them to the present when loading.
+
+Usage:
+    from contextcore.demo.workload import (
+        JsonFileSink, SyntheticWorkloadGenerator, WorkloadProfile,
+    )
+
+    profile = WorkloadProfile.for_task_count(1_000_000, projects=20, seed=7)
+    sink = JsonFileSink("load_output")
+    stats = SyntheticWorkloadGenerator(profile).generate(sink)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import queue
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from contextcore.demo.project_data import ASSIGNEES, BLOCKER_SCENARIOS, SERVICE_CONFIGS
+
+_HOUR_NS = 3600 * 10**9
+_DAY_NS = 24 * _HOUR_NS
+
+# History ends here unless the profile sets end_time, so output is reproducible
+DEFAULT_END_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Task type at each hierarchy level (depth 1 = epics only)
+_LEVEL_TYPES = ("epic", "story", "task", "subtask")
+_LEVEL_STATS = {"epic": "epics", "story": "stories", "task": "tasks", "subtask": "subtasks"}
+
+_INSIGHT_TYPES = (
+    "analysis", "recommendation", "decision", "question",
+    "blocker", "discovery", "risk", "progress", "lesson",
+)
+_INSIGHT_AUDIENCES = ("agent", "human", "both")
+_CAPABILITIES = ("code_review", "test_generation", "refactor", "docs", "triage")
+_AGENTS = ("claude-planner", "claude-coder", "claude-reviewer", "gpt-triage")
+
+
+@dataclass
+class Distribution:
+    """
+    A sampleable distribution.
+
+    kind:
+        constant     -> a
+        uniform      -> uniform(a, b)
+        lognormal    -> median a, shape sigma b
+        exponential  -> mean a
+        poisson      -> mean a (integer counts)
+    """
+    kind: str
+    a: float
+    b: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            return self.a
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b)
+        if self.kind == "exponential":
+            return rng.expovariate(1.0 / self.a) if self.a > 0 else 0.0
+        if self.kind == "poisson":
+            return float(_poisson(rng, self.a))
+        raise ValueError(f"Unknown distribution kind: {self.kind}")
+
+    def sample_count(self, rng: random.Random, minimum: int = 0) -> int:
+        return max(minimum, int(round(self.sample(rng))))
+
+    @property
+    def mean(self) -> float:
+        if self.kind == "uniform":
+            return (self.a + self.b) / 2
+        if self.kind == "lognormal":
+            return self.a * math.exp(self.b ** 2 / 2)
+        return self.a
+
+
+# Duration of a handoff request span
+_HANDOFF_HOURS = Distribution("exponential", 0.5)
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Knuth's method for small means, normal approximation for large ones."""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, int(round(rng.gauss(mean, math.sqrt(mean)))))
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+@dataclass
+class WorkloadProfile:
+    """
+    Shape of a synthetic workload.
+
+    Fan-outs are per parent: ``fanout["story"]`` is the number of stories
+    under each epic, ``fanout["task"]`` tasks per story, and so on.
+    """
+    projects: int = 1
+    epics_per_project: int = 10
+    hierarchy_depth: int = 3
+    fanout: Dict[str, Distribution] = field(default_factory=lambda: {
+        "story": Distribution("uniform", 2, 6),
+        "task": Distribution("uniform", 3, 10),
+        "subtask": Distribution("poisson", 1.0),
+    })
+    duration_days: int = 90
+    sprint_days: int = 14
+    cycle_time_hours: Distribution = field(default_factory=lambda: Distribution("lognormal", 16.0, 0.9))
+    queue_time_hours: Distribution = field(default_factory=lambda: Distribution("exponential", 4.0))
+    blocker_probability: float = 0.15
+    blocked_hours: Distribution = field(default_factory=lambda: Distribution("lognormal", 24.0, 1.0))
+    dependency_probability: float = 0.1
+    insights_per_task: Distribution = field(default_factory=lambda: Distribution("poisson", 0.2))
+    handoffs_per_task: Distribution = field(default_factory=lambda: Distribution("poisson", 0.05))
+    emit_logs: bool = True
+    seed: int = 0
+    end_time: Optional[datetime] = None
+
+    def expected_tasks_per_epic(self) -> float:
+        """Expected leaf + intermediate items below one epic."""
+        total, level_count = 0.0, 1.0
+        for level in _LEVEL_TYPES[1:self.hierarchy_depth]:
+            level_count *= self.fanout[level].mean
+            total += level_count
+        return total
+
+    @classmethod
+    def for_task_count(cls, tasks: int, projects: int = 1, **overrides: Any) -> "WorkloadProfile":
+        """Build a profile whose epic count yields roughly ``tasks`` work items."""
+        profile = cls(projects=projects, **overrides)
+        per_epic = max(profile.expected_tasks_per_epic(), 1.0)
+        profile.epics_per_project = max(1, math.ceil(tasks / (projects * per_epic)))
+        return profile
+
+
+class WorkloadSink:
+    """Destination for generated span and log dictionaries."""
+
+    def write_span(self, span: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def write_log(self, log: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> Dict[str, Any]:
+        """Flush and return sink-specific statistics."""
+        return {}
+
+
+class JsonFileSink(WorkloadSink):
+    """
+    Streams spans and logs into the JSON files read by ``contextcore demo load``.
+
+    Files are written incrementally; the ``*_count`` field is appended after
+    the array so nothing has to be buffered. No wall-clock stamp is written
+    unless ``generated_at`` is given, so seeded output stays byte-identical.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        spans_name: str = "demo_spans.json",
+        logs_name: str = "demo_logs.json",
+        generated_at: Optional[str] = None,
+    ):
+        os.makedirs(output_dir, exist_ok=True)
+        self.spans_file = os.path.join(output_dir, spans_name)
+        self.logs_file = os.path.join(output_dir, logs_name)
+        header = f'"generated_at": {json.dumps(generated_at)}, ' if generated_at else ""
+        self._spans = open(self.spans_file, "w", buffering=1 << 20)
+        self._logs = open(self.logs_file, "w", buffering=1 << 20)
+        self._spans.write(f'{{{header}"spans": [\n')
+        self._logs.write(f'{{{header}"logs": [\n')
+        self._span_count = 0
+        self._log_count = 0
+
+    def write_span(self, span: Dict[str, Any]) -> None:
+        if self._span_count:
+            self._spans.write(",\n")
+        self._spans.write(json.dumps(span, separators=(",", ":"), default=str))
+        self._span_count += 1
+
+    def write_log(self, log: Dict[str, Any]) -> None:
+        if self._log_count:
+            self._logs.write(",\n")
+        self._logs.write(json.dumps(log, separators=(",", ":"), default=str))
+        self._log_count += 1
+
+    def close(self) -> Dict[str, Any]:
+        self._spans.write(f'\n], "span_count": {self._span_count}}}\n')
+        self._logs.write(f'\n], "log_count": {self._log_count}}}\n')
+        self._spans.close()
+        self._logs.close()
+        return {"spans_file": self.spans_file, "logs_file": self.logs_file}
+
+
+_END = object()
+
+
+def _drain(q: "queue.Queue[Any]") -> Iterator[Any]:
+    while True:
+        item = q.get()
+        if item is _END:
+            return
+        yield item
+
+
+class OTLPSink(WorkloadSink):
+    """
+    Streams spans to an OTLP/gRPC endpoint and logs to Loki while generating.
+
+    Uses ``SpanReplayer`` and ``LokiPusher`` on background threads fed by
+    bounded queues, so generation is back-pressured by the receivers.
+    """
+
+    def __init__(
+        self,
+        otlp_endpoint: str,
+        loki_endpoint: Optional[str] = None,
+        insecure: bool = True,
+        chunk_size: int = 1000,
+        workers: int = 4,
+        queue_size: int = 50_000,
+    ):
+        from contextcore.demo.replay import LokiPusher, SpanReplayer
+
+        self._replayer = SpanReplayer(otlp_endpoint, insecure=insecure, chunk_size=chunk_size, workers=workers)
+        self._pusher = LokiPusher(loki_endpoint, workers=workers) if loki_endpoint else None
+        self._span_q: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._log_q: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._results: Dict[str, Any] = {}
+
+        def run(name: str, fn: Any, q: "queue.Queue[Any]") -> None:
+            self._results[name] = fn(_drain(q))
+
+        self._threads = [threading.Thread(target=run, args=("otlp_export", self._replayer.replay, self._span_q), daemon=True)]
+        if self._pusher:
+            self._threads.append(threading.Thread(target=run, args=("loki_push", self._pusher.push, self._log_q), daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def write_span(self, span: Dict[str, Any]) -> None:
+        self._span_q.put(span)
+
+    def write_log(self, log: Dict[str, Any]) -> None:
+        if self._pusher:
+            self._log_q.put(log)
+
+    def close(self) -> Dict[str, Any]:
+        self._span_q.put(_END)
+        self._log_q.put(_END)
+        for thread in self._threads:
+            thread.join()
+        self._replayer.shutdown()
+        if self._pusher:
+            self._pusher.close()
+        return {name: stats.to_dict() for name, stats in self._results.items()}
+
+
+@dataclass
+class _Node:
+    """Generation state for one work item (only ancestors are held at once)."""
+    task_id: str
+    task_type: str
+    span_id: str
+    start_ns: int
+    sprint_id: Optional[str]
+
+
+class SyntheticWorkloadGenerator:
+    """Generates a seeded synthetic portfolio and streams it to a sink."""
+
+    def __init__(self, profile: WorkloadProfile):
+        self.profile = profile
+        self.rng = random.Random(profile.seed)
+        end = profile.end_time or DEFAULT_END_TIME
+        self.end_ns = int(end.timestamp() * 1e9)
+        self.start_ns = self.end_ns - profile.duration_days * _DAY_NS
+        self._services = list(SERVICE_CONFIGS)
+        self._sink: Optional[WorkloadSink] = None
+        self.stats: Dict[str, int] = {}
+
+    # -- ids and helpers ----------------------------------------------------
+
+    def _trace_id(self) -> str:
+        return f"{self.rng.getrandbits(128) or 1:032x}"
+
+    def _span_id(self) -> str:
+        return f"{self.rng.getrandbits(64) or 1:016x}"
+
+    def _hours_ns(self, dist: Distribution) -> int:
+        return max(1, int(dist.sample(self.rng) * _HOUR_NS))
+
+    def _sprint_id(self, ts_ns: int) -> str:
+        index = (ts_ns - self.start_ns) // (self.profile.sprint_days * _DAY_NS)
+        return f"sprint-{max(0, index) + 1}"
+
+    @staticmethod
+    def _iso(ts_ns: int) -> str:
+        return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+
+    def _count(self, key: str, n: int = 1) -> None:
+        self.stats[key] = self.stats.get(key, 0) + n
+
+    def _log(self, project: str, service: str, event: str, task_id: str, ts_ns: int, **fields: Any) -> None:
+        if not self.profile.emit_logs:
+            return
+        entry = {
+            "timestamp": self._iso(ts_ns),
+            "level": fields.pop("level", "info"),
+            "event": event,
+            "service": service,
+            "project_id": project,
+            "task_id": task_id,
+            "trigger": "synthetic",
+        }
+        entry.update({k: v for k, v in fields.items() if v is not None})
+        self._sink.write_log(entry)
+        self._count("logs")
+
+    def _emit_span(self, span: Dict[str, Any]) -> None:
+        self._sink.write_span(span)
+        self._count("spans")
+
+    # -- generation ---------------------------------------------------------
+
+    def generate(self, sink: WorkloadSink) -> Dict[str, Any]:
+        """
+        Generate the full workload into ``sink`` and close it.
+
+        Returns:
+            Counts by item type merged with the sink's own statistics
+        """
+        self._sink = sink
+        self.stats = {}
+        try:
+            for p in range(self.profile.projects):
+                self._generate_project(f"load-project-{p + 1:04d}")
+        finally:
+            sink_stats = sink.close()
+        return {**self.stats, **sink_stats}
+
+    def _generate_project(self, project: str) -> None:
+        resource = {"service.name": "contextcore", "service.namespace": "contextcore", "project.id": project}
+
+        # Sprints: one root span each, fixed windows over the duration; the
+        # last one is still open if the window does not fill it
+        sprint_ns = self.profile.sprint_days * _DAY_NS
+        sprint_start = self.start_ns
+        index = 1
+        while sprint_start < self.end_ns:
+            sprint_end = min(sprint_start + sprint_ns, self.end_ns)
+            sprint_id = f"sprint-{index}"
+            self._emit_span(self._sprint_span(project, resource, sprint_id, index, sprint_start, sprint_end))
+            self._count("sprints")
+            sprint_start = sprint_end
+            index += 1
+
+        counter = [0]
+        recent: List[Tuple[str, str]] = []  # (trace_id, span_id) for dependency links
+
+        for e in range(self.profile.epics_per_project):
+            service = self._services[e % len(self._services)]
+            svc_resource = {"service.name": service, "service.namespace": "contextcore", "project.id": project}
+            # Epics start across the first 80% of the window so they have room to run
+            epic_start = self.start_ns + int(self.rng.random() * 0.8 * (self.end_ns - self.start_ns))
+            trace_id = self._trace_id()
+            self._generate_node(
+                project, service, svc_resource, trace_id, None, 0, epic_start, counter, recent,
+            )
+
+    def _generate_node(
+        self,
+        project: str,
+        service: str,
+        resource: Dict[str, Any],
+        trace_id: str,
+        parent: Optional[_Node],
+        level: int,
+        start_ns: int,
+        counter: List[int],
+        recent: List[Tuple[str, str]],
+    ) -> int:
+        """Generate one work item and its subtree; returns its end time."""
+        task_type = _LEVEL_TYPES[level]
+        counter[0] += 1
+        task_id = f"{task_type.upper()}-{counter[0]:08d}"
+        node = _Node(task_id, task_type, self._span_id(), min(start_ns, self.end_ns - 1), self._sprint_id(start_ns))
+        self._count(_LEVEL_STATS[task_type])
+
+        events: List[Dict[str, Any]] = []
+        assignee = self.rng.choice(ASSIGNEES)
+        points = self.rng.choice([1, 2, 3, 5, 8, 13])
+        events.append({"name": "task.created", "timestamp_ns": node.start_ns,
+                       "attributes": {"task.title": task_id, "task.type": task_type}})
+        self._log(project, service, "task.created", task_id, node.start_ns, task_type=task_type,
+                  task_title=task_id, sprint_id=node.sprint_id, assignee=assignee, story_points=points,
+                  parent_id=parent.task_id if parent else None)
+
+        # Children run inside the parent; leaves get a sampled cycle time
+        child_level = level + 1
+        is_leaf = child_level >= self.profile.hierarchy_depth
+        extra: Dict[str, Any] = {}
+        status = "done"
+        cursor = node.start_ns + self._hours_ns(self.profile.queue_time_hours)
+
+        if not is_leaf:
+            children = self.profile.fanout[_LEVEL_TYPES[child_level]].sample_count(
+                self.rng, minimum=0 if _LEVEL_TYPES[child_level] == "subtask" else 1,
+            )
+            end_ns = cursor
+            for _ in range(children):
+                child_start = cursor + self._hours_ns(self.profile.queue_time_hours)
+                child_end = self._generate_node(
+                    project, service, resource, trace_id, node, child_level, child_start, counter, recent,
+                )
+                end_ns = max(end_ns, child_end)
+                # Siblings overlap: the next one starts partway through this one
+                cursor = child_start + (child_end - child_start) // 2
+            if children == 0:
+                end_ns = cursor + self._hours_ns(self.profile.cycle_time_hours)
+        else:
+            self._generate_agent_activity(project, trace_id, node)
+            in_progress = cursor
+            events.append({"name": "task.status_changed", "timestamp_ns": min(in_progress, self.end_ns),
+                           "attributes": {"from": "todo", "to": "in_progress"}})
+            self._log(project, service, "task.status_changed", task_id, min(in_progress, self.end_ns),
+                      task_type=task_type, sprint_id=node.sprint_id, from_status="todo", to_status="in_progress")
+            end_ns = in_progress + self._hours_ns(self.profile.cycle_time_hours)
+
+            if self.rng.random() < self.profile.blocker_probability:
+                blocker = self.rng.choice(BLOCKER_SCENARIOS)
+                block_at = in_progress + (end_ns - in_progress) // 3
+                unblock_at = block_at + self._hours_ns(self.profile.blocked_hours)
+                end_ns += unblock_at - block_at
+                if block_at < self.end_ns:
+                    events.append({"name": "task.blocked", "timestamp_ns": block_at,
+                                   "attributes": {"reason": blocker["reason"]}})
+                    self._log(project, service, "task.blocked", task_id, block_at, level="warn",
+                              task_type=task_type, sprint_id=node.sprint_id, reason=blocker["reason"])
+                    self._count("blockers")
+                    if unblock_at < self.end_ns:
+                        events.append({"name": "task.unblocked", "timestamp_ns": unblock_at, "attributes": {}})
+                        self._log(project, service, "task.unblocked", task_id, unblock_at,
+                                  task_type=task_type, sprint_id=node.sprint_id)
+                    else:
+                        status = "blocked"
+                        extra["task.blocked_by"] = blocker["reason"]
+
+        links = []
+        if recent and self.rng.random() < self.profile.dependency_probability:
+            dep_trace, dep_span = self.rng.choice(recent)
+            links.append({"trace_id": dep_trace, "span_id": dep_span, "attributes": {"link.type": "depends_on"}})
+
+        end_ns = max(end_ns, node.start_ns + 1)
+        if end_ns >= self.end_ns:
+            end_ns = self.end_ns
+            if status == "done":
+                status = "in_progress"
+        else:
+            events.append({"name": "task.completed", "timestamp_ns": end_ns, "attributes": {}})
+            self._log(project, service, "task.completed", task_id, end_ns, task_type=task_type,
+                      sprint_id=node.sprint_id, story_points=points)
+
+        extra.update({"task.assignee": assignee, "task.story_points": points,
+                      "task.priority": self.rng.choice(["high", "medium", "low"])})
+        span = self._task_span(
+            project, resource, trace_id, node.span_id, parent.span_id if parent else None,
+            task_id, task_type, task_id, node.start_ns, end_ns,
+            status=status, sprint_id=node.sprint_id, extra=extra, events=events, links=links,
+        )
+        self._emit_span(span)
+
+        recent.append((trace_id, node.span_id))
+        if len(recent) > 256:
+            del recent[:128]
+        return end_ns
+
+    def _sprint_span(
+        self,
+        project: str,
+        resource: Dict[str, Any],
+        sprint_id: str,
+        index: int,
+        start_ns: int,
+        end_ns: int,
+    ) -> Dict[str, Any]:
+        """Sprint span in the shape of ``TaskTracker.start_sprint`` / ``end_sprint``."""
+        name = f"Sprint {index}"
+        planned = self.rng.randint(20, 40)
+        ended = end_ns - start_ns == self.profile.sprint_days * _DAY_NS
+        attributes: Dict[str, Any] = {
+            "sprint.id": sprint_id,
+            "sprint.name": name,
+            "sprint.goal": f"{name} goals",
+            "sprint.start_date": self._iso(start_ns)[:10],
+            "sprint.end_date": self._iso(start_ns + self.profile.sprint_days * _DAY_NS)[:10],
+            "sprint.planned_points": planned,
+            "project.id": project,
+        }
+        events: List[Dict[str, Any]] = [
+            {"name": "sprint.started", "timestamp_ns": start_ns, "attributes": {"name": name}},
+        ]
+        if ended:
+            completed = self.rng.randint(planned * 3 // 5, planned)
+            attributes["sprint.completed_points"] = completed
+            events.append({"name": "sprint.ended", "timestamp_ns": end_ns,
+                           "attributes": {"completed_points": completed}})
+        return {
+            "name": "contextcore.sprint",
+            "trace_id": self._trace_id(),
+            "span_id": self._span_id(),
+            "start_time_ns": start_ns,
+            "end_time_ns": end_ns,
+            "status": {"status_code": "OK" if ended else "UNSET", "description": None},
+            "kind": "INTERNAL",
+            "attributes": attributes,
+            "resource": resource,
+            "events": events,
+        }
+
+    def _task_span(
+        self,
+        project: str,
+        resource: Dict[str, Any],
+        trace_id: str,
+        span_id: str,
+        parent_span_id: Optional[str],
+        task_id: str,
+        task_type: str,
+        title: str,
+        start_ns: int,
+        end_ns: int,
+        status: str,
+        sprint_id: Optional[str],
+        extra: Optional[Dict[str, Any]] = None,
+        events: Optional[List[Dict[str, Any]]] = None,
+        links: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = {
+            "task.id": task_id,
+            "task.type": task_type,
+            "task.title": title,
+            "task.status": status,
+            "project.id": project,
+        }
+        if sprint_id:
+            attributes["sprint.id"] = sprint_id
+        if extra:
+            attributes.update(extra)
+        blocked = status == "blocked"
+        span: Dict[str, Any] = {
+            "name": f"contextcore.task.{task_type}",
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "start_time_ns": start_ns,
+            "end_time_ns": end_ns,
+            "status": {
+                "status_code": "ERROR" if blocked else "OK",
+                "description": "Task blocked" if blocked else None,
+            },
+            "kind": "INTERNAL",
+            "attributes": attributes,
+            "resource": resource,
+        }
+        if parent_span_id:
+            span["parent_span_id"] = parent_span_id
+        if events:
+            span["events"] = events
+        if links:
+            span["links"] = links
+        return span
+
+    def _generate_agent_activity(self, project: str, task_trace_id: str, node: _Node) -> None:
+        """Insights and handoffs raised while working a leaf task (own traces)."""
+        resource = {"service.name": "contextcore-agent", "project.id": project}
+
+        for _ in range(self.profile.insights_per_task.sample_count(self.rng)):
+            ts = min(node.start_ns + self._hours_ns(self.profile.queue_time_hours), self.end_ns - 10**6)
+            insight_type = self.rng.choice(_INSIGHT_TYPES)
+            agent = self.rng.choice(_AGENTS)
+            insight_id = f"insight-{self.rng.getrandbits(48):012x}"
+            self._emit_span({
+                "name": f"insight.{insight_type}",
+                "trace_id": self._trace_id(),
+                "span_id": self._span_id(),
+                "start_time_ns": ts,
+                "end_time_ns": ts + 10**6,
+                "status": {"status_code": "UNSET", "description": None},
+                "kind": "INTERNAL",
+                "attributes": {
+                    "insight.id": insight_id,
+                    "insight.type": insight_type,
+                    "insight.summary": f"{insight_type} for {node.task_id}",
+                    "insight.confidence": round(self.rng.uniform(0.5, 1.0), 2),
+                    "insight.audience": self.rng.choice(_INSIGHT_AUDIENCES),
+                    "insight.applies_to": [node.task_id],
+                    "project.id": project,
+                    "agent.id": agent,
+                    "agent.session_id": f"session-{self.rng.getrandbits(32):08x}",
+                    "gen_ai.operation.name": "insight.emit",
+                },
+                "links": [{"trace_id": task_trace_id, "span_id": node.span_id, "attributes": {"link.type": "task"}}],
+                "resource": resource,
+            })
+            self._count("insights")
+
+        for _ in range(self.profile.handoffs_per_task.sample_count(self.rng)):
+            ts = min(node.start_ns + self._hours_ns(self.profile.queue_time_hours), self.end_ns - 10**6)
+            capability = self.rng.choice(_CAPABILITIES)
+            from_agent, to_agent = self.rng.sample(_AGENTS, 2)
+            handoff_id = f"handoff-{self.rng.getrandbits(48):012x}"
+            self._emit_span({
+                "name": "handoff.request",
+                "trace_id": self._trace_id(),
+                "span_id": self._span_id(),
+                "start_time_ns": ts,
+                "end_time_ns": min(ts + self._hours_ns(_HANDOFF_HOURS), self.end_ns),
+                "status": {"status_code": "UNSET", "description": None},
+                "kind": "PRODUCER",
+                "attributes": {
+                    "handoff.id": handoff_id,
+                    "handoff.from_agent": from_agent,
+                    "handoff.to_agent": to_agent,
+                    "handoff.capability_id": capability,
+                    "handoff.status": self.rng.choice(["completed", "completed", "completed", "failed"]),
+                    "project.id": project,
+                    "gen_ai.operation.name": "handoff.request",
+                    "gen_ai.tool.name": capability,
+                    "gen_ai.tool.type": "agent_handoff",
+                    "gen_ai.tool.call.id": handoff_id,
+                },
+                "resource": resource,
+            })
+            self._count("handoffs")
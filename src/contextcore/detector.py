@@ -19,19 +19,36 @@ All spans/metrics/logs will include attributes like:
     - business.criticality
     - design.doc
     - etc.
+
+Pod annotations are fixed for the pod's lifetime, so detection is memoized:
+
+1. Downward API annotations file (``$CONTEXTCORE_PODINFO_DIR/annotations``,
+   default /etc/podinfo) - read locally, never touches the network
+2. Process-level memo - one lookup per pod per process
+3. On-disk cache (~/.contextcore/cache/k8s-detection.json) keyed by pod
+   UID (or hostname) with a TTL of CONTEXTCORE_DETECTION_CACHE_TTL seconds
+   (default 3600, 0 disables); CONTEXTCORE_DETECTION_CACHE=0 also disables
+   it and CONTEXTCORE_DETECTION_CACHE_PATH moves it
+4. API server (read_namespaced_pod), whose result fills 2 and 3
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import platform
 import socket
+import threading
+import time
 import uuid
-from typing import Any, Dict, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
 
 from opentelemetry.sdk.resources import Resource, ResourceDetector
 
+from contextcore.utils.persisted_cache import cache_path, env_float, read_json, write_atomic
+
 logger = logging.getLogger(__name__)
 
 
@@ -218,6 +235,118 @@ ANNOTATION_TO_ATTRIBUTE = {
 }
 
 
+# =============================================================================
+# Pod annotation cache
+# =============================================================================
+
+DEFAULT_PODINFO_DIR = "/etc/podinfo"
+DEFAULT_DETECTION_CACHE_TTL = 3600
+
+# (namespace, pod_name) -> annotations; None records a failed lookup so a
+# process does not retry a slow or unreachable API server on every detect()
+_ANNOTATION_MEMO: Dict[Tuple[str, str], Optional[Dict[str, str]]] = {}
+_ANNOTATION_MEMO_LOCK = threading.Lock()
+
+
+def clear_detection_cache(disk: bool = False) -> None:
+    """Forget memoized pod annotations (and the on-disk cache if ``disk``)."""
+    with _ANNOTATION_MEMO_LOCK:
+        _ANNOTATION_MEMO.clear()
+    path = _detection_cache_path()
+    if disk and path is not None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _podinfo_dir() -> Path:
+    return Path(os.environ.get("CONTEXTCORE_PODINFO_DIR", DEFAULT_PODINFO_DIR))
+
+
+def _detection_cache_path() -> Optional[Path]:
+    if _detection_cache_ttl() <= 0:
+        return None
+    return cache_path("CONTEXTCORE_DETECTION_CACHE", "k8s-detection.json")
+
+
+def _detection_cache_ttl() -> float:
+    return env_float("CONTEXTCORE_DETECTION_CACHE_TTL", DEFAULT_DETECTION_CACHE_TTL)
+
+
+def _parse_downward_api_annotations(text: str) -> Dict[str, str]:
+    """
+    Parse a downward API annotations file.
+
+    Each line is ``key="value"`` with the value quoted Go-style, which
+    json.loads decodes for everything annotations normally contain.
+    """
+    annotations: Dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, raw = line.partition("=")
+        if not sep:
+            continue
+        raw = raw.strip()
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw.strip('"')
+        annotations[key.strip()] = str(value)
+    return annotations
+
+
+def _read_downward_api_annotations() -> Optional[Dict[str, str]]:
+    """Annotations from the downward API volume, or None if not mounted."""
+    path = _podinfo_dir() / "annotations"
+    try:
+        return _parse_downward_api_annotations(path.read_text())
+    except OSError:
+        return None
+
+
+def _pod_cache_key(namespace: str, pod_name: str) -> str:
+    """Disk cache key: pod UID when known, so a recreated pod never reuses entries."""
+    uid = os.environ.get("POD_UID")
+    if not uid:
+        try:
+            uid = (_podinfo_dir() / "uid").read_text().strip()
+        except OSError:
+            uid = None
+    return f"{namespace}/{pod_name}/{uid or socket.gethostname()}"
+
+
+def _load_cached_annotations(key: str) -> Optional[Dict[str, str]]:
+    path = _detection_cache_path()
+    if path is None:
+        return None
+    try:
+        entry = read_json(path)[key]
+        if time.time() - entry["stored_at"] < _detection_cache_ttl():
+            return dict(entry["annotations"])
+    except (ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _store_cached_annotations(key: str, annotations: Dict[str, str]) -> None:
+    path = _detection_cache_path()
+    if path is None:
+        return
+    ttl = _detection_cache_ttl()
+    now = time.time()
+    entries = read_json(path)
+    # Drop expired entries from pods that are long gone
+    entries = {
+        k: v for k, v in (entries if isinstance(entries, dict) else {}).items()
+        if isinstance(v, dict) and now - v.get("stored_at", 0) < ttl
+    }
+    entries[key] = {"stored_at": now, "annotations": annotations}
+    try:
+        write_atomic(path, json.dumps(entries))
+    except OSError as e:
+        logger.debug(f"Could not write detection cache {path}: {e}")
+
+
 class ProjectContextDetector(ResourceDetector):
     """
     Detect project context from Kubernetes pod annotations.
@@ -297,15 +426,12 @@ class ProjectContextDetector(ResourceDetector):
         """
         Read project context from K8s pod annotations.
 
-        Includes timeout handling for K8s API calls to prevent blocking
-        during cluster startup or API server unavailability.
+        Uses the downward API file or a cached lookup when available; the
+        API server is only queried once per pod (see module docstring).
         """
-        try:
-            from kubernetes import client, config
-            from kubernetes.client.rest import ApiException
-        except ImportError:
-            logger.debug("kubernetes package not installed, skipping K8s detection")
-            return {}
+        annotations = _read_downward_api_annotations()
+        if annotations is not None:
+            return self._parse_annotations(annotations)
 
         # Determine pod name and namespace
         pod_name = self._pod_name or os.environ.get("HOSTNAME")
@@ -314,6 +440,37 @@ class ProjectContextDetector(ResourceDetector):
         if not pod_name or not namespace:
             return {}
 
+        memo_key = (namespace, pod_name)
+        with _ANNOTATION_MEMO_LOCK:
+            if memo_key in _ANNOTATION_MEMO:
+                annotations = _ANNOTATION_MEMO[memo_key]
+                return self._parse_annotations(annotations) if annotations is not None else {}
+
+        cache_key = _pod_cache_key(namespace, pod_name)
+        annotations = _load_cached_annotations(cache_key)
+        if annotations is None:
+            annotations = self._read_pod_annotations(pod_name, namespace)
+            if annotations is not None:
+                _store_cached_annotations(cache_key, annotations)
+
+        with _ANNOTATION_MEMO_LOCK:
+            _ANNOTATION_MEMO[memo_key] = annotations
+        return self._parse_annotations(annotations) if annotations is not None else {}
+
+    def _read_pod_annotations(self, pod_name: str, namespace: str) -> Optional[Dict[str, str]]:
+        """
+        Read pod annotations from the API server, or None on failure.
+
+        Includes timeout handling for K8s API calls to prevent blocking
+        during cluster startup or API server unavailability.
+        """
+        try:
+            from kubernetes import client, config
+            from kubernetes.client.rest import ApiException
+        except ImportError:
+            logger.debug("kubernetes package not installed, skipping K8s detection")
+            return None
+
         # Load kubeconfig with timeout consideration
         try:
             if self._kubeconfig:
@@ -325,7 +482,7 @@ class ProjectContextDetector(ResourceDetector):
                 config.load_kube_config()
             except Exception as e:
                 logger.debug(f"Could not load kubeconfig: {e}")
-                return {}
+                return None
 
         # Get pod annotations with explicit timeout
         v1 = client.CoreV1Api()
@@ -346,7 +503,7 @@ class ProjectContextDetector(ResourceDetector):
                 logger.debug(f"Pod {namespace}/{pod_name} not found")
             else:
                 logger.debug(f"K8s API error reading pod {namespace}/{pod_name}: {e.status} {e.reason}")
-            return {}
+            return None
         except Exception as e:
             # Handle timeouts and connection errors
             error_name = type(e).__name__
@@ -357,10 +514,9 @@ class ProjectContextDetector(ResourceDetector):
                 )
             else:
                 logger.debug(f"Could not read pod {namespace}/{pod_name}: {e}")
-            return {}
+            return None
 
-        annotations = pod.metadata.annotations or {}
-        return self._parse_annotations(annotations)
+        return dict(pod.metadata.annotations or {})
 
     def _detect_from_env(self) -> Dict[str, str]:
         """Read project context from environment variables."""
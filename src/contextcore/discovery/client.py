@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Tuple, List
 from urllib.parse import urljoin
 
+from contextcore.tracing.traceql import get_traceql_client
+
 from .agentcard import AgentCard
 
 
@@ -189,20 +191,16 @@ class DiscoveryClient:
         return list(set(agent_ids))  # Remove duplicates
 
     def _query_tempo(self, query: str) -> Optional[List[dict]]:
-        """Execute TraceQL query against Tempo."""
-        if self._http is None:
-            logger.warning("HTTP client not initialized - use context manager")
-            return None
-            
+        """Execute TraceQL query against Tempo.
+
+        Uses the shared TraceQL client, so Tempo lookups work with or
+        without the context manager and reuse pooled connections.
+        """
         try:
-            # Use Tempo's search API with TraceQL query
-            url = f"{self.tempo_url.rstrip('/')}/api/search"
-            params = {"q": query, "limit": 100}
-            
-            response = self._http.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = get_traceql_client(self.tempo_url).search(
+                query, limit=100, timeout=self.timeout
+            )
+
             # Tempo API returns traces, we need to extract spans
             spans = []
             if 'traces' in data:
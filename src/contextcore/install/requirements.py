@@ -20,6 +20,8 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
+import threading
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -43,6 +45,37 @@ def _get_config():
     }
 
 
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+# All network checks go through one pooled client so concurrent verification
+# reuses keep-alive connections instead of opening a socket per probe.
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the process-wide pooled HTTP client, creating it on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(
+                timeout=5,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    """Close the pooled HTTP client (a new one is created on next use)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
 class RequirementCategory(str, Enum):
     """Categories of installation requirements."""
 
@@ -205,7 +238,7 @@ def check_grafana_running() -> bool:
     """Check if Grafana is running and healthy."""
     config = _get_config()
     try:
-        response = httpx.get(f"{config['grafana_url']}/api/health", timeout=5)
+        response = _get_http_client().get(f"{config['grafana_url']}/api/health", timeout=5)
         return response.status_code == 200
     except Exception:
         return False
@@ -215,7 +248,7 @@ def check_tempo_running() -> bool:
     """Check if Tempo is running and healthy."""
     config = _get_config()
     try:
-        response = httpx.get(f"{config['tempo_url']}/ready", timeout=5)
+        response = _get_http_client().get(f"{config['tempo_url']}/ready", timeout=5)
         return response.status_code == 200
     except Exception:
         return False
@@ -225,7 +258,7 @@ def check_mimir_running() -> bool:
     """Check if Mimir is running and healthy."""
     config = _get_config()
     try:
-        response = httpx.get(f"{config['mimir_url']}/ready", timeout=5)
+        response = _get_http_client().get(f"{config['mimir_url']}/ready", timeout=5)
         return response.status_code == 200
     except Exception:
         return False
@@ -235,7 +268,7 @@ def check_loki_running() -> bool:
     """Check if Loki is running and healthy."""
     config = _get_config()
     try:
-        response = httpx.get(f"{config['loki_url']}/ready", timeout=5)
+        response = _get_http_client().get(f"{config['loki_url']}/ready", timeout=5)
         return response.status_code == 200
     except Exception:
         return False
@@ -288,7 +321,7 @@ def _check_grafana_api(endpoint: str) -> tuple[bool, str]:
     """
     config = _get_config()
     try:
-        response = httpx.get(
+        response = _get_http_client().get(
             f"{config['grafana_url']}{endpoint}",
             auth=_get_grafana_auth(),
             timeout=5,
@@ -303,15 +336,47 @@ def _check_grafana_api(endpoint: str) -> tuple[bool, str]:
         return False, str(e)
 
 
+# Datasource lookups are shared by three checks; cache the response briefly so
+# one verification run makes a single request (concurrent callers wait on it).
+_DATASOURCES_CACHE_TTL = 30.0
+_datasources_cache: Optional[tuple[float, str, Optional[list[dict]]]] = None
+_datasources_lock = threading.Lock()
+
+
+def clear_check_cache() -> None:
+    """Drop cached check inputs so the next verification run re-fetches them."""
+    global _datasources_cache
+    with _datasources_lock:
+        _datasources_cache = None
+
+
 def _get_grafana_datasources() -> list[dict] | None:
     """Get Grafana datasources list.
 
     Returns list of datasources or None if request failed.
-    Handles auth errors gracefully.
+    Handles auth errors gracefully. Results are cached for
+    _DATASOURCES_CACHE_TTL seconds per Grafana URL.
     """
+    global _datasources_cache
+    grafana_url = _get_config()["grafana_url"]
+    with _datasources_lock:
+        if _datasources_cache is not None:
+            fetched_at, cached_url, cached = _datasources_cache
+            if (
+                cached_url == grafana_url
+                and time.monotonic() - fetched_at < _DATASOURCES_CACHE_TTL
+            ):
+                return cached
+        datasources = _fetch_grafana_datasources()
+        _datasources_cache = (time.monotonic(), grafana_url, datasources)
+        return datasources
+
+
+def _fetch_grafana_datasources() -> list[dict] | None:
+    """Request the datasources list from the Grafana API."""
     config = _get_config()
     try:
-        response = httpx.get(
+        response = _get_http_client().get(
             f"{config['grafana_url']}/api/datasources",
             auth=_get_grafana_auth(),
             timeout=5,
@@ -388,7 +453,7 @@ def check_grafana_has_dashboards() -> bool:
 
     # Try API first
     try:
-        response = httpx.get(
+        response = _get_http_client().get(
             f"{config['grafana_url']}/api/search?type=dash-db&tag=contextcore",
             auth=_get_grafana_auth(),
             timeout=5,
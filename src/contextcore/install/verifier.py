@@ -3,15 +3,21 @@ Installation verification with telemetry emission.
 
 Verifies ContextCore installation completeness and emits metrics, logs,
 and traces representing the installation state.
+
+Requirement checks run concurrently on a thread pool: each requirement is
+scheduled as soon as the requirements it ``depends_on`` have finished, so
+independent network probes overlap instead of stacking their timeouts.
+Results are still reported (and telemetry emitted) in requirement order.
 """
 
 from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from opentelemetry import metrics, trace
 from opentelemetry.trace import Status, StatusCode
@@ -21,6 +27,7 @@ from contextcore.install.requirements import (
     InstallationRequirement,
     RequirementCategory,
     RequirementStatus,
+    clear_check_cache,
     get_requirements_by_category,
 )
 
@@ -179,12 +186,16 @@ class InstallationVerifier:
 
         # Or with specific categories
         result = verifier.verify(categories=[RequirementCategory.INFRASTRUCTURE])
+
+        # Run checks one at a time
+        result = InstallationVerifier(max_workers=1).verify()
     """
 
     def __init__(
         self,
         requirements: Optional[list[InstallationRequirement]] = None,
         emit_telemetry: bool = True,
+        max_workers: int = 8,
     ):
         """
         Initialize verifier.
@@ -192,9 +203,11 @@ class InstallationVerifier:
         Args:
             requirements: Custom requirements list (defaults to all)
             emit_telemetry: Whether to emit OTel metrics/traces
+            max_workers: Maximum requirement checks running at once
         """
         self.requirements = requirements or INSTALLATION_REQUIREMENTS
         self.emit_telemetry = emit_telemetry
+        self.max_workers = max(1, max_workers)
         self._results_cache: dict[str, RequirementResult] = {}
 
     def _check_requirement(
@@ -239,6 +252,54 @@ class InstallationVerifier:
         self._results_cache[req.id] = result
         return result
 
+    def _iter_results(
+        self, requirements: list[InstallationRequirement]
+    ) -> Iterator[RequirementResult]:
+        """
+        Check requirements concurrently, yielding results in input order.
+
+        A requirement is submitted once every dependency that is part of this
+        run has a result, so ``_check_requirement`` sees the same dependency
+        state it would in a sequential pass. Dependencies outside the run
+        (e.g. filtered out by category) are ignored, as before. If the
+        remaining dependencies form a cycle, the earliest pending requirement
+        is released, matching sequential behaviour where a not-yet-checked
+        dependency did not block.
+
+        Closing the generator early cancels checks that have not started.
+        """
+        ids = {req.id for req in requirements}
+        pending = list(requirements)
+        done: dict[str, RequirementResult] = {}
+        running: dict[Future, InstallationRequirement] = {}
+        next_index = 0
+
+        def is_ready(req: InstallationRequirement) -> bool:
+            return all(dep not in ids or dep in done for dep in req.depends_on)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="install-verify"
+        )
+        try:
+            while pending or running:
+                ready = [req for req in pending if is_ready(req)]
+                if not ready and not running:
+                    ready = pending[:1]
+                for req in ready:
+                    pending.remove(req)
+                    running[executor.submit(self._check_requirement, req)] = req
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    req = running.pop(future)
+                    done[req.id] = future.result()
+
+                while next_index < len(requirements) and requirements[next_index].id in done:
+                    yield done[requirements[next_index].id]
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _emit_requirement_telemetry(
         self, result: RequirementResult, parent_span: trace.Span
     ) -> None:
@@ -387,6 +448,7 @@ class InstallationVerifier:
         """
         start = time.perf_counter()
         self._results_cache.clear()
+        clear_check_cache()
 
         # Filter requirements by category if specified
         requirements = self.requirements
@@ -406,9 +468,8 @@ class InstallationVerifier:
                 "gen_ai.operation.name": "install.verify",
             },
         ) as parent_span:
-            # Check each requirement
-            for req in requirements:
-                result = self._check_requirement(req)
+            # Check requirements concurrently, reporting in order
+            for result in self._iter_results(requirements):
                 results.append(result)
                 self._emit_requirement_telemetry(result, parent_span)
 
@@ -517,6 +578,7 @@ class InstallationVerifier:
 
         start = time.perf_counter()
         self._results_cache.clear()
+        clear_check_cache()
 
         # Filter requirements by category if specified
         requirements = self.requirements
@@ -552,8 +614,9 @@ class InstallationVerifier:
         ) as parent_span:
             if step_all:
                 # Checkpoint after each requirement
-                for req in requirements:
-                    result = self._check_requirement(req)
+                checks = self._iter_results(requirements)
+                for result in checks:
+                    req = result.requirement
                     results.append(result)
                     self._emit_requirement_telemetry(result, parent_span)
 
@@ -583,14 +646,20 @@ class InstallationVerifier:
                         )
                         if not on_checkpoint(checkpoint):
                             aborted = True
+                            checks.close()
                             break
             else:
-                # Checkpoint after each category
+                # Checkpoint after each category. Checks run in the same
+                # concurrent pass; a category checkpoint fires once all of
+                # its requirements have been reported.
+                checks = self._iter_results(
+                    [req for reqs in requirements_by_category.values() for req in reqs]
+                )
                 for cat, cat_requirements in requirements_by_category.items():
                     cat_results: list[RequirementResult] = []
 
-                    for req in cat_requirements:
-                        result = self._check_requirement(req)
+                    for _ in cat_requirements:
+                        result = next(checks)
                         results.append(result)
                         cat_results.append(result)
                         self._emit_requirement_telemetry(result, parent_span)
@@ -653,6 +722,7 @@ class InstallationVerifier:
                         if not on_checkpoint(checkpoint):
                             aborted = True
                             break
+                checks.close()
 
             # Calculate final results (even if aborted, return what we have)
             category_results: dict[RequirementCategory, CategoryResult] = {}
@@ -8,6 +8,8 @@ from contextcore.integrations.github_review import (
 )
 from contextcore.integrations.openapi_parser import (
     EndpointSpec,
+    OpenAPISpec,
+    load_openapi,
     parse_openapi,
 )
 from contextcore.integrations.contract_drift import (
@@ -24,6 +26,8 @@ __all__ = [
     "PRReviewAnalyzer",
     # OpenAPI Parser
     "EndpointSpec",
+    "OpenAPISpec",
+    "load_openapi",
     "parse_openapi",
     # Contract Drift
     "DriftIssue",
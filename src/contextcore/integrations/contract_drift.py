@@ -5,7 +5,9 @@ Scope A: A2A schema drift — compare JSON schema files against Pydantic models
 and Python enums. Runs offline, reads only local files.
 
 Scope B: OpenAPI drift — compare OpenAPI specs against live service responses.
-Requires network access to the service.
+Requires network access to the service. Endpoints are probed concurrently over
+pooled keep-alive connections, with a per-host rate limit and an overall
+deadline; parsed specs are cached by content hash.
 
 Usage::
 
@@ -20,160 +22,151 @@ Usage::
 __all__ = [
     'EndpointSpec',
     'parse_openapi',
+    'clear_parse_cache',
+    'EndpointProber',
+    'ProbeResult',
     'DriftIssue',
     'DriftReport',
     'ContractDriftDetector',
 ]
 
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-import urllib.request
 import urllib.parse
 import json
 import logging
-import yaml
+import threading
+import time
 import os
 from pathlib import Path
 
+import httpx
+
+from contextcore.integrations.openapi_parser import (
+    EndpointSpec,
+    clear_parse_cache,
+    parse_openapi,
+)
+
 logger = logging.getLogger(__name__)
 
+
+# ---------------------------------------------------------------------------
+# Live endpoint probing (Scope B)
+# ---------------------------------------------------------------------------
+
+class _HostRateLimiter:
+    """Spaces request starts to at most ``rate_per_s`` per host."""
+
+    def __init__(self, rate_per_s: Optional[float]):
+        self.interval = 1.0 / rate_per_s if rate_per_s else 0.0
+        self._next_start: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str, deadline: Optional[float]) -> bool:
+        """Wait for the host's next slot; False if it falls after ``deadline``."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            if deadline is not None and start >= deadline:
+                return False
+            self._next_start[host] = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+        return True
+
+
 @dataclass
-class EndpointSpec:
-    """Represents a parsed OpenAPI endpoint specification."""
-    path: str
-    method: str
-    operation_id: Optional[str]
-    request_content_type: Optional[str]
-    response_content_type: Optional[str]
-    response_schema: Optional[Dict[str, Any]]
-    parameters: List[Dict[str, Any]]
-
-def parse_openapi(spec_url_or_path: str) -> List[EndpointSpec]:
-    """
-    Parse OpenAPI specification from URL or file path.
-    
-    Args:
-        spec_url_or_path: URL (http/https) or local file path to OpenAPI spec
-        
-    Returns:
-        List of parsed endpoint specifications
-        
-    Raises:
-        Exception: If spec cannot be loaded or parsed
-    """
-    try:
-        spec = _load_spec(spec_url_or_path)
-        
-        endpoints = []
-        paths = spec.get("paths", {})
-        
-        for path, methods in paths.items():
-            # Skip non-method keys like parameters, summary, etc.
-            http_methods = {'get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace'}
-            
-            for method, operation in methods.items():
-                if method.lower() not in http_methods:
-                    continue
-                    
-                endpoint = EndpointSpec(
-                    path=path,
-                    method=method.upper(),
-                    operation_id=operation.get("operationId"),
-                    request_content_type=_get_request_content_type(operation),
-                    response_content_type=_get_response_content_type(operation),
-                    response_schema=_get_response_schema(operation, spec),
-                    parameters=_get_parameters(operation)
-                )
-                endpoints.append(endpoint)
-        
-        return endpoints
-        
-    except Exception as e:
-        raise Exception(f"Failed to parse OpenAPI spec from {spec_url_or_path}: {str(e)}") from e
-
-def _load_spec(spec_url_or_path: str) -> Dict[str, Any]:
-    """Load specification from URL or file path."""
-    if spec_url_or_path.startswith("http://") or spec_url_or_path.startswith("https://"):
-        # Load from URL
-        with urllib.request.urlopen(spec_url_or_path) as response:
-            content = response.read().decode('utf-8')
-            if spec_url_or_path.endswith(".json") or response.info().get_content_type() == "application/json":
-                return json.loads(content)
-            else:
-                return yaml.safe_load(content)
-    else:
-        # Load from file
-        with open(spec_url_or_path, 'r', encoding='utf-8') as file:
-            if spec_url_or_path.endswith(".json"):
-                return json.load(file)
-            else:
-                return yaml.safe_load(file)
-
-def _get_request_content_type(operation: Dict[str, Any]) -> Optional[str]:
-    """Extract request content type from operation."""
-    request_body = operation.get("requestBody", {})
-    content = request_body.get("content", {})
-    return next(iter(content.keys()), None) if content else None
-
-def _get_response_content_type(operation: Dict[str, Any]) -> Optional[str]:
-    """Extract response content type from operation (defaults to 200 response)."""
-    responses = operation.get("responses", {})
-    success_response = responses.get("200", responses.get("201", {}))
-    content = success_response.get("content", {})
-    return next(iter(content.keys()), None) if content else None
-
-def _get_response_schema(operation: Dict[str, Any], spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Extract and resolve response schema from operation."""
-    responses = operation.get("responses", {})
-    success_response = responses.get("200", responses.get("201", {}))
-    content = success_response.get("content", {})
-    
-    # Try to get schema from JSON content type first, then any available
-    schema_def = None
-    if "application/json" in content:
-        schema_def = content["application/json"].get("schema")
-    elif content:
-        schema_def = next(iter(content.values()), {}).get("schema")
-    
-    if not schema_def:
-        return None
-        
-    # Resolve $ref if present
-    if "$ref" in schema_def:
-        return _resolve_ref(schema_def["$ref"], spec)
-    
-    return schema_def
-
-def _resolve_ref(ref: str, spec: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Resolve JSON Schema $ref reference within the specification.
-    
+class ProbeResult:
+    """Outcome of probing one endpoint."""
+
+    endpoint: EndpointSpec
+    status: Optional[int] = None
+    error: Optional[str] = None
+    skipped: bool = False  # Not probed (or cut short) by the deadline
+    elapsed_s: float = 0.0
+
+
+class EndpointProber:
+    """Probe endpoints concurrently over a pooled keep-alive HTTP client.
+
     Args:
-        ref: Reference string like "#/components/schemas/User"
-        spec: Full OpenAPI specification
-        
-    Returns:
-        Resolved schema dictionary
+        timeout: Per-request timeout in seconds.
+        max_concurrency: Maximum probes in flight.
+        per_host_rps: Maximum requests started per second per host
+            (None for no limit).
+        deadline_s: Overall time budget; endpoints not started by then are
+            reported as skipped and in-flight requests are cut short.
     """
-    if not ref or not ref.startswith("#/"):
-        return {}
-    
-    # Split reference path and navigate through spec
-    path_parts = ref[2:].split("/")  # Remove "#/" prefix
-    current = spec
-    
-    for part in path_parts:
-        if not isinstance(current, dict) or part not in current:
-            return {}
-        current = current[part]
-    
-    return current if isinstance(current, dict) else {}
-
-def _get_parameters(operation: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract parameters from operation."""
-    return operation.get("parameters", [])
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        max_concurrency: int = 8,
+        per_host_rps: Optional[float] = 20.0,
+        deadline_s: Optional[float] = None,
+    ):
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_rps = per_host_rps
+        self.deadline_s = deadline_s
+
+    def probe(self, service_url: str, endpoints: List[EndpointSpec]) -> List[ProbeResult]:
+        """Probe every endpoint under ``service_url``; results keep input order."""
+        if not endpoints:
+            return []
+        base = service_url.rstrip('/')
+        deadline = time.monotonic() + self.deadline_s if self.deadline_s is not None else None
+        limiter = _HostRateLimiter(self.per_host_rps)
+        workers = min(self.max_concurrency, len(endpoints))
+
+        # Follow redirects like the urllib-based prober did, so an endpoint
+        # behind a redirect reports the status of its final response
+        with httpx.Client(
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=workers,
+                max_keepalive_connections=workers,
+            ),
+        ) as client:
+
+            def run(endpoint: EndpointSpec) -> ProbeResult:
+                url = f"{base}{endpoint.path}"
+                host = urllib.parse.urlsplit(url).netloc
+                if not limiter.acquire(host, deadline):
+                    return ProbeResult(endpoint=endpoint, skipped=True)
+                timeout = self.timeout
+                if deadline is not None:
+                    timeout = min(timeout, max(deadline - time.monotonic(), 0.001))
+                start = time.monotonic()
+                try:
+                    resp = client.request(endpoint.method, url, timeout=timeout)
+                    return ProbeResult(
+                        endpoint=endpoint,
+                        status=resp.status_code,
+                        elapsed_s=time.monotonic() - start,
+                    )
+                except Exception as e:
+                    return ProbeResult(
+                        endpoint=endpoint,
+                        error=str(e) or type(e).__name__,
+                        # Cut short by the deadline rather than unreachable
+                        skipped=(
+                            isinstance(e, httpx.TimeoutException)
+                            and deadline is not None
+                            and time.monotonic() >= deadline
+                        ),
+                        elapsed_s=time.monotonic() - start,
+                    )
+
+            if workers == 1:
+                return [run(endpoint) for endpoint in endpoints]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(run, endpoints))
 
 
 # ---------------------------------------------------------------------------
@@ -307,8 +300,17 @@ class ContractDriftDetector:
         "artifact-intent.schema.json": "ArtifactIntent",
     }
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_concurrency: int = 8,
+        per_host_rps: Optional[float] = 20.0,
+        deadline_s: Optional[float] = None,
+    ):
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.per_host_rps = per_host_rps
+        self.deadline_s = deadline_s
 
     def detect(
         self,
@@ -736,44 +738,60 @@ class ContractDriftDetector:
 
         report.schemas_checked += len(endpoints)
 
-        for endpoint in endpoints:
-            url = f"{service_url.rstrip('/')}{endpoint.path}"
-            try:
-                req = urllib.request.Request(
-                    url,
-                    method=endpoint.method if endpoint.method != "GET" else None,
+        prober = EndpointProber(
+            timeout=self.timeout,
+            max_concurrency=self.max_concurrency,
+            per_host_rps=self.per_host_rps,
+            deadline_s=self.deadline_s,
+        )
+        for result in prober.probe(service_url, endpoints):
+            endpoint = result.endpoint
+            location = f"{endpoint.method} {endpoint.path}"
+            if result.skipped:
+                report.issues.append(
+                    DriftIssue(
+                        scope="openapi",
+                        schema_id=contract_url,
+                        location=location,
+                        issue_type="probe_skipped",
+                        severity="warning",
+                        expected=f"probe completed within the {self.deadline_s}s deadline",
+                        actual="not completed before the deadline",
+                        recommendation=(
+                            "Raise the probe deadline or concurrency to cover "
+                            f"{location}."
+                        ),
+                    )
                 )
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                    status = resp.status
-                    if status >= 400:
-                        report.issues.append(
-                            DriftIssue(
-                                scope="openapi",
-                                schema_id=contract_url,
-                                location=f"{endpoint.method} {endpoint.path}",
-                                issue_type="endpoint_error",
-                                severity="critical",
-                                expected="2xx response",
-                                actual=f"HTTP {status}",
-                                recommendation=(
-                                    f"Endpoint {endpoint.method} {endpoint.path} "
-                                    f"returns {status}."
-                                ),
-                            )
-                        )
-            except Exception as e:
+            elif result.error is not None:
                 report.issues.append(
                     DriftIssue(
                         scope="openapi",
                         schema_id=contract_url,
-                        location=f"{endpoint.method} {endpoint.path}",
+                        location=location,
                         issue_type="connection_error",
                         severity="critical",
                         expected="endpoint reachable",
-                        actual=str(e),
+                        actual=result.error,
                         recommendation=(
-                            f"Endpoint {endpoint.method} {endpoint.path} "
+                            f"Endpoint {location} "
                             f"is not reachable at {service_url}."
                         ),
                     )
                 )
+            elif result.status >= 400:
+                report.issues.append(
+                    DriftIssue(
+                        scope="openapi",
+                        schema_id=contract_url,
+                        location=location,
+                        issue_type="endpoint_error",
+                        severity="critical",
+                        expected="2xx response",
+                        actual=f"HTTP {result.status}",
+                        recommendation=(
+                            f"Endpoint {location} "
+                            f"returns {result.status}."
+                        ),
+                    )
+                )
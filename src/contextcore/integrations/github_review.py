@@ -9,8 +9,10 @@ checklists, and required reviewer suggestions based on ProjectContext risks.
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
-import fnmatch
+from typing import List, Dict, Optional, Any, Tuple
+from functools import lru_cache
+
+from contextcore.utils.scope_matcher import ScopeMatcher
 
 __all__ = ['ReviewPriority', 'ReviewFocus', 'ReviewGuidance', 'PRReviewAnalyzer']
 
@@ -169,15 +171,20 @@ class PRReviewAnalyzer:
         risks = project_context_spec.get('risks', [])
         business_info = project_context_spec.get('business', {})
         
+        # Classify every changed file against all risk scopes in one pass
+        scope_matches = _scope_matcher(
+            tuple(risk.get('scope') or '' for risk in risks)
+        ).paths_by_pattern(changed_files)
+
         # Process each risk in the project context
-        for risk in risks:
+        for risk, matched_files in zip(risks, scope_matches, strict=True):
             risk_type = risk.get('type', '').lower()
             risk_priority_str = risk.get('priority', 'P4')
             risk_scope = risk.get('scope', '')
             risk_description = risk.get('description', '')
             
             # Check if any changed files match the risk scope pattern
-            if risk_scope and self._match_files(changed_files, risk_scope):
+            if risk_scope and matched_files:
                 priority = self._priority_from_string(risk_priority_str)
                 
                 # Create focus area for this risk
@@ -218,8 +225,9 @@ class PRReviewAnalyzer:
         return spec.get('project_id', spec.get('name', 'unknown-project'))
 
     def _match_files(self, files: List[str], pattern: str) -> List[str]:
-        """Match files against a pattern using fnmatch."""
-        return [f for f in files if fnmatch.fnmatch(f, pattern)]
+        """Match files against a pattern with fnmatch semantics."""
+        matcher = _scope_matcher((pattern,))
+        return [f for f in files if matcher.matches_any(f)]
 
     def _priority_from_string(self, priority_str: str) -> ReviewPriority:
         """Convert priority string (P1-P4) to ReviewPriority enum."""
@@ -234,9 +242,12 @@ class PRReviewAnalyzer:
     def _generate_general_checklist(self, files: List[str]) -> List[str]:
         """Generate general checklist items based on changed files."""
         checklist = []
+        matched = set()
+        for indices in _FILE_TYPE_MATCHER.match_many(files).values():
+            matched.update(_FILE_TYPE_MATCHER.patterns[i] for i in indices)
         
         # Python files
-        if self._match_files(files, '*.py'):
+        if '*.py' in matched:
             checklist.extend([
                 "Code follows PEP 8 style guidelines",
                 "Unit tests added/updated for new functionality",
@@ -244,18 +255,18 @@ class PRReviewAnalyzer:
             ])
         
         # JavaScript/TypeScript files
-        if self._match_files(files, '*.js') or self._match_files(files, '*.ts'):
+        if matched & {'*.js', '*.ts'}:
             checklist.extend([
                 "ESLint rules followed",
                 "Frontend tests updated where applicable"
             ])
         
         # Configuration files
-        if self._match_files(files, '*.yaml') or self._match_files(files, '*.yml') or self._match_files(files, '*.json'):
+        if matched & {'*.yaml', '*.yml', '*.json'}:
             checklist.append("Configuration changes reviewed and validated")
         
         # Database migrations
-        if self._match_files(files, '*migration*') or self._match_files(files, '*schema*'):
+        if matched & {'*migration*', '*schema*'}:
             checklist.extend([
                 "Database migration is reversible",
                 "Migration tested on staging environment"
@@ -268,3 +279,15 @@ class PRReviewAnalyzer:
         ])
         
         return checklist
+
+
+# File-type patterns behind the general checklist
+_FILE_TYPE_MATCHER = ScopeMatcher(
+    ['*.py', '*.js', '*.ts', '*.yaml', '*.yml', '*.json', '*migration*', '*schema*']
+)
+
+
+@lru_cache(maxsize=128)
+def _scope_matcher(patterns: Tuple[str, ...]) -> ScopeMatcher:
+    """Compiled matcher for a set of risk scopes, reused across analyses."""
+    return ScopeMatcher(patterns)
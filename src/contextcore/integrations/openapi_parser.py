@@ -4,15 +4,62 @@ OpenAPI specification parser for contract drift detection.
 Supports both JSON and YAML formats from URLs or local file paths.
 
 Prime Contractor Pattern: Spec by Claude, drafts by GPT-4o-mini, integration by Claude.
+
+This is the single parser shared by ``parse_openapi`` callers and
+``contract_drift``. Parsing is layered so that repeated runs do little work:
+
+- ``OpenAPISpec`` wraps a loaded document. ``$ref`` pointers are resolved
+  once per reference and memoized; chains of references are followed with
+  cycle detection. Endpoints and the (method, path) index are built lazily.
+- Parsed endpoint lists are kept in memory by SHA-256 of the raw spec, so an
+  identical document at another location is not parsed again.
+- Parsed endpoint lists are persisted under ``~/.contextcore/cache/openapi/``
+  as JSON keyed by source, and revalidated by file mtime/size or by URL ETag
+  (``If-None-Match``) before reuse. Override the location with
+  CONTEXTCORE_OPENAPI_CACHE_DIR; disable with CONTEXTCORE_OPENAPI_CACHE=0.
+
+Usage::
+
+    from contextcore.integrations.openapi_parser import load_openapi, parse_openapi
+
+    endpoints = parse_openapi("openapi.yaml")
+
+    spec = load_openapi("openapi.yaml")
+    users = spec.get_endpoint("GET", "/users")
+    schema = spec.resolve_ref("#/components/schemas/User")
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-from urllib.request import urlopen
-from urllib.error import URLError
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Dict, Any, Tuple
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote
+from urllib.request import Request, urlopen
+import copy
+import hashlib
 import json
+import logging
+import os
+import threading
 
-__all__ = ['EndpointSpec', 'parse_openapi']
+from contextcore.utils.persisted_cache import cache_path, is_racy, write_atomic
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'EndpointSpec',
+    'OpenAPISpec',
+    'clear_parse_cache',
+    'load_openapi',
+    'parse_openapi',
+]
+
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace')
+
+# Bump when EndpointSpec or parsing output changes to orphan old cache files.
+_CACHE_FORMAT = 2
+_CONTENT_CACHE_SIZE = 32
 
 
 @dataclass
@@ -27,6 +74,114 @@ class EndpointSpec:
     parameters: List[Dict[str, Any]]
 
 
+class OpenAPISpec:
+    """A loaded OpenAPI document with memoized ``$ref`` resolution."""
+
+    def __init__(self, spec: Dict[str, Any], source: str = ""):
+        self.spec = spec if isinstance(spec, dict) else {}
+        self.source = source
+        self._refs: Dict[str, Dict[str, Any]] = {}
+        self._endpoints: Optional[List[EndpointSpec]] = None
+        self._index: Optional[Dict[Tuple[str, str], EndpointSpec]] = None
+
+    @property
+    def endpoints(self) -> List[EndpointSpec]:
+        """All operations in document order (built on first access)."""
+        if self._endpoints is None:
+            self._endpoints = self._build_endpoints()
+        return self._endpoints
+
+    def get_endpoint(self, method: str, path: str) -> Optional[EndpointSpec]:
+        """Look up one operation by HTTP method and path template."""
+        if self._index is None:
+            self._index = {(e.method, e.path): e for e in self.endpoints}
+        return self._index.get((method.upper(), path))
+
+    def resolve_ref(self, ref: str) -> Dict[str, Any]:
+        """
+        Resolve a local JSON pointer such as ``#/components/schemas/User``.
+
+        References to references are followed. Unresolvable, non-local and
+        cyclic references resolve to ``{}``.
+        """
+        cached = self._refs.get(ref)
+        if cached is not None:
+            return cached
+
+        seen = []
+        target: Any = {}
+        current = ref
+        while True:
+            if current in self._refs:
+                target = self._refs[current]
+                break
+            if current in seen:
+                logger.debug(f"Cyclic $ref chain in {self.source or 'spec'}: {' -> '.join(seen)}")
+                target = {}
+                break
+            seen.append(current)
+            target = self._walk(current)
+            if isinstance(target, dict) and isinstance(target.get("$ref"), str) and len(target) == 1:
+                current = target["$ref"]
+                continue
+            break
+
+        resolved = target if isinstance(target, dict) else {}
+        for visited in seen:
+            self._refs[visited] = resolved
+        return resolved
+
+    # -- internals ---------------------------------------------------------
+
+    def _walk(self, ref: str) -> Any:
+        if not ref or not ref.startswith("#/"):
+            return {}
+        current: Any = self.spec
+        for part in ref[2:].split("/"):
+            part = unquote(part).replace("~1", "/").replace("~0", "~")
+            if not isinstance(current, dict) or part not in current:
+                return {}
+            current = current[part]
+        return current
+
+    def _build_endpoints(self) -> List[EndpointSpec]:
+        endpoints = []
+        paths = self.spec.get("paths", {})
+        if not isinstance(paths, dict):
+            return endpoints
+
+        for path, methods in paths.items():
+            if not isinstance(methods, dict):
+                continue
+
+            for method, operation in methods.items():
+                if method.lower() not in HTTP_METHODS:
+                    continue
+                if not isinstance(operation, dict):
+                    continue
+
+                endpoints.append(EndpointSpec(
+                    path=path,
+                    method=method.upper(),
+                    operation_id=operation.get("operationId"),
+                    request_content_type=_get_request_content_type(operation),
+                    response_content_type=_get_response_content_type(operation),
+                    response_schema=self._response_schema(operation),
+                    parameters=operation.get("parameters", []),
+                ))
+
+        return endpoints
+
+    def _response_schema(self, operation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract and resolve response schema from operation."""
+        schema_def = _get_response_schema_def(operation)
+        if not schema_def:
+            return None
+        if "$ref" in schema_def:
+            return self.resolve_ref(schema_def["$ref"])
+        return schema_def
+
+
 def parse_openapi(spec_url_or_path: str) -> List[EndpointSpec]:
     """
     Parse OpenAPI specification from URL or file path.
@@ -41,81 +196,212 @@ def parse_openapi(spec_url_or_path: str) -> List[EndpointSpec]:
         ValueError: If spec cannot be loaded or parsed
     """
     try:
-        spec = _load_spec(spec_url_or_path)
+        endpoints = _cached_endpoints(spec_url_or_path)
+    except ValueError:
+        raise
     except Exception as e:
         raise ValueError(f"Failed to load OpenAPI spec from {spec_url_or_path}: {e}") from e
+    return copy.deepcopy(endpoints)
 
-    endpoints = []
-    paths = spec.get("paths", {})
 
-    http_methods = {'get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace'}
+def load_openapi(spec_url_or_path: str) -> OpenAPISpec:
+    """
+    Load an OpenAPI document for ref resolution and endpoint lookup.
 
-    for path, methods in paths.items():
-        if not isinstance(methods, dict):
-            continue
+    Raises:
+        ValueError: If spec cannot be loaded or parsed
+    """
+    try:
+        content, is_json, _ = _fetch(spec_url_or_path)
+    except Exception as e:
+        raise ValueError(f"Failed to load OpenAPI spec from {spec_url_or_path}: {e}") from e
+    return OpenAPISpec(_decode(content, is_json, spec_url_or_path), source=spec_url_or_path)
 
-        for method, operation in methods.items():
-            if method.lower() not in http_methods:
-                continue
-            if not isinstance(operation, dict):
-                continue
 
-            endpoint = EndpointSpec(
-                path=path,
-                method=method.upper(),
-                operation_id=operation.get("operationId"),
-                request_content_type=_get_request_content_type(operation),
-                response_content_type=_get_response_content_type(operation),
-                response_schema=_get_response_schema(operation, spec),
-                parameters=operation.get("parameters", []),
-            )
-            endpoints.append(endpoint)
+def clear_parse_cache(disk: bool = False) -> None:
+    """Drop in-memory parse results, and persisted ones if ``disk``."""
+    with _lock:
+        _by_content.clear()
+        _by_source.clear()
+    cache_dir = _cache_dir()
+    if disk and cache_dir is not None:
+        for entry in cache_dir.glob("*.json"):
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Loading and caching
+# ---------------------------------------------------------------------------
+
+# digest -> endpoints, LRU
+_by_content: "OrderedDict[str, List[EndpointSpec]]" = OrderedDict()
+# source -> (validator, digest, endpoints); validator is (mtime_ns, size) or an ETag
+_by_source: Dict[str, Tuple[Any, str, List[EndpointSpec]]] = {}
+_lock = threading.Lock()
+
 
+def _is_url(spec_url_or_path: str) -> bool:
+    return spec_url_or_path.startswith(("http://", "https://"))
+
+
+def _cached_endpoints(source: str) -> List[EndpointSpec]:
+    if _is_url(source):
+        key = source
+        known = _source_entry(key)
+        etag = known[0] if known and isinstance(known[0], str) else None
+        content, is_json, validator = _fetch(source, etag=etag)
+        if content is None:
+            # 304 Not Modified
+            return known[2]
+    else:
+        key = os.path.abspath(source)
+        st = os.stat(source)
+        validator = (st.st_mtime_ns, st.st_size)
+        known = _source_entry(key)
+        if known and known[0] == validator:
+            return known[2]
+        content, is_json, _ = _fetch(source)
+
+    digest = hashlib.sha256(content).hexdigest()
+    with _lock:
+        endpoints = _by_content.get(digest)
+        if endpoints is not None:
+            _by_content.move_to_end(digest)
+    if endpoints is None:
+        endpoints = OpenAPISpec(_decode(content, is_json, source), source=source).endpoints
+        with _lock:
+            _by_content[digest] = endpoints
+            while len(_by_content) > _CONTENT_CACHE_SIZE:
+                _by_content.popitem(last=False)
+
+    # Files modified within the racy window are not remembered: a same-size
+    # rewrite within the filesystem's mtime granularity would go unnoticed.
+    racy = not _is_url(source) and is_racy(validator[0])
+    if validator is not None and not racy:
+        with _lock:
+            _by_source[key] = (validator, digest, endpoints)
+        _persist(key, validator, digest, endpoints)
     return endpoints
 
 
-def _load_spec(spec_url_or_path: str) -> Dict[str, Any]:
-    """Load specification from URL or file path."""
+def _source_entry(key: str) -> Optional[Tuple[Any, str, List[EndpointSpec]]]:
+    with _lock:
+        entry = _by_source.get(key)
+    if entry is None:
+        entry = _load_persisted(key)
+        if entry is not None:
+            with _lock:
+                _by_source[key] = entry
+    return entry
+
+
+def _fetch(
+    spec_url_or_path: str, etag: Optional[str] = None
+) -> Tuple[Optional[bytes], bool, Any]:
+    """
+    Read raw spec bytes.
+
+    Returns (content, is_json, validator). For URLs the validator is the
+    response ETag (or None) and content is None on 304 Not Modified.
+    """
+    if _is_url(spec_url_or_path):
+        request = Request(spec_url_or_path)
+        if etag:
+            request.add_header("If-None-Match", etag)
+        try:
+            with urlopen(request, timeout=30) as response:
+                content = response.read()
+                is_json = (
+                    spec_url_or_path.endswith(".json")
+                    or response.info().get_content_type() == "application/json"
+                )
+                return content, is_json, response.headers.get("ETag")
+        except HTTPError as e:
+            if e.code == 304 and etag:
+                return None, False, etag
+            raise ValueError(f"Failed to fetch URL: {e}") from e
+        except URLError as e:
+            raise ValueError(f"Failed to fetch URL: {e}") from e
+
+    with open(spec_url_or_path, 'rb') as f:
+        return f.read(), spec_url_or_path.endswith(".json"), None
+
+
+def _decode(content: bytes, is_json: bool, source: str) -> Dict[str, Any]:
+    """Decode JSON or YAML spec content."""
+    text = content.decode('utf-8')
+    if is_json:
+        return json.loads(text)
+
     # Try to import yaml, fall back to JSON-only if not available
     try:
         import yaml
-        has_yaml = True
     except ImportError:
-        has_yaml = False
-
-    if spec_url_or_path.startswith(("http://", "https://")):
-        # Load from URL
         try:
-            with urlopen(spec_url_or_path, timeout=30) as response:
-                content = response.read().decode('utf-8')
-        except URLError as e:
-            raise ValueError(f"Failed to fetch URL: {e}") from e
+            return json.loads(text)
+        except json.JSONDecodeError:
+            raise ValueError("YAML support requires PyYAML package") from None
+    return yaml.safe_load(text)
+
+
+def _cache_dir() -> Optional[Path]:
+    """Directory of persisted parse results, or None if persistence is disabled."""
+    path = cache_path("CONTEXTCORE_OPENAPI_CACHE", "openapi")
+    override = os.environ.get("CONTEXTCORE_OPENAPI_CACHE_DIR")
+    return Path(override) if path is not None and override else path
+
+
+def _persisted_path(key: str) -> Optional[Path]:
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return cache_dir / f"{name}-v{_CACHE_FORMAT}.json"
 
-        if spec_url_or_path.endswith(".json"):
-            return json.loads(content)
-        elif has_yaml:
-            return yaml.safe_load(content)
-        else:
-            # Try JSON first, then fail
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                raise ValueError("YAML support requires PyYAML package")
-    else:
-        # Load from file
-        with open(spec_url_or_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if spec_url_or_path.endswith(".json"):
-            return json.loads(content)
-        elif has_yaml:
-            return yaml.safe_load(content)
-        else:
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                raise ValueError("YAML support requires PyYAML package")
 
+def _load_persisted(key: str) -> Optional[Tuple[Any, str, List[EndpointSpec]]]:
+    path = _persisted_path(key)
+    if path is None:
+        return None
+    try:
+        payload = json.loads(path.read_text())
+        if payload["key"] != key:
+            return None
+        validator = payload["validator"]
+        if isinstance(validator, list):
+            validator = tuple(validator)
+        endpoints = [EndpointSpec(**e) for e in payload["endpoints"]]
+        return validator, payload["digest"], endpoints
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable OpenAPI cache entry for {key}: {e}")
+        return None
+
+
+def _persist(key: str, validator: Any, digest: str, endpoints: List[EndpointSpec]) -> None:
+    path = _persisted_path(key)
+    if path is None:
+        return
+    try:
+        records = [asdict(e) for e in endpoints]
+        payload = json.dumps({
+            "key": key, "validator": validator, "digest": digest, "endpoints": records,
+        })
+        if json.loads(payload)["endpoints"] != records:
+            # YAML-only values (dates, non-string keys) would come back changed
+            return
+        write_atomic(path, payload)
+    except Exception as e:
+        logger.debug(f"Could not persist OpenAPI cache entry for {key}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Operation helpers
+# ---------------------------------------------------------------------------
 
 def _get_request_content_type(operation: Dict[str, Any]) -> Optional[str]:
     """Extract request content type from operation."""
@@ -132,51 +418,17 @@ def _get_response_content_type(operation: Dict[str, Any]) -> Optional[str]:
     return next(iter(content.keys()), None) if content else None
 
 
-def _get_response_schema(operation: Dict[str, Any], spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Extract and resolve response schema from operation."""
+def _get_response_schema_def(operation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Unresolved schema of the 200/201 response, preferring application/json."""
     responses = operation.get("responses", {})
     success_response = responses.get("200", responses.get("201", {}))
     content = success_response.get("content", {})
 
     # Try to get schema from JSON content type first, then any available
-    schema_def = None
     if "application/json" in content:
-        schema_def = content["application/json"].get("schema")
-    elif content:
+        return content["application/json"].get("schema")
+    if content:
         first_content = next(iter(content.values()), {})
-        schema_def = first_content.get("schema")
-
-    if not schema_def:
-        return None
-
-    # Resolve $ref if present
-    if "$ref" in schema_def:
-        return _resolve_ref(schema_def["$ref"], spec)
-
-    return schema_def
-
-
-def _resolve_ref(ref: str, spec: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Resolve JSON Schema $ref reference within the specification.
-
-    Args:
-        ref: Reference string like "#/components/schemas/User"
-        spec: Full OpenAPI specification
-
-    Returns:
-        Resolved schema dictionary
-    """
-    if not ref or not ref.startswith("#/"):
-        return {}
-
-    # Split reference path and navigate through spec
-    path_parts = ref[2:].split("/")  # Remove "#/" prefix
-    current = spec
-
-    for part in path_parts:
-        if not isinstance(current, dict) or part not in current:
-            return {}
-        current = current[part]
+        return first_content.get("schema")
+    return None
 
-    return current if isinstance(current, dict) else {}
@@ -8,6 +8,7 @@ emitting new lessons after task completion.
 
 from __future__ import annotations
 
+import time
 from typing import Optional
 
 from contextcore.learning.emitter import LessonEmitter
@@ -42,7 +43,13 @@ class LearningLoop:
         )
     """
 
-    def __init__(self, project_id: str, agent_id: str, tempo_url: str = "http://localhost:3200"):
+    def __init__(
+        self,
+        project_id: str,
+        agent_id: str,
+        tempo_url: str = "http://localhost:3200",
+        cache_ttl_s: float = 300.0,
+    ):
         """
         Initialize the learning loop.
 
@@ -50,16 +57,25 @@ class LearningLoop:
             project_id: Unique identifier for the project
             agent_id: Unique identifier for the agent
             tempo_url: Optional Tempo URL for retriever (default: http://localhost:3200)
+            cache_ttl_s: How long retrieved lessons are reused within this session
+                (0 disables the cache)
         """
         self.project_id = project_id
         self.agent_id = agent_id
         self.emitter = LessonEmitter(project_id=project_id, agent_id=agent_id)
         self.retriever = LessonRetriever(tempo_url=tempo_url)
+        self.cache_ttl_s = cache_ttl_s
+        # (project_id, "task"|"file", task type or path) -> (fetched_at, lessons)
+        self._lesson_cache: dict[tuple[str, str, str], tuple[float, list[Lesson]]] = {}
 
     def before_task(self, task_type: str, files: Optional[list[str]] = None) -> list[Lesson]:
         """
         Retrieve relevant lessons before starting a task.
 
+        The task-type query and one query per file are answered together by
+        ``LessonRetriever.retrieve_many`` (a single TraceQL request for most
+        tasks), and results are cached per file for the rest of the session.
+
         Args:
             task_type: Type of task (e.g., "testing", "debugging", "implementation", "refactoring")
             files: Optional list of file paths relevant to the task
@@ -67,17 +83,26 @@ class LearningLoop:
         Returns:
             List of relevant lessons for the task
         """
-        lessons = []
+        keys = [(self.project_id, "task", task_type)]
+        keys.extend((self.project_id, "file", f) for f in dict.fromkeys(files or []))
+
+        now = time.monotonic()
+        missing = [
+            key for key in keys
+            if key not in self._lesson_cache
+            or now - self._lesson_cache[key][0] >= self.cache_ttl_s
+        ]
+        if missing:
+            queries = [self._query_for(key) for key in missing]
+            wanted = [(key, q) for key, q in zip(missing, queries, strict=True) if q is not None]
+            fetched = self.retriever.retrieve_many([q for _, q in wanted])
+            results = dict(zip((key for key, _ in wanted), fetched, strict=True))
+            for key in missing:
+                self._lesson_cache[key] = (now, results.get(key, []))
 
-        # Get lessons for the task type
-        task_lessons = self.retriever.get_lessons_for_task(task_type, self.project_id)
-        lessons.extend(task_lessons)
-
-        # Get lessons for specific files if provided
-        if files:
-            for file_path in files:
-                file_lessons = self.retriever.get_lessons_for_file(file_path, self.project_id)
-                lessons.extend(file_lessons)
+        lessons = []
+        for key in keys:
+            lessons.extend(self._lesson_cache[key][1])
 
         # Deduplicate by lesson ID and sort by effectiveness
         seen_ids = set()
@@ -106,6 +131,7 @@ class LearningLoop:
             affected_files: Optional list of files affected by this blocker resolution
         """
         applies_to = affected_files or []
+        self.invalidate_lessons(applies_to)
 
         self.emitter.emit_lesson(
             summary=blocker,
@@ -118,3 +144,22 @@ class LearningLoop:
             anti_pattern=None,
             global_lesson=False
         )
+
+    def invalidate_lessons(self, files: Optional[list[str]] = None) -> None:
+        """
+        Drop cached lessons so the next ``before_task`` re-queries Tempo.
+
+        Args:
+            files: Only drop entries for these files (default: the whole cache)
+        """
+        if files is None:
+            self._lesson_cache.clear()
+            return
+        for file_path in files:
+            self._lesson_cache.pop((self.project_id, "file", file_path), None)
+
+    def _query_for(self, key: tuple[str, str, str]):
+        project_id, kind, value = key
+        if kind == "task":
+            return self.retriever.task_query(value, project_id)
+        return self.retriever.file_query(value, project_id)
@@ -6,15 +6,33 @@ enabling continuous learning from past experiences.
 """
 
 import json
-import urllib.request
-import urllib.parse
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
 
 from contextcore.learning.models import Lesson, LessonQuery, LessonCategory
+from contextcore.tracing.traceql import get_traceql_client
 
 __all__ = ['LessonRetriever']
 
+# Task types with a matching lesson category; other task types have no
+# task-level lessons.
+TASK_CATEGORIES = {
+    "testing": LessonCategory.TESTING,
+    "debugging": LessonCategory.DEBUGGING,
+    "refactoring": LessonCategory.REFACTORING,
+}
+
+# Tempo's default search limit, applied per query folded into a batch.
+# Lessons are emitted one per trace, so this is also the lesson budget.
+TRACES_PER_QUERY = 20
+# Queries folded into one TraceQL request, and batches run concurrently.
+BATCH_SIZE = 25
+BATCH_WORKERS = 4
+
 
 class LessonRetriever:
     """Retrieves lessons from Tempo tracing backend using TraceQL queries."""
@@ -40,26 +58,83 @@ class LessonRetriever:
             # Build TraceQL query string
             traceql = self._build_traceql(query)
             
-            # Query Tempo and get raw results
-            raw_results = self._query_tempo(traceql, query.time_range or "7d")
-            
-            # Parse results into Lesson objects
-            lessons = self._parse_results(raw_results)
+            # Query Tempo and parse results into Lesson objects
+            lessons = self._fetch_lessons(traceql, query.time_range or "7d")
             
-            # Apply confidence filtering
-            min_confidence = query.min_confidence or 0.0
-            lessons = [lesson for lesson in lessons if lesson.confidence >= min_confidence]
-            
-            # Sort by effectiveness_score descending
-            lessons.sort(key=lambda x: x.effectiveness_score, reverse=True)
-            
-            # Return top max_results
-            return lessons[:query.max_results or len(lessons)]
+            return self._rank(lessons, query)
             
         except Exception as e:
             print(f"Error retrieving lessons: {e}")
             return []
 
+    def retrieve_many(self, queries: Sequence[LessonQuery]) -> List[List[Lesson]]:
+        """Retrieve lessons for several queries with as few Tempo round-trips as possible.
+
+        Queries sharing a project and time range are folded into one TraceQL
+        request per BATCH_SIZE queries (batches run concurrently). Each
+        query's category and file filters are then re-applied to the
+        combined result, so every query gets the lessons ``retrieve`` would
+        return for it.
+
+        A batch shares one limit of TRACES_PER_QUERY per query, so a busy
+        category can crowd the others out of a full result. When a batch
+        comes back full, queries left with fewer than TRACES_PER_QUERY
+        lessons are re-run on their own, as ``retrieve`` would run them.
+
+        Args:
+            queries: LessonQuery objects to answer
+
+        Returns:
+            One list of lessons per query, in the same order as ``queries``
+        """
+        results: List[List[Lesson]] = [[] for _ in queries]
+        groups: Dict[Tuple[Optional[str], str], List[int]] = {}
+        for index, query in enumerate(queries):
+            key = (query.project_id, query.time_range or "7d")
+            groups.setdefault(key, []).append(index)
+
+        batches = [
+            (project_id, time_range, indexes[start:start + BATCH_SIZE])
+            for (project_id, time_range), indexes in groups.items()
+            for start in range(0, len(indexes), BATCH_SIZE)
+        ]
+
+        def run(batch) -> Tuple[List[Lesson], bool]:
+            project_id, time_range, indexes = batch
+            traceql = self._build_batch_traceql(project_id, [queries[i] for i in indexes])
+            limit = TRACES_PER_QUERY * len(indexes)
+            try:
+                lessons = self._fetch_lessons(traceql, time_range, limit=limit)
+            except Exception as e:
+                print(f"Error retrieving lessons: {e}")
+                return [], False
+            return lessons, len(lessons) >= limit
+
+        fetched = self._map(run, batches)
+
+        crowded: List[int] = []
+        for (_, _, indexes), (lessons, full) in zip(batches, fetched, strict=True):
+            for i in indexes:
+                query = queries[i]
+                matching = [lesson for lesson in lessons if self._matches(lesson, query)]
+                if full and len(matching) < TRACES_PER_QUERY:
+                    crowded.append(i)
+                    continue
+                results[i] = self._rank(matching, query)
+
+        refetched = self._map(lambda i: self.retrieve(queries[i]), crowded)
+        for i, lessons in zip(crowded, refetched, strict=True):
+            results[i] = lessons
+        return results
+
+    @staticmethod
+    def _map(fn, items: list) -> list:
+        """``map`` over ``items``, on BATCH_WORKERS threads when there is more than one."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(items))) as pool:
+            return list(pool.map(fn, items))
+
     def get_lessons_for_file(self, file_path: str, project_id: Optional[str] = None, 
                            category: Optional[LessonCategory] = None) -> List[Lesson]:
         """Get lessons that apply to a specific file.
@@ -72,13 +147,7 @@ class LessonRetriever:
         Returns:
             List of relevant lessons
         """
-        query = LessonQuery(
-            project_id=project_id,
-            file_pattern=file_path,
-            category=category,
-            time_range="7d"
-        )
-        return self.retrieve(query)
+        return self.retrieve(self.file_query(file_path, project_id, category))
 
     def get_lessons_for_task(self, task_type: str, project_id: Optional[str] = None) -> List[Lesson]:
         """Get lessons for a specific task type.
@@ -90,24 +159,33 @@ class LessonRetriever:
         Returns:
             List of relevant lessons
         """
-        # Map task types to categories
-        task_mapping = {
-            "testing": LessonCategory.TESTING,
-            "debugging": LessonCategory.DEBUGGING,
-            "implementation": LessonCategory.IMPLEMENTATION,
-            "refactoring": LessonCategory.REFACTORING
-        }
-        
-        category = task_mapping.get(task_type)
-        if not category:
+        query = self.task_query(task_type, project_id)
+        if query is None:
             return []
-            
-        query = LessonQuery(
+        return self.retrieve(query)
+
+    @staticmethod
+    def file_query(file_path: str, project_id: Optional[str] = None,
+                   category: Optional[LessonCategory] = None) -> LessonQuery:
+        """Query used by ``get_lessons_for_file``."""
+        return LessonQuery(
+            project_id=project_id,
+            file_pattern=file_path,
+            category=category,
+            time_range="7d"
+        )
+
+    @staticmethod
+    def task_query(task_type: str, project_id: Optional[str] = None) -> Optional[LessonQuery]:
+        """Query used by ``get_lessons_for_task``, or None for unmapped task types."""
+        category = TASK_CATEGORIES.get(task_type)
+        if not category:
+            return None
+        return LessonQuery(
             project_id=project_id,
             category=category,
             time_range="7d"
         )
-        return self.retrieve(query)
 
     def get_global_lessons(self, category: Optional[LessonCategory] = None, 
                          min_confidence: float = 0.9) -> List[Lesson]:
@@ -152,43 +230,108 @@ class LessonRetriever:
         # Add file pattern regex matching
         if query.file_pattern:
             # Escape special regex characters in file path
-            escaped_pattern = query.file_pattern.replace(".", r"\.")
+            escaped_pattern = self._file_regex(query.file_pattern)
             conditions.append(f'span.lesson.applies_to =~ ".*{escaped_pattern}.*"')
         
         return "{ " + " && ".join(conditions) + " }"
 
-    def _query_tempo(self, traceql: str, time_range: str) -> List[dict]:
+    def _build_batch_traceql(self, project_id: Optional[str],
+                             queries: Sequence[LessonQuery]) -> str:
+        """Build one TraceQL query matching the union of ``queries``.
+
+        All queries must share ``project_id``. File-only queries are folded
+        into a single ``applies_to`` alternation.
+        """
+        conditions = ['span.insight.type = "lesson"']
+        if project_id:
+            conditions.append(f'(resource.project.id = "{project_id}" || resource.project.id = "global")')
+
+        alternatives = []
+        file_patterns = []
+        for query in queries:
+            if query.file_pattern and not query.category:
+                file_patterns.append(self._file_regex(query.file_pattern))
+                continue
+            parts = []
+            if query.category:
+                parts.append(f'span.insight.category = "{query.category.value}"')
+            if query.file_pattern:
+                parts.append(
+                    f'span.lesson.applies_to =~ ".*{self._file_regex(query.file_pattern)}.*"'
+                )
+            if not parts:
+                # An unfiltered query needs every lesson; no narrowing possible.
+                alternatives = file_patterns = []
+                break
+            alternatives.append(" && ".join(parts))
+
+        if file_patterns:
+            unique = list(dict.fromkeys(file_patterns))
+            alternatives.append(f'span.lesson.applies_to =~ ".*({"|".join(unique)}).*"')
+        if len(alternatives) == 1:
+            conditions.append(alternatives[0])
+        elif alternatives:
+            conditions.append("(" + " || ".join(f"({a})" for a in alternatives) + ")")
+
+        return "{ " + " && ".join(conditions) + " }"
+
+    @staticmethod
+    def _file_regex(file_pattern: str) -> str:
+        return file_pattern.replace(".", r"\.")
+
+    def _matches(self, lesson: Lesson, query: LessonQuery) -> bool:
+        """Re-apply a query's category and file filters to a lesson."""
+        if query.category and lesson.category != query.category:
+            return False
+        if query.file_pattern:
+            pattern = self._file_regex(query.file_pattern)
+            try:
+                regex = re.compile(pattern)
+            except re.error:
+                return any(query.file_pattern in item for item in lesson.applies_to)
+            return any(regex.search(item) for item in lesson.applies_to)
+        return True
+
+    @staticmethod
+    def _rank(lessons: List[Lesson], query: LessonQuery) -> List[Lesson]:
+        """Apply confidence filtering, sort by effectiveness and truncate."""
+        min_confidence = query.min_confidence or 0.0
+        lessons = [lesson for lesson in lessons if lesson.confidence >= min_confidence]
+        lessons.sort(key=lambda x: x.effectiveness_score, reverse=True)
+        return lessons[:query.max_results or len(lessons)]
+
+    def _fetch_lessons(self, traceql: str, time_range: str,
+                       limit: Optional[int] = None) -> List[Lesson]:
+        """Run a TraceQL query and parse the results into lessons."""
+        return self._parse_results(self._query_tempo(traceql, time_range, limit))
+
+    def _query_tempo(self, traceql: str, time_range: str,
+                     limit: Optional[int] = None) -> List[dict]:
         """Execute TraceQL query against Tempo API.
         
         Args:
             traceql: TraceQL query string
             time_range: Time range string (e.g., "7d", "1h")
+            limit: Maximum traces to return (None lets Tempo decide)
             
         Returns:
             List of trace dictionaries from Tempo response
         """
         try:
-            # Parse time range to get start/end timestamps
+            # Parse time range to get the search window length
             start_time, end_time = self._parse_time_range(time_range)
-            
-            # Build API request URL
-            params = {
-                'q': traceql,
-                'start': str(int(start_time.timestamp() * 1000)),  # Convert to milliseconds
-                'end': str(int(end_time.timestamp() * 1000))
-            }
-            
-            url = f"{self.tempo_url}/api/search?" + urllib.parse.urlencode(params)
-            
-            # Execute HTTP request
-            with urllib.request.urlopen(url) as response:
-                result = json.loads(response.read())
-                return result.get('traces', [])
-                
-        except urllib.error.HTTPError as e:
+            since_seconds = int((end_time - start_time).total_seconds())
+
+            # Execute via the shared TraceQL client (pooled, cached)
+            result = get_traceql_client(self.tempo_url).search(
+                traceql, since_seconds=since_seconds, limit=limit
+            )
+            return result.get('traces', [])
+
+        except httpx.HTTPStatusError as e:
             print(f"HTTP error querying Tempo: {e}")
             return []
-        except urllib.error.URLError as e:
+        except httpx.RequestError as e:
             print(f"Network error querying Tempo: {e}")
             return []
         except json.JSONDecodeError as e:
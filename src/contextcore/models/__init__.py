@@ -59,7 +59,9 @@ from contextcore.models.manifest_loader import (
     load_manifest,
     load_manifest_v1,
     load_manifest_v2,
+    load_manifest_raw,
     load_manifest_from_dict,
+    clear_manifest_cache,
     detect_manifest_version,
 )
 
@@ -125,6 +127,8 @@ __all__ = [
     "load_manifest",
     "load_manifest_v1",
     "load_manifest_v2",
+    "load_manifest_raw",
+    "clear_manifest_cache",
     "load_manifest_from_dict",
     "detect_manifest_version",
     # Artifact Manifest (Wayfinder contract)
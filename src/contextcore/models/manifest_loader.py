@@ -13,21 +13,45 @@ Usage:
     # Type-specific loading
     manifest_v1 = load_manifest_v1("path/to/.contextcore.yaml")
     manifest_v2 = load_manifest_v2("path/to/.contextcore.yaml")
+
+Snapshot cache:
+    Loads are served from a snapshot keyed by (path, size, mtime, content
+    hash), so the commands in one pipeline parse and validate a manifest
+    once. Returned models are shared between callers and must be treated as
+    read-only (use ``model_copy(deep=True)`` before mutating).
+
+    Validated snapshots are also persisted under
+    ``~/.contextcore/cache/manifests`` (override with
+    CONTEXTCORE_MANIFEST_CACHE_DIR, disable with CONTEXTCORE_MANIFEST_CACHE=0)
+    as JSON keyed by content hash and model version, so later CLI
+    invocations skip YAML parsing and the v1 migration. Manifests whose
+    parsed YAML does not round-trip through JSON (e.g. unquoted dates) are
+    only cached in-process.
 """
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 import yaml
 
 from contextcore.models.manifest import ContextManifest, load_context_manifest
 from contextcore.models.manifest_v2 import ContextManifestV2
+from contextcore.utils.persisted_cache import cache_path, write_atomic
 
 if TYPE_CHECKING:
     from os import PathLike
 
+logger = logging.getLogger(__name__)
+
 
 # Type alias for the unified return type
 ManifestType = Union[ContextManifest, ContextManifestV2]
@@ -82,18 +106,7 @@ def load_manifest(path: Union[str, "PathLike[str]"]) -> ManifestType:
         ValueError: If the manifest is invalid
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest file not found: {path}")
-
-    raw_data = yaml.safe_load(path.read_text(encoding="utf-8"))
-
-    version = detect_manifest_version(raw_data)
-
-    if version == "v2":
-        return ContextManifestV2(**raw_data)
-    else:
-        # Use the backward-compatible v1.1 loader
-        return load_context_manifest(path)
+    return _validated(path, _snapshot(path))
 
 
 def load_manifest_v1(path: Union[str, "PathLike[str]"]) -> ContextManifest:
@@ -109,19 +122,15 @@ def load_manifest_v1(path: Union[str, "PathLike[str]"]) -> ContextManifest:
         ContextManifest instance
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest file not found: {path}")
-
-    raw_data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    version = detect_manifest_version(raw_data)
+    snapshot = _snapshot(path)
 
-    if version == "v2":
+    if snapshot.version == "v2":
         raise ValueError(
-            f"Expected v1.1 manifest but got v2 (apiVersion: {raw_data.get('apiVersion')}). "
+            f"Expected v1.1 manifest but got v2 (apiVersion: {snapshot.raw_data.get('apiVersion')}). "
             "Use load_manifest() or load_manifest_v2() instead."
         )
 
-    return load_context_manifest(path)
+    return _validated(path, snapshot)
 
 
 def load_manifest_v2(path: Union[str, "PathLike[str]"]) -> ContextManifestV2:
@@ -137,20 +146,30 @@ def load_manifest_v2(path: Union[str, "PathLike[str]"]) -> ContextManifestV2:
         ContextManifestV2 instance
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest file not found: {path}")
+    snapshot = _snapshot(path)
 
-    raw_data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    version = detect_manifest_version(raw_data)
-
-    if version != "v2":
+    if snapshot.version != "v2":
         raise ValueError(
-            f"Expected v2 manifest but got {version} (apiVersion: {raw_data.get('apiVersion')}). "
+            f"Expected v2 manifest but got {snapshot.version} "
+            f"(apiVersion: {snapshot.raw_data.get('apiVersion')}). "
             "Use load_manifest() or load_manifest_v1() instead, or migrate with "
             "contextcore manifest migrate."
         )
 
-    return ContextManifestV2(**raw_data)
+    return _validated(path, snapshot)
+
+
+def load_manifest_raw(path: Union[str, "PathLike[str]"]) -> Any:
+    """
+    Load the parsed YAML of a manifest through the snapshot cache.
+
+    Returns a private copy, so callers may modify it freely.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    return copy.deepcopy(_snapshot(Path(path)).raw_data)
 
 
 def load_manifest_from_dict(data: Dict[str, Any]) -> ManifestType:
@@ -171,3 +190,150 @@ def load_manifest_from_dict(data: Dict[str, Any]) -> ManifestType:
         return ContextManifestV2(**data)
     else:
         return ContextManifest(**data)
+
+
+# =============================================================================
+# Snapshot cache
+# =============================================================================
+
+
+@dataclass
+class _Snapshot:
+    """Parsed (and, once requested, validated) state of one manifest file."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+    raw_data: Any
+    version: str
+    manifest: Optional[ManifestType] = None
+
+
+_snapshots: Dict[str, _Snapshot] = {}
+_snapshots_lock = threading.Lock()
+_schema_tag: Optional[str] = None
+
+
+def clear_manifest_cache(disk: bool = False) -> None:
+    """Forget in-process snapshots (and persisted ones if ``disk``)."""
+    with _snapshots_lock:
+        _snapshots.clear()
+    cache_dir = _cache_dir()
+    if disk and cache_dir is not None:
+        for entry in cache_dir.glob("*.json"):
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+def _cache_dir() -> Optional[Path]:
+    """Directory of persisted snapshots, or None if persistence is disabled."""
+    path = cache_path("CONTEXTCORE_MANIFEST_CACHE", "manifests")
+    override = os.environ.get("CONTEXTCORE_MANIFEST_CACHE_DIR")
+    return Path(override) if path is not None and override else path
+
+
+def _get_schema_tag() -> str:
+    """Identify the model code, so persisted snapshots never outlive a model change."""
+    global _schema_tag
+    if _schema_tag is None:
+        import pydantic
+
+        from contextcore.contracts import types
+        from contextcore.models import core, manifest, manifest_v2
+
+        parts = [pydantic.VERSION]
+        for module in (manifest, manifest_v2, core, types):
+            try:
+                stat = Path(module.__file__).stat()
+                parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+            except (OSError, TypeError):
+                parts.append("?")
+        _schema_tag = hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
+    return _schema_tag
+
+
+def _persisted_path(digest: str) -> Optional[Path]:
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / f"{digest}-{_get_schema_tag()}.json"
+
+
+def _load_persisted(digest: str, size: int, mtime_ns: int) -> Optional[_Snapshot]:
+    path = _persisted_path(digest)
+    if path is None:
+        return None
+    try:
+        payload = json.loads(path.read_text())
+        version = payload["version"]
+        model = ContextManifestV2 if version == "v2" else ContextManifest
+        manifest = model.model_validate_json(payload["manifest"])
+        raw_data = payload["raw_data"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable manifest snapshot {digest}: {e}")
+        return None
+    return _Snapshot(size, mtime_ns, digest, raw_data, version, manifest)
+
+
+def _persist(snapshot: _Snapshot) -> None:
+    path = _persisted_path(snapshot.digest)
+    if path is None:
+        return
+    try:
+        payload = json.dumps({
+            "version": snapshot.version,
+            "raw_data": snapshot.raw_data,
+            "manifest": snapshot.manifest.model_dump_json(),
+        })
+        if json.loads(payload)["raw_data"] != snapshot.raw_data:
+            # YAML-only types (dates, non-string keys) would come back changed
+            return
+        write_atomic(path, payload)
+    except Exception as e:
+        logger.debug(f"Could not persist manifest snapshot {path}: {e}")
+
+
+def _snapshot(path: Path) -> _Snapshot:
+    """Return the current snapshot for ``path``, re-reading only if it changed."""
+    if not path.exists():
+        raise FileNotFoundError(f"Manifest file not found: {path}")
+
+    key = str(path.resolve())
+    stat = path.stat()
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+    if snapshot and (snapshot.size, snapshot.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+        return snapshot
+
+    content = path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    if snapshot and snapshot.digest == digest:
+        # Touched but unchanged
+        snapshot.size, snapshot.mtime_ns = stat.st_size, stat.st_mtime_ns
+        return snapshot
+
+    snapshot = _load_persisted(digest, stat.st_size, stat.st_mtime_ns)
+    if snapshot is None:
+        raw_data = yaml.safe_load(content.decode("utf-8"))
+        version = detect_manifest_version(raw_data) if isinstance(raw_data, dict) else "v1.1"
+        snapshot = _Snapshot(stat.st_size, stat.st_mtime_ns, digest, raw_data, version)
+
+    with _snapshots_lock:
+        _snapshots[key] = snapshot
+    return snapshot
+
+
+def _validated(path: Path, snapshot: _Snapshot) -> ManifestType:
+    """Return the snapshot's model, validating (and persisting) it on first use."""
+    if snapshot.manifest is None:
+        if snapshot.version == "v2":
+            snapshot.manifest = ContextManifestV2(**snapshot.raw_data)
+        else:
+            # Use the backward-compatible v1.1 loader
+            snapshot.manifest = load_context_manifest(path)
+        _persist(snapshot)
+    return snapshot.manifest
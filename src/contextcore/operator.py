@@ -10,11 +10,14 @@ Prime Contractor Pattern: Components drafted by Haiku, assembled by Opus.
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import hashlib
 import json
 import logging
 import os
 import sys
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, TypeVar
@@ -24,7 +27,7 @@ from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
 # OpenTelemetry imports
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -740,43 +743,103 @@ def create_owner_reference(body: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Field manager name for server-side apply; owns the fields we generate.
+FIELD_MANAGER = "contextcore-operator"
+
+# Annotation on the owning ProjectContext holding generated-artifact hashes.
+ARTIFACT_HASHES_ANNOTATION = "contextcore.io/artifact-hashes"
+
+_APPLY_CONTENT_TYPE = "application/apply-patch+yaml"
+
+# Shared API clients (one connection pool for all handlers)
+_core_api: Optional[Any] = None
+_custom_api: Optional[Any] = None
+
+
+def get_core_api() -> Any:
+    """Get the shared CoreV1Api client, creating it on first use."""
+    global _core_api
+    if _core_api is None:
+        _core_api = client.CoreV1Api()
+    return _core_api
+
+
+def get_custom_api() -> Any:
+    """Get the shared CustomObjectsApi client, creating it on first use."""
+    global _custom_api
+    if _custom_api is None:
+        _custom_api = client.CustomObjectsApi()
+    return _custom_api
+
+
+# Annotations that change on every generation and must not affect the hash.
+_VOLATILE_ANNOTATIONS = frozenset({"contextcore.io/generated"})
+
+
+def artifact_fingerprint(resource: Dict[str, Any]) -> str:
+    """Stable content hash of a generated resource (canonical JSON, sha256)."""
+    metadata = dict(resource.get("metadata", {}))
+    annotations = metadata.get("annotations")
+    if annotations:
+        metadata["annotations"] = {
+            k: v for k, v in annotations.items() if k not in _VOLATILE_ANNOTATIONS
+        }
+    canonical = json.dumps(
+        {**resource, "metadata": metadata},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def get_artifact_hashes(body: Dict[str, Any]) -> Dict[str, str]:
+    """Read the artifact hashes recorded on a ProjectContext."""
+    annotations = body.get("metadata", {}).get("annotations") or {}
+    raw = annotations.get(ARTIFACT_HASHES_ANNOTATION)
+    if not raw:
+        return {}
+    try:
+        hashes = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return hashes if isinstance(hashes, dict) else {}
+
+
 def apply_resource(api: Any, resource: Dict[str, Any], namespace: str) -> str:
-    """Apply a Kubernetes resource (create or update)."""
+    """
+    Apply a Kubernetes resource with a single server-side-apply request.
+
+    Args:
+        api: CoreV1Api for ConfigMaps or CustomObjectsApi for CRDs
+            (None uses the shared client for the resource kind)
+        resource: Full desired object
+        namespace: Target namespace
+
+    Returns:
+        "applied"
+    """
     kind = resource["kind"]
     name = resource["metadata"]["name"]
+    apply_options = {
+        "field_manager": FIELD_MANAGER,
+        "force": True,
+        "_content_type": _APPLY_CONTENT_TYPE,
+    }
 
     try:
         if kind == "ConfigMap":
-            try:
-                api.read_namespaced_config_map(name, namespace)
-                api.patch_namespaced_config_map(name, namespace, resource)
-                return "updated"
-            except ApiException as e:
-                if e.status == 404:
-                    api.create_namespaced_config_map(namespace, resource)
-                    return "created"
-                raise
+            (api or get_core_api()).patch_namespaced_config_map(
+                name, namespace, resource, **apply_options
+            )
         else:
             # For CRDs like ServiceMonitor and PrometheusRule
             group, version = resource["apiVersion"].rsplit("/", 1)
             plural = f"{kind.lower()}s"
-
-            custom_api = client.CustomObjectsApi()
-            try:
-                custom_api.get_namespaced_custom_object(
-                    group, version, namespace, plural, name
-                )
-                custom_api.patch_namespaced_custom_object(
-                    group, version, namespace, plural, name, resource
-                )
-                return "updated"
-            except ApiException as e:
-                if e.status == 404:
-                    custom_api.create_namespaced_custom_object(
-                        group, version, namespace, plural, resource
-                    )
-                    return "created"
-                raise
+            (api or get_custom_api()).patch_namespaced_custom_object(
+                group, version, namespace, plural, name, resource, **apply_options
+            )
+        return "applied"
     except ApiException as e:
         logger.error(
             f"Failed to apply {kind}/{name}",
@@ -789,12 +852,11 @@ def delete_resource(api: Any, kind: str, name: str, namespace: str) -> bool:
     """Delete a Kubernetes resource."""
     try:
         if kind == "ConfigMap":
-            api.delete_namespaced_config_map(name, namespace)
+            (api or get_core_api()).delete_namespaced_config_map(name, namespace)
         else:
             group, version = "monitoring.coreos.com", "v1"
             plural = f"{kind.lower()}s"
-            custom_api = client.CustomObjectsApi()
-            custom_api.delete_namespaced_custom_object(
+            get_custom_api().delete_namespaced_custom_object(
                 group, version, namespace, plural, name
             )
         return True
@@ -804,6 +866,244 @@ def delete_resource(api: Any, kind: str, name: str, namespace: str) -> bool:
         raise
 
 
+def reconcile_artifacts(
+    body: Dict[str, Any],
+    namespace: str,
+    name: str,
+    patch: kopf.Patch,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Generate artifacts for a ProjectContext and apply the ones that changed.
+
+    Each artifact is fingerprinted and compared with the hash recorded in the
+    owner's ARTIFACT_HASHES_ANNOTATION; unchanged artifacts cost no API calls.
+    Successfully applied hashes are written back to the annotation via
+    ``patch``. Failed artifacts keep their previous hash so they are retried
+    on the next event.
+
+    Args:
+        body: ProjectContext object
+        namespace: ProjectContext namespace
+        name: ProjectContext name
+        patch: kopf patch for the ProjectContext
+        force: Apply every artifact regardless of recorded hashes
+
+    Returns:
+        Mapping of artifact key to generated resource name(s)
+    """
+    spec = body.get("spec", {})
+    owner_ref = create_owner_reference(body)
+    labels = {"app.kubernetes.io/managed-by": "contextcore-operator"}
+
+    generated = {
+        "dashboard": generate_grafana_dashboard(name, namespace, spec, labels),
+        "serviceMonitor": generate_service_monitor(name, namespace, spec, labels),
+        "prometheusRules": generate_prometheus_rules(name, namespace, spec, labels),
+    }
+
+    previous = get_artifact_hashes(body)
+    hashes = dict(previous)
+    artifacts: Dict[str, Any] = {}
+
+    for key, resource in generated.items():
+        resource["metadata"]["ownerReferences"] = [owner_ref]
+        resource_name = resource["metadata"]["name"]
+        fingerprint = artifact_fingerprint(resource)
+
+        if not force and previous.get(key) == fingerprint:
+            logger.debug(
+                f"{resource['kind']} unchanged, skipping apply",
+                extra={"artifact": key, "name": resource_name},
+            )
+        else:
+            try:
+                apply_resource(None, resource, namespace)
+                hashes[key] = fingerprint
+                logger.info(
+                    f"{resource['kind']} applied",
+                    extra={"artifact": key, "name": resource_name},
+                )
+            except Exception as e:
+                logger.warning(f"Failed to apply {resource['kind']}: {e}")
+                continue
+
+        artifacts[key] = [resource_name] if key == "prometheusRules" else resource_name
+
+    if hashes != previous:
+        patch.setdefault("metadata", {}).setdefault("annotations", {})[
+            ARTIFACT_HASHES_ANNOTATION
+        ] = json.dumps(hashes, sort_keys=True)
+
+    return artifacts
+
+
+# =============================================================================
+# Reconcile Work Queue
+# =============================================================================
+
+_meter = metrics.get_meter("contextcore.operator")
+
+reconcile_duration = _meter.create_histogram(
+    name="contextcore.operator.reconcile.duration",
+    description="Time spent reconciling one ProjectContext",
+    unit="ms",
+)
+
+reconcile_queue_depth = _meter.create_up_down_counter(
+    name="contextcore.operator.queue.depth",
+    description="ProjectContexts waiting for a reconcile slot",
+    unit="1",
+)
+
+reconcile_coalesced = _meter.create_counter(
+    name="contextcore.operator.reconcile.coalesced",
+    description="Reconcile requests superseded by a newer spec before running",
+    unit="1",
+)
+
+
+class ReconcileQueue:
+    """
+    Asyncio work queue for ProjectContext reconciliation.
+
+    - At most ``max_concurrency`` reconciles run at once, and at most
+      ``namespace_concurrency`` within one namespace, so a busy namespace
+      cannot starve the rest of the cluster.
+    - Requests for the same object coalesce: while one is waiting for a
+      slot, a newer request replaces its work and every waiter receives the
+      result of the latest spec. At most one reconcile per object runs at a
+      time.
+    - Blocking Kubernetes calls run in worker threads.
+
+    Usage:
+        queue = ReconcileQueue(max_concurrency=16, namespace_concurrency=4)
+        result = await queue.submit("default", "checkout", work)
+    """
+
+    def __init__(self, max_concurrency: int = 16, namespace_concurrency: int = 4):
+        self.max_concurrency = max(1, max_concurrency)
+        self.namespace_concurrency = max(1, namespace_concurrency)
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._namespaces: Dict[str, asyncio.Semaphore] = {}
+        # (namespace, name) -> [pending work or None, waiting futures]
+        self._slots: Dict[tuple, List[Any]] = {}
+        self.completed = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    @property
+    def depth(self) -> int:
+        """Objects with a reconcile waiting to start."""
+        return sum(1 for work, _ in self._slots.values() if work is not None)
+
+    async def submit(self, namespace: str, name: str, work: Callable[[], T]) -> T:
+        """Queue ``work`` for an object and wait for the (possibly coalesced) result."""
+        key = (namespace, name)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        slot = self._slots.get(key)
+
+        if slot is None:
+            self._slots[key] = [work, [future]]
+            reconcile_queue_depth.add(1)
+            asyncio.create_task(self._drain(key))
+        elif slot[0] is not None:
+            # Still waiting for a slot: newest spec wins, all waiters share it
+            slot[0] = work
+            slot[1].append(future)
+            self.coalesced += 1
+            reconcile_coalesced.add(1, attributes={"namespace": namespace})
+        else:
+            # Running: run once more afterwards with the newest spec
+            slot[0] = work
+            slot[1] = [future]
+            reconcile_queue_depth.add(1)
+
+        return await future
+
+    async def _drain(self, key: tuple) -> None:
+        namespace = key[0]
+        ns_sem = self._namespaces.setdefault(
+            namespace, asyncio.Semaphore(self.namespace_concurrency)
+        )
+        slot = self._slots[key]
+        try:
+            while slot[0] is not None:
+                # Namespace first: a burst waiting on its own namespace limit
+                # must not sit on global slots other namespaces could use
+                async with ns_sem, self._global:
+                    work, futures = slot[0], slot[1]
+                    slot[0], slot[1] = None, []
+                    reconcile_queue_depth.add(-1)
+
+                    start = time.perf_counter()
+                    try:
+                        result = await asyncio.to_thread(work)
+                    except Exception as e:
+                        self.failed += 1
+                        for f in futures:
+                            if not f.done():
+                                f.set_exception(e)
+                    else:
+                        self.completed += 1
+                        for f in futures:
+                            if not f.done():
+                                f.set_result(result)
+                    finally:
+                        reconcile_duration.record(
+                            (time.perf_counter() - start) * 1000,
+                            attributes={"namespace": namespace},
+                        )
+        finally:
+            del self._slots[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "depth": self.depth,
+            "in_flight": len(self._slots),
+            "completed": self.completed,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+        }
+
+
+_reconcile_queue: Optional[ReconcileQueue] = None
+
+
+def get_reconcile_queue() -> ReconcileQueue:
+    """
+    Get the operator-wide reconcile queue, creating it on first use.
+
+    Limits come from CONTEXTCORE_OPERATOR_MAX_CONCURRENCY (default 16) and
+    CONTEXTCORE_OPERATOR_NAMESPACE_CONCURRENCY (default 4).
+    """
+    global _reconcile_queue
+    if _reconcile_queue is None:
+        _reconcile_queue = ReconcileQueue(
+            max_concurrency=int(os.environ.get("CONTEXTCORE_OPERATOR_MAX_CONCURRENCY", "16")),
+            namespace_concurrency=int(
+                os.environ.get("CONTEXTCORE_OPERATOR_NAMESPACE_CONCURRENCY", "4")
+            ),
+        )
+    return _reconcile_queue
+
+
+def _reconcile(
+    body: Dict[str, Any], namespace: str, name: str, force: bool
+) -> tuple:
+    """Run reconcile_artifacts against a private patch (called in a worker thread)."""
+    local_patch: Dict[str, Any] = {}
+    artifacts = reconcile_artifacts(body, namespace, name, local_patch, force=force)
+    return artifacts, local_patch
+
+
+def _merge_patch(patch: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """Copy annotation updates produced by _reconcile into the kopf patch."""
+    annotations = updates.get("metadata", {}).get("annotations")
+    if annotations:
+        patch.setdefault("metadata", {}).setdefault("annotations", {}).update(annotations)
+
+
 # =============================================================================
 # Kopf Handlers
 # =============================================================================
@@ -842,7 +1142,7 @@ def cleanup(**_: Any) -> None:
 
 @kopf.on.create("contextcore.io", "v1alpha1", "projectcontexts")
 @kopf.on.create("contextcore.io", "v1", "projectcontexts")
-def on_create(
+async def on_create(
     body: Dict[str, Any],
     namespace: str,
     name: str,
@@ -870,52 +1170,11 @@ def on_create(
             },
         )
 
-        owner_ref = create_owner_reference(body)
-        labels = {"app.kubernetes.io/managed-by": "contextcore-operator"}
-        core_api = client.CoreV1Api()
-
-        # Generate artifacts
-        service_monitor = generate_service_monitor(name, namespace, spec, labels)
-        service_monitor["metadata"]["ownerReferences"] = [owner_ref]
-
-        prometheus_rules = generate_prometheus_rules(name, namespace, spec, labels)
-        prometheus_rules["metadata"]["ownerReferences"] = [owner_ref]
-
-        dashboard = generate_grafana_dashboard(name, namespace, spec, labels)
-        dashboard["metadata"]["ownerReferences"] = [owner_ref]
-
-        # Apply resources
-        artifacts = {}
-
-        try:
-            result = apply_resource(core_api, dashboard, namespace)
-            artifacts["dashboard"] = dashboard["metadata"]["name"]
-            logger.info(
-                f"Dashboard {result}",
-                extra={"artifact": "dashboard", "name": dashboard["metadata"]["name"]},
-            )
-        except Exception as e:
-            logger.warning(f"Failed to create dashboard: {e}")
-
-        try:
-            result = apply_resource(None, service_monitor, namespace)
-            artifacts["serviceMonitor"] = service_monitor["metadata"]["name"]
-            logger.info(
-                f"ServiceMonitor {result}",
-                extra={"artifact": "serviceMonitor", "name": service_monitor["metadata"]["name"]},
-            )
-        except Exception as e:
-            logger.warning(f"Failed to create ServiceMonitor: {e}")
-
-        try:
-            result = apply_resource(None, prometheus_rules, namespace)
-            artifacts["prometheusRules"] = [prometheus_rules["metadata"]["name"]]
-            logger.info(
-                f"PrometheusRule {result}",
-                extra={"artifact": "prometheusRules", "name": prometheus_rules["metadata"]["name"]},
-            )
-        except Exception as e:
-            logger.warning(f"Failed to create PrometheusRule: {e}")
+        # Generate and apply all artifacts
+        artifacts, updates = await get_reconcile_queue().submit(
+            namespace, name, functools.partial(_reconcile, body, namespace, name, True)
+        )
+        _merge_patch(patch, updates)
 
         # Update status
         patch.setdefault("status", {})
@@ -936,7 +1195,7 @@ def on_create(
 
 @kopf.on.update("contextcore.io", "v1alpha1", "projectcontexts")
 @kopf.on.update("contextcore.io", "v1", "projectcontexts")
-def on_update(
+async def on_update(
     body: Dict[str, Any],
     namespace: str,
     name: str,
@@ -964,39 +1223,11 @@ def on_update(
             },
         )
 
-        # Regenerate and apply artifacts (same as create)
-        owner_ref = create_owner_reference(body)
-        labels = {"app.kubernetes.io/managed-by": "contextcore-operator"}
-        core_api = client.CoreV1Api()
-
-        dashboard = generate_grafana_dashboard(name, namespace, spec, labels)
-        dashboard["metadata"]["ownerReferences"] = [owner_ref]
-
-        service_monitor = generate_service_monitor(name, namespace, spec, labels)
-        service_monitor["metadata"]["ownerReferences"] = [owner_ref]
-
-        prometheus_rules = generate_prometheus_rules(name, namespace, spec, labels)
-        prometheus_rules["metadata"]["ownerReferences"] = [owner_ref]
-
-        artifacts = {}
-
-        try:
-            apply_resource(core_api, dashboard, namespace)
-            artifacts["dashboard"] = dashboard["metadata"]["name"]
-        except Exception as e:
-            logger.warning(f"Failed to update dashboard: {e}")
-
-        try:
-            apply_resource(None, service_monitor, namespace)
-            artifacts["serviceMonitor"] = service_monitor["metadata"]["name"]
-        except Exception as e:
-            logger.warning(f"Failed to update ServiceMonitor: {e}")
-
-        try:
-            apply_resource(None, prometheus_rules, namespace)
-            artifacts["prometheusRules"] = [prometheus_rules["metadata"]["name"]]
-        except Exception as e:
-            logger.warning(f"Failed to update PrometheusRule: {e}")
+        # Regenerate artifacts; only changed ones are applied
+        artifacts, updates = await get_reconcile_queue().submit(
+            namespace, name, functools.partial(_reconcile, body, namespace, name, False)
+        )
+        _merge_patch(patch, updates)
 
         patch.setdefault("status", {})
         patch["status"]["phase"] = "Active"
@@ -1012,7 +1243,7 @@ def on_update(
 
 @kopf.on.delete("contextcore.io", "v1alpha1", "projectcontexts")
 @kopf.on.delete("contextcore.io", "v1", "projectcontexts")
-def on_delete(
+async def on_delete(
     body: Dict[str, Any],
     namespace: str,
     name: str,
@@ -6,6 +6,7 @@ Provides operational commands for:
 - Health monitoring
 - Smoke testing
 - Backup and restore
+- Shared, snapshot-cached probing (probes)
 - Storage management
 
 Example usage:
@@ -34,6 +35,7 @@ from contextcore.ops.doctor import doctor, DoctorResult
 from contextcore.ops.health import health_check, HealthStatus, ComponentHealth
 from contextcore.ops.smoke_test import smoke_test, SmokeTestResult
 from contextcore.ops.backup import backup, restore, list_backups
+from contextcore.ops.probes import Probe, ProbeEngine, ProbeRefresher, get_probe_engine
 
 __all__ = [
     # Doctor
@@ -50,4 +52,9 @@ __all__ = [
     "backup",
     "restore",
     "list_backups",
+    # Probes
+    "Probe",
+    "ProbeEngine",
+    "ProbeRefresher",
+    "get_probe_engine",
 ]
@@ -6,19 +6,43 @@ Provides:
 - Export datasource configurations
 - Export ContextCore state
 - Restore from backup directory
+
+Backups are incremental and content-addressed. Every dashboard and the
+datasource list are stored once as a JSON blob named by its SHA-256 in a
+``.blobs`` directory shared by all backups under the same base directory;
+each backup's manifest maps dashboard UIDs to blobs. A new backup reuses the
+previous backup's blob for any dashboard whose version (from the search API)
+is unchanged, and fetches the rest concurrently. Because every manifest is a
+complete listing, restoring any backup reassembles Grafana as it was at that
+point in time.
+
+Layout:
+    backups/
+        .blobs/ab/ab12....json
+        20260117-143000/manifest.json
+        20260118-143000/manifest.json
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 
+BLOB_DIR_NAME = ".blobs"
+DEFAULT_BACKUP_WORKERS = 8
+
+# Manifest version for content-addressed backups; "1.0" backups hold full copies
+MANIFEST_VERSION = "2.0"
+
 
 @dataclass
 class BackupManifest:
@@ -29,15 +53,35 @@ class BackupManifest:
     dashboards_count: int = 0
     datasources_count: int = 0
     has_state: bool = False
+    # Content-addressed backups (version 2.0):
+    # uid -> {"blob": sha256, "version": dashboard version, "title": title},
+    # plus "stale": True when the dashboard could not be fetched and the
+    # parent backup's copy was kept
+    dashboards: dict[str, dict] = field(default_factory=dict)
+    datasources_blob: Optional[str] = None
+    dashboards_reused: int = 0  # Dashboards taken unchanged from the parent backup
+    parent: Optional[str] = None  # Backup directory name blobs were reused from
+
+    @property
+    def content_addressed(self) -> bool:
+        return self.version != "1.0"
 
     def to_dict(self) -> dict:
-        return {
+        data = {
             "created_at": self.created_at,
             "version": self.version,
             "dashboards_count": self.dashboards_count,
             "datasources_count": self.datasources_count,
             "has_state": self.has_state,
         }
+        if self.content_addressed:
+            data.update({
+                "dashboards": self.dashboards,
+                "datasources_blob": self.datasources_blob,
+                "dashboards_reused": self.dashboards_reused,
+                "parent": self.parent,
+            })
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "BackupManifest":
@@ -47,6 +91,10 @@ class BackupManifest:
             dashboards_count=data.get("dashboards_count", 0),
             datasources_count=data.get("datasources_count", 0),
             has_state=data.get("has_state", False),
+            dashboards=data.get("dashboards") or {},
+            datasources_blob=data.get("datasources_blob"),
+            dashboards_reused=data.get("dashboards_reused", 0),
+            parent=data.get("parent"),
         )
 
 
@@ -60,13 +108,100 @@ class BackupResult:
     errors: list[str]
 
 
+class BlobStore:
+    """Content-addressed JSON blobs, shared by the backups in one directory."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def has(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def put(self, data: Any) -> str:
+        """Store ``data`` (if not already stored) and return its digest."""
+        payload = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        """
+        Load a blob.
+
+        Raises:
+            FileNotFoundError: If the blob is missing
+        """
+        with open(self.path(digest), encoding="utf-8") as f:
+            return json.load(f)
+
+    def digests(self) -> set[str]:
+        if not self.root.exists():
+            return set()
+        return {p.stem for p in self.root.glob("*/*.json")}
+
+
+def _new_client(max_workers: int) -> httpx.Client:
+    return httpx.Client(
+        timeout=10,
+        limits=httpx.Limits(
+            max_connections=max_workers,
+            max_keepalive_connections=max_workers,
+        ),
+    )
+
+
+def _list_dashboards(
+    client: httpx.Client,
+    grafana_url: str,
+    auth: tuple[str, str],
+) -> tuple[list[dict], list[str]]:
+    response = client.get(f"{grafana_url}/api/search?type=dash-db", auth=auth)
+    if response.status_code != 200:
+        return [], [f"Failed to list dashboards: HTTP {response.status_code}"]
+    return [db for db in response.json() if db.get("uid")], []
+
+
+def _fetch_dashboards(
+    client: httpx.Client,
+    grafana_url: str,
+    auth: tuple[str, str],
+    uids: list[str],
+    max_workers: int,
+) -> dict[str, Optional[dict]]:
+    """Fetch dashboards concurrently; failed fetches map to None."""
+
+    def fetch(uid: str) -> Optional[dict]:
+        try:
+            response = client.get(f"{grafana_url}/api/dashboards/uid/{uid}", auth=auth)
+        except httpx.HTTPError:
+            return None
+        return response.json() if response.status_code == 200 else None
+
+    if not uids:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(uids)))) as pool:
+        return dict(zip(uids, pool.map(fetch, uids), strict=True))
+
+
 def export_grafana_dashboards(
     backup_dir: Path,
     grafana_url: str = "http://localhost:3000",
     auth: tuple[str, str] = ("admin", "admin"),
+    max_workers: int = DEFAULT_BACKUP_WORKERS,
 ) -> tuple[int, list[str]]:
     """
-    Export all Grafana dashboards to backup directory.
+    Export all Grafana dashboards to backup directory as full copies.
+
+    Dashboards are fetched concurrently. backup() stores dashboards in the
+    shared blob store instead (see backup_grafana_dashboards).
 
     Returns:
         Tuple of (count, errors)
@@ -77,43 +212,140 @@ def export_grafana_dashboards(
     count = 0
 
     try:
-        with httpx.Client(timeout=10) as client:
-            # Get list of dashboards
-            response = client.get(
-                f"{grafana_url}/api/search?type=dash-db",
-                auth=auth,
-            )
-            if response.status_code != 200:
-                errors.append(f"Failed to list dashboards: HTTP {response.status_code}")
+        with _new_client(max_workers) as client:
+            dashboards, errors = _list_dashboards(client, grafana_url, auth)
+            if errors:
                 return 0, errors
 
-            dashboards = response.json()
-
-            for db in dashboards:
-                uid = db.get("uid")
-                if not uid:
+            uids = [db["uid"] for db in dashboards]
+            fetched = _fetch_dashboards(client, grafana_url, auth, uids, max_workers)
+            for uid in uids:
+                data = fetched[uid]
+                if data is None:
+                    errors.append(f"Failed to export dashboard {uid}")
                     continue
+                filepath = dashboards_dir / f"{uid}.json"
+                with open(filepath, "w") as f:
+                    json.dump(data, f, indent=2)
+                count += 1
 
-                # Get full dashboard
-                response = client.get(
-                    f"{grafana_url}/api/dashboards/uid/{uid}",
-                    auth=auth,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    filepath = dashboards_dir / f"{uid}.json"
-                    with open(filepath, "w") as f:
-                        json.dump(data, f, indent=2)
-                    count += 1
+    except httpx.ConnectError:
+        errors.append("Could not connect to Grafana")
+    except Exception as e:
+        errors.append(f"Error exporting dashboards: {e}")
+
+    return count, errors
+
+
+def _dashboard_blob(data: dict) -> dict:
+    """What is kept of a dashboard API response: the model and its folder."""
+    meta = data.get("meta", {})
+    return {
+        "dashboard": data.get("dashboard", {}),
+        "meta": {k: meta[k] for k in ("folderUid", "folderTitle") if k in meta},
+    }
+
+
+def backup_grafana_dashboards(
+    store: BlobStore,
+    grafana_url: str = "http://localhost:3000",
+    auth: tuple[str, str] = ("admin", "admin"),
+    previous: Optional[BackupManifest] = None,
+    max_workers: int = DEFAULT_BACKUP_WORKERS,
+) -> tuple[dict[str, dict], int, list[str]]:
+    """
+    Store all Grafana dashboards in ``store``.
+
+    Dashboards whose search-result version matches the entry in ``previous``
+    reuse that entry's blob without being fetched; the rest are fetched
+    concurrently. Grafana versions whose search API reports no version are
+    always fetched, and identical content still deduplicates to one blob.
+    A dashboard that fails to fetch keeps its entry from ``previous``,
+    marked stale, so the manifest still lists every dashboard.
+
+    Returns:
+        Tuple of (uid -> manifest entry, dashboards reused, errors)
+    """
+    entries: dict[str, dict] = {}
+    errors: list[str] = []
+    reused = 0
+    known = previous.dashboards if previous is not None else {}
+
+    try:
+        with _new_client(max_workers) as client:
+            dashboards, errors = _list_dashboards(client, grafana_url, auth)
+            if errors:
+                return {}, 0, errors
+
+            to_fetch = []
+            for db in dashboards:
+                uid = db["uid"]
+                prior = known.get(uid)
+                version = db.get("version")
+                if (
+                    prior is not None
+                    and version is not None
+                    and prior.get("version") == version
+                    and store.has(prior["blob"])
+                ):
+                    entries[uid] = dict(prior, title=db.get("title", prior.get("title", "")))
+                    reused += 1
                 else:
-                    errors.append(f"Failed to export dashboard {uid}")
+                    to_fetch.append(uid)
+
+            titles = {db["uid"]: db.get("title", "") for db in dashboards}
+            fetched = _fetch_dashboards(client, grafana_url, auth, to_fetch, max_workers)
+            for uid in to_fetch:
+                data = fetched[uid]
+                if data is None:
+                    prior = known.get(uid)
+                    if prior is not None and store.has(prior["blob"]):
+                        entries[uid] = dict(prior, title=titles[uid], stale=True)
+                        errors.append(
+                            f"Failed to export dashboard {uid}; kept the previous backup's copy"
+                        )
+                    else:
+                        errors.append(f"Failed to export dashboard {uid}")
+                    continue
+                entries[uid] = {
+                    "blob": store.put(_dashboard_blob(data)),
+                    "version": data.get("meta", {}).get(
+                        "version", data.get("dashboard", {}).get("version")
+                    ),
+                    "title": titles[uid],
+                }
 
     except httpx.ConnectError:
         errors.append("Could not connect to Grafana")
     except Exception as e:
         errors.append(f"Error exporting dashboards: {e}")
 
-    return count, errors
+    # Sorted by UID so consecutive manifests diff cleanly
+    return dict(sorted(entries.items())), reused, errors
+
+
+def backup_grafana_datasources(
+    store: BlobStore,
+    grafana_url: str = "http://localhost:3000",
+    auth: tuple[str, str] = ("admin", "admin"),
+) -> tuple[Optional[str], int, list[str]]:
+    """
+    Store Grafana datasources in ``store``.
+
+    Returns:
+        Tuple of (blob digest or None, count, errors)
+    """
+    try:
+        with httpx.Client(timeout=10) as client:
+            response = client.get(f"{grafana_url}/api/datasources", auth=auth)
+            if response.status_code != 200:
+                return None, 0, [f"Failed to export datasources: HTTP {response.status_code}"]
+            datasources = response.json()
+            return store.put(datasources), len(datasources), []
+    except httpx.ConnectError:
+        return None, 0, ["Could not connect to Grafana"]
+    except Exception as e:
+        return None, 0, [f"Error exporting datasources: {e}"]
 
 
 def export_grafana_datasources(
@@ -158,46 +390,66 @@ def backup(
     output_dir: Optional[Path] = None,
     grafana_url: str = "http://localhost:3000",
     grafana_auth: tuple[str, str] = ("admin", "admin"),
+    incremental: bool = True,
+    max_workers: int = DEFAULT_BACKUP_WORKERS,
 ) -> BackupResult:
     """
-    Create a full backup of ContextCore state.
+    Create a backup of ContextCore state.
 
     Args:
-        output_dir: Base directory for backups (default: ./backups/YYYYMMDD-HHMMSS)
+        output_dir: Base directory for backups (default: ./backups); the
+            backup is written to a YYYYMMDD-HHMMSS directory inside it
         grafana_url: Grafana base URL
         grafana_auth: Grafana authentication (username, password)
+        incremental: Reuse blobs of the latest backup for unchanged dashboards
+        max_workers: Dashboards fetched in parallel
 
     Returns:
         BackupResult with path and manifest
     """
     # Create timestamped backup directory
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    if output_dir is None:
-        output_dir = Path("backups") / timestamp
-    else:
-        output_dir = Path(output_dir) / timestamp
+    base_dir = Path(output_dir) if output_dir is not None else Path("backups")
+    output_dir = base_dir / timestamp
+    store = BlobStore(base_dir / BLOB_DIR_NAME)
+
+    parent: Optional[tuple[Path, BackupManifest]] = None
+    if incremental:
+        parent = next(
+            ((p, m) for p, m in list_backups(base_dir) if m.content_addressed and p != output_dir),
+            None,
+        )
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     errors = []
 
     # Export dashboards
-    dashboards_count, dashboard_errors = export_grafana_dashboards(
-        output_dir, grafana_url, grafana_auth
+    dashboards, reused, dashboard_errors = backup_grafana_dashboards(
+        store,
+        grafana_url,
+        grafana_auth,
+        previous=parent[1] if parent else None,
+        max_workers=max_workers,
     )
     errors.extend(dashboard_errors)
 
     # Export datasources
-    datasources_count, datasource_errors = export_grafana_datasources(
-        output_dir, grafana_url, grafana_auth
+    datasources_blob, datasources_count, datasource_errors = backup_grafana_datasources(
+        store, grafana_url, grafana_auth
     )
     errors.extend(datasource_errors)
 
     # Create manifest
     manifest = BackupManifest(
         created_at=datetime.now(timezone.utc).isoformat(),
-        dashboards_count=dashboards_count,
+        version=MANIFEST_VERSION,
+        dashboards_count=len(dashboards),
         datasources_count=datasources_count,
+        dashboards=dashboards,
+        datasources_blob=datasources_blob,
+        dashboards_reused=reused,
+        parent=parent[0].name if parent and reused else None,
     )
 
     # Write manifest
@@ -213,30 +465,18 @@ def backup(
     )
 
 
-def import_grafana_dashboards(
-    backup_dir: Path,
-    grafana_url: str = "http://localhost:3000",
-    auth: tuple[str, str] = ("admin", "admin"),
+def _import_dashboards(
+    payloads: list[tuple[str, dict]],
+    grafana_url: str,
+    auth: tuple[str, str],
 ) -> tuple[int, list[str]]:
-    """
-    Import dashboards from backup directory to Grafana.
-
-    Returns:
-        Tuple of (count, errors)
-    """
-    dashboards_dir = backup_dir / "dashboards"
-    if not dashboards_dir.exists():
-        return 0, ["No dashboards directory in backup"]
-
+    """Post (name, dashboard or API response) pairs to Grafana."""
     errors = []
     count = 0
 
     try:
         with httpx.Client(timeout=10) as client:
-            for filepath in dashboards_dir.glob("*.json"):
-                with open(filepath) as f:
-                    data = json.load(f)
-
+            for name, data in payloads:
                 # Prepare import payload
                 dashboard = data.get("dashboard", data)
                 payload = {
@@ -252,7 +492,7 @@ def import_grafana_dashboards(
                 if response.status_code == 200:
                     count += 1
                 else:
-                    errors.append(f"Failed to import {filepath.name}: HTTP {response.status_code}")
+                    errors.append(f"Failed to import {name}: HTTP {response.status_code}")
 
     except httpx.ConnectError:
         errors.append("Could not connect to Grafana")
@@ -262,6 +502,53 @@ def import_grafana_dashboards(
     return count, errors
 
 
+def import_grafana_dashboards(
+    backup_dir: Path,
+    grafana_url: str = "http://localhost:3000",
+    auth: tuple[str, str] = ("admin", "admin"),
+) -> tuple[int, list[str]]:
+    """
+    Import dashboards from backup directory to Grafana.
+
+    Handles both full-copy backups (``dashboards/*.json``) and
+    content-addressed backups (manifest entries resolved from the blob store
+    next to the backup directory).
+
+    Returns:
+        Tuple of (count, errors)
+    """
+    manifest_path = backup_dir / "manifest.json"
+    manifest = None
+    if manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                manifest = BackupManifest.from_dict(json.load(f))
+        except (OSError, ValueError) as e:
+            return 0, [f"Could not read backup manifest: {e}"]
+
+    if manifest is not None and manifest.content_addressed:
+        store = BlobStore(backup_dir.parent / BLOB_DIR_NAME)
+        payloads = []
+        errors = []
+        for uid, entry in manifest.dashboards.items():
+            try:
+                payloads.append((uid, store.get(entry["blob"])))
+            except (OSError, ValueError, KeyError):
+                errors.append(f"Missing backup data for dashboard {uid}")
+        count, import_errors = _import_dashboards(payloads, grafana_url, auth)
+        return count, errors + import_errors
+
+    dashboards_dir = backup_dir / "dashboards"
+    if not dashboards_dir.exists():
+        return 0, ["No dashboards directory in backup"]
+
+    payloads = []
+    for filepath in dashboards_dir.glob("*.json"):
+        with open(filepath) as f:
+            payloads.append((filepath.name, json.load(f)))
+    return _import_dashboards(payloads, grafana_url, auth)
+
+
 def restore(
     backup_path: Path,
     grafana_url: str = "http://localhost:3000",
@@ -270,6 +557,10 @@ def restore(
     """
     Restore from a backup directory.
 
+    Every backup is a complete listing, so restoring one reassembles
+    dashboards as they were when it was taken (see find_backup to pick a
+    backup by time).
+
     Args:
         backup_path: Path to backup directory
         grafana_url: Grafana base URL
@@ -331,3 +622,68 @@ def list_backups(base_dir: Optional[Path] = None) -> list[tuple[Path, BackupMani
     backups.sort(key=lambda x: x[1].created_at, reverse=True)
 
     return backups
+
+
+def find_backup(at: datetime, base_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Latest backup taken at or before ``at``.
+
+    Args:
+        at: Point in time (naive datetimes are taken as local time)
+        base_dir: Base directory to search (default: ./backups)
+
+    Returns:
+        Backup directory, or None if every backup is newer
+    """
+    if at.tzinfo is None:
+        at = at.astimezone()
+    for path, manifest in list_backups(base_dir):
+        try:
+            created = datetime.fromisoformat(manifest.created_at)
+        except ValueError:
+            continue
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        if created <= at:
+            return path
+    return None
+
+
+def prune_blobs(base_dir: Optional[Path] = None) -> int:
+    """
+    Delete blobs no remaining backup refers to.
+
+    Run after removing old backup directories to reclaim their space.
+    Nothing is deleted if any manifest cannot be read.
+
+    Args:
+        base_dir: Base directory of the backups (default: ./backups)
+
+    Returns:
+        Number of blobs deleted
+    """
+    if base_dir is None:
+        base_dir = Path("backups")
+    if not base_dir.exists():
+        return 0
+    store = BlobStore(base_dir / BLOB_DIR_NAME)
+
+    referenced = set()
+    for manifest_path in base_dir.glob("*/manifest.json"):
+        try:
+            with open(manifest_path) as f:
+                manifest = BackupManifest.from_dict(json.load(f))
+        except (OSError, ValueError, AttributeError):
+            return 0
+        referenced.update(entry["blob"] for entry in manifest.dashboards.values())
+        if manifest.datasources_blob:
+            referenced.add(manifest.datasources_blob)
+
+    removed = 0
+    for digest in store.digests() - referenced:
+        try:
+            store.path(digest).unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
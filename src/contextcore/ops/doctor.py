@@ -12,13 +12,14 @@ Validates system readiness before deployment:
 from __future__ import annotations
 
 import shutil
-import socket
 import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from contextcore.ops.probes import Probe, ProbeOutcome, get_probe_engine
+
 
 class CheckStatus(str, Enum):
     """Status of a preflight check."""
@@ -103,71 +104,80 @@ def check_tool(name: str) -> CheckResult:
     )
 
 
-def check_docker_running() -> CheckResult:
-    """Check if Docker daemon is running."""
-    import subprocess
+DOCKER_PROBE = Probe.command("docker info", timeout=10)
 
-    try:
-        result = subprocess.run(
-            ["docker", "info"],
-            capture_output=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            return CheckResult(
-                name="docker:daemon",
-                status=CheckStatus.PASS,
-                message="Docker is running",
-            )
+
+def _port_probe(port: int) -> Probe:
+    return Probe.tcp("127.0.0.1", port, timeout=1)
+
+
+def _docker_from_outcome(outcome: ProbeOutcome) -> CheckResult:
+    if outcome.ok:
         return CheckResult(
             name="docker:daemon",
-            status=CheckStatus.FAIL,
-            message="Docker is not running",
-            details="Start Docker Desktop or run: sudo systemctl start docker",
+            status=CheckStatus.PASS,
+            message="Docker is running",
         )
-    except subprocess.TimeoutExpired:
+    if outcome.error_kind == "timeout":
         return CheckResult(
             name="docker:daemon",
             status=CheckStatus.FAIL,
             message="Docker daemon timed out",
         )
-    except FileNotFoundError:
+    if outcome.error_kind == "missing":
         return CheckResult(
             name="docker:daemon",
             status=CheckStatus.FAIL,
             message="Docker not installed",
         )
+    return CheckResult(
+        name="docker:daemon",
+        status=CheckStatus.FAIL,
+        message="Docker is not running",
+        details="Start Docker Desktop or run: sudo systemctl start docker",
+    )
 
 
-def check_port_available(port: int, service: str) -> CheckResult:
-    """Check if a port is available for binding."""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(1)
-    try:
-        result = sock.connect_ex(("127.0.0.1", port))
-        if result == 0:
-            # Port is in use
-            return CheckResult(
-                name=f"port:{port}",
-                status=CheckStatus.FAIL,
-                message=f"Port {port} ({service}) is in use",
-                details=f"Free the port or change {service} port",
-            )
-        # Port is available
+def _port_from_outcome(port: int, service: str, outcome: ProbeOutcome) -> CheckResult:
+    if outcome.ok:
+        # Port is in use
         return CheckResult(
             name=f"port:{port}",
-            status=CheckStatus.PASS,
-            message=f"Port {port} ({service}) is available",
-        )
-    except socket.error:
-        # Assume available if we can't connect
-        return CheckResult(
-            name=f"port:{port}",
-            status=CheckStatus.PASS,
-            message=f"Port {port} ({service}) is available",
+            status=CheckStatus.FAIL,
+            message=f"Port {port} ({service}) is in use",
+            details=f"Free the port or change {service} port",
         )
-    finally:
-        sock.close()
+    # Port is available (or we couldn't connect, which we treat the same)
+    return CheckResult(
+        name=f"port:{port}",
+        status=CheckStatus.PASS,
+        message=f"Port {port} ({service}) is available",
+    )
+
+
+def check_docker_running(max_age_s: Optional[float] = None) -> CheckResult:
+    """Check if Docker daemon is running."""
+    return _docker_from_outcome(get_probe_engine().get(DOCKER_PROBE, max_age_s))
+
+
+def check_port_available(
+    port: int,
+    service: str,
+    max_age_s: Optional[float] = None,
+) -> CheckResult:
+    """Check if a port is available for binding."""
+    outcome = get_probe_engine().get(_port_probe(port), max_age_s)
+    return _port_from_outcome(port, service, outcome)
+
+
+def doctor_probes(check_ports: bool = True, check_docker: bool = True) -> list[Probe]:
+    """Probes doctor() runs, for warming the snapshot ahead of time."""
+    probes = []
+    if check_docker:
+        probes.append(DOCKER_PROBE)
+    if check_ports:
+        probes.extend(_port_probe(port) for port in REQUIRED_PORTS)
+    return probes
 
 
 def check_disk_space(min_gb: int = 10) -> CheckResult:
@@ -222,6 +232,7 @@ def doctor(
     check_disk: bool = True,
     check_dirs: bool = True,
     base_path: Optional[Path] = None,
+    max_age_s: Optional[float] = None,
 ) -> DoctorResult:
     """
     Run all preflight checks.
@@ -233,10 +244,16 @@ def doctor(
         check_disk: Check disk space
         check_dirs: Check if data directories exist
         base_path: Base path for data directories
+        max_age_s: Reuse Docker/port probe results younger than this
+            (None: snapshot TTL, 0: re-probe)
 
     Returns:
         DoctorResult with all check results
     """
+    # Docker and port probes are the slow ones: run them together up front.
+    probes = doctor_probes(check_ports=check_ports, check_docker=check_docker)
+    outcomes = get_probe_engine().run(probes, max_age_s) if probes else {}
+
     result = DoctorResult()
 
     # Check required tools
@@ -246,12 +263,12 @@ def doctor(
 
     # Check Docker daemon
     if check_docker:
-        result.add(check_docker_running())
+        result.add(_docker_from_outcome(outcomes[DOCKER_PROBE.key]))
 
     # Check ports
     if check_ports:
         for port, service in REQUIRED_PORTS.items():
-            result.add(check_port_available(port, service))
+            result.add(_port_from_outcome(port, service, outcomes[_port_probe(port).key]))
 
     # Check disk space
     if check_disk:
@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
-import httpx
+from contextcore.ops.probes import Probe, ProbeOutcome, get_probe_engine
 
 
 class HealthStatus(str, Enum):
@@ -81,12 +81,73 @@ DEFAULT_COMPONENTS = {
 }
 
 
+def _component_from_outcome(
+    name: str,
+    url: str,
+    outcome: ProbeOutcome,
+    expected_status: int = 200,
+) -> ComponentHealth:
+    if outcome.status_code is not None:
+        return ComponentHealth(
+            name=name,
+            status=(
+                HealthStatus.HEALTHY
+                if outcome.status_code == expected_status
+                else HealthStatus.UNHEALTHY
+            ),
+            message="Ready" if outcome.status_code == expected_status else f"HTTP {outcome.status_code}",
+            url=url,
+            response_time_ms=outcome.latency_ms,
+        )
+    if outcome.error_kind == "connect":
+        return ComponentHealth(
+            name=name,
+            status=HealthStatus.UNHEALTHY,
+            message="Connection refused",
+            url=url,
+        )
+    if outcome.error_kind == "timeout":
+        return ComponentHealth(
+            name=name,
+            status=HealthStatus.UNHEALTHY,
+            message="Timeout",
+            url=url,
+        )
+    return ComponentHealth(
+        name=name,
+        status=HealthStatus.UNKNOWN,
+        message=outcome.error or "Unknown error",
+        url=url,
+    )
+
+
+def _port_from_outcome(name: str, port: int, outcome: ProbeOutcome) -> ComponentHealth:
+    if outcome.ok:
+        return ComponentHealth(
+            name=name,
+            status=HealthStatus.HEALTHY,
+            message=f"Listening on port {port}",
+        )
+    if outcome.error_kind is not None:
+        return ComponentHealth(
+            name=name,
+            status=HealthStatus.UNHEALTHY,
+            message=f"Socket error: {outcome.error}",
+        )
+    return ComponentHealth(
+        name=name,
+        status=HealthStatus.UNHEALTHY,
+        message=f"Not listening on port {port}",
+    )
+
+
 def check_component_health(
     name: str,
     url: str,
     method: str = "GET",
     timeout: float = 5.0,
     expected_status: int = 200,
+    max_age_s: Optional[float] = None,
 ) -> ComponentHealth:
     """
     Check health of a single component via HTTP.
@@ -97,58 +158,22 @@ def check_component_health(
         method: HTTP method
         timeout: Request timeout in seconds
         expected_status: Expected HTTP status code
+        max_age_s: Reuse a probe result younger than this (None: snapshot TTL, 0: re-probe)
 
     Returns:
         ComponentHealth with status and details
     """
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            import time
-
-            start = time.time()
-            response = client.request(method, url)
-            elapsed_ms = (time.time() - start) * 1000
-
-            if response.status_code == expected_status:
-                return ComponentHealth(
-                    name=name,
-                    status=HealthStatus.HEALTHY,
-                    message="Ready",
-                    url=url,
-                    response_time_ms=elapsed_ms,
-                )
-            else:
-                return ComponentHealth(
-                    name=name,
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"HTTP {response.status_code}",
-                    url=url,
-                    response_time_ms=elapsed_ms,
-                )
-    except httpx.ConnectError:
-        return ComponentHealth(
-            name=name,
-            status=HealthStatus.UNHEALTHY,
-            message="Connection refused",
-            url=url,
-        )
-    except httpx.TimeoutException:
-        return ComponentHealth(
-            name=name,
-            status=HealthStatus.UNHEALTHY,
-            message="Timeout",
-            url=url,
-        )
-    except Exception as e:
-        return ComponentHealth(
-            name=name,
-            status=HealthStatus.UNKNOWN,
-            message=str(e),
-            url=url,
-        )
+    probe = Probe.http(url, method=method, timeout=timeout)
+    outcome = get_probe_engine().get(probe, max_age_s)
+    return _component_from_outcome(name, url, outcome, expected_status)
 
 
-def check_port_listening(name: str, port: int, host: str = "localhost") -> ComponentHealth:
+def check_port_listening(
+    name: str,
+    port: int,
+    host: str = "localhost",
+    max_age_s: Optional[float] = None,
+) -> ComponentHealth:
     """
     Check if a port is listening.
 
@@ -156,47 +181,53 @@ def check_port_listening(name: str, port: int, host: str = "localhost") -> Compo
         name: Component/service name
         port: Port number
         host: Host to check
+        max_age_s: Reuse a probe result younger than this (None: snapshot TTL, 0: re-probe)
 
     Returns:
         ComponentHealth with status
     """
-    import socket
-
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(2)
-    try:
-        result = sock.connect_ex((host, port))
-        if result == 0:
-            return ComponentHealth(
-                name=name,
-                status=HealthStatus.HEALTHY,
-                message=f"Listening on port {port}",
-            )
-        return ComponentHealth(
-            name=name,
-            status=HealthStatus.UNHEALTHY,
-            message=f"Not listening on port {port}",
-        )
-    except socket.error as e:
-        return ComponentHealth(
-            name=name,
-            status=HealthStatus.UNHEALTHY,
-            message=f"Socket error: {e}",
-        )
-    finally:
-        sock.close()
+    outcome = get_probe_engine().get(Probe.tcp(host, port), max_age_s)
+    return _port_from_outcome(name, port, outcome)
+
+
+# OTLP receivers checked by health_check(include_otlp=True)
+OTLP_PORTS = {
+    "OTLP gRPC": 4317,
+    "OTLP HTTP": 4318,
+}
+
+
+def health_probes(
+    components: Optional[dict] = None,
+    include_otlp: bool = True,
+) -> list[Probe]:
+    """Probes health_check() runs, for warming the snapshot ahead of time."""
+    if components is None:
+        components = DEFAULT_COMPONENTS
+    probes = [
+        Probe.http(config["url"], method=config.get("method", "GET"))
+        for config in components.values()
+    ]
+    if include_otlp:
+        probes.extend(Probe.tcp("localhost", port) for port in OTLP_PORTS.values())
+    return probes
 
 
 def health_check(
     components: Optional[dict] = None,
     include_otlp: bool = True,
+    max_age_s: Optional[float] = None,
 ) -> HealthCheckResult:
     """
     Check health of all components.
 
+    All components are probed concurrently. Results younger than
+    ``max_age_s`` are read from the shared probe snapshot instead.
+
     Args:
         components: Dict of component configs (name -> {url, method})
         include_otlp: Include OTLP endpoint checks
+        max_age_s: Reuse probe results younger than this (None: snapshot TTL, 0: re-probe)
 
     Returns:
         HealthCheckResult with all component statuses
@@ -204,20 +235,17 @@ def health_check(
     if components is None:
         components = DEFAULT_COMPONENTS
 
+    outcomes = get_probe_engine().run(health_probes(components, include_otlp), max_age_s)
     result = HealthCheckResult()
 
-    # Check HTTP endpoints
+    # HTTP endpoints
     for name, config in components.items():
-        health = check_component_health(
-            name=name,
-            url=config["url"],
-            method=config.get("method", "GET"),
-        )
-        result.add(health)
+        probe = Probe.http(config["url"], method=config.get("method", "GET"))
+        result.add(_component_from_outcome(name, config["url"], outcomes[probe.key]))
 
-    # Check OTLP endpoints
+    # OTLP endpoints
     if include_otlp:
-        result.add(check_port_listening("OTLP gRPC", 4317))
-        result.add(check_port_listening("OTLP HTTP", 4318))
+        for name, port in OTLP_PORTS.items():
+            result.add(_port_from_outcome(name, port, outcomes[Probe.tcp("localhost", port).key]))
 
     return result
@@ -0,0 +1,397 @@
+"""
+Shared probe engine for ops commands.
+
+``health_check``, ``smoke_test`` and ``doctor`` all ask the same questions of
+the local stack: does this URL answer, is this port open, does this command
+succeed. ProbeEngine answers them concurrently over one pooled HTTP client
+and publishes every outcome to a short-TTL JSON snapshot. Any CLI call, or
+the TUI status screen, made within the TTL reads the snapshot instead of
+re-probing. Probes are keyed by what they touch (``http:GET:<url>``,
+``tcp:<host>:<port>``, ``cmd:<command>``), so a URL probed by ``ops health``
+is reused by ``ops smoke-test``.
+
+ProbeRefresher keeps the snapshot warm from a background thread
+(``contextcore ops refresh``).
+
+Usage:
+    from contextcore.ops.probes import Probe, get_probe_engine
+
+    engine = get_probe_engine()
+    outcomes = engine.run([
+        Probe.http("http://localhost:3200/ready"),
+        Probe.tcp("localhost", 4317),
+    ])
+    tempo = engine.get(Probe.http("http://localhost:3200/ready"))  # From snapshot
+    print(tempo.status_code, tempo.latency_ms)
+
+Configuration:
+    CONTEXTCORE_PROBE_TTL: Seconds a snapshot entry stays fresh (default 15)
+    CONTEXTCORE_PROBE_SNAPSHOT: "0" keeps outcomes in memory only
+    CONTEXTCORE_PROBE_SNAPSHOT_PATH: Snapshot location
+        (default ~/.contextcore/cache/ops-probes.json)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shlex
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import httpx
+
+from contextcore.utils.persisted_cache import cache_path, env_float, read_json, write_atomic
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "Probe",
+    "ProbeEngine",
+    "ProbeOutcome",
+    "ProbeRefresher",
+    "get_probe_engine",
+]
+
+DEFAULT_TTL_S = 15.0
+
+
+@dataclass(frozen=True)
+class Probe:
+    """One thing to check: an HTTP endpoint, a TCP port or a command."""
+
+    kind: str  # "http", "tcp" or "command"
+    target: str  # URL, "host:port" or command line
+    method: str = "GET"
+    timeout: float = 5.0
+    auth: Optional[tuple[str, str]] = field(default=None, repr=False)
+    # Reduces an HTTP JSON body to what callers need; the result is stored
+    # in the snapshot as ProbeOutcome.data.
+    summarize: Optional[Callable[[Any], Any]] = field(
+        default=None, compare=False, hash=False, repr=False
+    )
+
+    @classmethod
+    def http(cls, url: str, method: str = "GET", **kwargs: Any) -> "Probe":
+        return cls(kind="http", target=url, method=method, **kwargs)
+
+    @classmethod
+    def tcp(cls, host: str, port: int, timeout: float = 2.0) -> "Probe":
+        return cls(kind="tcp", target=f"{host}:{port}", timeout=timeout)
+
+    @classmethod
+    def command(cls, command: str, timeout: float = 10.0) -> "Probe":
+        return cls(kind="command", target=command, timeout=timeout)
+
+    @property
+    def key(self) -> str:
+        if self.kind == "http":
+            return f"http:{self.method}:{self.target}"
+        if self.kind == "tcp":
+            return f"tcp:{self.target}"
+        return f"cmd:{self.target}"
+
+
+@dataclass
+class ProbeOutcome:
+    """Result of running a probe."""
+
+    key: str
+    ok: bool
+    checked_at: float
+    status_code: Optional[int] = None  # HTTP
+    returncode: Optional[int] = None  # connect_ex() result or process exit code
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+    error_kind: Optional[str] = None  # "connect", "timeout", "missing", "socket", "error"
+    data: Any = None
+
+    def age_s(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.time()) - self.checked_at
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProbeOutcome":
+        return cls(**{k: data.get(k) for k in cls.__dataclass_fields__})
+
+
+class ProbeEngine:
+    """Runs probes concurrently and shares outcomes through a snapshot file."""
+
+    def __init__(
+        self,
+        snapshot_path: Optional[Path] = None,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_workers: int = 8,
+    ):
+        """
+        Args:
+            snapshot_path: JSON file outcomes are published to (None: memory only)
+            ttl_s: Default age below which an outcome is reused
+            max_workers: Probes run in parallel
+        """
+        self.snapshot_path = snapshot_path
+        self.ttl_s = ttl_s
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._outcomes: dict[str, ProbeOutcome] = {}
+        self._client: Optional[httpx.Client] = None
+
+    def run(
+        self,
+        probes: Iterable[Probe],
+        max_age_s: Optional[float] = None,
+    ) -> dict[str, ProbeOutcome]:
+        """
+        Outcomes for ``probes`` keyed by ``Probe.key``.
+
+        Outcomes younger than ``max_age_s`` (default: the engine TTL; 0 forces
+        a re-probe) are reused; the rest are probed in parallel and published.
+        """
+        probes = list({p.key: p for p in probes}.values())
+        max_age = self.ttl_s if max_age_s is None else max_age_s
+        now = time.time()
+
+        known = self.snapshot()
+        results = {
+            p.key: known[p.key]
+            for p in probes
+            if p.key in known and known[p.key].age_s(now) < max_age
+        }
+        stale = [p for p in probes if p.key not in results]
+        if not stale:
+            return results
+
+        if len(stale) == 1:
+            fresh = [self._probe(stale[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as pool:
+                fresh = list(pool.map(self._probe, stale))
+
+        with self._lock:
+            for outcome in fresh:
+                self._outcomes[outcome.key] = outcome
+                results[outcome.key] = outcome
+        self._publish(fresh)
+        return results
+
+    def get(self, probe: Probe, max_age_s: Optional[float] = None) -> ProbeOutcome:
+        """Outcome of a single probe (see ``run``)."""
+        return self.run([probe], max_age_s)[probe.key]
+
+    def snapshot(self) -> dict[str, ProbeOutcome]:
+        """Latest known outcome per probe key, from memory and the snapshot file."""
+        on_disk = self._read_snapshot()
+        with self._lock:
+            merged = dict(on_disk)
+            for key, outcome in self._outcomes.items():
+                if key not in merged or merged[key].checked_at < outcome.checked_at:
+                    merged[key] = outcome
+            return merged
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    # -- probing -------------------------------------------------------------
+
+    def _http_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=self.max_workers,
+                        max_keepalive_connections=self.max_workers,
+                    ),
+                )
+            return self._client
+
+    def _probe(self, probe: Probe) -> ProbeOutcome:
+        try:
+            if probe.kind == "http":
+                return self._probe_http(probe)
+            if probe.kind == "tcp":
+                return self._probe_tcp(probe)
+            if probe.kind == "command":
+                return self._probe_command(probe)
+            raise ValueError(f"Unknown probe kind: {probe.kind}")
+        except Exception as e:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=time.time(), error=str(e), error_kind="error"
+            )
+
+    def _probe_http(self, probe: Probe) -> ProbeOutcome:
+        start = time.time()
+        try:
+            response = self._http_client().request(
+                probe.method, probe.target, auth=probe.auth, timeout=probe.timeout
+            )
+        except httpx.ConnectError as e:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=start, error=str(e), error_kind="connect"
+            )
+        except httpx.TimeoutException as e:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=start, error=str(e) or "Timeout", error_kind="timeout"
+            )
+        except Exception as e:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=start, error=str(e), error_kind="error"
+            )
+
+        outcome = ProbeOutcome(
+            key=probe.key,
+            ok=200 <= response.status_code < 400,
+            checked_at=start,
+            status_code=response.status_code,
+            latency_ms=(time.time() - start) * 1000,
+        )
+        if probe.summarize is not None and outcome.ok:
+            try:
+                outcome.data = probe.summarize(response.json())
+            except Exception as e:
+                outcome.ok = False
+                outcome.error = str(e)
+                outcome.error_kind = "error"
+        return outcome
+
+    def _probe_tcp(self, probe: Probe) -> ProbeOutcome:
+        host, _, port = probe.target.rpartition(":")
+        start = time.time()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(probe.timeout)
+        try:
+            result = sock.connect_ex((host, int(port)))
+            return ProbeOutcome(
+                key=probe.key,
+                ok=result == 0,
+                checked_at=start,
+                returncode=result,
+                latency_ms=(time.time() - start) * 1000,
+            )
+        except socket.error as e:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=start, error=str(e), error_kind="socket"
+            )
+        finally:
+            sock.close()
+
+    def _probe_command(self, probe: Probe) -> ProbeOutcome:
+        start = time.time()
+        try:
+            result = subprocess.run(
+                shlex.split(probe.target), capture_output=True, timeout=probe.timeout
+            )
+        except subprocess.TimeoutExpired:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=start, error="Timeout", error_kind="timeout"
+            )
+        except FileNotFoundError as e:
+            return ProbeOutcome(
+                key=probe.key, ok=False, checked_at=start, error=str(e), error_kind="missing"
+            )
+        return ProbeOutcome(
+            key=probe.key,
+            ok=result.returncode == 0,
+            checked_at=start,
+            returncode=result.returncode,
+            latency_ms=(time.time() - start) * 1000,
+        )
+
+    # -- snapshot ------------------------------------------------------------
+
+    def _read_snapshot(self) -> dict[str, ProbeOutcome]:
+        if self.snapshot_path is None:
+            return {}
+        raw = read_json(self.snapshot_path)
+        if not isinstance(raw, dict):
+            return {}
+        outcomes = {}
+        for key, data in raw.items():
+            try:
+                outcomes[key] = ProbeOutcome.from_dict(data)
+            except (TypeError, AttributeError):
+                continue
+        return outcomes
+
+    def _publish(self, outcomes: list[ProbeOutcome]) -> None:
+        if self.snapshot_path is None:
+            return
+        merged = self._read_snapshot()
+        for outcome in outcomes:
+            merged[outcome.key] = outcome
+        try:
+            payload = json.dumps({k: asdict(v) for k, v in merged.items()}, default=str)
+            write_atomic(self.snapshot_path, payload)
+        except OSError as e:
+            logger.debug(f"Could not write probe snapshot {self.snapshot_path}: {e}")
+
+
+class ProbeRefresher:
+    """Re-probes a fixed set of probes on an interval from a daemon thread."""
+
+    def __init__(
+        self,
+        probes: Iterable[Probe],
+        interval_s: float = 10.0,
+        engine: Optional[ProbeEngine] = None,
+        on_refresh: Optional[Callable[[dict[str, ProbeOutcome]], None]] = None,
+    ):
+        self.probes = list(probes)
+        self.interval_s = interval_s
+        self.engine = engine or get_probe_engine()
+        self.on_refresh = on_refresh
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh_once(self) -> dict[str, ProbeOutcome]:
+        outcomes = self.engine.run(self.probes, max_age_s=0)
+        if self.on_refresh is not None:
+            self.on_refresh(outcomes)
+        return outcomes
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="contextcore-probe-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh_once()
+            except Exception as e:
+                logger.warning(f"Probe refresh failed: {e}")
+            self._stop.wait(self.interval_s)
+
+
+_default_engine: Optional[ProbeEngine] = None
+_default_lock = threading.Lock()
+
+
+def get_probe_engine() -> ProbeEngine:
+    """Process-wide engine, publishing a snapshot unless CONTEXTCORE_PROBE_SNAPSHOT=0."""
+    global _default_engine
+    with _default_lock:
+        if _default_engine is None:
+            _default_engine = ProbeEngine(
+                cache_path("CONTEXTCORE_PROBE_SNAPSHOT", "ops-probes.json"),
+                ttl_s=env_float("CONTEXTCORE_PROBE_TTL", DEFAULT_TTL_S),
+            )
+        return _default_engine
@@ -10,11 +10,12 @@ Validates the entire stack is working after deployment:
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Optional
 
-import httpx
+from contextcore.ops.probes import Probe, ProbeOutcome, get_probe_engine
 
 
 class TestStatus(str, Enum):
@@ -62,170 +63,123 @@ class SmokeTestSuite:
         self.results.append(result)
 
 
-def test_grafana_health() -> SmokeTestResult:
-    """Test Grafana is responding."""
-    try:
-        with httpx.Client(timeout=5) as client:
-            response = client.get("http://localhost:3000/api/health")
-            if response.status_code == 200:
-                return SmokeTestResult(
-                    name="Grafana Health",
-                    status=TestStatus.PASS,
-                    message="Grafana is responding",
-                )
-            return SmokeTestResult(
-                name="Grafana Health",
-                status=TestStatus.FAIL,
-                message=f"HTTP {response.status_code}",
-            )
-    except Exception as e:
+GRAFANA_AUTH = ("admin", "admin")
+
+# Probes behind the default smoke tests; smoke_test() runs them concurrently
+# before the tests read their outcomes from the shared probe engine.
+GRAFANA_HEALTH_PROBE = Probe.http("http://localhost:3000/api/health")
+TEMPO_HEALTH_PROBE = Probe.http("http://localhost:3200/ready")
+MIMIR_HEALTH_PROBE = Probe.http("http://localhost:9009/ready")
+LOKI_HEALTH_PROBE = Probe.http("http://localhost:3100/ready")
+GRAFANA_DATASOURCES_PROBE = Probe.http(
+    "http://localhost:3000/api/datasources",
+    auth=GRAFANA_AUTH,
+    summarize=lambda datasources: [ds.get("name", "unknown") for ds in datasources],
+)
+GRAFANA_DASHBOARDS_PROBE = Probe.http(
+    "http://localhost:3000/api/search?type=dash-db",
+    auth=GRAFANA_AUTH,
+    summarize=len,
+)
+OTLP_GRPC_PROBE = Probe.tcp("localhost", 4317)
+
+SMOKE_PROBES = [
+    GRAFANA_HEALTH_PROBE,
+    TEMPO_HEALTH_PROBE,
+    MIMIR_HEALTH_PROBE,
+    LOKI_HEALTH_PROBE,
+    GRAFANA_DATASOURCES_PROBE,
+    GRAFANA_DASHBOARDS_PROBE,
+    OTLP_GRPC_PROBE,
+]
+
+
+def _responding(name: str, component: str, probe: Probe) -> SmokeTestResult:
+    outcome = get_probe_engine().get(probe)
+    if outcome.status_code == 200:
         return SmokeTestResult(
-            name="Grafana Health",
-            status=TestStatus.FAIL,
-            message=str(e),
+            name=name,
+            status=TestStatus.PASS,
+            message=f"{component} is responding",
         )
+    return SmokeTestResult(
+        name=name,
+        status=TestStatus.FAIL,
+        message=_failure_message(outcome),
+    )
+
+
+def _failure_message(outcome: ProbeOutcome) -> str:
+    if outcome.status_code is not None and outcome.status_code != 200:
+        return f"HTTP {outcome.status_code}"
+    return outcome.error or "Unknown error"
+
+
+def test_grafana_health() -> SmokeTestResult:
+    """Test Grafana is responding."""
+    return _responding("Grafana Health", "Grafana", GRAFANA_HEALTH_PROBE)
 
 
 def test_tempo_health() -> SmokeTestResult:
     """Test Tempo is responding."""
-    try:
-        with httpx.Client(timeout=5) as client:
-            response = client.get("http://localhost:3200/ready")
-            if response.status_code == 200:
-                return SmokeTestResult(
-                    name="Tempo Health",
-                    status=TestStatus.PASS,
-                    message="Tempo is responding",
-                )
-            return SmokeTestResult(
-                name="Tempo Health",
-                status=TestStatus.FAIL,
-                message=f"HTTP {response.status_code}",
-            )
-    except Exception as e:
-        return SmokeTestResult(
-            name="Tempo Health",
-            status=TestStatus.FAIL,
-            message=str(e),
-        )
+    return _responding("Tempo Health", "Tempo", TEMPO_HEALTH_PROBE)
 
 
 def test_mimir_health() -> SmokeTestResult:
     """Test Mimir is responding."""
-    try:
-        with httpx.Client(timeout=5) as client:
-            response = client.get("http://localhost:9009/ready")
-            if response.status_code == 200:
-                return SmokeTestResult(
-                    name="Mimir Health",
-                    status=TestStatus.PASS,
-                    message="Mimir is responding",
-                )
-            return SmokeTestResult(
-                name="Mimir Health",
-                status=TestStatus.FAIL,
-                message=f"HTTP {response.status_code}",
-            )
-    except Exception as e:
-        return SmokeTestResult(
-            name="Mimir Health",
-            status=TestStatus.FAIL,
-            message=str(e),
-        )
+    return _responding("Mimir Health", "Mimir", MIMIR_HEALTH_PROBE)
 
 
 def test_loki_health() -> SmokeTestResult:
     """Test Loki is responding."""
-    try:
-        with httpx.Client(timeout=5) as client:
-            response = client.get("http://localhost:3100/ready")
-            if response.status_code == 200:
-                return SmokeTestResult(
-                    name="Loki Health",
-                    status=TestStatus.PASS,
-                    message="Loki is responding",
-                )
-            return SmokeTestResult(
-                name="Loki Health",
-                status=TestStatus.FAIL,
-                message=f"HTTP {response.status_code}",
-            )
-    except Exception as e:
-        return SmokeTestResult(
-            name="Loki Health",
-            status=TestStatus.FAIL,
-            message=str(e),
-        )
+    return _responding("Loki Health", "Loki", LOKI_HEALTH_PROBE)
 
 
 def test_grafana_datasources() -> SmokeTestResult:
     """Test Grafana has datasources configured."""
-    try:
-        with httpx.Client(timeout=5) as client:
-            response = client.get(
-                "http://localhost:3000/api/datasources",
-                auth=("admin", "admin"),
-            )
-            if response.status_code == 200:
-                datasources = response.json()
-                if len(datasources) > 0:
-                    names = [ds.get("name", "unknown") for ds in datasources]
-                    return SmokeTestResult(
-                        name="Grafana Datasources",
-                        status=TestStatus.PASS,
-                        message=f"{len(datasources)} datasource(s) configured",
-                        details=", ".join(names),
-                    )
-                return SmokeTestResult(
-                    name="Grafana Datasources",
-                    status=TestStatus.FAIL,
-                    message="No datasources configured",
-                )
-            return SmokeTestResult(
-                name="Grafana Datasources",
-                status=TestStatus.FAIL,
-                message=f"HTTP {response.status_code}",
-            )
-    except Exception as e:
+    outcome = get_probe_engine().get(GRAFANA_DATASOURCES_PROBE)
+    if outcome.status_code != 200 or outcome.error:
         return SmokeTestResult(
             name="Grafana Datasources",
             status=TestStatus.FAIL,
-            message=str(e),
+            message=_failure_message(outcome),
         )
+    names = outcome.data or []
+    if len(names) > 0:
+        return SmokeTestResult(
+            name="Grafana Datasources",
+            status=TestStatus.PASS,
+            message=f"{len(names)} datasource(s) configured",
+            details=", ".join(names),
+        )
+    return SmokeTestResult(
+        name="Grafana Datasources",
+        status=TestStatus.FAIL,
+        message="No datasources configured",
+    )
 
 
 def test_grafana_dashboards() -> SmokeTestResult:
     """Test Grafana has dashboards provisioned."""
-    try:
-        with httpx.Client(timeout=5) as client:
-            response = client.get(
-                "http://localhost:3000/api/search?type=dash-db",
-                auth=("admin", "admin"),
-            )
-            if response.status_code == 200:
-                dashboards = response.json()
-                if len(dashboards) > 0:
-                    return SmokeTestResult(
-                        name="Grafana Dashboards",
-                        status=TestStatus.PASS,
-                        message=f"{len(dashboards)} dashboard(s) provisioned",
-                    )
-                return SmokeTestResult(
-                    name="Grafana Dashboards",
-                    status=TestStatus.SKIP,
-                    message="No dashboards (run 'contextcore dashboards provision')",
-                )
-            return SmokeTestResult(
-                name="Grafana Dashboards",
-                status=TestStatus.FAIL,
-                message=f"HTTP {response.status_code}",
-            )
-    except Exception as e:
+    outcome = get_probe_engine().get(GRAFANA_DASHBOARDS_PROBE)
+    if outcome.status_code != 200 or outcome.error:
         return SmokeTestResult(
             name="Grafana Dashboards",
             status=TestStatus.FAIL,
-            message=str(e),
+            message=_failure_message(outcome),
         )
+    count = outcome.data or 0
+    if count > 0:
+        return SmokeTestResult(
+            name="Grafana Dashboards",
+            status=TestStatus.PASS,
+            message=f"{count} dashboard(s) provisioned",
+        )
+    return SmokeTestResult(
+        name="Grafana Dashboards",
+        status=TestStatus.SKIP,
+        message="No dashboards (run 'contextcore dashboards provision')",
+    )
 
 
 def test_contextcore_cli() -> SmokeTestResult:
@@ -249,31 +203,24 @@ def test_contextcore_cli() -> SmokeTestResult:
 
 def test_can_emit_span() -> SmokeTestResult:
     """Test can emit a span to OTLP endpoint."""
-    try:
-        import socket
-
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex(("localhost", 4317))
-        sock.close()
-
-        if result == 0:
-            return SmokeTestResult(
-                name="OTLP Endpoint",
-                status=TestStatus.PASS,
-                message="OTLP gRPC endpoint is listening",
-            )
+    outcome = get_probe_engine().get(OTLP_GRPC_PROBE)
+    if outcome.ok:
         return SmokeTestResult(
             name="OTLP Endpoint",
-            status=TestStatus.FAIL,
-            message="OTLP gRPC endpoint not available on port 4317",
+            status=TestStatus.PASS,
+            message="OTLP gRPC endpoint is listening",
         )
-    except Exception as e:
+    if outcome.error_kind is not None:
         return SmokeTestResult(
             name="OTLP Endpoint",
             status=TestStatus.FAIL,
-            message=str(e),
+            message=outcome.error or "Unknown error",
         )
+    return SmokeTestResult(
+        name="OTLP Endpoint",
+        status=TestStatus.FAIL,
+        message="OTLP gRPC endpoint not available on port 4317",
+    )
 
 
 # Default smoke tests
@@ -291,12 +238,17 @@ DEFAULT_TESTS: list[Callable[[], SmokeTestResult]] = [
 
 def smoke_test(
     tests: Optional[list[Callable[[], SmokeTestResult]]] = None,
+    max_age_s: Optional[float] = None,
 ) -> SmokeTestSuite:
     """
     Run all smoke tests.
 
+    The probes behind the default tests run concurrently up front; results
+    younger than ``max_age_s`` are read from the shared probe snapshot.
+
     Args:
         tests: List of test functions (defaults to DEFAULT_TESTS)
+        max_age_s: Reuse probe results younger than this (None: snapshot TTL, 0: re-probe)
 
     Returns:
         SmokeTestSuite with all test results
@@ -304,11 +256,12 @@ def smoke_test(
     if tests is None:
         tests = DEFAULT_TESTS
 
+    if any(test_fn in DEFAULT_TESTS for test_fn in tests):
+        get_probe_engine().run(SMOKE_PROBES, max_age_s)
+
     suite = SmokeTestSuite()
 
     for test_fn in tests:
-        import time
-
         start = time.time()
         result = test_fn()
         result.duration_ms = (time.time() - start) * 1000
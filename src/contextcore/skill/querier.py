@@ -17,9 +17,8 @@ import uuid
 import warnings
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
-from urllib.parse import urlencode
 
-import requests
+import httpx
 
 from contextcore.skill.models import (
     Audience,
@@ -32,6 +31,7 @@ from contextcore.skill.models import (
     SkillManifest,
     SkillType,
 )
+from contextcore.tracing.traceql import get_traceql_client
 
 if TYPE_CHECKING:
     from contextcore.agent.insights import InsightEmitter
@@ -375,23 +375,17 @@ class SkillCapabilityQuerier:
         # Parse time range to seconds
         time_seconds = self._parse_time_range(time_range)
 
-        # Build API request
-        params = {
-            "q": query,
-            "limit": limit,
-            "start": f"-{time_seconds}s",
-        }
-
-        url = f"{self.tempo_url}/api/search?{urlencode(params)}"
-
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
+            data = get_traceql_client(self.tempo_url).search(
+                query,
+                since_seconds=time_seconds,
+                limit=limit,
+                timeout=self.timeout,
+            )
 
             return self._parse_trace_results(data)
 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             warnings.warn(
                 f"Cannot connect to Tempo at {self.tempo_url}. "
                 "Ensure Tempo is running and accessible.",
@@ -399,7 +393,7 @@ class SkillCapabilityQuerier:
             )
             return []
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             warnings.warn(
                 f"Tempo query failed: {e}. Query: {query}",
                 UserWarning
@@ -654,18 +648,13 @@ class SkillManifestQuerier:
         # Similar implementation to SkillCapabilityQuerier
         time_seconds = self._capability_querier._parse_time_range(time_range)
 
-        params = {
-            "q": query,
-            "limit": limit,
-            "start": f"-{time_seconds}s",
-        }
-
-        url = f"{self.tempo_url}/api/search?{urlencode(params)}"
-
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
+            data = get_traceql_client(self.tempo_url).search(
+                query,
+                since_seconds=time_seconds,
+                limit=limit,
+                timeout=self.timeout,
+            )
 
             return self._parse_skill_results(data)
 
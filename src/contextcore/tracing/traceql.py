@@ -0,0 +1,350 @@
+"""
+Shared TraceQL client for Tempo.
+
+Every Tempo consumer (skill capabilities, lessons, agent discovery, insights)
+goes through one client per Tempo base URL, which provides:
+
+- Keep-alive connection pooling (a single httpx.Client)
+- Retries with exponential backoff for transient failures
+- Request coalescing: concurrent identical queries share one HTTP request
+- A size-bounded LRU response cache keyed by the normalized query and the
+  time bucket the search window falls in; every caller gets its own copy
+  of the response, so mutating a result never corrupts the cache
+- Hit/miss statistics for tuning cache size and bucket width
+
+Usage:
+    from contextcore.tracing.traceql import get_traceql_client
+
+    client = get_traceql_client("http://localhost:3200")
+    data = client.search('{ name =~ "skill:.*" }', since_seconds=86400, limit=20)
+    trace = client.get_trace(data["traces"][0]["traceID"])
+    print(client.stats.hit_rate)
+
+Search windows are aligned to ``time_bucket_s`` boundaries so repeated calls
+within the same bucket hit the cache and send identical requests to Tempo.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import httpx
+
+from contextcore.contracts.timeouts import (
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_DELAY_S,
+    HTTP_CLIENT_TIMEOUT_S,
+    RETRYABLE_HTTP_STATUS_CODES,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "TraceQLClient",
+    "TraceQLStats",
+    "get_traceql_client",
+    "normalize_traceql",
+    "quote_traceql",
+    "reset_traceql_clients",
+]
+
+# Quoted TraceQL string literals; whitespace inside them is significant.
+_STRING_LITERAL = re.compile(r'("(?:[^"\\]|\\.)*")')
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_traceql(query: str) -> str:
+    """
+    Canonicalize a TraceQL query for use as a cache key.
+
+    Collapses whitespace runs outside string literals, so queries that only
+    differ in formatting share a cache entry.
+    """
+    parts = _STRING_LITERAL.split(query.strip())
+    for i in range(0, len(parts), 2):
+        parts[i] = _WHITESPACE.sub(" ", parts[i])
+    return "".join(parts)
+
+
+def quote_traceql(value: str) -> str:
+    """Quote ``value`` as a TraceQL string literal, escaping ``\\`` and ``"``."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@dataclass
+class TraceQLStats:
+    """Counters for a TraceQLClient."""
+
+    requests: int = 0  # HTTP requests sent (including retries)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    coalesced: int = 0  # Callers that waited on an identical in-flight request
+    errors: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without a new request (cache or coalesced)."""
+        lookups = self.cache_hits + self.cache_misses
+        if lookups == 0:
+            return 0.0
+        return (self.cache_hits + self.coalesced) / lookups
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class TraceQLClient:
+    """
+    Pooled, caching TraceQL client for one Tempo instance.
+
+    Thread-safe. Prefer get_traceql_client() so all consumers of the same
+    Tempo URL share one instance (and therefore one pool and cache).
+
+    Errors are raised as httpx exceptions (httpx.RequestError for transport
+    failures, httpx.HTTPStatusError for non-2xx responses) and are never
+    cached; callers keep their own fallback behaviour.
+    """
+
+    def __init__(
+        self,
+        tempo_url: str,
+        timeout: float = HTTP_CLIENT_TIMEOUT_S,
+        cache_size: int = 256,
+        cache_ttl_s: float = 30.0,
+        time_bucket_s: int = 60,
+        max_connections: int = 10,
+    ):
+        """
+        Args:
+            tempo_url: Tempo HTTP API base URL
+            timeout: Default request timeout in seconds
+            cache_size: Maximum cached responses (LRU eviction beyond this)
+            cache_ttl_s: Maximum age of a cached response (0 disables caching)
+            time_bucket_s: Granularity that search windows are aligned to
+            max_connections: Connection pool size
+        """
+        self.tempo_url = tempo_url.rstrip("/")
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.cache_ttl_s = cache_ttl_s
+        self.time_bucket_s = max(1, int(time_bucket_s))
+        self.stats = TraceQLStats()
+
+        self._http = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple, tuple[Any, float]] = OrderedDict()
+        self._inflight: dict[tuple, Future] = {}
+
+    # -- public API --------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        since_seconds: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        retry_delay: float = DEFAULT_RETRY_DELAY_S,
+    ) -> dict:
+        """
+        Run a TraceQL search (GET /api/search) and return the JSON body.
+
+        Args:
+            query: TraceQL query
+            since_seconds: Search the last N seconds (None lets Tempo decide)
+            limit: Maximum traces to return
+            timeout: Per-request timeout override
+            max_retries: Retries for transient failures
+            retry_delay: Initial delay between retries (exponential backoff)
+        """
+        params: dict[str, Any] = {"q": normalize_traceql(query)}
+        if since_seconds is not None:
+            end = self._bucket_end(time.time())
+            params["start"] = end - int(since_seconds)
+            params["end"] = end
+        if limit is not None:
+            params["limit"] = int(limit)
+
+        key = ("search",) + tuple(sorted(params.items()))
+        return self._cached(
+            key,
+            lambda: self._get_json(
+                "/api/search", params, timeout, max_retries, retry_delay
+            ),
+        )
+
+    def get_trace(
+        self,
+        trace_id: str,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        retry_delay: float = DEFAULT_RETRY_DELAY_S,
+    ) -> dict:
+        """Fetch a full trace by ID (GET /api/traces/{id}) and return the JSON body."""
+        return self._cached(
+            ("trace", trace_id),
+            lambda: self._get_json(
+                f"/api/traces/{trace_id}", None, timeout, max_retries, retry_delay
+            ),
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self._http.close()
+
+    # -- internals ---------------------------------------------------------
+
+    def _bucket_end(self, now: float) -> int:
+        """Round ``now`` up to the next bucket boundary (epoch seconds)."""
+        return int(math.ceil(now / self.time_bucket_s) * self.time_bucket_s)
+
+    def _cached(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Serve from cache, join an identical in-flight request, or fetch.
+
+        The cache and coalesced callers share one snapshot of the response;
+        each caller receives a deep copy of it.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                snapshot, stored_at = entry
+                if time.monotonic() - stored_at < self.cache_ttl_s:
+                    self._cache.move_to_end(key)
+                    self.stats.cache_hits += 1
+                    return copy.deepcopy(snapshot)
+                del self._cache[key]
+
+            self.stats.cache_misses += 1
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.stats.coalesced += 1
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self.stats.errors += 1
+            future.set_exception(e)
+            raise
+
+        snapshot = copy.deepcopy(value)
+        with self._lock:
+            self._inflight.pop(key, None)
+            if self.cache_ttl_s > 0 and self.cache_size > 0:
+                self._cache[key] = (snapshot, time.monotonic())
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                    self.stats.evictions += 1
+        future.set_result(snapshot)
+        return value
+
+    def _get_json(
+        self,
+        path: str,
+        params: Optional[dict],
+        timeout: Optional[float],
+        max_retries: int,
+        retry_delay: float,
+    ) -> Any:
+        """GET with retries for timeouts, connect errors and retryable statuses."""
+        url = f"{self.tempo_url}{path}"
+        delay = retry_delay
+
+        for attempt in range(max_retries + 1):
+            with self._lock:
+                self.stats.requests += 1
+            try:
+                response = self._http.get(
+                    url,
+                    params=params,
+                    timeout=timeout if timeout is not None else self.timeout,
+                )
+            except (httpx.TimeoutException, httpx.ConnectError) as e:
+                if attempt >= max_retries:
+                    raise
+                logger.warning(
+                    f"Tempo request to {url} failed: {e}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1})"
+                )
+            else:
+                if (
+                    response.status_code not in RETRYABLE_HTTP_STATUS_CODES
+                    or attempt >= max_retries
+                ):
+                    response.raise_for_status()
+                    return response.json()
+                logger.warning(
+                    f"Tempo returned {response.status_code} for {url}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1})"
+                )
+            time.sleep(delay)
+            delay *= DEFAULT_RETRY_BACKOFF
+
+        raise RuntimeError("Unexpected retry loop exit")
+
+
+# =============================================================================
+# Shared clients
+# =============================================================================
+
+_clients: dict[str, TraceQLClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_traceql_client(tempo_url: str) -> TraceQLClient:
+    """Get the process-wide client for a Tempo URL, creating it on first use."""
+    base_url = tempo_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = TraceQLClient(base_url)
+            _clients[base_url] = client
+        return client
+
+
+def reset_traceql_clients() -> None:
+    """Close and forget all shared clients (mainly for tests)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -109,8 +109,11 @@ class StatusScreen(Screen):
         """Background worker to refresh service health status."""
         while self.auto_refresh_enabled:
             try:
-                # Get health status for all services
-                health_results = await self.health_checker.check_all()
+                # Get health status for all services; anything probed within
+                # the last interval (e.g. by `contextcore ops refresh`) is reused
+                health_results = await self.health_checker.check_all(
+                    max_age_s=self.refresh_interval
+                )
                 self.service_healths = health_results
                 self.last_update = datetime.datetime.now()
 
@@ -11,6 +11,15 @@ import aiohttp
 
 __all__ = ["ServiceHealth", "ServiceHealthChecker"]
 
+# HTTP services shown on the status screen (OTLP gRPC is checked over TCP)
+SERVICES = [
+    ("Grafana", "http://localhost:3000/api/health"),
+    ("Tempo", "http://localhost:3200/ready"),
+    ("Mimir", "http://localhost:9009/ready"),
+    ("Loki", "http://localhost:3100/ready"),
+    ("Alloy", "http://localhost:12345/ready"),
+]
+
 
 @dataclass
 class ServiceHealth:
@@ -118,57 +127,52 @@ class ServiceHealthChecker:
                 error=str(e)
             )
 
-    async def check_all(self) -> Dict[str, ServiceHealth]:
-        """Check health of all observability services concurrently."""
-        # Define service endpoints
-        services = [
-            ("Grafana", "http://localhost:3000/api/health"),
-            ("Tempo", "http://localhost:3200/ready"),
-            ("Mimir", "http://localhost:9009/ready"),
-            ("Loki", "http://localhost:3100/ready"),
-            ("Alloy", "http://localhost:12345/ready"),
-        ]
-
-        # Create HTTP check tasks
-        http_tasks = [
-            self.check_http(name, url) for name, url in services
-        ]
-
-        # Create TCP check task for OTLP gRPC
-        tcp_task = self.check_tcp("OTLP gRPC", "localhost", 4317)
-
-        # Execute all checks concurrently
-        try:
-            results = await asyncio.gather(*http_tasks, tcp_task, return_exceptions=True)
-
-            health_dict = {}
-            service_names = [name for name, _ in services] + ["OTLP gRPC"]
-
-            for i, result in enumerate(results):
-                service_name = service_names[i]
-                if isinstance(result, ServiceHealth):
-                    health_dict[service_name] = result
-                elif isinstance(result, Exception):
-                    health_dict[service_name] = ServiceHealth(
-                        name=service_name,
-                        healthy=False,
-                        response_time_ms=None,
-                        error=str(result)
-                    )
-                else:
-                    health_dict[service_name] = ServiceHealth(
-                        name=service_name,
-                        healthy=False,
-                        response_time_ms=None,
-                        error="Unknown error"
-                    )
+    async def check_all(self, max_age_s: Optional[float] = None) -> Dict[str, ServiceHealth]:
+        """
+        Check health of all observability services concurrently.
+
+        Reads the shared ops probe snapshot, so results published by
+        ``contextcore ops health`` or ``contextcore ops refresh`` within
+        ``max_age_s`` (default: the snapshot TTL) are shown without re-probing.
+        """
+        from contextcore.ops.probes import Probe, get_probe_engine
 
-            return health_dict
+        probes = {
+            name: Probe.http(url, timeout=self.timeout) for name, url in SERVICES
+        }
+        probes["OTLP gRPC"] = Probe.tcp("localhost", 4317, timeout=self.timeout)
 
+        try:
+            outcomes = await asyncio.to_thread(
+                get_probe_engine().run, probes.values(), max_age_s
+            )
         except Exception as e:
-            # Fallback if gather fails entirely
-            service_names = [name for name, _ in services] + ["OTLP gRPC"]
             return {
                 name: ServiceHealth(name=name, healthy=False, error=str(e))
-                for name in service_names
+                for name in probes
             }
+
+        health_dict = {}
+        for name, probe in probes.items():
+            outcome = outcomes[probe.key]
+            if outcome.ok:
+                error = None
+            elif outcome.status_code is not None:
+                error = f"HTTP {outcome.status_code}"
+            elif outcome.error_kind == "connect" or (
+                probe.kind == "tcp" and outcome.error_kind is None
+            ):
+                error = "Connection refused"
+            elif outcome.error_kind == "timeout":
+                error = "Timeout" if probe.kind == "http" else "Connection timeout"
+            else:
+                error = outcome.error or "Unknown error"
+            health_dict[name] = ServiceHealth(
+                name=name,
+                healthy=outcome.ok,
+                response_time_ms=(
+                    int(outcome.latency_ms) if outcome.latency_ms is not None else None
+                ),
+                error=error,
+            )
+        return health_dict
@@ -0,0 +1,131 @@
+"""
+Persistent cache of file checksums.
+
+Verifying an export re-hashes the same source, manifest and context files
+on every run. FileChecksumCache remembers each file's SHA-256 keyed by
+(path, size, mtime_ns, inode) and only streams a file through the hasher
+when that key changes. Entries are persisted as JSON so repeated CLI
+invocations reuse them.
+
+Two hashing modes are supported:
+
+- ``binary``: the raw bytes (same as ``provenance.get_file_checksum``)
+- ``text``: UTF-8 text with universal newlines, streamed in chunks (same
+  result as ``sha256(path.read_text(encoding="utf-8").encode("utf-8"))``
+  without loading the whole file)
+
+Files modified within the last ``RACY_WINDOW_S`` seconds are hashed but
+not cached: a second write in the same mtime tick with the same size
+would otherwise go unnoticed.
+
+Usage:
+    from contextcore.utils.file_checksums import get_checksum_cache
+
+    cache = get_checksum_cache()
+    digest = cache.sha256(Path("out/artifact-manifest.yaml"), text=True)
+    cache.save()
+
+Configuration:
+    CONTEXTCORE_CHECKSUM_CACHE: "0" disables persistence (in-memory only)
+    CONTEXTCORE_CHECKSUM_CACHE_PATH: cache file location
+        (default ~/.contextcore/cache/file-checksums.json)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from contextcore.utils.persisted_cache import PersistedJSONCache, cache_path, is_racy
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FileChecksumCache", "get_checksum_cache"]
+
+CHUNK_SIZE = 1 << 16
+
+
+class FileChecksumCache(PersistedJSONCache):
+    """Thread-safe SHA-256 cache keyed by file identity and modification state."""
+
+    FORMAT = 1
+    DESCRIPTION = "checksum cache"
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 10_000):
+        """
+        Args:
+            path: JSON file to persist entries to (None keeps them in memory)
+            max_entries: Oldest entries are dropped beyond this many
+        """
+        super().__init__(path, max_entries)
+
+    def sha256(self, path: Path, text: bool = False) -> Optional[str]:
+        """
+        Checksum of ``path``, or None if it is missing or unreadable.
+
+        Raises:
+            UnicodeDecodeError: In text mode, if the file is not valid UTF-8
+        """
+        try:
+            resolved = path.resolve()
+            st = resolved.stat()
+        except OSError:
+            return None
+        if not resolved.is_file():
+            return None
+
+        key = f"{'t' if text else 'b'}:{resolved}"
+        # [size, mtime_ns, inode, sha256]
+        signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+        entry = self._get(key)
+        if entry is not None and entry[:3] == signature:
+            self.hits += 1
+            return entry[3]
+        self.misses += 1
+
+        try:
+            digest = _hash_text(resolved) if text else _hash_binary(resolved)
+        except OSError as e:
+            logger.debug(f"Could not hash {resolved}: {e}")
+            return None
+
+        if not is_racy(st.st_mtime_ns):
+            self._put(key, signature + [digest])
+        return digest
+
+    def _valid_entry(self, entry: Any) -> bool:
+        return isinstance(entry, list) and len(entry) == 4
+
+
+def _hash_binary(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _hash_text(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, encoding="utf-8") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), ""):
+            hasher.update(chunk.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+_default_cache: Optional[FileChecksumCache] = None
+_default_lock = threading.Lock()
+
+
+def get_checksum_cache() -> FileChecksumCache:
+    """Process-wide cache, persisted unless CONTEXTCORE_CHECKSUM_CACHE=0."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = FileChecksumCache(
+                cache_path("CONTEXTCORE_CHECKSUM_CACHE", "file-checksums.json")
+            )
+        return _default_cache
@@ -0,0 +1,174 @@
+"""
+Shared plumbing for the on-disk caches under ``~/.contextcore/cache``.
+
+Several CLI paths keep state between invocations: file checksums, weaver
+registry summaries, status section snapshots, probe outcomes and the
+insight index. They share the same conventions, implemented once here:
+
+- ``cache_path``: a ``CONTEXTCORE_<NAME>=0`` switch that keeps the cache
+  in memory only, and a ``CONTEXTCORE_<NAME>_PATH`` override of the default
+  location
+- ``write_atomic``: write to a per-process, per-thread temporary file and
+  ``os.replace`` it, so concurrent readers never see a partial file
+- ``is_racy``: files modified within ``RACY_WINDOW_S`` seconds must not be
+  trusted by size and mtime, since a second write in the same mtime tick
+  with the same size would go unnoticed
+- ``PersistedJSONCache``: a thread-safe, size-bounded ``key -> entry`` map
+  saved as one versioned JSON document
+
+Usage:
+    from contextcore.utils.persisted_cache import PersistedJSONCache, cache_path
+
+    class SummaryCache(PersistedJSONCache):
+        FORMAT = 1
+        DESCRIPTION = "summary cache"
+
+    cache = SummaryCache(cache_path("CONTEXTCORE_SUMMARY_CACHE", "summaries.json"))
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CACHE_DIR",
+    "RACY_WINDOW_S",
+    "PersistedJSONCache",
+    "cache_path",
+    "env_float",
+    "is_racy",
+    "read_json",
+    "write_atomic",
+]
+
+CACHE_DIR = Path.home() / ".contextcore" / "cache"
+RACY_WINDOW_S = 2.0
+
+
+def cache_path(env_var: str, default_name: str) -> Optional[Path]:
+    """
+    Location of a persisted cache, or None if it is disabled.
+
+    ``env_var`` set to "0", "false" or "no" disables persistence;
+    ``<env_var>_PATH`` overrides the default ``CACHE_DIR / default_name``.
+    """
+    if os.environ.get(env_var, "1").lower() in ("0", "false", "no"):
+        return None
+    override = os.environ.get(f"{env_var}_PATH")
+    return Path(override) if override else CACHE_DIR / default_name
+
+
+def env_float(env_var: str, default: float) -> float:
+    """Float setting from the environment; unset or malformed gives ``default``."""
+    try:
+        return float(os.environ.get(env_var, default))
+    except ValueError:
+        return default
+
+
+def is_racy(mtime_ns: int, now: Optional[float] = None) -> bool:
+    """True if a file with this mtime may still change without its stat changing."""
+    now = time.time() if now is None else now
+    return now - mtime_ns / 1e9 <= RACY_WINDOW_S
+
+
+def read_json(path: Path) -> Any:
+    """Parsed contents of ``path``, or None if it is missing or not valid JSON."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """
+    Replace ``path`` with ``text`` without exposing a partial file.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+class PersistedJSONCache:
+    """
+    Thread-safe, size-bounded ``key -> entry`` map persisted as one JSON file.
+
+    Subclasses set ``FORMAT`` (bump it when the entry shape changes, which
+    orphans older files) and ``DESCRIPTION`` (used in log messages), and
+    override ``_valid_entry`` to drop malformed entries on load.
+    """
+
+    FORMAT = 1
+    DESCRIPTION = "cache"
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 1_000):
+        """
+        Args:
+            path: JSON file to persist entries to (None keeps them in memory)
+            max_entries: Oldest entries are dropped beyond this many
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = {}
+        self._dirty = False
+        if path is not None:
+            self._entries = self._read(path)
+
+    def save(self) -> None:
+        """Persist entries if anything changed since the last save."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({"format": self.FORMAT, "entries": self._entries})
+            self._dirty = False
+        try:
+            write_atomic(self.path, payload)
+        except OSError as e:
+            logger.debug(f"Could not write {self.DESCRIPTION} {self.path}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            return self._entries.get(key)
+
+    def _put(self, key: str, entry: Any) -> None:
+        """Store ``entry`` as the newest one, evicting the oldest beyond ``max_entries``."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+
+    def _valid_entry(self, entry: Any) -> bool:
+        return True
+
+    def _read(self, path: Path) -> Dict[str, Any]:
+        data = read_json(path)
+        if not isinstance(data, dict) or data.get("format") != self.FORMAT:
+            return {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {k: v for k, v in entries.items() if self._valid_entry(v)}
@@ -0,0 +1,149 @@
+"""
+Cached in-process access to ProjectContext custom resources.
+
+CLI commands such as ``contextcore review pr`` used to spawn ``kubectl get
+projectcontext`` for every lookup, paying for a process start, kubeconfig
+parsing and API discovery each time. ProjectContextClient loads the cluster
+configuration once, keeps one pooled API client, and caches fetched
+resources (and not-found results) for ``ttl_s`` seconds.
+
+Like ``kubectl``, lookups prefer the newest served CRD version and fall back
+to older ones when a cluster only has the v1 CRD installed.
+
+Usage:
+    from contextcore.utils.project_context_client import get_project_context_client
+
+    pc = get_project_context_client().get("checkout-service", "commerce")
+    spec = pc.get("spec", {}) if pc else None
+
+Configuration:
+    CONTEXTCORE_KUBE_CACHE_TTL: seconds to reuse a fetched resource (default 30)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from contextcore.utils.persisted_cache import env_float
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ProjectContextClient", "get_project_context_client"]
+
+DEFAULT_TTL_S = 30.0
+
+
+class ProjectContextClient:
+    """Thread-safe, TTL-cached reader for ProjectContext resources."""
+
+    CRD_GROUP = "contextcore.io"
+    CRD_VERSIONS = ("v2", "v1")
+    CRD_PLURAL = "projectcontexts"
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        kubeconfig: Optional[str] = None,
+        api: Any = None,
+    ):
+        """
+        Args:
+            ttl_s: Seconds a fetched resource (or a not-found result) is reused
+            kubeconfig: Kubeconfig file (default: in-cluster, then ~/.kube/config)
+            api: Pre-built CustomObjectsApi (skips loading configuration)
+        """
+        self.ttl_s = ttl_s
+        self.kubeconfig = kubeconfig
+        self.hits = 0
+        self.misses = 0
+        self._api = api
+        self._api_error: Optional[str] = None
+        self._lock = threading.Lock()
+        # (namespace, name) -> (fetched_at, resource or None)
+        self._entries: Dict[Tuple[str, str], Tuple[float, Optional[dict]]] = {}
+
+    def get(self, name: str, namespace: str = "default") -> Optional[dict]:
+        """The ProjectContext resource, or None if it is missing or unreachable."""
+        key = (namespace, name)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_s:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        api = self._custom_api()
+        if api is None:
+            return None
+
+        resource: Optional[dict] = None
+        for version in self.CRD_VERSIONS:
+            try:
+                resource = api.get_namespaced_custom_object(
+                    group=self.CRD_GROUP,
+                    version=version,
+                    namespace=namespace,
+                    plural=self.CRD_PLURAL,
+                    name=name,
+                )
+                break
+            except Exception as e:
+                # ApiException: 404 means this CRD version is not served
+                # (or the object does not exist); anything else is an error
+                if getattr(e, "status", None) != 404:
+                    logger.debug(f"Failed to get ProjectContext {namespace}/{name}: {e}")
+                    return None
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), resource)
+        return resource
+
+    def invalidate(self, name: Optional[str] = None, namespace: str = "default") -> None:
+        """Drop one cached resource, or all of them if ``name`` is None."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((namespace, name), None)
+
+    def _custom_api(self) -> Any:
+        """CustomObjectsApi built from cluster configuration on first use."""
+        with self._lock:
+            if self._api is not None or self._api_error is not None:
+                return self._api
+            try:
+                from kubernetes import client, config
+
+                configuration = client.Configuration()
+                if self.kubeconfig:
+                    config.load_kube_config(
+                        config_file=self.kubeconfig, client_configuration=configuration
+                    )
+                else:
+                    try:
+                        config.load_incluster_config(client_configuration=configuration)
+                    except config.ConfigException:
+                        config.load_kube_config(client_configuration=configuration)
+                self._api = client.CustomObjectsApi(client.ApiClient(configuration))
+            except Exception as e:
+                self._api_error = str(e)
+                logger.debug(f"Kubernetes configuration unavailable: {e}")
+            return self._api
+
+
+_default_client: Optional[ProjectContextClient] = None
+_default_lock = threading.Lock()
+
+
+def get_project_context_client() -> ProjectContextClient:
+    """Process-wide client; CONTEXTCORE_KUBE_CACHE_TTL sets the cache TTL."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = ProjectContextClient(
+                ttl_s=env_float("CONTEXTCORE_KUBE_CACHE_TTL", DEFAULT_TTL_S)
+            )
+        return _default_client
@@ -0,0 +1,77 @@
+"""
+Compiled matcher for sets of fnmatch-style scope patterns.
+
+Guidance constraints and review risks attach glob scopes (``src/api/*``,
+``*.py``) to rules. Checking many paths with ``fnmatch.fnmatch`` against
+every scope re-translates each glob on every call and costs one regex
+evaluation per (path, scope) pair. ScopeMatcher translates every pattern
+once and folds them into a single regex of optional lookaheads, so one
+``match()`` call reports every pattern a path satisfies.
+
+Matching semantics are exactly those of ``fnmatch.fnmatch`` (including
+``os.path.normcase`` on both path and pattern).
+
+Usage:
+    matcher = ScopeMatcher(["src/api/*", "*.py", "docs/*"])
+    matcher.match("src/api/checkout.py")        # [0, 1]
+    matcher.match_many(["a.py", "docs/x.md"])   # {"a.py": [1], "docs/x.md": [2]}
+    matcher.paths_by_pattern(files)             # [[...], [...], [...]]
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from typing import Iterable
+
+__all__ = ["ScopeMatcher"]
+
+
+class ScopeMatcher:
+    """Resolve paths against a fixed set of glob patterns in one regex pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: tuple[str, ...] = tuple(patterns)
+        translated = [
+            fnmatch.translate(os.path.normcase(p)) for p in self.patterns
+        ]
+        # Each pattern becomes an optional, capturing lookahead anchored at the
+        # start of the path; the overall match always succeeds and group i is
+        # set exactly when pattern i matches.
+        self._combined = re.compile(
+            "".join(f"(?:(?=({t})))?" for t in translated)
+        )
+        self._any = re.compile("|".join(f"(?:{t})" for t in translated)) if translated else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match(self, path: str) -> list[int]:
+        """Indices of the patterns that match ``path``, in pattern order."""
+        if self._any is None:
+            return []
+        m = self._combined.match(os.path.normcase(path))
+        return [i for i, group in enumerate(m.groups()) if group is not None]
+
+    def matches_any(self, path: str) -> bool:
+        """Whether at least one pattern matches ``path``."""
+        return self._any is not None and self._any.match(os.path.normcase(path)) is not None
+
+    def match_many(self, paths: Iterable[str]) -> dict[str, list[int]]:
+        """Map each distinct path to the indices of the patterns it matches."""
+        results: dict[str, list[int]] = {}
+        for path in paths:
+            if path not in results:
+                results[path] = self.match(path) if self.matches_any(path) else []
+        return results
+
+    def paths_by_pattern(self, paths: Iterable[str]) -> list[list[str]]:
+        """For each pattern, the paths (in input order) that match it."""
+        buckets: list[list[str]] = [[] for _ in self.patterns]
+        for path in paths:
+            if not self.matches_any(path):
+                continue
+            for i in self.match(path):
+                buckets[i].append(path)
+        return buckets
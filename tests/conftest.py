@@ -25,6 +25,15 @@ def test_env() -> Dict[str, str]:
         "CONTEXTCORE_OWNER": "test-team",
         "CONTEXTCORE_DESIGN_DOC": "https://docs.test/design",
         "CONTEXTCORE_NAMESPACE": "test-namespace",
+        # Keep on-disk caches and snapshots from writing to the user's home
+        "CONTEXTCORE_MANIFEST_CACHE": "0",
+        "CONTEXTCORE_CHECKSUM_CACHE": "0",
+        "CONTEXTCORE_DETECTION_CACHE_TTL": "0",
+        "CONTEXTCORE_INSIGHT_INDEX": "0",
+        "CONTEXTCORE_OPENAPI_CACHE": "0",
+        "CONTEXTCORE_PROBE_SNAPSHOT": "0",
+        "CONTEXTCORE_STATUS_CACHE": "0",
+        "CONTEXTCORE_WEAVER_CACHE": "0",
     }
 
 
@@ -45,6 +54,16 @@ def set_test_env(test_env: Dict[str, str]) -> Generator[None, None, None]:
             os.environ[key] = value
 
 
+@pytest.fixture(autouse=True)
+def reset_detection_memo() -> Generator[None, None, None]:
+    """Forget pod annotations memoized by ProjectContextDetector."""
+    from contextcore.detector import clear_detection_cache
+
+    clear_detection_cache()
+    yield
+    clear_detection_cache()
+
+
 # ============================================================================
 # Model Fixtures
 # ============================================================================
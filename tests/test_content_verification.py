@@ -7,13 +7,18 @@ and protocol coherence checks.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
 
 from contextcore.contracts.a2a.models import GateOutcome
 from contextcore.contracts.a2a.content_verification import (
+    _PLACEHOLDER_PATTERNS,
+    _SOURCE_EXTENSIONS,
     ContentVerifier,
+    _iter_source_files,
+    _scan_files_for_placeholders,
     scan_placeholders,
     verify_schema_fields,
     verify_import_consistency,
@@ -128,6 +133,86 @@ class TestPlaceholderScan:
         )
         assert result.result == GateOutcome.PASS
 
+    def test_exclude_dirs_pruned(self, tmp_path: Path):
+        src = tmp_path / "src"
+        (src / "vendor").mkdir(parents=True)
+        (src / "vendor" / "lib.py").write_text("# TODO: upstream\n")
+        (src / "main.py").write_text("print('ok')\n")
+
+        result = scan_placeholders(
+            gate_id="test-placeholders",
+            task_id="T-001",
+            source_dir=str(src),
+            exclude_dirs=["vendor"],
+        )
+        assert result.result == GateOutcome.PASS
+
+
+def _line_by_line_hits(source_dir: Path, extra: list[str]) -> list[tuple[str, int, str]]:
+    """Reference scan: every pattern against every line of every file."""
+    patterns = list(_PLACEHOLDER_PATTERNS) + [re.compile(p, re.IGNORECASE) for p in extra]
+    hits = []
+    for fpath in sorted(p for p in source_dir.rglob("*") if p.is_file() and p.suffix in _SOURCE_EXTENSIONS):
+        lines = fpath.read_text(encoding="utf-8", errors="replace").splitlines()
+        rel = str(fpath.relative_to(source_dir))
+        for lineno, line in enumerate(lines, start=1):
+            for pat in patterns:
+                match = pat.search(line)
+                if match:
+                    hits.append((rel, lineno, match.group()))
+    return hits
+
+
+def _scanner_hits(source_dir: Path, extra: list[str], workers: int) -> list[tuple[str, int, str]]:
+    files = _iter_source_files(source_dir)
+    compiled = [re.compile(p, re.IGNORECASE) for p in extra]
+    hits = []
+    scanned = _scan_files_for_placeholders(files, compiled, workers)
+    for fpath, found in zip(files, scanned, strict=True):
+        rel = str(fpath.relative_to(source_dir))
+        hits.extend((rel, lineno, text) for lineno, text in found or [])
+    return hits
+
+
+class TestPlaceholderScanEquivalence:
+    """The single-pass scanner reports exactly what a line-by-line scan does."""
+
+    SAMPLE = (
+        "# TODO: one\r\n"
+        "x = 'REPLACE_WITH_KEY'  # fixme: two on one line\n"
+        "xxx is lowercase, XXX is not\x0b"
+        "PLACEHOLDER\u2028INSERT_HERE\x1c"
+        "todo:FIXME:\r"
+        "TODO without colon\n"
+        "start CHANGEME end\n"
+        "é TODO: after non-ascii\n"
+    )
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        src = tmp_path / "src"
+        for i in range(80):
+            d = src / f"pkg{i % 7}" / ("sub" if i % 3 else "")
+            d.mkdir(parents=True, exist_ok=True)
+            body = self.SAMPLE if i % 4 else "clean = True\n"
+            (d / f"m{i}.py").write_text(body * (1 + i % 3), newline="")
+        (src / "notes.txt").write_text("TODO: not a source file\n")
+        (src / "b.go").write_bytes(b"// TODO: \xff\xfe invalid utf-8\n")
+        return src
+
+    @pytest.mark.parametrize("extra", [[], [r"^start", r"end$", r"CHANGEME"]])
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_identical_findings(self, tree: Path, extra: list[str], workers: int):
+        expected = _line_by_line_hits(tree, extra)
+        assert expected
+        assert _scanner_hits(tree, extra, workers) == expected
+
+    def test_file_order_matches_rglob(self, tree: Path):
+        expected = sorted(
+            p for p in tree.rglob("*") if p.is_file() and p.suffix in _SOURCE_EXTENSIONS
+        )
+        assert _iter_source_files(tree) == expected
+
 
 # ===========================================================================
 # Tests — Schema field verification
@@ -0,0 +1,185 @@
+"""
+Tests for OpenAPI drift probing, run against a local stub HTTP server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from contextcore.integrations.contract_drift import (
+    ContractDriftDetector,
+    DriftReport,
+    EndpointProber,
+    EndpointSpec,
+)
+
+
+class StubService:
+    """HTTP/1.1 keep-alive server with per-path status codes and latency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.statuses: dict[str, int] = {}
+        self.redirects: dict[str, str] = {}
+        self.requests: list[tuple[str, str, float]] = []
+        self.connections: set = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                with lock:
+                    stub.requests.append((self.command, self.path, time.monotonic()))
+                    stub.connections.add(self.client_address)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                time.sleep(stub.delay)
+                with lock:
+                    stub.in_flight -= 1
+                body = b"{}"
+                if self.path in stub.redirects:
+                    self.send_response(301)
+                    self.send_header("Location", stub.redirects[self.path])
+                else:
+                    self.send_response(stub.statuses.get(self.path, 200))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_DELETE = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda *args: None  # Clients hang up at the deadline
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def service():
+    stub = StubService()
+    yield stub
+    stub.close()
+
+
+def _endpoints(n: int, method: str = "GET") -> list[EndpointSpec]:
+    return [
+        EndpointSpec(
+            path=f"/items/{i}",
+            method=method,
+            operation_id=None,
+            request_content_type=None,
+            response_content_type=None,
+            response_schema=None,
+            parameters=[],
+        )
+        for i in range(n)
+    ]
+
+
+def _write_spec(tmp_path, n: int):
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {f"/items/{i}": {"get": {"operationId": f"get{i}"}} for i in range(n)},
+    }
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(spec))
+    return path
+
+
+class TestEndpointProber:
+    def test_bounded_concurrency_and_order(self, service):
+        service.delay = 0.05
+        endpoints = _endpoints(24)
+
+        results = EndpointProber(max_concurrency=4, per_host_rps=None).probe(service.url, endpoints)
+
+        assert [r.endpoint for r in results] == endpoints
+        assert all(r.status == 200 for r in results)
+        assert 1 < service.max_in_flight <= 4
+
+    def test_connections_reused(self, service):
+        EndpointProber(max_concurrency=2, per_host_rps=None).probe(service.url, _endpoints(20))
+        assert len(service.requests) == 20
+        assert len(service.connections) <= 2
+
+    def test_per_host_rate_limit(self, service):
+        EndpointProber(max_concurrency=8, per_host_rps=50).probe(service.url, _endpoints(6))
+
+        starts = sorted(t for _, _, t in service.requests)
+        assert starts[-1] - starts[0] >= 5 * 0.02 * 0.9
+
+    def test_deadline_skips_remaining(self, service):
+        service.delay = 0.2
+        start = time.monotonic()
+
+        results = EndpointProber(
+            max_concurrency=1, per_host_rps=None, deadline_s=0.3
+        ).probe(service.url, _endpoints(10))
+
+        assert time.monotonic() - start < 1.5
+        assert any(r.skipped for r in results)
+        assert results[0].status == 200
+
+    def test_redirects_are_followed(self, service):
+        service.redirects["/items/0"] = "/items/moved"
+        service.statuses["/items/moved"] = 404
+
+        [result] = EndpointProber(per_host_rps=None).probe(service.url, _endpoints(1))
+
+        assert result.status == 404
+        assert [path for _, path, _ in service.requests] == ["/items/0", "/items/moved"]
+
+    def test_methods_and_errors(self, service):
+        service.statuses["/items/1"] = 404
+        results = EndpointProber(per_host_rps=None).probe(service.url, _endpoints(2, "DELETE"))
+
+        assert [m for m, _, _ in service.requests] == ["DELETE", "DELETE"]
+        assert [r.status for r in results] == [200, 404]
+
+        unreachable = EndpointProber(timeout=1).probe("http://127.0.0.1:1", _endpoints(1))
+        assert unreachable[0].error
+
+
+class TestOpenAPIDrift:
+    def test_issues_in_spec_order(self, service, tmp_path):
+        service.statuses["/items/2"] = 500
+        service.statuses["/items/5"] = 404
+        spec = _write_spec(tmp_path, 8)
+
+        report = DriftReport(scope="openapi")
+        ContractDriftDetector(per_host_rps=None)._detect_openapi_drift(report, str(spec), service.url)
+
+        assert report.schemas_checked == 8
+        assert [(i.location, i.issue_type, i.actual) for i in report.issues] == [
+            ("GET /items/2", "endpoint_error", "HTTP 500"),
+            ("GET /items/5", "endpoint_error", "HTTP 404"),
+        ]
+
+    def test_skipped_endpoints_reported(self, service, tmp_path):
+        service.delay = 0.2
+        spec = _write_spec(tmp_path, 6)
+
+        report = DriftReport(scope="openapi")
+        ContractDriftDetector(
+            max_concurrency=1, per_host_rps=None, deadline_s=0.1
+        )._detect_openapi_drift(report, str(spec), service.url)
+
+        assert {i.issue_type for i in report.issues} == {"probe_skipped"}
+        assert all(i.severity == "warning" for i in report.issues)
+
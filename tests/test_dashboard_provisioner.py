@@ -0,0 +1,238 @@
+"""
+Tests for dashboard provisioning, run against a fake Grafana API.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from contextcore.dashboards import provisioner as provisioner_module
+from contextcore.dashboards.discovery import DashboardConfig as DiscoveryConfig
+from contextcore.dashboards.provisioner import (
+    DashboardProvisioner,
+    dashboard_content_hash,
+)
+
+
+class FakeGrafana:
+    """Enough of the Grafana folder and dashboard API to provision against."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.folders: dict[str, dict] = {}
+        self.dashboards: dict[str, dict] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._next_id = 1
+        lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length", 0))
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _handle(self):
+                with lock:
+                    fake.requests.append((self.command, self.path))
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    time.sleep(fake.delay)
+                    with lock:
+                        status, body = fake.route(self.command, self.path, self._body())
+                finally:
+                    with lock:
+                        fake.in_flight -= 1
+                self._reply(status, body)
+
+            do_GET = do_POST = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda *args: None
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def route(self, method, path, body):
+        if path == "/api/folders" and method == "GET":
+            return 200, list(self.folders.values())
+        if path == "/api/folders" and method == "POST":
+            if body["uid"] in self.folders:
+                return 409, {"message": "folder exists"}
+            folder = {"id": self._new_id(), "uid": body["uid"], "title": body["title"]}
+            self.folders[body["uid"]] = folder
+            return 200, folder
+        match = re.fullmatch(r"/api/folders/([^/]+)", path)
+        if match:
+            folder = self.folders.get(match.group(1))
+            return (200, folder) if folder else (404, {"message": "not found"})
+        match = re.fullmatch(r"/api/dashboards/uid/([^/]+)", path)
+        if match:
+            stored = self.dashboards.get(match.group(1))
+            return (200, stored) if stored else (404, {"message": "not found"})
+        if path == "/api/dashboards/db" and method == "POST":
+            dashboard = dict(body["dashboard"])
+            previous = self.dashboards.get(dashboard["uid"])
+            dashboard["id"] = previous["dashboard"]["id"] if previous else self._new_id()
+            dashboard["version"] = previous["dashboard"]["version"] + 1 if previous else 1
+            self.dashboards[dashboard["uid"]] = {
+                "dashboard": dashboard,
+                "meta": {"folderId": body["folderId"]},
+            }
+            return 200, {"status": "success", "url": f"/d/{dashboard['uid']}"}
+        return 404, {"message": "not found"}
+
+    def count(self, method, path):
+        return sum(1 for m, p in self.requests if m == method and p == path)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def grafana():
+    fake = FakeGrafana()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def dashboards(tmp_path, monkeypatch):
+    """Six discovered dashboards backed by files in tmp_path."""
+    configs = []
+    for i in range(6):
+        path = tmp_path / f"dash-{i}.json"
+        path.write_text(json.dumps({
+            "uid": f"dash-{i}",
+            "title": f"Dashboard {i}",
+            "panels": [{"type": "stat", "title": f"Panel {i}"}],
+        }))
+        configs.append(DiscoveryConfig(
+            uid=f"dash-{i}",
+            title=f"Dashboard {i}",
+            extension="core" if i % 2 else "squirrel",
+            file_path=path,
+        ))
+    monkeypatch.setattr(
+        provisioner_module, "discover_all_dashboards", lambda extension=None: configs
+    )
+    return configs
+
+
+def _provisioner(grafana):
+    return DashboardProvisioner(grafana_url=grafana.url, username="admin", password="admin")
+
+
+class TestProvisionAll:
+    def test_first_run_posts_every_dashboard(self, grafana, dashboards):
+        results = _provisioner(grafana).provision_all()
+
+        assert [name for name, _, _ in results] == [c.title for c in dashboards]
+        assert all(ok for _, ok, _ in results)
+        assert grafana.count("POST", "/api/dashboards/db") == 6
+        assert grafana.count("POST", "/api/folders") == 2
+        assert grafana.count("GET", "/api/folders") <= 3
+
+    def test_rerun_skips_unchanged_dashboards(self, grafana, dashboards):
+        provisioner = _provisioner(grafana)
+        provisioner.provision_all()
+        grafana.requests.clear()
+
+        results = provisioner.provision_all()
+
+        assert all(ok and msg.startswith("Unchanged") for _, ok, msg in results)
+        assert grafana.count("POST", "/api/dashboards/db") == 0
+        assert grafana.count("GET", "/api/folders") == 1
+        assert not any(p.startswith("/api/folders/") for _, p in grafana.requests)
+
+    def test_only_changed_dashboard_is_reposted(self, grafana, dashboards):
+        provisioner = _provisioner(grafana)
+        provisioner.provision_all()
+        changed = json.loads(dashboards[2].file_path.read_text())
+        changed["panels"].append({"type": "graph"})
+        dashboards[2].file_path.write_text(json.dumps(changed))
+        grafana.requests.clear()
+
+        results = provisioner.provision_all()
+
+        assert grafana.count("POST", "/api/dashboards/db") == 1
+        assert results[2][2].startswith("Provisioned")
+        assert grafana.dashboards["dash-2"]["dashboard"]["version"] == 2
+
+    def test_force_reposts_everything(self, grafana, dashboards):
+        provisioner = _provisioner(grafana)
+        provisioner.provision_all()
+        grafana.requests.clear()
+
+        provisioner.provision_all(force=True)
+
+        assert grafana.count("POST", "/api/dashboards/db") == 6
+
+    def test_moved_folder_is_reposted(self, grafana, dashboards):
+        provisioner = _provisioner(grafana)
+        provisioner.provision_all()
+        grafana.dashboards["dash-0"]["meta"]["folderId"] = 999
+        grafana.requests.clear()
+
+        provisioner.provision_all()
+
+        assert grafana.count("POST", "/api/dashboards/db") == 1
+
+    def test_runs_concurrently(self, dashboards):
+        slow = FakeGrafana(delay=0.05)
+        try:
+            _provisioner(slow).provision_all(max_workers=6)
+        finally:
+            slow.close()
+        assert slow.max_in_flight > 1
+
+    def test_unreachable_grafana(self, dashboards, monkeypatch):
+        monkeypatch.setattr(provisioner_module.time_module, "sleep", lambda s: None)
+        provisioner = DashboardProvisioner(grafana_url="http://127.0.0.1:9")
+
+        results = provisioner.provision_all()
+
+        assert len(results) == 6
+        assert all(not ok and "Cannot connect" in msg for _, ok, msg in results)
+
+    def test_dry_run_makes_no_requests(self, grafana, dashboards):
+        results = _provisioner(grafana).provision_all(dry_run=True)
+        assert all(ok for _, ok, _ in results)
+        assert grafana.requests == []
+
+
+class TestContentHash:
+    def test_ignores_grafana_assigned_fields(self):
+        local = {"uid": "a", "title": "A", "panels": []}
+        deployed = {"uid": "a", "title": "A", "panels": [], "id": 42, "version": 7}
+        assert dashboard_content_hash(local) == dashboard_content_hash(deployed)
+
+    def test_key_order_independent(self):
+        assert dashboard_content_hash({"a": 1, "b": 2}) == dashboard_content_hash({"b": 2, "a": 1})
+
+    def test_detects_content_change(self):
+        assert dashboard_content_hash({"title": "A"}) != dashboard_content_hash({"title": "B"})
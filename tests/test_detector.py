@@ -11,6 +11,7 @@ from contextcore.detector import (
     ANNOTATION_PREFIX,
     ANNOTATION_TO_ATTRIBUTE,
     ProjectContextDetector,
+    clear_detection_cache,
     get_project_context,
 )
 
@@ -138,3 +139,81 @@ class TestK8sDetection:
         attrs = dict(resource.attributes)
         # Should have env-based values
         assert attrs.get("project.id") == "test-project"
+
+
+class TestDetectionCache:
+    """Test memoized pod annotation lookup."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CONTEXTCORE_PODINFO_DIR", str(tmp_path / "podinfo"))
+        monkeypatch.setenv("CONTEXTCORE_DETECTION_CACHE_PATH", str(tmp_path / "cache.json"))
+        monkeypatch.setenv("CONTEXTCORE_DETECTION_CACHE_TTL", "3600")
+        monkeypatch.setenv("POD_UID", "uid-1")
+        return tmp_path
+
+    def _detector(self, annotations):
+        detector = ProjectContextDetector(pod_name="test-pod", namespace="test-namespace")
+        reader = MagicMock(return_value=annotations)
+        detector._read_pod_annotations = reader
+        return detector, reader
+
+    def test_api_read_once_per_process(self):
+        detector, reader = self._detector({"contextcore.io/project": "k8s-project"})
+
+        assert detector._detect_from_k8s()["project.id"] == "k8s-project"
+        assert detector._detect_from_k8s()["project.id"] == "k8s-project"
+        assert reader.call_count == 1
+
+    def test_failed_lookup_is_not_retried_in_process(self):
+        detector, reader = self._detector(None)
+
+        assert detector._detect_from_k8s() == {}
+        assert detector._detect_from_k8s() == {}
+        assert reader.call_count == 1
+
+    def test_disk_cache_survives_process_memo(self):
+        detector, _ = self._detector({"contextcore.io/owner": "team-a"})
+        detector._detect_from_k8s()
+        clear_detection_cache()  # simulate a new process
+
+        fresh, reader = self._detector({"contextcore.io/owner": "changed"})
+        assert fresh._detect_from_k8s()["business.owner"] == "team-a"
+        reader.assert_not_called()
+
+    def test_disk_cache_ttl_and_uid(self, monkeypatch):
+        detector, _ = self._detector({"contextcore.io/owner": "team-a"})
+        detector._detect_from_k8s()
+        clear_detection_cache()
+
+        monkeypatch.setenv("POD_UID", "uid-2")  # recreated pod
+        fresh, reader = self._detector({"contextcore.io/owner": "team-b"})
+        assert fresh._detect_from_k8s()["business.owner"] == "team-b"
+
+        clear_detection_cache()
+        monkeypatch.setenv("CONTEXTCORE_DETECTION_CACHE_TTL", "0")
+        fresh, reader = self._detector({"contextcore.io/owner": "team-c"})
+        assert fresh._detect_from_k8s()["business.owner"] == "team-c"
+
+    def test_disk_cache_switch(self, isolated_cache, monkeypatch):
+        monkeypatch.setenv("CONTEXTCORE_DETECTION_CACHE", "0")
+        detector, _ = self._detector({"contextcore.io/owner": "team-a"})
+        detector._detect_from_k8s()
+
+        assert not (isolated_cache / "cache.json").exists()
+
+    def test_downward_api_file_skips_api(self, isolated_cache):
+        podinfo = isolated_cache / "podinfo"
+        podinfo.mkdir()
+        (podinfo / "annotations").write_text(
+            'contextcore.io/project="downward"\n'
+            'contextcore.io/design-doc="https://docs.test/a b"\n'
+            'kubernetes.io/psp="restricted"\n'
+        )
+        detector, reader = self._detector({"contextcore.io/project": "api"})
+
+        attrs = detector._detect_from_k8s()
+
+        assert attrs["project.id"] == "downward"
+        assert attrs["design.doc"] == "https://docs.test/a b"
+        reader.assert_not_called()
@@ -0,0 +1,53 @@
+"""
+Tests for risk-based PR review guidance.
+"""
+
+import fnmatch
+
+from contextcore.integrations.github_review import PRReviewAnalyzer, ReviewPriority
+
+SPEC = {
+    "project_id": "checkout",
+    "business": {"criticality": "critical"},
+    "risks": [
+        {"type": "security", "priority": "P1", "scope": "src/auth/*", "description": "Auth"},
+        {"type": "data-integrity", "priority": "P3", "scope": "*migration*", "description": "DB"},
+        {"type": "availability", "priority": "P2", "scope": "deploy/*.yaml", "description": "Ops"},
+        {"type": "financial", "priority": "P1", "scope": None},
+        {"type": "unknown", "priority": "P1", "scope": "*"},
+    ],
+}
+
+
+class TestAnalyze:
+    def test_focus_areas_follow_matching_scopes(self):
+        files = ["src/auth/login.py", "db/0001_migration.sql", "README.md"]
+
+        guidance = PRReviewAnalyzer().analyze("42", files, SPEC)
+
+        assert [f.area for f in guidance.focus_areas] == ["Security", "Data integrity"]
+        assert guidance.overall_priority == ReviewPriority.CRITICAL
+        assert guidance.warnings == ["This change affects a critical criticality business service"]
+        assert "Database migration is reversible" in guidance.auto_checklist
+        assert "Code follows PEP 8 style guidelines" in guidance.auto_checklist
+        assert "ESLint rules followed" not in guidance.auto_checklist
+
+    def test_matches_fnmatch_on_many_files(self):
+        files = [f"pkg{i}/mod{j}.py" for i in range(50) for j in range(20)]
+        files += ["deploy/app.yaml", "src/auth/token.ts"]
+
+        guidance = PRReviewAnalyzer().analyze("7", files, SPEC)
+
+        expected = [
+            r["type"] for r in SPEC["risks"]
+            if r["scope"] and r["type"] in PRReviewAnalyzer.RISK_CHECKLISTS
+            and any(fnmatch.fnmatch(f, r["scope"]) for f in files)
+        ]
+        assert [f.area.lower().replace(" ", "-") for f in guidance.focus_areas] == expected
+        assert "ESLint rules followed" in guidance.auto_checklist
+        assert "Configuration changes reviewed and validated" in guidance.auto_checklist
+
+    def test_no_risks(self):
+        guidance = PRReviewAnalyzer().analyze("1", ["a.txt"], {"name": "x"})
+        assert guidance.focus_areas == []
+        assert guidance.project_id == "x"
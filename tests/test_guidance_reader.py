@@ -0,0 +1,164 @@
+"""Tests for GuidanceReader caching, the resourceVersion watch and file reloads."""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from contextcore.agent import guidance
+from contextcore.agent.guidance import GuidanceReader
+
+
+def _context(version, *rules):
+    return {
+        "metadata": {"name": "checkout", "resourceVersion": version},
+        "spec": {"agentGuidance": {"constraints": [
+            {"id": f"c{i}", "rule": rule, "scope": "src/**"} for i, rule in enumerate(rules)
+        ]}},
+    }
+
+
+def _rules(reader):
+    return [c.rule for c in reader.get_guidance().constraints]
+
+
+class ApiException(Exception):
+    """Shape of kubernetes.client.ApiException."""
+
+    def __init__(self, status=None, reason=None):
+        super().__init__(f"({status}) {reason}")
+        self.status = status
+        self.reason = reason
+
+
+class FakeCustomObjectsApi:
+    def __init__(self, context):
+        self.context = context
+        self.gets = 0
+
+    def get_namespaced_custom_object(self, **kwargs):
+        self.gets += 1
+        return self.context
+
+    def list_namespaced_custom_object(self, **kwargs):
+        raise AssertionError("only called through the fake watch")
+
+
+class FakeWatch:
+    """Replays one scripted stream per ``stream()`` call; stops the reader after the last."""
+
+    scripts: list = []
+    calls: list = []
+    reader: GuidanceReader | None = None
+
+    def stream(self, func, **kwargs):
+        FakeWatch.calls.append(kwargs)
+        script = FakeWatch.scripts.pop(0)
+        if not FakeWatch.scripts:
+            FakeWatch.reader._watch_stop.set()
+        for item in script:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeCustomObjectsApi(_context("1", "no new deps"))
+    # Stand-ins for the kubernetes modules guidance uses, so the tests do not
+    # depend on (or trigger lazy imports in) the real client package
+    monkeypatch.setattr(guidance, "config", SimpleNamespace(load_incluster_config=lambda: None))
+    monkeypatch.setattr(
+        guidance, "client",
+        SimpleNamespace(CustomObjectsApi=lambda: fake, ApiException=ApiException),
+    )
+    monkeypatch.setattr(guidance, "k8s_watch", SimpleNamespace(Watch=FakeWatch))
+    FakeWatch.scripts, FakeWatch.calls = [], []
+    return fake
+
+
+@pytest.fixture
+def reader(api):
+    reader = GuidanceReader(project_id="checkout")
+    FakeWatch.reader = reader
+    return reader
+
+
+class TestWatchEvents:
+    def test_modified_event_replaces_cache_without_api_read(self, api, reader):
+        assert _rules(reader) == ["no new deps"]
+
+        reader._handle_watch_event({"type": "MODIFIED", "object": _context("2", "keep API stable")})
+
+        assert _rules(reader) == ["keep API stable"]
+        assert reader.get_constraints_for_path("src/app.py")[0].rule == "keep API stable"
+        assert api.gets == 1
+
+    def test_same_version_keeps_parsed_guidance(self, reader):
+        first = reader.get_guidance()
+        reader._handle_watch_event({"type": "MODIFIED", "object": _context("1", "no new deps")})
+        assert reader.get_guidance() is first
+
+    def test_deleted_event_drops_cache(self, api, reader):
+        reader.get_guidance()
+        reader._handle_watch_event({"type": "DELETED", "object": _context("2")})
+
+        api.context = _context("3", "recreated")
+        assert _rules(reader) == ["recreated"]
+        assert api.gets == 2
+
+    def test_without_watch_reads_once_until_refresh(self, api, reader):
+        reader.get_guidance()
+        api.context = _context("2", "changed")
+
+        assert _rules(reader) == ["no new deps"]
+        assert [c.rule for c in reader.get_guidance(refresh=True).constraints] == ["changed"]
+
+
+class TestWatchLoop:
+    def test_resumes_from_last_version_and_resyncs_after_gone(self, reader):
+        reader.get_guidance()
+        FakeWatch.scripts = [
+            [ApiException(status=410, reason="Gone")],
+            [{"type": "ADDED", "object": _context("7", "after resync")}],
+        ]
+
+        reader._watch_loop()
+
+        assert [c["resource_version"] for c in FakeWatch.calls] == ["1", None]
+        assert FakeWatch.calls[0]["field_selector"] == "metadata.name=checkout"
+        assert _rules(reader) == ["after resync"]
+
+    def test_background_watch_refreshes_cache(self, api, reader):
+        FakeWatch.scripts = [[{"type": "MODIFIED", "object": _context("4", "from watch")}]]
+        reader.start_watch()
+        reader._watch_thread.join(5)
+
+        assert _rules(reader) == ["from watch"]
+        assert api.gets == 0
+        reader.stop_watch()
+
+
+class TestContextFile:
+    def _write(self, path, version, rule, mtime_ns):
+        import yaml
+
+        path.write_text(yaml.safe_dump(_context(version, rule)))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_reloads_only_when_file_changes(self, tmp_path):
+        path = tmp_path / "projectcontext.yaml"
+        self._write(path, "1", "no new deps", 1_000_000_000_000_000_000)
+        reader = GuidanceReader(project_id="checkout", context_path=str(path))
+
+        first = reader.get_guidance()
+        assert reader.get_guidance() is first
+
+        # Same size, newer mtime
+        self._write(path, "2", "no new libs", 1_000_000_005_000_000_000)
+        assert _rules(reader) == ["no new libs"]
@@ -0,0 +1,154 @@
+"""
+Tests for the insight ID -> trace index and InsightQuerier.get().
+"""
+
+import json
+
+import pytest
+
+from contextcore.agent import insights as insights_module
+from contextcore.agent.insight_index import InsightIndex, InsightIndexEntry
+from contextcore.agent.insights import InsightQuerier
+
+
+def _trace(insight_id, project_id="proj-1"):
+    attrs = {"insight.id": insight_id, "insight.type": "decision", "project.id": project_id}
+    return {
+        "batches": [{
+            "scopeSpans": [{
+                "spans": [{
+                    "attributes": [
+                        {"key": k, "value": {"stringValue": v}} for k, v in attrs.items()
+                    ]
+                }]
+            }]
+        }]
+    }
+
+
+class FakeTempo:
+    """Records calls; every trace holds the insight ``ins-<trace_id>``."""
+
+    def __init__(self, search_traces=None):
+        self.calls = []
+        self.search_traces = search_traces or []
+
+    def get_trace(self, trace_id, **kwargs):
+        self.calls.append(("get_trace", trace_id))
+        return _trace(f"ins-{trace_id}")
+
+    def search(self, query, **kwargs):
+        self.calls.append(("search", query, kwargs.get("limit")))
+        return {"traces": [{"traceID": t} for t in self.search_traces]}
+
+
+@pytest.fixture
+def fake_tempo(monkeypatch):
+    tempo = FakeTempo()
+    monkeypatch.setattr(insights_module, "get_traceql_client", lambda url: tempo)
+    return tempo
+
+
+class TestInsightIndex:
+    def test_record_and_lookup(self, tmp_path):
+        index = InsightIndex(tmp_path / "index.jsonl")
+        index.record("ins-1", "trace-1", "proj-1")
+
+        assert index.lookup("ins-1") == InsightIndexEntry("trace-1", "proj-1")
+        assert index.lookup("ins-2") is None
+
+    def test_shared_between_instances(self, tmp_path):
+        path = tmp_path / "index.jsonl"
+        first, second = InsightIndex(path), InsightIndex(path)
+
+        first.record("ins-1", "trace-1")
+        assert second.lookup("ins-1").trace_id == "trace-1"
+        second.record("ins-2", "trace-2")
+        assert first.lookup("ins-2").trace_id == "trace-2"
+
+    def test_partial_line_ignored_until_complete(self, tmp_path):
+        path = tmp_path / "index.jsonl"
+        path.write_text('{"id": "ins-1", "trace_id": "t')
+        index = InsightIndex(path)
+        assert index.lookup("ins-1") is None
+
+        with open(path, "a") as fh:
+            fh.write('race-1"}\n')
+        assert index.lookup("ins-1").trace_id == "trace-1"
+
+    def test_compaction_keeps_newest(self, tmp_path):
+        path = tmp_path / "index.jsonl"
+        index = InsightIndex(path, max_entries=5)
+        for i in range(20):
+            index.record(f"ins-{i}", f"trace-{i}")
+
+        lines = path.read_text().splitlines()
+        assert len(lines) <= 10
+        assert json.loads(lines[-1])["id"] == "ins-19"
+        assert InsightIndex(path).lookup("ins-19").trace_id == "trace-19"
+        assert InsightIndex(path).lookup("ins-0") is None
+
+    def test_in_memory(self):
+        index = InsightIndex(max_entries=2)
+        for i in range(3):
+            index.record(f"ins-{i}", f"trace-{i}")
+        assert len(index) == 2
+        assert index.lookup("ins-0") is None
+
+
+class TestQuerierGet:
+    def test_indexed_lookup_fetches_one_trace(self, fake_tempo):
+        index = InsightIndex()
+        index.record("ins-abc", "abc", "proj-1")
+        querier = InsightQuerier(insight_index=index)
+
+        insight = querier.get("ins-abc")
+
+        assert insight.id == "ins-abc"
+        assert insight.trace_id == "abc"
+        assert fake_tempo.calls == [("get_trace", "abc")]
+
+    def test_unindexed_id_uses_targeted_search(self, fake_tempo):
+        fake_tempo.search_traces = ["xyz"]
+        index = InsightIndex()
+        querier = InsightQuerier(insight_index=index)
+
+        insight = querier.get("ins-xyz", project_id="proj-1")
+
+        assert insight.id == "ins-xyz"
+        assert fake_tempo.calls[0] == ("search", '{ span.insight.id = "ins-xyz" }', 1)
+        assert index.lookup("ins-xyz") == InsightIndexEntry("xyz", "proj-1")
+
+    def test_search_escapes_insight_id(self, fake_tempo):
+        querier = InsightQuerier(insight_index=InsightIndex())
+
+        assert querier.get('x" || span.insight.id != "') is None
+        assert fake_tempo.calls[0][1] == r'{ span.insight.id = "x\" || span.insight.id != \"" }'
+
+    def test_other_project_not_returned(self, fake_tempo):
+        index = InsightIndex()
+        index.record("ins-abc", "abc", "proj-1")
+        querier = InsightQuerier(insight_index=index)
+
+        assert querier.get("ins-abc", project_id="proj-2") is None
+
+    def test_missing_insight(self, fake_tempo):
+        querier = InsightQuerier(insight_index=InsightIndex())
+        assert querier.get("ins-missing") is None
+
+    def test_local_storage_fallback(self, tmp_path):
+        (tmp_path / "proj-1_insights.json").write_text(json.dumps([{
+            "id": "ins-local",
+            "type": "lesson",
+            "summary": "Mock the token endpoint",
+            "project_id": "proj-1",
+            "timestamp": "2026-01-01T00:00:00+00:00",
+        }]))
+        querier = InsightQuerier(
+            tempo_url=None,
+            local_storage_path=str(tmp_path),
+            insight_index=InsightIndex(),
+        )
+
+        assert querier.get("ins-local", project_id="proj-1").summary == "Mock the token endpoint"
+        assert querier.get("ins-other", project_id="proj-1") is None
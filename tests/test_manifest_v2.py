@@ -33,6 +33,8 @@ from contextcore.models.manifest_v2 import (
     TacticV2,
 )
 from contextcore.models.manifest_loader import (
+    clear_manifest_cache,
+    load_manifest_raw,
     detect_manifest_version,
     load_manifest,
     load_manifest_from_dict,
@@ -1146,3 +1148,109 @@ def test_enrichment_key_result_operator_window_export() -> None:
     assert kr.operator == "gte"
     assert kr.window == "30d"
     assert kr.baseline == 99.5
+
+
+# =============================================================================
+# Manifest snapshot cache
+# =============================================================================
+
+
+@pytest.fixture
+def v2_manifest_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONTEXTCORE_MANIFEST_CACHE", "1")
+    monkeypatch.setenv("CONTEXTCORE_MANIFEST_CACHE_DIR", str(tmp_path / "cache"))
+    clear_manifest_cache()
+    path = tmp_path / ".contextcore.yaml"
+    path.write_text(yaml.safe_dump({
+        "apiVersion": "contextcore.io/v1alpha2",
+        "kind": "ContextManifest",
+        "metadata": {"name": "cached"},
+        "spec": _make_spec("cached", "Cached"),
+    }))
+    yield path
+    clear_manifest_cache()
+
+
+def _count_yaml_parses(monkeypatch) -> list:
+    calls = []
+    real = yaml.safe_load
+
+    def counting(stream):
+        calls.append(stream)
+        return real(stream)
+
+    monkeypatch.setattr(yaml, "safe_load", counting)
+    return calls
+
+
+def test_snapshot_cache_reuses_validated_manifest(v2_manifest_file, monkeypatch) -> None:
+    """Repeated loads of an unchanged file parse and validate once."""
+    parses = _count_yaml_parses(monkeypatch)
+
+    first = load_manifest(v2_manifest_file)
+    assert load_manifest_v2(v2_manifest_file) is first
+    assert load_manifest_raw(v2_manifest_file)["metadata"]["name"] == "cached"
+    assert len(parses) == 1
+
+
+def test_snapshot_cache_sees_edits(v2_manifest_file) -> None:
+    """A changed file is re-read; a touched but identical file is not."""
+    import os
+
+    first = load_manifest(v2_manifest_file)
+    stat = v2_manifest_file.stat()
+    os.utime(v2_manifest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_manifest(v2_manifest_file) is first
+
+    data = yaml.safe_load(v2_manifest_file.read_text())
+    data["metadata"]["name"] = "edited"
+    v2_manifest_file.write_text(yaml.safe_dump(data))
+    assert load_manifest(v2_manifest_file).metadata.name == "edited"
+
+
+def test_snapshot_persisted_across_processes(v2_manifest_file, monkeypatch) -> None:
+    """A new process loads the persisted snapshot without YAML or validation."""
+    first = load_manifest(v2_manifest_file)
+    clear_manifest_cache()  # simulate a new process
+
+    monkeypatch.setattr(yaml, "safe_load", lambda _: pytest.fail("YAML re-parsed"))
+    monkeypatch.setattr(
+        ContextManifestV2, "__init__", lambda *a, **k: pytest.fail("model re-validated")
+    )
+    second = load_manifest(v2_manifest_file)
+
+    assert second is not first
+    assert second.model_dump() == first.model_dump()
+
+
+def test_snapshot_persisted_as_json(v2_manifest_file) -> None:
+    """Persisted snapshots are plain JSON; unreadable ones are ignored."""
+    import json
+
+    load_manifest(v2_manifest_file)
+    (persisted,) = (v2_manifest_file.parent / "cache").glob("*.json")
+    assert json.loads(persisted.read_text())["version"] == "v2"
+
+    persisted.write_bytes(b"\x80\x04not json")
+    clear_manifest_cache()
+    assert load_manifest(v2_manifest_file).metadata.name == "cached"
+
+
+def test_snapshot_not_persisted_when_raw_data_is_not_json(v2_manifest_file) -> None:
+    """YAML dates would not survive a JSON round trip, so only memory caches them."""
+    import datetime
+
+    v2_manifest_file.write_text(
+        v2_manifest_file.read_text() + "x-reviewed: 2026-01-01\n"
+    )
+    load_manifest(v2_manifest_file)
+    assert not list((v2_manifest_file.parent / "cache").glob("*.json"))
+
+    clear_manifest_cache()
+    assert load_manifest_raw(v2_manifest_file)["x-reviewed"] == datetime.date(2026, 1, 1)
+
+
+def test_load_manifest_raw_returns_copy(v2_manifest_file) -> None:
+    """Callers may mutate the raw data without affecting the cache."""
+    load_manifest_raw(v2_manifest_file)["metadata"]["name"] = "mutated"
+    assert load_manifest_raw(v2_manifest_file)["metadata"]["name"] == "cached"
@@ -0,0 +1,205 @@
+"""
+Tests for the shared OpenAPI parser: ref resolution, endpoint index and caching.
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from contextcore.integrations import contract_drift, openapi_parser
+from contextcore.integrations.openapi_parser import (
+    OpenAPISpec,
+    clear_parse_cache,
+    load_openapi,
+    parse_openapi,
+)
+
+
+def _spec(n: int = 3) -> dict:
+    return {
+        "openapi": "3.0.0",
+        "paths": {
+            f"/items/{i}": {
+                "parameters": [],
+                "get": {
+                    "operationId": f"get{i}",
+                    "responses": {
+                        "200": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ItemAlias"}
+                                }
+                            }
+                        }
+                    },
+                },
+            }
+            for i in range(n)
+        },
+        "components": {
+            "schemas": {
+                "Item": {"type": "object", "properties": {"id": {"type": "string"}}},
+                "ItemAlias": {"$ref": "#/components/schemas/Item"},
+                "A": {"$ref": "#/components/schemas/B"},
+                "B": {"$ref": "#/components/schemas/A"},
+                "a/b": {"type": "string"},
+            }
+        },
+    }
+
+
+def _write(path, spec):
+    path.write_text(json.dumps(spec))
+    # Age the file past the racy window so it is eligible for persistence.
+    os.utime(path, (1_700_000_000, 1_700_000_000))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_parse_cache()
+    yield
+    clear_parse_cache()
+
+
+@pytest.fixture
+def persistent_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("CONTEXTCORE_OPENAPI_CACHE", "1")
+    monkeypatch.setenv("CONTEXTCORE_OPENAPI_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+class TestOpenAPISpec:
+    def test_ref_chains_resolved_and_memoized(self, monkeypatch):
+        spec = OpenAPISpec(_spec())
+        item = spec.resolve_ref("#/components/schemas/ItemAlias")
+        assert item["type"] == "object"
+
+        monkeypatch.setattr(spec, "_walk", lambda ref: pytest.fail("pointer re-walked"))
+        assert spec.resolve_ref("#/components/schemas/ItemAlias") is item
+        assert spec.resolve_ref("#/components/schemas/Item") is item
+
+    def test_cycles_and_bad_refs_resolve_empty(self):
+        spec = OpenAPISpec(_spec())
+        assert spec.resolve_ref("#/components/schemas/A") == {}
+        assert spec.resolve_ref("#/components/schemas/Missing") == {}
+        assert spec.resolve_ref("other.yaml#/Item") == {}
+        assert spec.resolve_ref("#/components/schemas/a~1b") == {"type": "string"}
+
+    def test_shared_components_walked_once(self, monkeypatch):
+        spec = OpenAPISpec(_spec(50))
+        walks = []
+        real_walk = spec._walk
+        monkeypatch.setattr(spec, "_walk", lambda ref: walks.append(ref) or real_walk(ref))
+
+        endpoints = spec.endpoints
+
+        assert len(endpoints) == 50
+        assert all(e.response_schema["type"] == "object" for e in endpoints)
+        assert len(walks) == 2
+
+    def test_endpoint_index(self):
+        spec = OpenAPISpec(_spec())
+        assert spec.get_endpoint("get", "/items/1").operation_id == "get1"
+        assert spec.get_endpoint("POST", "/items/1") is None
+
+
+class TestParseOpenAPI:
+    def test_yaml_and_json_agree(self, tmp_path):
+        yaml = pytest.importorskip("yaml")
+        json_path = _write(tmp_path / "spec.json", _spec())
+        yaml_path = tmp_path / "spec.yaml"
+        yaml_path.write_text(yaml.safe_dump(_spec()))
+
+        assert parse_openapi(str(json_path)) == parse_openapi(str(yaml_path))
+
+    def test_missing_file_raises_value_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            parse_openapi(str(tmp_path / "missing.yaml"))
+
+    def test_contract_drift_uses_shared_parser(self):
+        assert contract_drift.parse_openapi is parse_openapi
+        assert contract_drift.EndpointSpec is openapi_parser.EndpointSpec
+
+    def test_identical_content_parsed_once(self, tmp_path, monkeypatch):
+        first = parse_openapi(str(_write(tmp_path / "a.json", _spec())))
+        monkeypatch.setattr(OpenAPISpec, "_build_endpoints", lambda self: pytest.fail("re-parsed"))
+
+        second = parse_openapi(str(_write(tmp_path / "b.json", _spec())))
+        assert second == first
+        assert second is not first
+
+
+class TestPersistentCache:
+    def test_reused_across_processes_until_mtime_changes(self, tmp_path, persistent_cache, monkeypatch):
+        path = _write(tmp_path / "spec.json", _spec())
+        first = parse_openapi(str(path))
+        assert list(persistent_cache.glob("*.json"))
+
+        clear_parse_cache()  # Simulates a new process
+        with monkeypatch.context() as m:
+            m.setattr(openapi_parser, "_fetch", lambda *a, **k: pytest.fail("file re-read"))
+            assert parse_openapi(str(path)) == first
+
+        _write(path, _spec(5))
+        os.utime(path, (1_700_000_100, 1_700_000_100))
+        assert len(parse_openapi(str(path))) == 5
+
+    def test_recently_modified_file_not_persisted(self, tmp_path, persistent_cache):
+        path = tmp_path / "spec.json"
+        path.write_text(json.dumps(_spec()))
+        parse_openapi(str(path))
+        assert not list(persistent_cache.glob("*.json"))
+
+    def test_persisted_as_json_and_corrupt_entries_ignored(self, tmp_path, persistent_cache):
+        path = _write(tmp_path / "spec.json", _spec())
+        first = parse_openapi(str(path))
+        (entry,) = persistent_cache.glob("*.json")
+        assert json.loads(entry.read_text())["endpoints"][0]["operation_id"] == "get0"
+
+        entry.write_bytes(b"\x80\x04not json")
+        clear_parse_cache()
+        assert parse_openapi(str(path)) == first
+
+    def test_url_revalidated_by_etag(self, persistent_cache):
+        body = json.dumps(_spec()).encode()
+        seen = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                seen.append(self.headers.get("If-None-Match"))
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/openapi"
+        try:
+            first = parse_openapi(url)
+            clear_parse_cache()
+            assert parse_openapi(url) == first
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert seen == [None, '"v1"']
+
+
+def test_load_openapi(tmp_path):
+    spec = load_openapi(str(_write(tmp_path / "spec.json", _spec())))
+    assert spec.get_endpoint("GET", "/items/2").response_schema["type"] == "object"
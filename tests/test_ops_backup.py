@@ -0,0 +1,323 @@
+"""
+Tests for incremental, content-addressed backups, run against a fake Grafana API.
+"""
+
+import importlib
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from contextcore.ops.backup import (
+    BLOB_DIR_NAME,
+    BackupManifest,
+    backup,
+    find_backup,
+    list_backups,
+    prune_blobs,
+    restore,
+)
+
+# contextcore.ops re-exports the backup() function under the module's name
+backup_module = importlib.import_module("contextcore.ops.backup")
+
+
+class FakeGrafana:
+    """Search, dashboard and datasource endpoints backed by dicts."""
+
+    def __init__(self, versions_in_search: bool = True, delay: float = 0.0):
+        self.versions_in_search = versions_in_search
+        self.delay = delay
+        self.dashboards: dict[str, dict] = {}
+        self.datasources = [{"name": "Tempo", "type": "tempo"}]
+        self.requests: list[tuple[str, str]] = []
+        self.imported: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with lock:
+                    fake.requests.append((self.command, self.path))
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    time.sleep(fake.delay)
+                    with lock:
+                        status, reply = fake.route(self.command, self.path, body)
+                finally:
+                    with lock:
+                        fake.in_flight -= 1
+                data = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda *args: None
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def save(self, uid, panels):
+        version = self.dashboards[uid]["version"] + 1 if uid in self.dashboards else 1
+        self.dashboards[uid] = {"uid": uid, "title": uid.title(), "panels": panels, "version": version}
+
+    def route(self, method, path, body):
+        if path == "/api/search?type=dash-db":
+            hits = []
+            for uid, d in self.dashboards.items():
+                hit = {"uid": uid, "title": d["title"], "type": "dash-db"}
+                if self.versions_in_search:
+                    hit["version"] = d["version"]
+                hits.append(hit)
+            return 200, hits
+        match = re.fullmatch(r"/api/dashboards/uid/([^/]+)", path)
+        if match and match.group(1) in self.dashboards:
+            d = self.dashboards[match.group(1)]
+            return 200, {
+                "dashboard": d,
+                "meta": {"version": d["version"], "folderUid": "cc", "folderTitle": "ContextCore",
+                         "updated": time.time()},
+            }
+        if path == "/api/datasources":
+            return 200, self.datasources
+        if path == "/api/dashboards/db" and method == "POST":
+            self.imported.append(body["dashboard"])
+            return 200, {"status": "success"}
+        return 404, {"message": "not found"}
+
+    def fetches(self):
+        return [p for m, p in self.requests if p.startswith("/api/dashboards/uid/")]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class Clock:
+    """Stands in for backup_module.datetime so each backup gets its own directory."""
+
+    def __init__(self):
+        self.now_value = datetime(2026, 1, 17, 14, 30, tzinfo=timezone.utc)
+
+    def advance(self, **kwargs):
+        self.now_value += timedelta(**kwargs)
+
+    def now(self, tz=None):
+        return self.now_value if tz else self.now_value.replace(tzinfo=None)
+
+    fromisoformat = staticmethod(datetime.fromisoformat)
+
+
+@pytest.fixture
+def grafana():
+    fake = FakeGrafana()
+    for i in range(10):
+        fake.save(f"dash-{i}", [{"title": f"panel {i}"}])
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(backup_module, "datetime", clock)
+    return clock
+
+
+def _backup(tmp_path, grafana, **kwargs):
+    return backup(tmp_path, grafana.url, ("admin", "admin"), **kwargs)
+
+
+def _blob_count(tmp_path):
+    return len(list((tmp_path / BLOB_DIR_NAME).glob("*/*.json")))
+
+
+class TestIncrementalBackup:
+    def test_first_backup_stores_every_dashboard(self, tmp_path, grafana, clock):
+        result = _backup(tmp_path, grafana)
+
+        assert result.success, result.errors
+        assert result.manifest.dashboards_count == 10
+        assert result.manifest.datasources_count == 1
+        assert result.manifest.dashboards_reused == 0
+        assert len(grafana.fetches()) == 10
+        assert _blob_count(tmp_path) == 11  # 10 dashboards + datasources
+        assert not (result.path / "dashboards").exists()
+
+    def test_second_backup_fetches_only_changed(self, tmp_path, grafana, clock):
+        first = _backup(tmp_path, grafana)
+        grafana.save("dash-3", [{"title": "edited"}])
+        grafana.requests.clear()
+        clock.advance(days=1)
+
+        second = _backup(tmp_path, grafana)
+
+        assert grafana.fetches() == ["/api/dashboards/uid/dash-3"]
+        assert second.manifest.dashboards_reused == 9
+        assert second.manifest.parent == first.path.name
+        assert _blob_count(tmp_path) == 12
+        assert (
+            second.manifest.dashboards["dash-0"]["blob"]
+            == first.manifest.dashboards["dash-0"]["blob"]
+        )
+
+    def test_without_search_versions_content_is_deduplicated(self, tmp_path, clock):
+        grafana = FakeGrafana(versions_in_search=False)
+        try:
+            for i in range(5):
+                grafana.save(f"dash-{i}", [])
+            _backup(tmp_path, grafana)
+            clock.advance(hours=1)
+            _backup(tmp_path, grafana)
+        finally:
+            grafana.close()
+        assert len(grafana.fetches()) == 10
+        assert _blob_count(tmp_path) == 6
+
+    def test_failed_fetch_keeps_previous_entry_as_stale(self, tmp_path, grafana, clock, monkeypatch):
+        first = _backup(tmp_path, grafana)
+        grafana.save("dash-3", [{"title": "edited"}])
+        route = grafana.route
+
+        def failing(method, path, body):
+            if path == "/api/dashboards/uid/dash-3":
+                return 500, {"message": "boom"}
+            return route(method, path, body)
+
+        monkeypatch.setattr(grafana, "route", failing)
+        clock.advance(days=1)
+        second = _backup(tmp_path, grafana)
+
+        entry = second.manifest.dashboards["dash-3"]
+        assert entry["stale"] is True
+        assert entry["blob"] == first.manifest.dashboards["dash-3"]["blob"]
+        assert second.manifest.dashboards_count == 10
+        assert any("dash-3" in e for e in second.errors)
+
+        monkeypatch.setattr(grafana, "route", route)
+        clock.advance(days=1)
+        third = _backup(tmp_path, grafana)
+        assert "stale" not in third.manifest.dashboards["dash-3"]
+
+    def test_full_backup_refetches(self, tmp_path, grafana, clock):
+        _backup(tmp_path, grafana)
+        grafana.requests.clear()
+        clock.advance(hours=1)
+
+        result = _backup(tmp_path, grafana, incremental=False)
+
+        assert len(grafana.fetches()) == 10
+        assert result.manifest.parent is None
+
+    def test_fetches_run_concurrently(self, tmp_path, clock):
+        grafana = FakeGrafana(delay=0.05)
+        try:
+            for i in range(8):
+                grafana.save(f"dash-{i}", [])
+            _backup(tmp_path, grafana, max_workers=8)
+        finally:
+            grafana.close()
+        assert grafana.max_in_flight > 1
+
+    def test_manifest_round_trip(self, tmp_path, grafana, clock):
+        result = _backup(tmp_path, grafana)
+        [(path, manifest)] = list_backups(tmp_path)
+        assert path == result.path
+        assert manifest == result.manifest
+
+    def test_legacy_manifest_still_reads(self):
+        manifest = BackupManifest.from_dict({"created_at": "x", "dashboards_count": 3})
+        assert not manifest.content_addressed
+        assert "dashboards" not in manifest.to_dict()
+
+
+class TestPointInTimeRestore:
+    def test_restores_dashboards_as_of_backup(self, tmp_path, grafana, clock):
+        first = _backup(tmp_path, grafana)
+        grafana.save("dash-0", [{"title": "changed"}])
+        clock.advance(days=1)
+        _backup(tmp_path, grafana)
+
+        success, messages = restore(first.path, grafana.url, ("admin", "admin"))
+
+        assert success, messages
+        assert messages[0] == "Imported 10 dashboard(s)"
+        restored = {d["uid"]: d for d in grafana.imported}
+        assert restored["dash-0"]["panels"] == [{"title": "panel 0"}]
+
+    def test_find_backup(self, tmp_path, grafana, clock):
+        first = _backup(tmp_path, grafana)
+        clock.advance(days=1)
+        second = _backup(tmp_path, grafana)
+        start = datetime(2026, 1, 17, 14, 30, tzinfo=timezone.utc)
+
+        assert find_backup(start + timedelta(hours=1), tmp_path) == first.path
+        assert find_backup(start + timedelta(days=2), tmp_path) == second.path
+        assert find_backup(start - timedelta(minutes=1), tmp_path) is None
+
+    def test_legacy_full_copy_backup_restores(self, tmp_path, grafana):
+        legacy = tmp_path / "20250101-000000"
+        (legacy / "dashboards").mkdir(parents=True)
+        (legacy / "dashboards" / "old.json").write_text(
+            json.dumps({"dashboard": {"uid": "old", "title": "Old"}})
+        )
+        (legacy / "manifest.json").write_text(json.dumps({"created_at": "2025-01-01T00:00:00+00:00"}))
+
+        success, messages = restore(legacy, grafana.url, ("admin", "admin"))
+
+        assert success, messages
+        assert [d["uid"] for d in grafana.imported] == ["old"]
+
+    def test_missing_blob_reported(self, tmp_path, grafana, clock):
+        result = _backup(tmp_path, grafana)
+        blob = result.manifest.dashboards["dash-1"]["blob"]
+        (tmp_path / BLOB_DIR_NAME / blob[:2] / f"{blob}.json").unlink()
+
+        success, messages = restore(result.path, grafana.url, ("admin", "admin"))
+
+        assert not success
+        assert "Missing backup data for dashboard dash-1" in messages
+
+
+class TestPruneBlobs:
+    def test_prunes_unreferenced_blobs(self, tmp_path, grafana, clock):
+        first = _backup(tmp_path, grafana)
+        grafana.save("dash-0", [{"title": "changed"}])
+        clock.advance(days=1)
+        _backup(tmp_path, grafana)
+        assert _blob_count(tmp_path) == 12
+
+        (first.path / "manifest.json").unlink()
+        first.path.rmdir()
+
+        assert prune_blobs(tmp_path) == 1
+        assert _blob_count(tmp_path) == 11
+
+    def test_unreadable_manifest_prunes_nothing(self, tmp_path, grafana, clock):
+        _backup(tmp_path, grafana)
+        broken = tmp_path / "broken"
+        broken.mkdir()
+        (broken / "manifest.json").write_text("{oops")
+        (tmp_path / BLOB_DIR_NAME / "ff").mkdir()
+        (tmp_path / BLOB_DIR_NAME / "ff" / f"{'f' * 64}.json").write_text("{}")
+
+        assert prune_blobs(tmp_path) == 0
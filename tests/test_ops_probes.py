@@ -0,0 +1,206 @@
+"""
+Tests for the shared ops probe engine and the checks built on it.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from contextcore.ops import probes as probes_module
+from contextcore.ops.health import HealthStatus, health_check
+from contextcore.ops.probes import Probe, ProbeEngine, ProbeRefresher
+
+
+class StubService:
+    """HTTP server with per-path status codes, JSON bodies and latency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.statuses: dict[str, int] = {}
+        self.bodies: dict[str, object] = {}
+        self.hits: list[str] = []
+        lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with lock:
+                    stub.hits.append(self.path)
+                time.sleep(stub.delay)
+                body = json.dumps(stub.bodies.get(self.path, {})).encode()
+                self.send_response(stub.statuses.get(self.path, 200))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda *args: None
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    service = StubService()
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def closed_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Shared engine publishing to a temporary snapshot."""
+    engine = ProbeEngine(tmp_path / "ops-probes.json", ttl_s=60)
+    monkeypatch.setattr(probes_module, "_default_engine", engine)
+    yield engine
+    engine.close()
+
+
+class TestProbeEngine:
+    def test_probes_run_concurrently(self, tmp_path):
+        slow = StubService(delay=0.3)
+        try:
+            engine = ProbeEngine(tmp_path / "snap.json", max_workers=8)
+            probes = [Probe.http(f"{slow.url}/ready/{i}") for i in range(6)]
+            start = time.monotonic()
+            outcomes = engine.run(probes)
+            elapsed = time.monotonic() - start
+            engine.close()
+        finally:
+            slow.close()
+        assert all(outcomes[p.key].status_code == 200 for p in probes)
+        assert elapsed < 1.2
+
+    def test_outcome_kinds(self, stub, closed_port, tmp_path):
+        stub.statuses["/down"] = 503
+        engine = ProbeEngine(None)
+        outcomes = engine.run([
+            Probe.http(f"{stub.url}/ready"),
+            Probe.http(f"{stub.url}/down"),
+            Probe.http(f"http://127.0.0.1:{closed_port}/ready"),
+            Probe.tcp("127.0.0.1", stub.server.server_address[1]),
+            Probe.tcp("127.0.0.1", closed_port),
+            Probe.command("definitely-not-a-real-command-xyz"),
+        ])
+        engine.close()
+        by_target = {k.split(":", 1)[1]: v for k, v in outcomes.items()}
+        assert by_target[f"GET:{stub.url}/ready"].ok
+        down = by_target[f"GET:{stub.url}/down"]
+        assert not down.ok and down.status_code == 503
+        refused = by_target[f"GET:http://127.0.0.1:{closed_port}/ready"]
+        assert refused.error_kind == "connect"
+        assert by_target[f"127.0.0.1:{stub.server.server_address[1]}"].ok
+        closed = by_target[f"127.0.0.1:{closed_port}"]
+        assert not closed.ok and closed.error_kind is None
+        assert by_target["definitely-not-a-real-command-xyz"].error_kind == "missing"
+
+    def test_snapshot_shared_between_engines(self, stub, tmp_path):
+        path = tmp_path / "snap.json"
+        probe = Probe.http(f"{stub.url}/ready")
+        first = ProbeEngine(path, ttl_s=60)
+        first.get(probe)
+        first.close()
+
+        second = ProbeEngine(path, ttl_s=60)
+        outcome = second.get(probe)
+        assert outcome.status_code == 200
+        assert stub.hits == ["/ready"]
+
+        second.get(probe, max_age_s=0)
+        second.close()
+        assert stub.hits == ["/ready", "/ready"]
+
+    def test_stale_entries_are_reprobed(self, stub, tmp_path):
+        engine = ProbeEngine(tmp_path / "snap.json", ttl_s=0.05)
+        probe = Probe.http(f"{stub.url}/ready")
+        engine.get(probe)
+        time.sleep(0.1)
+        engine.get(probe)
+        engine.close()
+        assert len(stub.hits) == 2
+
+    def test_summarize_stored_in_snapshot(self, stub, tmp_path):
+        stub.bodies["/api/datasources"] = [{"name": "Tempo", "secret": "x"}]
+        path = tmp_path / "snap.json"
+        probe = Probe.http(
+            f"{stub.url}/api/datasources",
+            summarize=lambda items: [i["name"] for i in items],
+        )
+        engine = ProbeEngine(path)
+        assert engine.get(probe).data == ["Tempo"]
+        engine.close()
+        assert "secret" not in path.read_text()
+
+    def test_corrupt_snapshot_ignored(self, stub, tmp_path):
+        path = tmp_path / "snap.json"
+        path.write_text("{not json")
+        engine = ProbeEngine(path)
+        assert engine.get(Probe.http(f"{stub.url}/ready")).ok
+        engine.close()
+        assert json.loads(path.read_text())
+
+    def test_refresher_republishes(self, stub, tmp_path):
+        engine = ProbeEngine(tmp_path / "snap.json", ttl_s=60)
+        refreshes = []
+        refresher = ProbeRefresher(
+            [Probe.http(f"{stub.url}/ready")],
+            interval_s=0.05,
+            engine=engine,
+            on_refresh=refreshes.append,
+        )
+        refresher.start()
+        deadline = time.monotonic() + 5
+        while len(refreshes) < 3 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        refresher.stop(timeout=5)
+        engine.close()
+        assert len(refreshes) >= 3
+        assert len(stub.hits) >= 3
+
+
+class TestOpsChecks:
+    def test_health_check_reads_snapshot(self, stub, closed_port, engine):
+        stub.statuses["/unhealthy"] = 500
+        components = {
+            "Up": {"url": f"{stub.url}/ready"},
+            "Sick": {"url": f"{stub.url}/unhealthy"},
+            "Gone": {"url": f"http://127.0.0.1:{closed_port}/ready"},
+        }
+        result = health_check(components, include_otlp=False)
+        assert [c.name for c in result.components] == ["Up", "Sick", "Gone"]
+        assert [c.status for c in result.components] == [
+            HealthStatus.HEALTHY,
+            HealthStatus.UNHEALTHY,
+            HealthStatus.UNHEALTHY,
+        ]
+        assert result.components[1].message == "HTTP 500"
+        assert result.components[2].message == "Connection refused"
+
+        health_check(components, include_otlp=False)
+        assert len(stub.hits) == 2
+
+        health_check(components, include_otlp=False, max_age_s=0)
+        assert len(stub.hits) == 4
@@ -19,6 +19,7 @@ from contextcore.contracts.a2a.pipeline_checker import (
     PipelineCheckReport,
     PipelineChecker,
 )
+from contextcore.utils.file_checksums import FileChecksumCache
 
 
 # ---------------------------------------------------------------------------
@@ -308,6 +309,78 @@ class TestChecksumChain:
         assert checksum_gate.result == GateOutcome.PASS
 
 
+def _backdate(*paths: Path) -> None:
+    """Move mtimes out of the checksum cache's racy window."""
+    import os
+    import time
+
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+class TestParallelGatesAndChecksumCache:
+    """Concurrent gate execution and cached checksums."""
+
+    def test_parallel_matches_sequential(self, tmp_path: Path):
+        out_dir = _write_fixture(tmp_path)
+
+        sequential = PipelineChecker(out_dir, max_workers=1).run()
+        parallel = PipelineChecker(out_dir, max_workers=8).run()
+
+        assert [g.gate_id for g in parallel.gates] == [g.gate_id for g in sequential.gates]
+        assert [g.result for g in parallel.gates] == [g.result for g in sequential.gates]
+        assert parallel.skipped == sequential.skipped
+        assert parallel.warnings == sequential.warnings
+
+    def test_unchanged_files_not_rehashed(self, tmp_path: Path):
+        out_dir = _write_fixture(tmp_path)
+        _backdate(*out_dir.iterdir(), tmp_path / "source-manifest.yaml")
+        cache = FileChecksumCache()
+
+        PipelineChecker(out_dir, checksum_cache=cache).run()
+        hashed = cache.misses
+        assert hashed >= 2 and cache.hits == 0
+
+        report = PipelineChecker(out_dir, checksum_cache=cache).run()
+        assert (cache.hits, cache.misses) == (hashed, hashed)
+        assert report.gates[1].result == GateOutcome.PASS
+
+    def test_modified_file_detected_through_cache(self, tmp_path: Path):
+        out_dir = _write_fixture(tmp_path)
+        manifest_path = out_dir / "test-project-artifact-manifest.yaml"
+        _backdate(manifest_path)
+        cache = FileChecksumCache()
+        PipelineChecker(out_dir, checksum_cache=cache).run()
+
+        manifest_path.write_text("tampered content!", encoding="utf-8")
+        report = PipelineChecker(out_dir, checksum_cache=cache).run()
+
+        assert report.gates[1].result == GateOutcome.FAIL
+
+    def test_crlf_manifest_hashed_as_text(self, tmp_path: Path):
+        """Text checksums keep read_text() newline semantics."""
+        out_dir = _write_fixture(tmp_path)
+        manifest_path = out_dir / "test-project-artifact-manifest.yaml"
+        manifest_path.write_bytes(manifest_path.read_bytes().replace(b"\n", b"\r\n"))
+
+        report = PipelineChecker(out_dir, checksum_cache=FileChecksumCache()).run()
+
+        assert report.gates[1].result == GateOutcome.PASS
+
+    def test_cache_persists(self, tmp_path: Path):
+        out_dir = _write_fixture(tmp_path)
+        _backdate(*out_dir.iterdir(), tmp_path / "source-manifest.yaml")
+        cache_path = tmp_path / "checksums.json"
+
+        first = FileChecksumCache(cache_path)
+        PipelineChecker(out_dir, checksum_cache=first).run()
+        reloaded = FileChecksumCache(cache_path)
+        PipelineChecker(out_dir, checksum_cache=reloaded).run()
+
+        assert reloaded.hits == first.misses and reloaded.misses == 0
+
+
 # ===========================================================================
 # Tests — Provenance cross-check
 # ===========================================================================
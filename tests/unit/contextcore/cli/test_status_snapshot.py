@@ -0,0 +1,260 @@
+"""Tests for the per-section status snapshot store."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from contextcore.cli import status_ops
+from contextcore.cli.status_ops import StatusSnapshotStore, insights_key
+from contextcore.contracts.a2a.pipeline_checker import PipelineChecker
+from tests.test_pipeline_checker import _write_fixture, _write_provenance
+
+# contextcore.cli re-exports the status command group under the module's name
+status_module = importlib.import_module("contextcore.cli.status")
+
+METADATA = {
+    "coverage": {"totalRequired": 4, "totalExisting": 1, "overallCoverage": 25.0},
+}
+
+
+def _age(path: Path, seconds: float = 60) -> None:
+    """Backdate a file so the racy-write window does not force re-reading."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - int(seconds * 1e9)))
+
+
+@pytest.fixture
+def export_dir(tmp_path):
+    out = tmp_path / "export"
+    out.mkdir()
+    meta = out / "onboarding-metadata.json"
+    meta.write_text(json.dumps(METADATA))
+    _age(meta)
+    _age(out)
+    return out
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Counts aggregator runs; pipeline and insights are stubbed."""
+    counts = {"coverage": 0, "pipeline": 0, "insights": 0}
+    coverage = status_module._aggregate_coverage
+
+    def fake_coverage(export_dir):
+        counts["coverage"] += 1
+        return coverage(export_dir)
+
+    def fake_pipeline(export_dir):
+        counts["pipeline"] += 1
+        return status_module.PipelineHealth(
+            gates_run=2, gates_passed=1, gates_failed=1, overall_status="unhealthy",
+            failures=[status_module.GateFailure("g1", "export", "bad", "fix it", "error")],
+        )
+
+    def fake_insights(project_id, time_range, tempo_url=None, local_storage=None):
+        counts["insights"] += 1
+        return ["use postgres"]
+
+    monkeypatch.setattr(status_module, "_aggregate_coverage", fake_coverage)
+    monkeypatch.setattr(status_module, "_aggregate_pipeline_health", fake_pipeline)
+    monkeypatch.setattr(status_module, "_aggregate_insights", fake_insights)
+    monkeypatch.setattr(status_ops, "_default_store", StatusSnapshotStore())
+    return counts
+
+
+def _build(export_dir, **kwargs):
+    return status_module.build_status_summary("proj", "7d", str(export_dir), **kwargs)
+
+
+class TestBuildStatusSummary:
+    def test_cached_summary_matches_fresh(self, export_dir, calls):
+        fresh = _build(export_dir, use_cache=False)
+        cached = _build(export_dir)
+        again = _build(export_dir)
+
+        for summary in (cached, again):
+            assert summary.coverage_status == fresh.coverage_status
+            assert summary.pipeline_health == fresh.pipeline_health
+            assert summary.agent_decisions == fresh.agent_decisions
+            assert summary.blockers == fresh.blockers
+            assert summary.highlights == fresh.highlights
+
+    def test_unchanged_sections_are_not_recomputed(self, export_dir, calls):
+        _build(export_dir)
+        _build(export_dir)
+        assert calls == {"coverage": 1, "pipeline": 1, "insights": 1}
+
+    def test_touched_export_rereads_coverage_but_not_pipeline(self, export_dir, calls):
+        _build(export_dir)
+        _age(export_dir / "onboarding-metadata.json", 30)
+
+        _build(export_dir)
+
+        assert calls == {"coverage": 2, "pipeline": 1, "insights": 1}
+
+    def test_changed_metadata_recomputes_pipeline(self, export_dir, calls):
+        _build(export_dir)
+        meta = export_dir / "onboarding-metadata.json"
+        meta.write_text(json.dumps({"coverage": {"totalRequired": 4, "totalExisting": 4,
+                                                 "overallCoverage": 100.0}}))
+        _age(meta, 30)
+
+        summary = _build(export_dir)
+
+        assert calls["pipeline"] == 2
+        assert summary.coverage_status.overall_percent == 100.0
+
+    def test_new_provenance_recomputes_pipeline_only(self, export_dir, calls):
+        _build(export_dir)
+        (export_dir / "provenance.json").write_text("{}")
+        _age(export_dir, 30)
+
+        _build(export_dir)
+
+        assert calls["pipeline"] == 2
+        assert calls["insights"] == 1
+
+    def test_recent_export_is_always_reread(self, export_dir, calls):
+        (export_dir / "onboarding-metadata.json").write_text(json.dumps(METADATA))
+        _build(export_dir)
+        _build(export_dir)
+        assert calls["coverage"] == 2
+
+    def test_new_insight_window_requeries(self, export_dir, calls, monkeypatch):
+        now = [1_200.0]
+        monkeypatch.setattr(
+            status_module, "insights_key", lambda period: insights_key(period, 60, now[0])
+        )
+        _build(export_dir)
+        now[0] += 30
+        _build(export_dir)
+        assert calls["insights"] == 1
+
+        now[0] += 60
+        _build(export_dir)
+        assert calls["insights"] == 2
+
+    def test_force_recomputes_everything(self, export_dir, calls):
+        _build(export_dir)
+        _build(export_dir, force=True)
+        assert calls == {"coverage": 2, "pipeline": 2, "insights": 2}
+
+
+class TestPipelineInputs:
+    @pytest.fixture
+    def pipeline_export(self, tmp_path, monkeypatch):
+        """A healthy export checked by the real PipelineChecker."""
+        monkeypatch.setattr(status_module, "_aggregate_insights", lambda *a, **k: [])
+        monkeypatch.setattr(status_ops, "_default_store", StatusSnapshotStore())
+        out = _write_fixture(tmp_path)
+        source = (tmp_path / "source-manifest.yaml").read_bytes()
+        _write_provenance(out, hashlib.sha256(source).hexdigest())
+        return out
+
+    def test_edited_artifact_manifest_recomputes_pipeline(self, pipeline_export):
+        assert _build(pipeline_export).pipeline_health.overall_status == "healthy"
+
+        with open(pipeline_export / "test-project-artifact-manifest.yaml", "a") as fh:
+            fh.write("  - id: extra\n")
+        health = _build(pipeline_export).pipeline_health
+
+        assert health.overall_status == "unhealthy"
+        assert [f.gate_id for f in health.failures] == ["test-project-checksum-chain"]
+
+    def test_deleted_inventory_source_recomputes_pipeline(self, pipeline_export):
+        source = pipeline_export / "derivation-rules.json"
+        source.write_text("{}")
+        inventory = [
+            {"artifact_id": role, "role": role, "source_file": source.name}
+            for role in sorted(PipelineChecker._EXPECTED_EXPORT_ROLES)
+        ]
+        (pipeline_export / "run-provenance.json").write_text(
+            json.dumps({"version": "2.0.0", "artifact_inventory": inventory})
+        )
+        assert _build(pipeline_export).pipeline_health.overall_status == "healthy"
+
+        source.unlink()
+        health = _build(pipeline_export).pipeline_health
+
+        assert [f.gate_id for f in health.failures] == ["test-project-artifact-inventory"]
+
+    def test_key_covers_referenced_files(self, pipeline_export):
+        keys = [status_ops.pipeline_key(str(pipeline_export))]
+        (pipeline_export / "test-project-projectcontext.yaml").write_text("edited: true\n")
+        keys.append(status_ops.pipeline_key(str(pipeline_export)))
+        owned = pipeline_export / "slo" / "checkout-api-slo.yaml"
+        owned.parent.mkdir()
+        owned.write_text("slo: {}\n")
+        keys.append(status_ops.pipeline_key(str(pipeline_export)))
+
+        assert len(set(keys)) == 3
+
+
+class TestWatch:
+    def test_yields_only_when_a_section_changes(self, export_dir, calls):
+        polls = []
+        meta = export_dir / "onboarding-metadata.json"
+
+        def sleep(seconds):
+            polls.append(seconds)
+            if len(polls) == 2:
+                meta.write_text(json.dumps({"coverage": {"totalRequired": 4, "totalExisting": 2,
+                                                         "overallCoverage": 50.0}}))
+                _age(meta, 30)
+
+        updates = status_module.watch_status_summary(
+            "proj", "7d", str(export_dir), interval_s=0.5, sleep=sleep
+        )
+        first, changed = next(updates)
+        assert changed == ["coverage", "pipeline", "insights"]
+        assert first.coverage_status.overall_percent == 25.0
+
+        second, changed = next(updates)
+        assert len(polls) == 2
+        assert changed == ["coverage"]
+        assert second.coverage_status.overall_percent == 50.0
+        assert calls["pipeline"] == 2  # metadata checksum changed
+        assert polls == [0.5, 0.5]
+
+
+class TestPersistence:
+    def test_snapshots_shared_across_instances(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        first = StatusSnapshotStore(path)
+        first.fetch("coverage", "/x", "k1", lambda: {"a": 1})
+        first.save()
+
+        second = StatusSnapshotStore(path)
+        value, recomputed = second.fetch("coverage", "/x", "k1", lambda: {"a": 2})
+        assert (value, recomputed) == ({"a": 1}, False)
+
+    def test_none_key_is_never_stored(self):
+        store = StatusSnapshotStore()
+        store.fetch("coverage", "/x", None, lambda: 1)
+        _, recomputed = store.fetch("coverage", "/x", None, lambda: 1)
+        assert recomputed
+
+    def test_unknown_format_is_ignored(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text(json.dumps({"format": -1, "entries": {"coverage|/x": ["k1", 0, 1]}}))
+        _, recomputed = StatusSnapshotStore(path).fetch("coverage", "/x", "k1", lambda: 2)
+        assert recomputed
+
+
+class TestSummaryCommand:
+    def test_summary_line(self, export_dir, calls):
+        result = CliRunner().invoke(
+            status_module.status, ["summary", "-p", "proj", "--export-dir", str(export_dir)]
+        )
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == (
+            "proj: | pipeline unhealthy (1/2 gates) | coverage 25% (3 gaps) "
+            "| 1 critical blockers | 1 recent decisions"
+        )
@@ -0,0 +1,186 @@
+"""Tests for the cached weaver registry index."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from contextcore.cli import weaver_ops
+from contextcore.cli.weaver import validate_registry, weaver
+from contextcore.cli.weaver_ops import RegistryIndex
+from contextcore.utils.file_checksums import FileChecksumCache
+
+# contextcore.cli re-exports the weaver command group under the module's name
+weaver_module = importlib.import_module("contextcore.cli.weaver")
+
+REPO_SEMCONV = Path(__file__).resolve().parents[4] / "semconv"
+
+TASK_YAML = """\
+groups:
+  - id: registry.task
+    type: attribute_group
+    attributes:
+      - id: task.id
+        type: string
+        brief: Task identifier
+        requirement_level: required
+      - id: task.status
+        brief: Task status
+        type:
+          members:
+            - id: todo
+              value: todo
+            - id: bogus
+              value: bogus
+"""
+
+
+@pytest.fixture
+def registry(tmp_path):
+    reg = tmp_path / "semconv"
+    (reg / "registry").mkdir(parents=True)
+    (reg / "registry_manifest.yaml").write_text("groups:\n  - registry/task.yaml\n")
+    (reg / "registry" / "task.yaml").write_text(TASK_YAML)
+    (reg / "registry" / "empty.yaml").write_text("")
+    (reg / "registry" / "broken.yaml").write_text("groups: [unclosed\n")
+    return reg
+
+
+@pytest.fixture
+def index(monkeypatch):
+    """Fresh in-memory index; Python attributes stubbed (tracker needs OTel)."""
+    idx = RegistryIndex()
+    monkeypatch.setattr(weaver_ops, "_default_index", idx)
+    monkeypatch.setattr(
+        weaver_module, "_load_python_attributes", lambda: frozenset({"task.id", "task.title"})
+    )
+    return idx
+
+
+def _age(path: Path, seconds: float = 60) -> None:
+    """Backdate a file so the racy-write window does not force re-hashing."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - int(seconds * 1e9)))
+
+
+def _age_all(reg: Path) -> None:
+    for path in reg.rglob("*.yaml"):
+        _age(path)
+
+
+class TestValidateRegistry:
+    def test_report(self, registry, index):
+        report = validate_registry(str(registry))
+
+        assert report.files_checked == 4
+        assert report.attributes_found == 2
+        assert report.enums_checked == 1
+        by_type = {}
+        for issue in report.issues:
+            by_type.setdefault(issue.issue_type, []).append(issue)
+        assert [i.file for i in by_type["parse_error"]] == [str(Path("registry/broken.yaml"))]
+        assert [i.file for i in by_type["format_error"]] == [str(Path("registry/empty.yaml"))]
+        mismatches = [i.message for i in by_type["enum_mismatch"]]
+        assert mismatches[0].startswith("Value 'bogus' in registry but not in Python TaskStatus")
+        assert all(i.location == "/registry.task/task.status/members" for i in by_type["enum_mismatch"])
+        assert [i.location for i in by_type["missing_in_registry"]] == ["task.title"]
+
+    def test_repeat_runs_parse_nothing(self, registry, index):
+        _age_all(registry)
+        first = validate_registry(str(registry))
+        misses = index.misses
+
+        second = validate_registry(str(registry))
+
+        assert index.misses == misses
+        assert second.issues == first.issues
+
+    def test_only_changed_file_is_reparsed(self, registry, index):
+        _age_all(registry)
+        validate_registry(str(registry))
+        misses = index.misses
+
+        task = registry / "registry" / "task.yaml"
+        task.write_text(TASK_YAML.replace("bogus", "done"))
+        _age(task, 30)
+        report = validate_registry(str(registry))
+
+        assert index.misses == misses + 1
+        assert not any("bogus" in i.message for i in report.issues)
+
+    def test_touched_but_unchanged_file_is_not_reparsed(self, registry, index):
+        _age_all(registry)
+        validate_registry(str(registry))
+        misses = index.misses
+
+        _age(registry / "registry" / "task.yaml", 30)
+        validate_registry(str(registry))
+
+        assert index.misses == misses
+
+    def test_keyed_by_shared_file_checksums(self, registry):
+        _age_all(registry)
+        checksums = FileChecksumCache()
+        idx = RegistryIndex(checksums=checksums)
+        idx.scan(registry)
+        hashed = checksums.misses
+
+        copy = registry / "registry" / "copy.yaml"
+        copy.write_text(TASK_YAML)
+        _age(copy)
+        idx.scan(registry)
+
+        assert checksums.misses == hashed + 1  # only the new file is hashed
+        assert idx.misses == 3  # identical content reuses task.yaml's summary
+
+    def test_matches_uncached_results_on_repo_registry(self, index, tmp_path):
+        if not REPO_SEMCONV.exists():
+            pytest.skip("semconv registry not present")
+        reg = tmp_path / "semconv"
+        shutil.copytree(REPO_SEMCONV, reg)
+
+        cold = validate_registry(str(reg))
+        warm = validate_registry(str(reg))
+        assert cold == warm
+        assert cold.files_checked >= 2
+        assert cold.attributes_found > 0
+
+
+class TestPersistence:
+    def test_summaries_shared_across_instances(self, registry, tmp_path):
+        _age_all(registry)
+        cache = tmp_path / "cache.json"
+        first = RegistryIndex(cache)
+        files = first.scan(registry)
+        first.save()
+
+        second = RegistryIndex(cache)
+        assert second.scan(registry) == files
+        assert second.misses == 0
+        assert second.hits == len(files)
+
+    def test_unknown_format_is_ignored(self, registry, tmp_path):
+        cache = tmp_path / "cache.json"
+        cache.write_text(json.dumps({"format": -1, "entries": {"x": [1, 2, "h", 0, {}]}}))
+        idx = RegistryIndex(cache)
+        idx.scan(registry)
+        assert idx.hits == 0
+
+
+class TestWeaverList:
+    def test_lists_from_index(self, registry, index):
+        result = CliRunner().invoke(
+            weaver, ["list", "--registry", str(registry), "--format", "json"]
+        )
+        assert result.exit_code == 0, result.output
+        attrs = json.loads(result.output)
+        assert [a["id"] for a in attrs] == ["task.id", "task.status"]
+        assert attrs[1]["type"] == "enum"
+        assert attrs[0]["group"] == "registry.task"
+        assert attrs[0]["source"] == str(Path("registry/task.yaml"))
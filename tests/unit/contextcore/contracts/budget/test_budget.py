@@ -16,7 +16,7 @@ from contextcore.contracts.budget.schema import (
     BudgetSpec,
     PhaseAllocation,
 )
-from contextcore.contracts.budget.tracker import BudgetTracker
+from contextcore.contracts.budget.tracker import BUDGET_KEY, BUDGET_LEDGER_KEY, BudgetTracker
 from contextcore.contracts.budget.validator import BudgetValidator
 from contextcore.contracts.types import BudgetHealth, BudgetType, OverflowPolicy
 
@@ -188,6 +188,43 @@ class TestTracker:
         t = BudgetTracker()
         assert t.get_remaining(spec, {}, "nonexistent") == 0.0
 
+    def test_ledger_matches_record_scan(self):
+        t = BudgetTracker()
+        ctx: dict = {}
+        for i in range(50):
+            t.record(ctx, f"b{i % 3}", f"p{i % 4}", 0.1 * i)
+        records = ctx[BUDGET_KEY]
+        assert len(records) == 50  # audit trail kept
+        for b in ("b0", "b1", "b2"):
+            assert t.get_consumed(ctx, b) == sum(
+                r["consumed"] for r in records if r["budget_id"] == b
+            )
+            for p in ("p0", "p1", "p2", "p3"):
+                assert t.get_phase_consumed(ctx, b, p) == sum(
+                    r["consumed"] for r in records
+                    if r["budget_id"] == b and r["phase"] == p
+                )
+
+    def test_ledger_rebuilt_for_hand_built_context(self):
+        t = BudgetTracker()
+        ctx: dict = {BUDGET_KEY: [
+            {"budget_id": "latency", "phase": "plan", "consumed": 100.0, "timestamp": ""},
+        ]}
+        assert t.get_consumed(ctx, "latency") == 100.0
+
+        ctx[BUDGET_KEY].append(
+            {"budget_id": "latency", "phase": "design", "consumed": 50.0, "timestamp": ""}
+        )
+        assert t.get_consumed(ctx, "latency") == 150.0
+        t.record(ctx, "latency", "plan", 25.0)
+        assert t.get_phase_consumed(ctx, "latency", "plan") == 125.0
+        assert ctx[BUDGET_LEDGER_KEY]["count"] == 3
+
+    def test_reads_do_not_modify_empty_context(self):
+        ctx: dict = {}
+        assert BudgetTracker().get_consumed(ctx, "latency") == 0
+        assert ctx == {}
+
 
 # ---------------------------------------------------------------------------
 # Validator tests
@@ -0,0 +1,133 @@
+"""Tests for structural value fingerprints."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from contextcore.contracts import fingerprint as fp_module
+from contextcore.contracts.fingerprint import (
+    fingerprint,
+    fingerprint_matches,
+    legacy_fingerprint,
+    value_fingerprint,
+)
+from contextcore.contracts.lineage.tracker import LineageTracker
+from contextcore.contracts.propagation.tracker import PropagationTracker
+from contextcore.contracts.types import TransformOp
+
+
+class Opaque:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Opaque({self.name!r})"
+
+
+# ---------------------------------------------------------------------------
+# Structural fingerprints
+# ---------------------------------------------------------------------------
+
+
+class TestFingerprint:
+    def test_format(self):
+        fp = fingerprint({"domain": "web_application"})
+        assert len(fp) == 16
+        int(fp, 16)
+
+    def test_equal_values_equal_fingerprints(self):
+        a = {"tasks": [{"id": i, "tags": ["x", "y"]} for i in range(100)]}
+        b = {"tasks": [{"id": i, "tags": ["x", "y"]} for i in range(100)]}
+        assert fingerprint(a) == fingerprint(b)
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("1", 1),
+            (1, 1.0),
+            (True, 1),
+            ([1, 2], (1, 2)),
+            ({"a": 1}, {"a": 2}),
+            ("x" * 5000, "x" * 4999 + "y"),
+            (TransformOp.CLASSIFY, TransformOp.CLASSIFY.value),
+        ],
+    )
+    def test_different_values_differ(self, a, b):
+        assert fingerprint(a) != fingerprint(b)
+
+    def test_non_plain_values_use_type_and_repr(self):
+        assert fingerprint([Opaque("a")]) == fingerprint([Opaque("a")])
+        assert fingerprint([Opaque("a")]) != fingerprint([Opaque("b")])
+        assert fingerprint({Opaque("k"): 1}) == fingerprint({Opaque("k"): 1})
+
+    def test_sets_are_order_independent(self):
+        assert fingerprint({"b", "a", "c"}) == fingerprint({"c", "a", "b"})
+        assert fingerprint(frozenset({1, 2})) != fingerprint({1, 2, 3})
+
+    def test_stable_across_processes(self):
+        value = "{'doc': 'x' * 10000, 'items': [1, 2.5, None, True, b'raw', ('t', 'u')], 'op': TransformOp.CLASSIFY}"
+        script = (
+            "from contextcore.contracts.fingerprint import fingerprint\n"
+            "from contextcore.contracts.types import TransformOp\n"
+            f"print(fingerprint({value}))\n"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert len(outputs) == 1
+
+    def test_large_strings_memoized_by_identity(self, monkeypatch):
+        fp_module.clear_fingerprint_memo()
+        doc = "lorem ipsum " * 1000
+        first = fingerprint(doc)
+
+        monkeypatch.setattr(fp_module, "_serialize", lambda _: pytest.fail("re-hashed"))
+        assert fingerprint(doc) == first
+
+
+# ---------------------------------------------------------------------------
+# Migration from legacy fingerprints
+# ---------------------------------------------------------------------------
+
+
+class TestLegacyCompatibility:
+    def test_legacy_scheme_unchanged(self):
+        import hashlib
+
+        value = {"domain": "web_application"}
+        assert legacy_fingerprint(value) == hashlib.sha256(repr(value).encode()).hexdigest()[:8]
+
+    def test_matches_either_scheme(self):
+        value = ["a", {"b": 1}]
+        assert fingerprint_matches(legacy_fingerprint(value), value)
+        assert fingerprint_matches(fingerprint(value), value)
+        assert not fingerprint_matches(legacy_fingerprint(value), ["a"])
+        assert not fingerprint_matches(fingerprint(value), ["a"])
+
+    def test_env_selects_legacy_for_trackers(self, monkeypatch):
+        monkeypatch.setenv("CONTEXTCORE_FINGERPRINT_SCHEME", "legacy")
+        assert value_fingerprint("x") == legacy_fingerprint("x")
+
+        ctx: dict = {}
+        PropagationTracker().stamp(ctx, "plan", "domain", "web_application")
+        assert PropagationTracker().get_provenance(ctx, "domain").value_hash == (
+            legacy_fingerprint("web_application")
+        )
+
+    def test_trackers_use_structural_by_default(self):
+        ctx: dict = {}
+        record = LineageTracker().record_transformation(
+            ctx, "domain", "classify", TransformOp.PASSTHROUGH, "raw", "raw"
+        )
+        assert record.input_hash == record.output_hash == fingerprint("raw")
@@ -0,0 +1,215 @@
+"""Tests for fidelity-preserving demo telemetry replay."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from contextcore.demo.replay import (
+    LokiPusher,
+    compute_time_shift,
+    encode_resource_spans,
+    iter_json_array,
+    iter_loki_batches,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _span(i: int, parent: int | None = None, service: str = "cart") -> Dict[str, Any]:
+    span: Dict[str, Any] = {
+        "name": f"task:T-{i}",
+        "trace_id": "0af7651916cd43dd8448eb211c80319c",
+        "span_id": f"{i:016x}",
+        "start_time_ns": 1_000 + i,
+        "end_time_ns": 2_000 + i,
+        "status": {"status_code": "ERROR", "description": "blocked"},
+        "kind": "INTERNAL",
+        "attributes": {"task.id": f"T-{i}", "task.points": 3, "task.labels": ["a", "b"]},
+        "events": [{"name": "blocked", "timestamp_ns": 1_500, "attributes": {}}],
+        "resource": {"service.name": service},
+    }
+    if parent is not None:
+        span["parent_span_id"] = f"{parent:016x}"
+        span["links"] = [{
+            "trace_id": "4bf92f3577b34da6a3ce929d0e0e4736",
+            "span_id": "00f067aa0ba902b7",
+            "attributes": {"link.type": "depends_on"},
+        }]
+    return span
+
+
+def _attrs(key_values) -> Dict[str, Any]:
+    return {kv.key: kv.value for kv in key_values}
+
+
+# ---------------------------------------------------------------------------
+# Streaming JSON
+# ---------------------------------------------------------------------------
+
+
+class TestIterJsonArray:
+    def test_streams_elements_across_small_reads(self, tmp_path: Path):
+        spans = [_span(i) for i in range(1, 50)]
+        path = tmp_path / "spans.json"
+        path.write_text(json.dumps({"generated_at": "x", "span_count": 49, "spans": spans}, indent=2))
+
+        loaded = list(iter_json_array(str(path), "spans", read_size=37))
+
+        assert loaded == spans
+
+    def test_empty_array(self, tmp_path: Path):
+        path = tmp_path / "logs.json"
+        path.write_text('{"log_count": 0, "logs": []}')
+
+        assert list(iter_json_array(str(path), "logs", read_size=4)) == []
+
+    def test_number_elements_at_buffer_edge(self, tmp_path: Path):
+        path = tmp_path / "n.json"
+        path.write_text('{"spans": [12345, 678910]}')
+
+        assert list(iter_json_array(str(path), "spans", read_size=3)) == [12345, 678910]
+
+
+# ---------------------------------------------------------------------------
+# OTLP encoding
+# ---------------------------------------------------------------------------
+
+
+class TestEncodeResourceSpans:
+    def test_preserves_ids_parents_and_links(self):
+        request = encode_resource_spans([_span(1), _span(2, parent=1)])
+
+        spans = request.resource_spans[0].scope_spans[0].spans
+        assert spans[0].trace_id.hex() == "0af7651916cd43dd8448eb211c80319c"
+        assert spans[0].span_id.hex() == f"{1:016x}"
+        assert spans[0].parent_span_id == b""
+        assert spans[1].parent_span_id.hex() == f"{1:016x}"
+        assert spans[1].links[0].span_id.hex() == "00f067aa0ba902b7"
+        assert spans[1].status.message == "blocked"
+
+    def test_attribute_types(self):
+        request = encode_resource_spans([_span(1)])
+
+        attrs = _attrs(request.resource_spans[0].scope_spans[0].spans[0].attributes)
+        assert attrs["task.id"].string_value == "T-1"
+        assert attrs["task.points"].int_value == 3
+        assert [v.string_value for v in attrs["task.labels"].array_value.values] == ["a", "b"]
+
+    def test_groups_by_resource(self):
+        request = encode_resource_spans([_span(1, service="cart"), _span(2, service="ads"), _span(3, service="cart")])
+
+        services = [
+            _attrs(rs.resource.attributes)["service.name"].string_value
+            for rs in request.resource_spans
+        ]
+        assert services == ["cart", "ads"]
+        assert len(request.resource_spans[0].scope_spans[0].spans) == 2
+
+    def test_time_shift_applies_to_all_timestamps(self):
+        shift = compute_time_shift([_span(1), _span(5)], anchor_ns=10_000)
+        span = encode_resource_spans([_span(1)], time_shift_ns=shift).resource_spans[0].scope_spans[0].spans[0]
+
+        assert shift == 10_000 - 2_005
+        assert span.start_time_unix_nano == 1_001 + shift
+        assert span.end_time_unix_nano == 2_001 + shift
+        assert span.events[0].time_unix_nano == 1_500 + shift
+
+
+# ---------------------------------------------------------------------------
+# Loki batching and push
+# ---------------------------------------------------------------------------
+
+
+def _logs(n: int) -> List[Dict[str, Any]]:
+    return [
+        {"timestamp": "2026-01-01T00:00:00Z", "service": f"svc-{i % 2}", "project_id": "p", "msg": "x" * 100}
+        for i in range(n)
+    ]
+
+
+class TestIterLokiBatches:
+    def test_respects_byte_budget(self):
+        counters: Dict[str, int] = {}
+        batches = list(iter_loki_batches(_logs(100), max_batch_bytes=2_000, counters=counters))
+
+        assert sum(count for _, count in batches) == 100
+        assert len(batches) > 1
+        for payload, _ in batches:
+            assert len(json.dumps(payload)) < 2_000 + 500
+        assert counters["streams"] == 2
+
+    def test_clamps_future_timestamps(self):
+        counters: Dict[str, int] = {}
+        logs = [{"timestamp": "2999-01-01T00:00:00Z"}]
+        (payload, _), = iter_loki_batches(logs, now_ns=42, counters=counters)
+
+        assert payload["streams"][0]["values"][0][0] == "42"
+        assert counters["clamped"] == 1
+
+
+class _LokiStub(BaseHTTPRequestHandler):
+    responses: List[int] = []
+    received: List[Dict[str, Any]] = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        status = _LokiStub.responses.pop(0) if _LokiStub.responses else 204
+        if status == 204:
+            assert self.headers["Content-Encoding"] == "gzip"
+            _LokiStub.received.append(json.loads(gzip.decompress(body)))
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def loki_url():
+    _LokiStub.responses = []
+    _LokiStub.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LokiStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/loki/api/v1/push"
+    server.shutdown()
+
+
+class TestLokiPusher:
+    def test_pushes_all_batches_compressed(self, loki_url):
+        pusher = LokiPusher(loki_url, max_batch_bytes=2_000, workers=3, backoff_seconds=0)
+        stats = pusher.push(_logs(60))
+        pusher.close()
+
+        assert stats.success
+        assert stats.items_sent == 60
+        assert sum(
+            len(s["values"]) for payload in _LokiStub.received for s in payload["streams"]
+        ) == 60
+
+    def test_retries_rate_limited_push(self, loki_url):
+        _LokiStub.responses = [429, 503]
+        pusher = LokiPusher(loki_url, workers=1, backoff_seconds=0)
+        stats = pusher.push(_logs(5))
+        pusher.close()
+
+        assert stats.success
+        assert stats.retries == 2
+
+    def test_reports_failure_after_retries(self, loki_url):
+        _LokiStub.responses = [500, 500, 500]
+        pusher = LokiPusher(loki_url, workers=1, max_retries=2, backoff_seconds=0)
+        stats = pusher.push(_logs(5))
+        pusher.close()
+
+        assert not stats.success
+        assert stats.items_failed == 5
@@ -0,0 +1,169 @@
+"""Tests for the synthetic workload generator."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from contextcore.demo.exporter import load_logs_from_file, load_spans_from_file
+from contextcore.demo.workload import (
+    Distribution,
+    JsonFileSink,
+    SyntheticWorkloadGenerator,
+    WorkloadProfile,
+    WorkloadSink,
+)
+
+
+END = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+class _ListSink(WorkloadSink):
+    def __init__(self):
+        self.spans: List[Dict[str, Any]] = []
+        self.logs: List[Dict[str, Any]] = []
+
+    def write_span(self, span):
+        self.spans.append(span)
+
+    def write_log(self, log):
+        self.logs.append(log)
+
+
+def _generate(**overrides) -> _ListSink:
+    profile = WorkloadProfile(projects=2, epics_per_project=3, seed=42, end_time=END, **overrides)
+    sink = _ListSink()
+    SyntheticWorkloadGenerator(profile).generate(sink)
+    return sink
+
+
+class TestSyntheticWorkloadGenerator:
+    def test_same_seed_is_deterministic(self):
+        assert _generate().spans == _generate().spans
+
+    def test_different_seed_differs(self):
+        a = _generate()
+        profile = WorkloadProfile(projects=2, epics_per_project=3, seed=43, end_time=END)
+        b = _ListSink()
+        SyntheticWorkloadGenerator(profile).generate(b)
+        assert a.spans != b.spans
+
+    def test_parents_exist_within_same_trace(self):
+        spans = _generate(hierarchy_depth=4).spans
+        by_id = {(s["trace_id"], s["span_id"]): s for s in spans}
+
+        children = [s for s in spans if "parent_span_id" in s]
+        assert children
+        for child in children:
+            parent = by_id[(child["trace_id"], child["parent_span_id"])]
+            assert parent["start_time_ns"] <= child["start_time_ns"]
+
+    def test_timestamps_never_exceed_end_time(self):
+        sink = _generate(blocker_probability=0.5)
+        end_ns = int(END.timestamp() * 1e9)
+
+        assert all(s["end_time_ns"] <= end_ns for s in sink.spans)
+        assert all(s["end_time_ns"] > s["start_time_ns"] for s in sink.spans)
+
+    def test_hierarchy_depth_limits_task_types(self):
+        types = {s["attributes"]["task.type"] for s in _generate(hierarchy_depth=2).spans if "task.type" in s["attributes"]}
+        assert types == {"epic", "story"}
+
+    def test_emits_insights_and_handoffs(self):
+        spans = _generate(
+            insights_per_task=Distribution("constant", 1),
+            handoffs_per_task=Distribution("constant", 1),
+        ).spans
+
+        assert any(s["name"].startswith("insight.") for s in spans)
+        assert any(s["name"] == "handoff.request" for s in spans)
+
+    def test_span_names_match_tracker(self):
+        spans = _generate(hierarchy_depth=2).spans
+        for span in spans:
+            if "task.type" in span["attributes"]:
+                assert span["name"] == f"contextcore.task.{span['attributes']['task.type']}"
+
+    def test_sprints_use_tracker_schema(self):
+        spans = _generate(duration_days=30, sprint_days=14).spans
+        sprints = [s for s in spans if s["name"] == "contextcore.sprint"]
+
+        assert len(sprints) == 2 * 3
+        for sprint in sprints:
+            attrs = sprint["attributes"]
+            assert {"sprint.id", "sprint.name", "sprint.planned_points", "sprint.goal"} <= set(attrs)
+            assert "task.type" not in attrs
+            assert sprint["events"][0]["name"] == "sprint.started"
+        # The third sprint is cut off by the window and has not ended yet
+        closed = [s for s in sprints if s["attributes"]["sprint.id"] != "sprint-3"]
+        assert all(s["events"][-1]["name"] == "sprint.ended" for s in closed)
+        assert all("sprint.completed_points" in s["attributes"] for s in closed)
+        assert all(len(s["events"]) == 1 for s in sprints if s["attributes"]["sprint.id"] == "sprint-3")
+
+    def test_no_logs_when_disabled(self):
+        assert _generate(emit_logs=False).logs == []
+
+    def test_for_task_count_scales_epics(self):
+        profile = WorkloadProfile.for_task_count(100_000, projects=10)
+        generated = profile.epics_per_project * profile.projects * profile.expected_tasks_per_epic()
+        assert 100_000 <= generated < 110_000
+
+
+class TestJsonFileSink:
+    def test_files_load_with_demo_loaders(self, tmp_path: Path):
+        profile = WorkloadProfile(epics_per_project=2, seed=1, end_time=END)
+        stats = SyntheticWorkloadGenerator(profile).generate(JsonFileSink(str(tmp_path)))
+
+        assert len(load_spans_from_file(stats["spans_file"])) == stats["spans"]
+        assert len(load_logs_from_file(stats["logs_file"])) == stats["logs"]
+
+    def test_output_is_byte_identical_for_seed(self, tmp_path: Path):
+        digests = []
+        for run in ("a", "b"):
+            # No end_time: history is anchored to the fixed default, not the clock
+            profile = WorkloadProfile(epics_per_project=2, seed=5)
+            stats = SyntheticWorkloadGenerator(profile).generate(JsonFileSink(str(tmp_path / run)))
+            digests.append(tuple(
+                hashlib.sha256(Path(stats[key]).read_bytes()).hexdigest()
+                for key in ("spans_file", "logs_file")
+            ))
+        assert digests[0] == digests[1]
+
+    def test_generated_at_is_opt_in(self, tmp_path: Path):
+        profile = WorkloadProfile(epics_per_project=1, seed=5, end_time=END)
+        sink = JsonFileSink(str(tmp_path), generated_at=END.isoformat())
+        stats = SyntheticWorkloadGenerator(profile).generate(sink)
+        assert json.loads(Path(stats["spans_file"]).read_text())["generated_at"] == END.isoformat()
+
+
+class TestWorkloadCommand:
+    def _run(self, out: Path, *extra: str) -> bytes:
+        from click.testing import CliRunner
+
+        from contextcore.cli.demo import demo
+
+        result = CliRunner().invoke(
+            demo, ["workload", "-n", "200", "--projects", "2", "--seed", "3", "-o", str(out), *extra]
+        )
+        assert result.exit_code == 0, result.output
+        return (out / "demo_spans.json").read_bytes() + (out / "demo_logs.json").read_bytes()
+
+    def test_same_seed_same_files(self, tmp_path: Path):
+        assert self._run(tmp_path / "a") == self._run(tmp_path / "b")
+
+    def test_end_time_option(self, tmp_path: Path):
+        self._run(tmp_path / "a", "--end-time", "2026-06-01T00:00:00")
+        spans = json.loads((tmp_path / "a" / "demo_spans.json").read_text())["spans"]
+        assert max(s["end_time_ns"] for s in spans) <= int(END.timestamp() * 1e9)
+
+    def test_bad_end_time(self, tmp_path: Path):
+        from click.testing import CliRunner
+
+        from contextcore.cli.demo import demo
+
+        result = CliRunner().invoke(demo, ["workload", "-o", str(tmp_path), "--end-time", "soon"])
+        assert result.exit_code == 2
+        assert "--end-time" in result.output
@@ -0,0 +1,225 @@
+"""Tests for concurrent, dependency-ordered installation verification."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from contextcore.install import requirements as req_module
+from contextcore.install.requirements import (
+    InstallationRequirement,
+    RequirementCategory,
+    RequirementStatus,
+)
+from contextcore.install.verifier import InstallationVerifier
+
+
+def _req(req_id, check, depends_on=None, category=RequirementCategory.TOOLING):
+    return InstallationRequirement(
+        id=req_id,
+        name=req_id,
+        description=req_id,
+        category=category,
+        check=check,
+        depends_on=depends_on or [],
+    )
+
+
+def _slow(result=True, delay=0.2):
+    def check():
+        time.sleep(delay)
+        return result
+    return check
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+class TestConcurrentScheduling:
+    def test_independent_checks_overlap(self):
+        reqs = [_req(f"r{i}", _slow()) for i in range(5)]
+        verifier = InstallationVerifier(requirements=reqs, emit_telemetry=False)
+
+        start = time.perf_counter()
+        result = verifier.verify()
+        elapsed = time.perf_counter() - start
+
+        assert result.passed_requirements == 5
+        assert elapsed < 0.6  # sequential would take ~1.0s
+
+    def test_max_workers_one_runs_sequentially(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def check():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return True
+
+        reqs = [_req(f"r{i}", check) for i in range(4)]
+        InstallationVerifier(
+            requirements=reqs, emit_telemetry=False, max_workers=1
+        ).verify()
+
+        assert max(peak) == 1
+
+    def test_dependency_runs_before_dependent(self):
+        order = []
+
+        def record(name, delay=0.0):
+            def check():
+                time.sleep(delay)
+                order.append(name)
+                return True
+            return check
+
+        reqs = [
+            _req("child", record("child"), depends_on=["parent"]),
+            _req("parent", record("parent", delay=0.1)),
+        ]
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        assert order == ["parent", "child"]
+        assert all(r.passed for r in result.results)
+
+    def test_results_keep_requirement_order(self):
+        reqs = [
+            _req("slow", _slow(delay=0.15)),
+            _req("fast", _slow(delay=0.0)),
+            _req("medium", _slow(delay=0.05)),
+        ]
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        assert [r.requirement.id for r in result.results] == ["slow", "fast", "medium"]
+
+    def test_failed_dependency_skips_dependent(self):
+        dependent = mock.Mock(return_value=True)
+        reqs = [
+            _req("base", lambda: False),
+            _req("dependent", dependent, depends_on=["base"]),
+        ]
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        skipped = result.results[1]
+        assert skipped.status == RequirementStatus.SKIPPED
+        assert skipped.error == "Dependency 'base' not met"
+        dependent.assert_not_called()
+
+    def test_dependency_outside_run_is_ignored(self):
+        reqs = [_req("dependent", lambda: True, depends_on=["not_in_run"])]
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        assert result.results[0].status == RequirementStatus.PASSED
+
+    def test_dependency_cycle_does_not_hang(self):
+        reqs = [
+            _req("a", lambda: True, depends_on=["b"]),
+            _req("b", lambda: True, depends_on=["a"]),
+        ]
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        assert result.passed_requirements == 2
+
+    def test_check_exception_is_reported_as_error(self):
+        def boom():
+            raise RuntimeError("probe exploded")
+
+        reqs = [_req("boom", boom)]
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        assert result.results[0].status == RequirementStatus.ERROR
+        assert result.results[0].error == "probe exploded"
+
+
+# ---------------------------------------------------------------------------
+# Debug mode
+# ---------------------------------------------------------------------------
+
+class TestVerifyDebug:
+    def test_category_checkpoints_group_results(self):
+        reqs = [
+            _req("c1", _slow(delay=0.05), category=RequirementCategory.CONFIGURATION),
+            _req("t1", _slow(delay=0.0)),
+            _req("c2", _slow(delay=0.0), category=RequirementCategory.CONFIGURATION),
+        ]
+        seen = []
+
+        def on_checkpoint(checkpoint):
+            seen.append(
+                (checkpoint.category_result.category,
+                 [r.requirement.id for r in checkpoint.category_requirements])
+            )
+            return True
+
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify_debug(
+            on_checkpoint=on_checkpoint
+        )
+
+        assert seen == [
+            (RequirementCategory.CONFIGURATION, ["c1", "c2"]),
+            (RequirementCategory.TOOLING, ["t1"]),
+        ]
+        assert result.is_complete
+
+    def test_abort_stops_reporting(self):
+        reqs = [_req(f"r{i}", lambda: True) for i in range(4)]
+
+        result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify_debug(
+            step_all=True, on_checkpoint=lambda checkpoint: False
+        )
+
+        assert result.total_requirements == 1
+        assert not result.is_complete
+
+
+# ---------------------------------------------------------------------------
+# Shared inputs
+# ---------------------------------------------------------------------------
+
+class TestGrafanaDatasourceCache:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        req_module.clear_check_cache()
+        yield
+        req_module.clear_check_cache()
+
+    def test_concurrent_datasource_checks_share_one_request(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return [{"type": "tempo"}, {"type": "prometheus"}, {"type": "loki"}]
+
+        with mock.patch.object(req_module, "_fetch_grafana_datasources", side_effect=fetch):
+            reqs = [
+                _req("tempo", req_module.check_grafana_has_tempo_datasource),
+                _req("mimir", req_module.check_grafana_has_mimir_datasource),
+                _req("loki", req_module.check_grafana_has_loki_datasource),
+            ]
+            result = InstallationVerifier(requirements=reqs, emit_telemetry=False).verify()
+
+        assert result.passed_requirements == 3
+        assert len(calls) == 1
+
+    def test_cache_cleared_between_runs(self):
+        fetch = mock.Mock(return_value=[{"type": "tempo"}])
+        with mock.patch.object(req_module, "_fetch_grafana_datasources", fetch):
+            reqs = [_req("tempo", req_module.check_grafana_has_tempo_datasource)]
+            verifier = InstallationVerifier(requirements=reqs, emit_telemetry=False)
+            verifier.verify()
+            verifier.verify()
+
+        assert fetch.call_count == 2
+
+    def test_http_client_is_shared(self):
+        assert req_module._get_http_client() is req_module._get_http_client()
@@ -0,0 +1,152 @@
+"""Tests for batched lesson retrieval and the per-session lesson cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from contextcore.learning import retriever as retriever_module
+from contextcore.learning.loop import LearningLoop
+from contextcore.learning.models import Lesson, LessonCategory, LessonSource
+from contextcore.learning.retriever import LessonRetriever
+
+
+def _lesson(lesson_id, category, applies_to, confidence=0.8, successes=0, failures=0):
+    return Lesson(
+        id=lesson_id,
+        summary=lesson_id,
+        category=category,
+        source=LessonSource.ERROR_FIXED,
+        confidence=confidence,
+        created_at=datetime(2026, 1, 1),
+        applies_to=applies_to,
+        success_count=successes,
+        failure_count=failures,
+    )
+
+
+LESSONS = [
+    _lesson("t1", LessonCategory.TESTING, ["tests/conftest.py"], confidence=0.7),
+    _lesson("t2", LessonCategory.TESTING, ["src/auth/oauth.py"], confidence=0.95),
+    _lesson("d1", LessonCategory.DEBUGGING, ["src/auth/oauth.py"], confidence=0.6),
+    _lesson("d2", LessonCategory.DEBUGGING, ["src/db/models.py"], successes=1, failures=3),
+    _lesson("low", LessonCategory.TESTING, ["src/auth/oauth.py"], confidence=0.2),
+    _lesson("other", LessonCategory.SECURITY, ["src/api/views.py"], confidence=0.9),
+]
+
+
+class FakeTempoRetriever(LessonRetriever):
+    """Answers every TraceQL query with all stored lessons (a superset), up to ``limit``."""
+
+    def __init__(self, lessons=LESSONS):
+        super().__init__()
+        self.lessons = list(lessons)
+        self.queries: list[str] = []
+
+    def _fetch_lessons(self, traceql, time_range, limit=None):
+        self.queries.append(traceql)
+        return self.lessons[:limit]
+
+
+def _expected(task_category, files):
+    """Lessons the per-query path selects, ranked as before_task ranks them."""
+    selected = []
+    for lesson in LESSONS:
+        if lesson.confidence < 0.5:
+            continue
+        if lesson.category == task_category or any(
+            f in item for f in files for item in lesson.applies_to
+        ):
+            selected.append(lesson)
+    return sorted(selected, key=lambda x: x.effectiveness_score, reverse=True)
+
+
+@pytest.fixture
+def loop():
+    loop = LearningLoop(project_id="my-project", agent_id="agent")
+    loop.retriever = FakeTempoRetriever()
+    return loop
+
+
+class TestRetrieveMany:
+    def test_one_request_for_task_and_files(self):
+        retriever = FakeTempoRetriever()
+        queries = [
+            retriever.task_query("testing", "my-project"),
+            retriever.file_query("src/auth/oauth.py", "my-project"),
+            retriever.file_query("src/db/models.py", "my-project"),
+        ]
+
+        results = retriever.retrieve_many(queries)
+
+        assert len(retriever.queries) == 1
+        assert [[lesson.id for lesson in r] for r in results] == [
+            ["t2", "t1"],
+            ["t2", "d1"],
+            ["d2"],
+        ]
+        traceql = retriever.queries[0]
+        assert 'span.insight.category = "testing"' in traceql
+        assert r"src/auth/oauth\.py|src/db/models\.py" in traceql
+
+    def test_large_batches_split(self, monkeypatch):
+        monkeypatch.setattr("contextcore.learning.retriever.BATCH_SIZE", 10)
+        retriever = FakeTempoRetriever()
+        files = [f"src/mod{i}.py" for i in range(35)]
+
+        results = retriever.retrieve_many([retriever.file_query(f, "p") for f in files])
+
+        assert len(retriever.queries) == 4
+        assert results == [[] for _ in files]
+
+    def test_full_batch_reruns_crowded_out_queries(self, monkeypatch):
+        monkeypatch.setattr(retriever_module, "TRACES_PER_QUERY", 2)
+        busy = [_lesson(f"b{i}", LessonCategory.TESTING, ["tests/x.py"]) for i in range(10)]
+        crowded_out = _lesson("f1", LessonCategory.DEBUGGING, ["src/db/models.py"], confidence=0.95)
+        retriever = FakeTempoRetriever(busy + [crowded_out])
+        queries = [
+            retriever.task_query("testing", "p"),
+            retriever.file_query("src/db/models.py", "p"),
+        ]
+
+        results = retriever.retrieve_many(queries)
+
+        # The batch (limit 4) is all testing lessons; only the file query is re-run
+        assert len(retriever.queries) == 2
+        assert "models" in retriever.queries[1] and "testing" not in retriever.queries[1]
+        assert len(results[0]) == 4
+        # The fake ignores filters, so the re-run returns a superset
+        assert results[1][0].id == "f1"
+
+
+class TestBeforeTask:
+    def test_same_ranked_result(self, loop):
+        files = ["src/auth/oauth.py", "src/db/models.py"]
+        lessons = loop.before_task("testing", files)
+
+        assert lessons == _expected(LessonCategory.TESTING, files)
+        assert len(loop.retriever.queries) == 1
+
+    def test_unknown_task_type_uses_files_only(self, loop):
+        lessons = loop.before_task("implementation", ["src/db/models.py"])
+        assert [lesson.id for lesson in lessons] == ["d2"]
+
+    def test_session_cache_by_file(self, loop):
+        loop.before_task("testing", ["src/auth/oauth.py"])
+        loop.before_task("testing", ["src/auth/oauth.py"])
+        assert len(loop.retriever.queries) == 1
+
+        loop.before_task("testing", ["src/auth/oauth.py", "src/db/models.py"])
+        assert len(loop.retriever.queries) == 2
+        assert "oauth" not in loop.retriever.queries[1]
+
+    def test_invalidate_and_ttl(self, loop):
+        loop.before_task("debugging", ["src/db/models.py"])
+        loop.invalidate_lessons(["src/db/models.py"])
+        loop.before_task("debugging", ["src/db/models.py"])
+        assert len(loop.retriever.queries) == 2
+
+        loop.cache_ttl_s = 0
+        loop.before_task("debugging", ["src/db/models.py"])
+        assert len(loop.retriever.queries) == 3
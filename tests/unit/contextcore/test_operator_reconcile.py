@@ -0,0 +1,277 @@
+"""Tests for hash-gated, server-side-apply reconciliation and the reconcile queue."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import sys
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class FakeKubeApi:
+    """In-memory stand-in for CoreV1Api and CustomObjectsApi."""
+
+    def __init__(self):
+        self.objects: dict[tuple, dict] = {}
+        self.calls: list[tuple] = []
+
+    def patch_namespaced_config_map(self, name, namespace, body, **kwargs):
+        self.calls.append(("patch", "ConfigMap", name, kwargs))
+        self.objects[("ConfigMap", namespace, name)] = body
+        return body
+
+    def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):
+        self.calls.append(("patch", body["kind"], name, kwargs))
+        self.objects[(body["kind"], namespace, name)] = body
+        return body
+
+
+class StubTracer:
+    @contextmanager
+    def trace_action(self, **_):
+        yield None
+
+
+@pytest.fixture
+def operator(monkeypatch):
+    # Other test modules import contextcore.operator with kopf/kubernetes
+    # mocked out; import a fresh copy against the real libraries.
+    for mod in [m for m in sys.modules if m == "kopf" or m.startswith("kubernetes")]:
+        if isinstance(sys.modules[mod], MagicMock):
+            monkeypatch.delitem(sys.modules, mod)
+    sys.modules.pop("contextcore.operator", None)
+    module = importlib.import_module("contextcore.operator")
+    monkeypatch.setattr(module, "get_tracer", lambda: StubTracer())
+    yield module
+    sys.modules.pop("contextcore.operator", None)
+
+
+@pytest.fixture
+def api(operator, monkeypatch):
+    fake = FakeKubeApi()
+    monkeypatch.setattr(operator, "_core_api", fake)
+    monkeypatch.setattr(operator, "_custom_api", fake)
+    return fake
+
+
+def _body(spec=None, annotations=None):
+    return {
+        "apiVersion": "contextcore.io/v1",
+        "kind": "ProjectContext",
+        "metadata": {
+            "name": "checkout",
+            "namespace": "default",
+            "uid": "uid-1",
+            "annotations": annotations or {},
+        },
+        "spec": spec or {
+            "project": {"id": "checkout"},
+            "business": {"criticality": "high", "owner": "commerce"},
+            "targets": [{"kind": "Deployment", "name": "checkout"}],
+        },
+    }
+
+
+def _with_patch_annotations(body, patch):
+    annotations = patch["metadata"]["annotations"]
+    body = json.loads(json.dumps(body))
+    body["metadata"]["annotations"].update(annotations)
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+class TestFingerprint:
+    def test_ignores_generation_timestamp(self, operator):
+        a = operator.generate_grafana_dashboard("x", "default", {}, {})
+        b = json.loads(json.dumps(a))
+        b["metadata"]["annotations"]["contextcore.io/generated"] = "later"
+        assert operator.artifact_fingerprint(a) == operator.artifact_fingerprint(b)
+
+    def test_content_change_changes_hash(self, operator):
+        a = operator.generate_service_monitor("x", "default", {}, {})
+        b = json.loads(json.dumps(a))
+        b["spec"]["endpoints"] = []
+        assert operator.artifact_fingerprint(a) != operator.artifact_fingerprint(b)
+
+    def test_bad_annotation_is_ignored(self, operator):
+        body = _body(annotations={operator.ARTIFACT_HASHES_ANNOTATION: "not json"})
+        assert operator.get_artifact_hashes(body) == {}
+
+
+# ---------------------------------------------------------------------------
+# Reconciliation
+# ---------------------------------------------------------------------------
+
+class TestReconcile:
+    async def test_create_applies_each_artifact_once_with_ssa(self, operator, api):
+        patch = {}
+        result = await operator.on_create(body=_body(), namespace="default", name="checkout", patch=patch)
+
+        assert [c[1] for c in api.calls] == ["ConfigMap", "ServiceMonitor", "PrometheusRule"]
+        for call in api.calls:
+            assert call[3]["_content_type"] == "application/apply-patch+yaml"
+            assert call[3]["field_manager"] == operator.FIELD_MANAGER
+            assert call[3]["force"] is True
+        assert set(result["generatedArtifacts"]) == {"dashboard", "serviceMonitor", "prometheusRules"}
+
+        hashes = json.loads(patch["metadata"]["annotations"][operator.ARTIFACT_HASHES_ANNOTATION])
+        assert set(hashes) == {"dashboard", "serviceMonitor", "prometheusRules"}
+
+    async def test_unchanged_update_makes_no_api_calls(self, operator, api):
+        patch = {}
+        await operator.on_create(body=_body(), namespace="default", name="checkout", patch=patch)
+        body = _with_patch_annotations(_body(), patch)
+        api.calls.clear()
+
+        update_patch = {}
+        result = await operator.on_update(body=body, namespace="default", name="checkout", patch=update_patch)
+
+        assert api.calls == []
+        assert "metadata" not in update_patch  # annotation already current
+        assert set(result["generatedArtifacts"]) == {"dashboard", "serviceMonitor", "prometheusRules"}
+
+    async def test_only_changed_artifacts_are_applied(self, operator, api):
+        patch = {}
+        await operator.on_create(body=_body(), namespace="default", name="checkout", patch=patch)
+        previous = json.loads(patch["metadata"]["annotations"][operator.ARTIFACT_HASHES_ANNOTATION])
+        api.calls.clear()
+
+        spec = _body()["spec"]
+        spec["observability"] = {"metrics": {"requestsTotal": "checkout_requests_total"}}
+        body = _with_patch_annotations(_body(spec=spec), patch)
+        update_patch = {}
+        await operator.on_update(body=body, namespace="default", name="checkout", patch=update_patch)
+
+        applied = {c[1] for c in api.calls}
+        assert applied and "ServiceMonitor" not in applied
+        assert len(api.calls) == len(applied)  # one call per changed resource
+        hashes = json.loads(update_patch["metadata"]["annotations"][operator.ARTIFACT_HASHES_ANNOTATION])
+        changed = {k for k in hashes if hashes[k] != previous[k]}
+        kinds = {"dashboard": "ConfigMap", "serviceMonitor": "ServiceMonitor", "prometheusRules": "PrometheusRule"}
+        assert applied == {kinds[k] for k in changed}
+
+    async def test_failed_apply_keeps_previous_hash(self, operator, api, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("apiserver unavailable")
+
+        monkeypatch.setattr(api, "patch_namespaced_custom_object", fail)
+        patch = {}
+        result = await operator.on_create(body=_body(), namespace="default", name="checkout", patch=patch)
+
+        hashes = json.loads(patch["metadata"]["annotations"][operator.ARTIFACT_HASHES_ANNOTATION])
+        assert set(hashes) == {"dashboard"}
+        assert set(result["generatedArtifacts"]) == {"dashboard"}
+
+
+# ---------------------------------------------------------------------------
+# Reconcile queue
+# ---------------------------------------------------------------------------
+
+class Recorder:
+    """Blocking work items that record concurrency and what ran."""
+
+    def __init__(self, delay=0.05):
+        import threading
+
+        self.delay = delay
+        self.ran: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def work(self, label):
+        import time
+
+        def run():
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(self.delay)
+            with self._lock:
+                self.active -= 1
+                self.ran.append(label)
+            return label
+
+        return run
+
+
+class TestReconcileQueue:
+    async def test_global_concurrency_is_bounded(self, operator):
+        queue = operator.ReconcileQueue(max_concurrency=3, namespace_concurrency=10)
+        rec = Recorder()
+
+        results = await asyncio.gather(
+            *(queue.submit(f"ns{i % 5}", f"cr{i}", rec.work(i)) for i in range(12))
+        )
+
+        assert results == list(range(12))
+        assert rec.peak == 3
+        assert queue.stats()["completed"] == 12
+
+    async def test_namespace_concurrency_is_bounded(self, operator):
+        queue = operator.ReconcileQueue(max_concurrency=10, namespace_concurrency=2)
+        rec = Recorder()
+
+        await asyncio.gather(*(queue.submit("busy", f"cr{i}", rec.work(i)) for i in range(6)))
+
+        assert rec.peak == 2
+
+    async def test_busy_namespace_does_not_hold_global_slots(self, operator):
+        queue = operator.ReconcileQueue(max_concurrency=4, namespace_concurrency=1)
+        rec = Recorder()
+
+        busy = [queue.submit("busy", f"cr{i}", rec.work(f"busy{i}")) for i in range(8)]
+        await asyncio.gather(*busy, queue.submit("quiet", "cr", rec.work("quiet")))
+
+        # Runs alongside the first busy reconcile instead of queuing behind the burst
+        assert "quiet" in rec.ran[:2]
+
+    async def test_burst_for_one_object_runs_latest_spec(self, operator):
+        queue = operator.ReconcileQueue(max_concurrency=1)
+        rec = Recorder()
+        blocker = asyncio.ensure_future(queue.submit("default", "other", rec.work("other")))
+        await asyncio.sleep(0)  # other object holds the only slot
+
+        results = await asyncio.gather(
+            *(queue.submit("default", "checkout", rec.work(f"v{i}")) for i in range(5))
+        )
+        await blocker
+
+        assert results == ["v4"] * 5
+        assert rec.ran == ["other", "v4"]
+        assert queue.stats()["coalesced"] == 4
+
+    async def test_update_during_run_reruns_once_with_latest(self, operator):
+        queue = operator.ReconcileQueue()
+        rec = Recorder()
+
+        first = asyncio.ensure_future(queue.submit("default", "checkout", rec.work("v1")))
+        await asyncio.sleep(0.01)  # v1 is running
+        later = [
+            asyncio.ensure_future(queue.submit("default", "checkout", rec.work(f"v{i}")))
+            for i in (2, 3)
+        ]
+
+        assert await first == "v1"
+        assert [await f for f in later] == ["v3", "v3"]
+        assert rec.ran == ["v1", "v3"]
+        assert rec.peak == 1
+        assert queue.stats()["in_flight"] == 0
+
+    async def test_failure_propagates_to_all_waiters(self, operator):
+        queue = operator.ReconcileQueue()
+
+        def boom():
+            raise RuntimeError("apiserver unavailable")
+
+        with pytest.raises(RuntimeError):
+            await queue.submit("default", "checkout", boom)
+        assert queue.stats()["failed"] == 1
+        assert queue.depth == 0
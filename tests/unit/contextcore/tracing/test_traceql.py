@@ -0,0 +1,270 @@
+"""Tests for the shared TraceQL client, run against a local fake Tempo."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from contextcore.tracing.traceql import (
+    TraceQLClient,
+    get_traceql_client,
+    normalize_traceql,
+    quote_traceql,
+    reset_traceql_clients,
+)
+
+
+class FakeTempo:
+    """Minimal Tempo HTTP API: /api/search and /api/traces/{id}."""
+
+    def __init__(self):
+        self.requests: list[tuple[str, dict]] = []
+        self.search_response: dict = {"traces": []}
+        self.traces: dict[str, dict] = {}
+        self.statuses: list[int] = []  # Status codes to return before succeeding
+        self.delay = 0.0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                fake.requests.append((parsed.path, params))
+                if fake.delay:
+                    time.sleep(fake.delay)
+
+                if fake.statuses:
+                    self._send(fake.statuses.pop(0), {})
+                elif parsed.path == "/api/search":
+                    self._send(200, fake.search_response)
+                elif parsed.path.startswith("/api/traces/"):
+                    trace = fake.traces.get(parsed.path.rsplit("/", 1)[-1])
+                    self._send(200 if trace else 404, trace or {})
+                else:
+                    self._send(404, {})
+
+            def _send(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def searches(self) -> list[dict]:
+        return [params for path, params in self.requests if path == "/api/search"]
+
+
+@pytest.fixture
+def tempo():
+    fake = FakeTempo()
+    yield fake
+    fake.stop()
+    reset_traceql_clients()
+
+
+@pytest.fixture
+def client(tempo):
+    c = TraceQLClient(tempo.url)
+    yield c
+    c.close()
+
+
+# ---------------------------------------------------------------------------
+# Query normalization
+# ---------------------------------------------------------------------------
+
+class TestNormalize:
+    def test_collapses_whitespace_outside_strings(self):
+        assert normalize_traceql('{  name =~ "skill:.*"\n && x = 1 }') == (
+            '{ name =~ "skill:.*" && x = 1 }'
+        )
+
+    def test_preserves_whitespace_inside_strings(self):
+        assert normalize_traceql('{ a = "two  spaces" }') == '{ a = "two  spaces" }'
+
+    def test_quote_escapes_quotes_and_backslashes(self):
+        assert quote_traceql('a"b\\c') == r'"a\"b\\c"'
+        query = "{ a = " + quote_traceql('x  "y') + " }"
+        assert normalize_traceql(query) == r'{ a = "x  \"y" }'
+
+
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+class TestCaching:
+    def test_identical_search_served_from_cache(self, tempo, client):
+        tempo.search_response = {"traces": [{"traceID": "abc"}]}
+
+        first = client.search('{ name = "x" }', since_seconds=3600, limit=5)
+        second = client.search('{  name = "x"  }', since_seconds=3600, limit=5)
+
+        assert first == second == {"traces": [{"traceID": "abc"}]}
+        assert len(tempo.searches()) == 1
+        assert client.stats.cache_hits == 1
+        assert client.stats.cache_misses == 1
+        assert client.stats.hit_rate == 0.5
+
+    def test_window_aligned_to_time_bucket(self, tempo, client):
+        client.search('{ name = "x" }', since_seconds=600)
+
+        params = tempo.searches()[0]
+        end = int(params["end"])
+        assert end % client.time_bucket_s == 0
+        assert end - int(params["start"]) == 600
+        assert end >= time.time()
+
+    def test_different_limits_are_separate_entries(self, tempo, client):
+        client.search('{ name = "x" }', limit=5)
+        client.search('{ name = "x" }', limit=10)
+
+        assert len(tempo.searches()) == 2
+
+    def test_lru_eviction(self, tempo):
+        client = TraceQLClient(tempo.url, cache_size=2)
+        for q in ("a", "b", "c"):
+            client.search(f'{{ name = "{q}" }}')
+        client.search('{ name = "a" }')  # evicted, refetched
+
+        assert len(tempo.searches()) == 4
+        assert client.stats.evictions == 2
+        client.close()
+
+    def test_ttl_expiry(self, tempo):
+        client = TraceQLClient(tempo.url, cache_ttl_s=0.05)
+        client.search('{ name = "x" }')
+        time.sleep(0.1)
+        client.search('{ name = "x" }')
+
+        assert len(tempo.searches()) == 2
+        client.close()
+
+    def test_get_trace_cached(self, tempo, client):
+        tempo.traces["t1"] = {"batches": []}
+
+        assert client.get_trace("t1") == {"batches": []}
+        assert client.get_trace("t1") == {"batches": []}
+        assert len(tempo.requests) == 1
+
+    def test_clear_cache(self, tempo, client):
+        client.search('{ name = "x" }')
+        client.clear_cache()
+        client.search('{ name = "x" }')
+
+        assert len(tempo.searches()) == 2
+
+    def test_mutating_a_result_leaves_the_cache_intact(self, tempo, client):
+        tempo.search_response = {"traces": [{"traceID": "t1"}]}
+
+        first = client.search('{ name = "x" }')
+        first["traces"].clear()
+
+        assert client.search('{ name = "x" }') == {"traces": [{"traceID": "t1"}]}
+        assert len(tempo.searches()) == 1
+
+    def test_insight_querier_invalidation_clears_shared_cache(self, tempo):
+        from contextcore.agent.insights import InsightQuerier
+
+        shared = get_traceql_client(tempo.url)
+        shared.search('{ name = "x" }')
+        InsightQuerier(tempo_url=tempo.url, local_storage_path=None).invalidate_cache()
+        shared.search('{ name = "x" }')
+
+        assert len(tempo.searches()) == 2
+
+
+# ---------------------------------------------------------------------------
+# Coalescing, retries and errors
+# ---------------------------------------------------------------------------
+
+class TestCoalescingAndErrors:
+    def test_concurrent_identical_queries_share_one_request(self, tempo, client):
+        tempo.delay = 0.2
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(lambda _: client.search('{ name = "x" }'), range(5)))
+
+        assert all(r == {"traces": []} for r in results)
+        assert len({id(r) for r in results}) == 5
+        assert len(tempo.searches()) == 1
+        assert client.stats.coalesced == 4
+
+    def test_retries_transient_status(self, tempo, client):
+        tempo.statuses = [503]
+
+        client.search('{ name = "x" }', max_retries=1, retry_delay=0.01)
+
+        assert len(tempo.searches()) == 2
+        assert client.stats.requests == 2
+
+    def test_errors_raise_and_are_not_cached(self, tempo, client):
+        tempo.statuses = [500]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.search('{ name = "x" }')
+        assert client.search('{ name = "x" }') == {"traces": []}
+        assert client.stats.errors == 1
+
+    def test_connection_error_raises(self):
+        client = TraceQLClient("http://127.0.0.1:1", timeout=1)
+        with pytest.raises(httpx.ConnectError):
+            client.search('{ name = "x" }')
+        client.close()
+
+
+# ---------------------------------------------------------------------------
+# Shared clients and consumers
+# ---------------------------------------------------------------------------
+
+class TestSharedClient:
+    def test_one_client_per_url(self, tempo):
+        assert get_traceql_client(tempo.url) is get_traceql_client(tempo.url + "/")
+
+    def test_consumers_share_cache(self, tempo):
+        from contextcore.discovery.client import DiscoveryClient
+        from contextcore.skill.querier import SkillCapabilityQuerier
+
+        tempo.search_response = {
+            "traces": [{"spanSet": {"spans": []}, "spans": [{"agent": {"id": "a1"}}]}]
+        }
+        querier = SkillCapabilityQuerier(tempo_url=tempo.url)
+        querier._execute_traceql('{ name =~ "skill:.*" }', "1h", 100)
+        querier._execute_traceql('{ name =~ "skill:.*" }', "1h", 100)
+
+        discovery = DiscoveryClient(tempo_url=tempo.url)
+        assert discovery.list_agents_from_tempo() == ["a1"]
+
+        stats = get_traceql_client(tempo.url).stats
+        assert stats.cache_hits == 1
+        assert len(tempo.searches()) == 2
+
+    def test_lesson_retriever_uses_shared_client(self, tempo):
+        from contextcore.learning.models import LessonQuery
+        from contextcore.learning.retriever import LessonRetriever
+
+        retriever = LessonRetriever(tempo_url=tempo.url)
+        assert retriever.retrieve(LessonQuery(time_range="1d")) == []
+
+        params = tempo.searches()[0]
+        assert 'span.insight.type = "lesson"' in params["q"]
+        assert int(params["end"]) - int(params["start"]) == 86400
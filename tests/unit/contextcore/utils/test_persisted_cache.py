@@ -0,0 +1,86 @@
+"""Tests for the shared persisted-cache helpers."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from contextcore.utils.persisted_cache import (
+    CACHE_DIR,
+    PersistedJSONCache,
+    cache_path,
+    env_float,
+    is_racy,
+    write_atomic,
+)
+
+
+class PairCache(PersistedJSONCache):
+    FORMAT = 3
+    DESCRIPTION = "pair cache"
+
+    def put(self, key, entry):
+        self._put(key, entry)
+
+    def get(self, key):
+        return self._get(key)
+
+    def _valid_entry(self, entry):
+        return isinstance(entry, list) and len(entry) == 2
+
+
+class TestCachePath:
+    def test_default_location(self, monkeypatch):
+        monkeypatch.delenv("CONTEXTCORE_DEMO_CACHE", raising=False)
+        monkeypatch.delenv("CONTEXTCORE_DEMO_CACHE_PATH", raising=False)
+        assert cache_path("CONTEXTCORE_DEMO_CACHE", "demo.json") == CACHE_DIR / "demo.json"
+
+    def test_override_and_disable(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("CONTEXTCORE_DEMO_CACHE_PATH", str(tmp_path / "x.json"))
+        assert cache_path("CONTEXTCORE_DEMO_CACHE", "demo.json") == tmp_path / "x.json"
+
+        monkeypatch.setenv("CONTEXTCORE_DEMO_CACHE", "0")
+        assert cache_path("CONTEXTCORE_DEMO_CACHE", "demo.json") is None
+
+
+def test_env_float_falls_back_on_bad_values(monkeypatch):
+    monkeypatch.setenv("CONTEXTCORE_DEMO_TTL", "soon")
+    assert env_float("CONTEXTCORE_DEMO_TTL", 5.0) == 5.0
+    monkeypatch.setenv("CONTEXTCORE_DEMO_TTL", "2.5")
+    assert env_float("CONTEXTCORE_DEMO_TTL", 5.0) == 2.5
+
+
+def test_is_racy():
+    now = time.time()
+    assert is_racy(int(now * 1e9), now=now + 1)
+    assert not is_racy(int(now * 1e9), now=now + 60)
+
+
+def test_write_atomic_leaves_no_temporary_files(tmp_path):
+    target = tmp_path / "nested" / "out.json"
+    write_atomic(target, "{}")
+    write_atomic(target, '{"a": 1}')
+    assert json.loads(target.read_text()) == {"a": 1}
+    assert [p.name for p in target.parent.iterdir()] == ["out.json"]
+
+
+class TestPersistedJSONCache:
+    def test_round_trip_and_eviction(self, tmp_path):
+        path = tmp_path / "pairs.json"
+        cache = PairCache(path, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, [key, 1])
+        cache.save()
+
+        reloaded = PairCache(path)
+        assert reloaded.get("a") is None
+        assert reloaded.get("c") == ["c", 1]
+
+    def test_other_formats_and_bad_entries_are_ignored(self, tmp_path):
+        path = tmp_path / "pairs.json"
+        path.write_text(json.dumps({"format": 3, "entries": {"ok": [1, 2], "bad": [1]}}))
+        assert PairCache(path).get("ok") == [1, 2]
+        assert PairCache(path).get("bad") is None
+
+        path.write_text(json.dumps({"format": 2, "entries": {"ok": [1, 2]}}))
+        assert PairCache(path).get("ok") is None
@@ -0,0 +1,106 @@
+"""Tests for the cached ProjectContext client."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+from contextcore.utils import project_context_client
+from contextcore.utils.project_context_client import ProjectContextClient
+
+# contextcore.cli re-exports the review command group under the module's name
+review_module = importlib.import_module("contextcore.cli.review")
+
+
+class ApiException(Exception):
+    """Shape of kubernetes.client.exceptions.ApiException."""
+
+    def __init__(self, status, reason=""):
+        super().__init__(reason)
+        self.status = status
+
+
+class FakeCustomObjectsApi:
+    """Serves ProjectContexts from a dict keyed by (version, namespace, name)."""
+
+    def __init__(self, objects=None, error=None):
+        self.objects = objects or {}
+        self.error = error
+        self.calls = []
+
+    def get_namespaced_custom_object(self, group, version, namespace, plural, name):
+        self.calls.append((version, namespace, name))
+        if self.error is not None:
+            raise self.error
+        try:
+            return self.objects[(version, namespace, name)]
+        except KeyError:
+            raise ApiException(status=404, reason="Not Found") from None
+
+
+PC = {"metadata": {"name": "checkout"}, "spec": {"project_id": "checkout", "risks": []}}
+
+
+class TestProjectContextClient:
+    def test_fetch_is_cached(self):
+        api = FakeCustomObjectsApi({("v2", "commerce", "checkout"): PC})
+        client = ProjectContextClient(api=api)
+
+        assert client.get("checkout", "commerce") == PC
+        assert client.get("checkout", "commerce") == PC
+        assert api.calls == [("v2", "commerce", "checkout")]
+        assert (client.hits, client.misses) == (1, 1)
+
+    def test_falls_back_to_older_crd_version(self):
+        api = FakeCustomObjectsApi({("v1", "default", "checkout"): PC})
+        assert ProjectContextClient(api=api).get("checkout") == PC
+        assert [v for v, _, _ in api.calls] == ["v2", "v1"]
+
+    def test_not_found_is_cached(self):
+        api = FakeCustomObjectsApi()
+        client = ProjectContextClient(api=api)
+        assert client.get("missing") is None
+        assert client.get("missing") is None
+        assert len(api.calls) == 2  # one lookup per CRD version, once
+
+    def test_errors_are_not_cached(self):
+        api = FakeCustomObjectsApi(error=ApiException(status=500, reason="boom"))
+        client = ProjectContextClient(api=api)
+        assert client.get("checkout") is None
+        api.error = None
+        api.objects[("v2", "default", "checkout")] = PC
+        assert client.get("checkout") == PC
+
+    def test_expired_entries_are_refetched(self):
+        api = FakeCustomObjectsApi({("v2", "default", "checkout"): PC})
+        client = ProjectContextClient(ttl_s=0, api=api)
+        client.get("checkout")
+        client.get("checkout")
+        assert len(api.calls) == 2
+
+    def test_invalidate(self):
+        api = FakeCustomObjectsApi({("v2", "default", "checkout"): PC})
+        client = ProjectContextClient(api=api)
+        client.get("checkout")
+        client.invalidate("checkout")
+        client.get("checkout")
+        assert len(api.calls) == 2
+
+
+class TestReviewProjectContextSpec:
+    @pytest.fixture
+    def api(self, monkeypatch):
+        api = FakeCustomObjectsApi({("v2", "commerce", "checkout"): PC})
+        monkeypatch.setattr(
+            project_context_client, "_default_client", ProjectContextClient(api=api)
+        )
+        return api
+
+    def test_reads_spec_from_cluster(self, api):
+        assert review_module._get_project_context_spec("commerce/checkout") == PC["spec"]
+        assert review_module._get_project_context_spec("checkout", "commerce") == PC["spec"]
+        assert len(api.calls) == 1
+
+    def test_missing_project(self, api):
+        assert review_module._get_project_context_spec("nope") is None
@@ -0,0 +1,87 @@
+"""Tests for the compiled scope pattern matcher."""
+
+from __future__ import annotations
+
+import fnmatch
+
+import pytest
+
+from contextcore.utils.scope_matcher import ScopeMatcher
+
+PATTERNS = [
+    "src/api/*",
+    "*.py",
+    "docs/*",
+    "*",
+    "src/[ab]*/x?.txt",
+    "",
+    "literal.md",
+    "*/*/deep/*",
+    "[!s]*.yaml",
+]
+
+PATHS = [
+    "src/api/checkout.py",
+    "a.py",
+    "docs/x.md",
+    "src/b1/x1.txt",
+    "src/c1/x1.txt",
+    "literal.md",
+    "",
+    "x/y/deep/z",
+    "src/api/",
+    "docs",
+    "k8s/deploy.yaml",
+    "svc.yaml",
+]
+
+
+# ---------------------------------------------------------------------------
+# fnmatch equivalence
+# ---------------------------------------------------------------------------
+
+class TestFnmatchEquivalence:
+    @pytest.mark.parametrize("path", PATHS)
+    def test_match_equals_fnmatch(self, path):
+        matcher = ScopeMatcher(PATTERNS)
+        expected = [i for i, p in enumerate(PATTERNS) if fnmatch.fnmatch(path, p)]
+        assert matcher.match(path) == expected
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_matches_any_equals_fnmatch(self, path):
+        matcher = ScopeMatcher(PATTERNS[:3])
+        expected = any(fnmatch.fnmatch(path, p) for p in PATTERNS[:3])
+        assert matcher.matches_any(path) is expected
+
+
+# ---------------------------------------------------------------------------
+# Batch APIs
+# ---------------------------------------------------------------------------
+
+class TestBatch:
+    def test_match_many(self):
+        matcher = ScopeMatcher(["src/api/*", "*.py", "docs/*"])
+        assert matcher.match_many(["src/api/a.py", "docs/x.md", "README", "a.py"]) == {
+            "src/api/a.py": [0, 1],
+            "docs/x.md": [2],
+            "README": [],
+            "a.py": [1],
+        }
+
+    def test_paths_by_pattern_preserves_input_order(self):
+        files = ["b.py", "docs/x.md", "a.py", "src/api/z.go"]
+        matcher = ScopeMatcher(["*.py", "src/api/*", "*.rs"])
+        assert matcher.paths_by_pattern(files) == [["b.py", "a.py"], ["src/api/z.go"], []]
+
+    def test_paths_by_pattern_matches_per_pattern_fnmatch(self):
+        patterns = [f"src/mod{i}/*.py" for i in range(50)] + ["*.md"]
+        files = [f"src/mod{i}/f{j}.py" for i in range(60) for j in range(3)] + ["x.md"]
+        expected = [[f for f in files if fnmatch.fnmatch(f, p)] for p in patterns]
+        assert ScopeMatcher(patterns).paths_by_pattern(files) == expected
+
+    def test_empty_pattern_set(self):
+        matcher = ScopeMatcher([])
+        assert len(matcher) == 0
+        assert matcher.match("a.py") == []
+        assert not matcher.matches_any("a.py")
+        assert matcher.match_many(["a.py"]) == {"a.py": []}